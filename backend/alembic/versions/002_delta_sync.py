@@ -0,0 +1,86 @@
+"""Delta sync support - updated_at keyset indexes and sync tombstones
+
+Revision ID: 002_delta_sync
+Revises: 001_pg_initial
+Create Date: 2026-10-18
+
+Backs GET /api/v1/sync, which lets offline clients download only the rows
+that changed since their last cursor.
+
+Changes:
+- reward_adjustments: new updated_at column (backfilled from created_at) and trigger
+- (updated_at, id) keyset indexes on chores, chore_assignments,
+  reward_adjustments and users
+- sync_tombstones: records hard deletes and family removals so clients can
+  drop rows that no longer exist for them
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002_delta_sync'
+down_revision: Union[str, None] = '001_pg_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add sync columns, indexes and the tombstone table."""
+
+    # =========================================================================
+    # STEP 1: reward_adjustments.updated_at
+    # =========================================================================
+    op.add_column('reward_adjustments',
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False)
+    )
+    # Existing rows were never modified, so their last change is their creation
+    op.execute("UPDATE reward_adjustments SET updated_at = created_at;")
+
+    op.execute("""
+        CREATE TRIGGER trg_reward_adjustments_updated_at
+        BEFORE UPDATE ON reward_adjustments
+        FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+    """)
+
+    # =========================================================================
+    # STEP 2: Keyset indexes for cursor pagination
+    # =========================================================================
+    op.create_index('idx_chores_updated_at_id', 'chores', ['updated_at', 'id'], unique=False)
+    op.create_index('idx_assignments_updated_at_id', 'chore_assignments', ['updated_at', 'id'], unique=False)
+    op.create_index('idx_adjustments_updated_at_id', 'reward_adjustments', ['updated_at', 'id'], unique=False)
+    op.create_index('idx_users_updated_at_id', 'users', ['updated_at', 'id'], unique=False)
+
+    # =========================================================================
+    # STEP 3: Create SYNC_TOMBSTONES table
+    # =========================================================================
+    op.create_table('sync_tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('entity_type', sa.String(length=32), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('family_id', sa.Integer(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.PrimaryKeyConstraint('id', name='pk_sync_tombstones')
+    )
+    op.create_index('ix_sync_tombstones_id', 'sync_tombstones', ['id'], unique=False)
+    op.create_index('ix_sync_tombstones_family_id', 'sync_tombstones', ['family_id'], unique=False)
+    op.create_index('ix_sync_tombstones_user_id', 'sync_tombstones', ['user_id'], unique=False)
+    op.create_index('idx_sync_tombstones_deleted_at_id', 'sync_tombstones', ['deleted_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the tombstone table, keyset indexes and reward_adjustments.updated_at."""
+    op.drop_index('idx_sync_tombstones_deleted_at_id', table_name='sync_tombstones')
+    op.drop_index('ix_sync_tombstones_user_id', table_name='sync_tombstones')
+    op.drop_index('ix_sync_tombstones_family_id', table_name='sync_tombstones')
+    op.drop_index('ix_sync_tombstones_id', table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+
+    op.drop_index('idx_users_updated_at_id', table_name='users')
+    op.drop_index('idx_adjustments_updated_at_id', table_name='reward_adjustments')
+    op.drop_index('idx_assignments_updated_at_id', table_name='chore_assignments')
+    op.drop_index('idx_chores_updated_at_id', table_name='chores')
+
+    op.execute("DROP TRIGGER IF EXISTS trg_reward_adjustments_updated_at ON reward_adjustments;")
+    op.drop_column('reward_adjustments', 'updated_at')
@@ -0,0 +1,93 @@
+"""Denormalized family_id on chores and chore_assignments
+
+Revision ID: 003_family_id
+Revises: 002_delta_sync
+Create Date: 2026-10-19
+
+Family-scoped queries (family chore lists, the unassigned pool, pending
+approvals) joined through users to find the family of each chore's
+creator. Chores now carry their creator's family and assignments their
+chore's, so those queries are single-table scans of a composite index.
+
+Changes:
+- chores.family_id and chore_assignments.family_id (nullable, FK to families)
+- Batched backfill, committed batch by batch so that no single transaction
+  holds row locks on the whole table
+- (family_id, is_disabled, assignment_mode) on chores and
+  (family_id, is_completed, is_approved) on chore_assignments, built
+  concurrently after the backfill
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003_family_id'
+down_revision: Union[str, None] = '002_delta_sync'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows (by id range) updated per backfill statement
+BATCH_SIZE = 5000
+
+
+def backfill(table: str, source: str) -> None:
+    """Run ``source`` (an UPDATE ... FROM) over ``table`` one id range at a time."""
+    connection = op.get_bind()
+    last_id = connection.execute(sa.text(f"SELECT max(id) FROM {table}")).scalar() or 0
+    for low in range(0, last_id, BATCH_SIZE):
+        connection.execute(sa.text(source), {"low": low, "high": low + BATCH_SIZE})
+
+
+def upgrade() -> None:
+    """Add, backfill and index family_id on chores and chore_assignments."""
+
+    # =========================================================================
+    # STEP 1: Columns
+    # =========================================================================
+    op.add_column('chores', sa.Column('family_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('fk_chores_family_id', 'chores', 'families', ['family_id'], ['id'])
+    op.add_column('chore_assignments', sa.Column('family_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('fk_assignments_family_id', 'chore_assignments', 'families', ['family_id'], ['id'])
+
+    with op.get_context().autocommit_block():
+        # =====================================================================
+        # STEP 2: Backfill, chores first since assignments copy from them
+        # =====================================================================
+        backfill('chores', """
+            UPDATE chores SET family_id = u.family_id
+            FROM users u
+            WHERE u.id = chores.creator_id
+              AND chores.id > :low AND chores.id <= :high
+              AND u.family_id IS NOT NULL
+        """)
+        backfill('chore_assignments', """
+            UPDATE chore_assignments SET family_id = c.family_id
+            FROM chores c
+            WHERE c.id = chore_assignments.chore_id
+              AND chore_assignments.id > :low AND chore_assignments.id <= :high
+              AND c.family_id IS NOT NULL
+        """)
+
+        # =====================================================================
+        # STEP 3: Composite indexes for the family-scoped queries
+        # =====================================================================
+        op.create_index(
+            'idx_chores_family_status', 'chores', ['family_id', 'is_disabled', 'assignment_mode'],
+            unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_assignments_family_status', 'chore_assignments', ['family_id', 'is_completed', 'is_approved'],
+            unique=False, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the family_id indexes and columns."""
+    op.drop_index('idx_assignments_family_status', table_name='chore_assignments')
+    op.drop_index('idx_chores_family_status', table_name='chores')
+
+    op.drop_constraint('fk_assignments_family_id', 'chore_assignments', type_='foreignkey')
+    op.drop_column('chore_assignments', 'family_id')
+    op.drop_constraint('fk_chores_family_id', 'chores', type_='foreignkey')
+    op.drop_column('chores', 'family_id')
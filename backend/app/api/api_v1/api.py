@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from .endpoints import users, chores, assignments, adjustments, activities, reports, statistics, families, health
+from .endpoints import users, chores, assignments, adjustments, activities, reports, statistics, families, health, sync, dashboard
 
 api_router = APIRouter()
 api_router.include_router(health.router, tags=["health"])
@@ -10,4 +10,6 @@ api_router.include_router(adjustments.router, prefix="/adjustments", tags=["adju
 api_router.include_router(activities.router, prefix="/activities", tags=["activities"])
 api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
 api_router.include_router(statistics.router, prefix="/statistics", tags=["statistics"])
-api_router.include_router(families.router, prefix="/families", tags=["families"])
\ No newline at end of file
+api_router.include_router(families.router, prefix="/families", tags=["families"])
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
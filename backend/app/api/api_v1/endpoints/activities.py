@@ -5,7 +5,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
 from sqlalchemy import select
 
-from ....dependencies.auth import get_current_user
+from ....dependencies.auth import get_current_read_user
 from ....models.user import User
 from ....services.activity_service import ActivityService
 from ....schemas.activity import (
@@ -14,7 +14,7 @@ from ....schemas.activity import (
     ActivitySummaryResponse,
     ActivityTypes
 )
-from ....db.base import get_db
+from ....db.base import get_read_db
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
@@ -29,8 +29,8 @@ async def get_recent_activities(
         default=None,
         description=f"Filter by activity type. Options: {', '.join(ActivityTypes.get_all_types())}"
     ),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db)
 ) -> ActivityListResponse:
     """
     Get recent activities for the current user.
@@ -103,8 +103,8 @@ async def get_activity_summary(
         le=365, 
         description="Number of days to analyze"
     ),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db)
 ) -> ActivitySummaryResponse:
     """
     Get activity summary statistics for the current user.
@@ -157,7 +157,7 @@ async def get_activity_summary(
 
 @router.get("/types", response_model=dict)
 async def get_activity_types(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_read_user)
 ) -> dict:
     """
     Get available activity types and their descriptions.
@@ -172,8 +172,8 @@ async def get_activity_types(
 
 @router.get("/debug", response_model=dict)
 async def debug_activities(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db)
 ) -> dict:
     """
     Debug endpoint to help troubleshoot activity feed issues.
@@ -227,8 +227,8 @@ async def debug_activities(
 @router.get("/{activity_id}", response_model=ActivityResponse)
 async def get_activity(
     activity_id: int = Path(..., description="ID of the activity to retrieve"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db)
 ) -> ActivityResponse:
     """
     Get a specific activity by ID.
@@ -1,17 +1,39 @@
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Form, Body, Request, Query, Path
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet
 from datetime import datetime, timedelta
 
 from ....db.base import get_db
-from ....schemas.chore import ChoreCreate, ChoreResponse, ChoreUpdate, ChoreApprove, ChoreDisable, ChoreReject
+from ....schemas.chore import (
+    ChoreCreate, ChoreResponse, ChoreUpdate, ChoreApprove, ChoreDisable, ChoreReject,
+    resolve_chore_fields, sparse_chore_model
+)
+from ....core.serialization import FastJSONResponse, model_list_response
 from ....dependencies.auth import get_current_user
 from ....dependencies.services import ChoreServiceDep
 from ....models.user import User
 from ....middleware.rate_limit import limit_api_endpoint, limit_create, limit_update, limit_delete
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+VIEW_QUERY_DESCRIPTION = "Representation: 'full' (default) or 'summary' (id, title, reward and status flags)"
+FIELDS_QUERY_DESCRIPTION = "Comma-separated chore fields to return (overrides view); id is always included"
+
+
+def _parse_sparse_fields(view: Optional[str], fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """Resolve ?view= / ?fields= into a field set, rejecting unknown values with 422."""
+    try:
+        return resolve_chore_fields(view, fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+
 @router.post(
     "",
     response_model=ChoreResponse,
@@ -228,6 +250,8 @@ async def read_chores(
     limit: int = Query(100, description="Maximum number of records to return"),
     state: Optional[str] = Query(None, description="Filter by state: active|completed|pending-approval"),
     child_id: Optional[int] = Query(None, description="Parent-only: filter chores for a specific child"),
+    view: Optional[str] = Query(None, description=VIEW_QUERY_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     chore_service: ChoreServiceDep = None
@@ -235,15 +259,19 @@ async def read_chores(
     """
     Get chores visible to the current user with optional state and child filters.
     """
+    sparse_fields = _parse_sparse_fields(view, fields)
+
     # Base scope
     if current_user.is_parent:
         if child_id is not None:
             # Verify child belongs to parent and fetch chores
-            chores = await chore_service.get_child_chores(db, parent_id=current_user.id, child_id=child_id)
+            chores = await chore_service.get_child_chores(
+                db, parent_id=current_user.id, child_id=child_id, fields=sparse_fields
+            )
         else:
-            chores = await chore_service.get_chores_for_user(db, user=current_user)
+            chores = await chore_service.get_chores_for_user(db, user=current_user, fields=sparse_fields)
     else:
-        chores = await chore_service.get_chores_for_user(db, user=current_user)
+        chores = await chore_service.get_chores_for_user(db, user=current_user, fields=sparse_fields)
 
     # Apply state filter
     if state:
@@ -262,7 +290,9 @@ async def read_chores(
                 detail="Invalid state. Must be one of: active, completed, pending-approval",
             )
 
-    return chores
+    if sparse_fields is not None:
+        return model_list_response(sparse_chore_model(sparse_fields), chores)
+    return model_list_response(ChoreResponse, chores)
 
 @router.get(
     "/available",
@@ -357,7 +387,7 @@ async def read_available_chores(
         )
 
     result = await chore_service.get_available_chores(db, child_id=current_user.id)
-    return result
+    return FastJSONResponse(content=result)
 
 @router.get(
     "/pending-approval",
@@ -448,7 +478,7 @@ async def read_pending_approval(
         )
 
     pending_assignments = await chore_service.get_pending_approval(db, parent_id=current_user.id)
-    return pending_assignments
+    return FastJSONResponse(content=pending_assignments)
 
 @router.get(
     "/child/{child_id}",
@@ -500,6 +530,8 @@ async def read_pending_approval(
 )
 async def read_child_chores(
     child_id: int = Path(..., description="The child's user ID"),
+    view: Optional[str] = Query(None, description=VIEW_QUERY_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     chore_service: ChoreServiceDep = None
@@ -515,23 +547,26 @@ async def read_child_chores(
             detail="Only parents can view children's chores"
         )
 
+    sparse_fields = _parse_sparse_fields(view, fields)
     chores = await chore_service.get_child_chores(
         db,
         parent_id=current_user.id,
-        child_id=child_id
+        child_id=child_id,
+        fields=sparse_fields
     )
 
-    # DEBUG: Log what we're about to return
-    print(f"[CHILD CHORES API] Returning {len(chores)} chores for child {child_id}")
-    for idx, chore in enumerate(chores):
-        print(f"[CHILD CHORES API] Chore {idx + 1}: id={chore.id}, title={chore.title}")
-        print(f"[CHILD CHORES API]   has is_completed attr: {hasattr(chore, 'is_completed')}")
-        print(f"[CHILD CHORES API]   has is_approved attr: {hasattr(chore, 'is_approved')}")
-        if hasattr(chore, 'is_completed'):
-            print(f"[CHILD CHORES API]   is_completed={chore.is_completed}, is_approved={chore.is_approved}")
-            print(f"[CHILD CHORES API]   completed_at={chore.completed_at}, approved_at={chore.approved_at}")
+    if sparse_fields is not None:
+        return model_list_response(sparse_chore_model(sparse_fields), chores)
 
-    return chores
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Returning %d chores for child %s", len(chores), child_id)
+        for chore in chores:
+            logger.debug(
+                "Chore %s: completed=%s, approved=%s",
+                chore.id, getattr(chore, "is_completed", None), getattr(chore, "is_approved", None)
+            )
+
+    return model_list_response(ChoreResponse, chores)
 
 @router.get(
     "/child/{child_id}/completed",
@@ -600,35 +635,23 @@ async def read_child_completed_chores(
             detail="Only parents can view children's completed chores"
         )
     
-    # Verify child belongs to parent (service will handle)
-    await chore_service.get_child_chores(
+    # Verifies the child belongs to the parent; one row per assignment
+    chores = await chore_service.get_child_chores(
         db,
         parent_id=current_user.id,
         child_id=child_id
     )
 
-    # Get all assignments for this child that are completed (whether approved or not)
-    from ....repositories.chore_assignment import ChoreAssignmentRepository
-    assignment_repo = ChoreAssignmentRepository()
-
-    assignments = await assignment_repo.get_by_assignee(
-        db,
-        assignee_id=child_id,
-        eager_load=True
-    )
-
-    # Filter to only completed assignments
-    completed_assignments = [a for a in assignments if a.is_completed]
-
-    # Return the chores from these assignments (deduplicate in case of multi-independent)
+    # Keep completed assignments (approved or pending), deduplicating
+    # multi-independent chores by chore ID
     seen_chore_ids = set()
     completed_chores = []
-    for assignment in completed_assignments:
-        if assignment.chore_id not in seen_chore_ids:
-            seen_chore_ids.add(assignment.chore_id)
-            completed_chores.append(assignment.chore)
+    for chore in chores:
+        if chore.is_completed and chore.id not in seen_chore_ids:
+            seen_chore_ids.add(chore.id)
+            completed_chores.append(chore)
 
-    return completed_chores
+    return model_list_response(ChoreResponse, completed_chores)
 
 @router.get(
     "/{chore_id}",
@@ -0,0 +1,115 @@
+"""
+Composite dashboard endpoints: one round trip for each app's startup data.
+"""
+import time
+from typing import Dict
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from ....core.serialization import FastJSONResponse
+from ....db.base import get_session_factory
+from ....dependencies.auth import get_current_user
+from ....dependencies.services import DashboardServiceDep
+from ....models.user import User
+from ....schemas.dashboard import ChildDashboardResponse, ParentDashboardResponse
+from ....middleware.rate_limit import limit_api_endpoint_default
+
+router = APIRouter()
+
+SERVER_TIMING_DESCRIPTION = """
+    The `Server-Timing` response header reports the duration of every section
+    (`available;dur=4.2, ...`) plus `total` for the whole request.
+"""
+
+
+def server_timing(timings: Dict[str, float], total_ms: float) -> str:
+    """Format section durations (ms) as a Server-Timing header value."""
+    entries = [f"{name};dur={duration:.1f}" for name, duration in timings.items()]
+    entries.append(f"total;dur={total_ms:.1f}")
+    return ", ".join(entries)
+
+
+@router.get(
+    "/child",
+    response_model=ChildDashboardResponse,
+    summary="Get the child app's startup data",
+    description="""
+    Return the current child's profile, balance, available chores and recent
+    activities in one response, replacing separate calls to `/users/me`,
+    `/users/allowance-summary`, `/chores/available` and `/activities/recent`.
+    Sections are loaded concurrently.
+
+    **Access**: Children only
+    """ + SERVER_TIMING_DESCRIPTION,
+    responses={
+        403: {
+            "description": "Endpoint is only for children",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "This endpoint is only for children users"}
+                }
+            }
+        }
+    }
+)
+@limit_api_endpoint_default
+async def read_child_dashboard(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    session_factory=Depends(get_session_factory),
+    dashboard_service: DashboardServiceDep = None
+):
+    """Return the startup data of the child app."""
+    if current_user.is_parent:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="This endpoint is only for children users"
+        )
+
+    start = time.perf_counter()
+    content, timings = await dashboard_service.get_child_dashboard(session_factory, child=current_user)
+    total_ms = (time.perf_counter() - start) * 1000
+    return FastJSONResponse(content=content, headers={"Server-Timing": server_timing(timings, total_ms)})
+
+
+@router.get(
+    "/parent",
+    response_model=ParentDashboardResponse,
+    summary="Get the parent app's startup data",
+    description="""
+    Return the current parent's children (with assignments), allowance summary,
+    assignments pending approval and family context in one response, replacing
+    separate calls to `/users/my-children`, `/users/allowance-summary`,
+    `/chores/pending-approval` and `/families/context`. Sections are loaded
+    concurrently.
+
+    **Access**: Parents only
+    """ + SERVER_TIMING_DESCRIPTION,
+    responses={
+        403: {
+            "description": "Endpoint is only for parents",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "This endpoint is only for parent users"}
+                }
+            }
+        }
+    }
+)
+@limit_api_endpoint_default
+async def read_parent_dashboard(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    session_factory=Depends(get_session_factory),
+    dashboard_service: DashboardServiceDep = None
+):
+    """Return the startup data of the parent app."""
+    if not current_user.is_parent:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="This endpoint is only for parent users"
+        )
+
+    start = time.perf_counter()
+    content, timings = await dashboard_service.get_parent_dashboard(session_factory, parent=current_user)
+    total_ms = (time.perf_counter() - start) * 1000
+    return FastJSONResponse(content=content, headers={"Server-Timing": server_timing(timings, total_ms)})
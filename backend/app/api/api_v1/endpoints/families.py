@@ -14,6 +14,7 @@ from ....dependencies.auth import (
     get_current_user, get_current_parent, get_current_user_with_family,
     require_family_membership, UserWithFamily
 )
+from ....repositories.family import NOLOAD
 from ....services.family import FamilyService
 from ....services.user_service import UserService
 from ....models.user import User
@@ -148,11 +149,6 @@ async def get_family_members(
     - Organized list of family members (parents and children)
     """
     try:
-        all_members = await family_service.get_family_members(
-            db,
-            family_id=user_with_family.family.id,
-            requesting_user_id=user_with_family.user.id
-        )
         parents = await family_service.get_family_parents(
             db,
             family_id=user_with_family.family.id,
@@ -161,13 +157,14 @@ async def get_family_members(
         children = await family_service.get_family_children(
             db,
             family_id=user_with_family.family.id,
-            requesting_user_id=user_with_family.user.id
+            requesting_user_id=user_with_family.user.id,
+            loader=NOLOAD
         )
         
         return FamilyMembersResponse(
             family_id=user_with_family.family.id,
             family_name=user_with_family.family.name,
-            total_members=len(all_members),
+            total_members=len(parents) + len(children),
             parents=[FamilyMemberResponse.model_validate(parent) for parent in parents],
             children=[FamilyMemberResponse.model_validate(child) for child in children]
         )
@@ -5,12 +5,16 @@ These endpoints follow Kubernetes health check patterns:
 - /health: Basic liveness probe
 - /health/ready: Readiness probe with dependency checks
 - /health/detailed: Component-level diagnostics
+
+The readiness and detailed checks are answered from the background health
+prober's last database check (see ``core/health.py``) and never take a pooled
+connection while it runs.
 """
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
-from ....db.base import get_db
+from ....core.health import DEGRADED, HEALTHY, NOT_READY, UNHEALTHY, current_health
+from ....db.base import engine, get_db
 from datetime import datetime
 
 router = APIRouter()
@@ -35,27 +39,28 @@ async def readiness_check(db: AsyncSession = Depends(get_db)):
     """
     Readiness check - verifies database connectivity.
 
-    Returns 200 only if the application can serve traffic.
+    Returns 200 only if the application can serve traffic: the last database
+    check succeeded and is recent. A slow database or a nearly exhausted
+    connection pool is reported as "degraded" but keeps the pod ready.
     Used by: Kubernetes readiness probes, load balancers.
     """
-    try:
-        # Simple query to verify database connection
-        await db.execute(text("SELECT 1"))
-        return {
-            "status": "ready",
-            "database": "connected",
-            "timestamp": datetime.utcnow().isoformat()
-        }
-    except Exception as e:
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "status": "not_ready",
-                "database": "disconnected",
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+    report = await current_health(db, engine.sync_engine.pool)
+    check = report.database
+    content = {
+        "status": report.status,
+        "database": "connected" if check.ok else "disconnected",
+        "latency_ms": check.latency_ms,
+        "checked_at": check.checked_at.isoformat(),
+        "pool": report.pool,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+    if report.issues:
+        content["issues"] = report.issues
+    if not report.ready:
+        if check.error:
+            content["error"] = check.error
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=content)
+    return content
 
 
 @router.get("/health/detailed")
@@ -64,26 +69,28 @@ async def detailed_health(db: AsyncSession = Depends(get_db)):
     Detailed health check - returns component-level status.
 
     Used by: Monitoring tools, debugging, dashboards.
-    Returns 200 if all components healthy, 503 if any component unhealthy.
+    Returns 200 if all components are healthy or degraded, 503 if any
+    component is unhealthy.
     """
+    report = await current_health(db, engine.sync_engine.pool)
+    check = report.database
     components = {}
-    overall_healthy = True
-
-    # Check database connectivity and version
-    try:
-        result = await db.execute(text("SELECT version()"))
-        db_version = result.scalar()
-        components["database"] = {
-            "status": "healthy",
-            "version": db_version,
-            "type": "PostgreSQL"
-        }
-    except Exception as e:
-        components["database"] = {
-            "status": "unhealthy",
-            "error": str(e)
-        }
-        overall_healthy = False
+
+    # Database connectivity and version, from the last check
+    components["database"] = {
+        "status": report.database_status,
+        "type": engine.dialect.name,
+        "checked_at": check.checked_at.isoformat(),
+        "age_seconds": round(check.age_seconds, 1)
+    }
+    if check.ok:
+        components["database"].update(version=check.version, latency_ms=check.latency_ms)
+    if report.database_status == UNHEALTHY:
+        components["database"]["error"] = check.error or report.issues[0]
+
+    # Connection pool usage, read without a checkout
+    if report.pool:
+        components["connection_pool"] = {"status": report.pool_status, **report.pool}
 
     # Future: Add more component checks here
     # - Cache connectivity (Redis, if added)
@@ -91,13 +98,15 @@ async def detailed_health(db: AsyncSession = Depends(get_db)):
     # - File storage access
     # - Message queue status
 
-    response_code = status.HTTP_200_OK if overall_healthy else status.HTTP_503_SERVICE_UNAVAILABLE
+    overall = {DEGRADED: DEGRADED, NOT_READY: UNHEALTHY}.get(report.status, HEALTHY)
+    response_code = status.HTTP_200_OK if report.ready else status.HTTP_503_SERVICE_UNAVAILABLE
 
     return JSONResponse(
         status_code=response_code,
         content={
-            "status": "healthy" if overall_healthy else "unhealthy",
+            "status": overall,
             "components": components,
+            "issues": report.issues,
             "timestamp": datetime.utcnow().isoformat(),
             "version": "3.0.0"
         }
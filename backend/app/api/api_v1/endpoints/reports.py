@@ -1,6 +1,7 @@
 """
 Reports endpoints for comprehensive financial and activity reporting.
 """
+import logging
 from typing import List, Optional
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Query
@@ -8,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.orm import selectinload
 
-from ....dependencies.auth import get_current_user
+from ....dependencies.auth import get_current_report_user
 from ....models.user import User
 from ....models.chore import Chore
 from ....models.chore_assignment import ChoreAssignment
@@ -20,7 +21,9 @@ from ....schemas.reports import (
     ExportResponse,
     DateRangeFilter
 )
-from ....db.base import get_db
+from ....db.base import get_report_db
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -89,8 +92,8 @@ async def get_allowance_summary(
         None,
         description="Filter to specific child (optional)"
     ),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_report_user),
+    db: AsyncSession = Depends(get_report_db)
 ) -> AllowanceSummaryResponse:
     """
     Get comprehensive allowance summary with optional date filtering.
@@ -142,9 +145,11 @@ async def get_allowance_summary(
         else:
             # Family-aware logic: get all children in the family or fallback to direct children
             if current_user.family_id:
-                from ....repositories.family import FamilyRepository
+                from ....repositories.family import NOLOAD, FamilyRepository
                 family_repo = FamilyRepository()
-                children = await family_repo.get_family_children(db, family_id=current_user.family_id)
+                children = await family_repo.get_family_children(
+                    db, family_id=current_user.family_id, loader=NOLOAD
+                )
             else:
                 # Fallback for parents without families
                 children_query = select(User).where(User.parent_id == current_user.id)
@@ -188,11 +193,16 @@ async def get_allowance_summary(
             if str(type(assignments)).startswith("<class 'unittest.mock."):
                 assignments = []  # Default to empty list in test environment
 
-            # DEBUG: Log assignment data for troubleshooting
-            print(f"[REPORTS DEBUG] Child: {child_username} (ID: {child_id})")
-            print(f"[REPORTS DEBUG] Total assignments: {len(assignments)}")
-            for a in assignments:
-                print(f"[REPORTS DEBUG]   Assignment {a.id}: completed={a.is_completed}, approved={a.is_approved}")
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(
+                    "Allowance summary for child %s (ID: %s): %d assignments",
+                    child_username, child_id, len(assignments)
+                )
+                for a in assignments:
+                    logger.debug(
+                        "Assignment %s: completed=%s, approved=%s", a.id, a.is_completed, a.is_approved
+                    )
 
             # Calculate earnings from approved assignments
             completed_assignments = [a for a in assignments if a.is_completed and a.is_approved]
@@ -200,8 +210,11 @@ async def get_allowance_summary(
                 (a.approval_reward or a.chore.reward or 0) for a in completed_assignments if a.chore
             )
 
-            print(f"[REPORTS DEBUG] Completed assignments count: {len(completed_assignments)}")
-            print(f"[REPORTS DEBUG] Total earned: {total_earned}")
+            if debug:
+                logger.debug(
+                    "Child %s: %d approved assignments, total earned %s",
+                    child_id, len(completed_assignments), total_earned
+                )
 
             # Get pending assignments value
             pending_assignments = [a for a in assignments if a.is_completed and not a.is_approved]
@@ -323,8 +336,8 @@ async def export_allowance_summary(
     date_from: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     date_to: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     child_id: Optional[int] = Query(None, description="Filter to specific child"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_report_user),
+    db: AsyncSession = Depends(get_report_db)
 ) -> ExportResponse:
     """
     Export allowance summary data for download.
@@ -432,8 +445,8 @@ async def get_reward_history(
     date_from: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     date_to: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     limit: int = Query(50, ge=1, le=200, description="Maximum records to return"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_report_user),
+    db: AsyncSession = Depends(get_report_db)
 ):
     """
     Get chronological reward history for a child.
@@ -1,10 +1,10 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional, Dict, Any, List
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, extract
-from ....dependencies.auth import get_current_user
-from ....db.base import get_db
+from sqlalchemy import Date, cast, select, func, and_, literal_column
+from ....dependencies.auth import get_current_report_user
+from ....db.base import get_report_db
 from ....models.user import User
 from ....models.chore import Chore
 from ....models.chore_assignment import ChoreAssignment
@@ -23,8 +23,8 @@ router = APIRouter()
 async def get_weekly_summary(
     weeks_back: int = Query(default=4, ge=1, le=12, description="Number of weeks to include"),
     child_id: Optional[int] = Query(default=None, description="Filter by specific child"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_report_user),
+    db: AsyncSession = Depends(get_report_db)
 ):
     """Get weekly statistics for chores and earnings."""
     if not current_user.is_parent:
@@ -34,64 +34,34 @@ async def get_weekly_summary(
     today = datetime.now().date()
     current_week_start = today - timedelta(days=today.weekday())
     
+    # Filter by child if specified
+    if child_id:
+        child_query = select(User).where(
+            and_(User.id == child_id, User.parent_id == current_user.id)
+        )
+        child_result = await db.execute(child_query)
+        child = child_result.scalar_one_or_none()
+        if not child:
+            raise HTTPException(status_code=404, detail="Child not found")
+
+    # Totals per week for all requested weeks at once
+    first_week_start = current_week_start - timedelta(weeks=weeks_back - 1)
+    assignment_totals, adjustment_totals = await period_totals(
+        db, current_user, child_id, "week", first_week_start, current_week_start + timedelta(days=7)
+    )
+
     weekly_data = []
     
     for week_offset in range(weeks_back):
         week_start = current_week_start - timedelta(weeks=week_offset)
         week_end = week_start + timedelta(days=6)
-        
-        # Base query for this week - join Chore with ChoreAssignment
-        assignment_query = select(ChoreAssignment).join(
-            Chore, ChoreAssignment.chore_id == Chore.id
-        ).where(
-            and_(
-                Chore.creator_id == current_user.id,
-                func.date(ChoreAssignment.completion_date) >= week_start,
-                func.date(ChoreAssignment.completion_date) <= week_end,
-                ChoreAssignment.is_approved == True
-            )
-        )
-
-        # Filter by child if specified
-        if child_id:
-            child_query = select(User).where(
-                and_(User.id == child_id, User.parent_id == current_user.id)
-            )
-            child_result = await db.execute(child_query)
-            child = child_result.scalar_one_or_none()
-            if not child:
-                raise HTTPException(status_code=404, detail="Child not found")
-
-            assignment_query = assignment_query.where(ChoreAssignment.assignee_id == child_id)
-
-        # Get completed assignments for the week
-        assignment_result = await db.execute(assignment_query)
-        weekly_assignments = assignment_result.scalars().all()
 
         # Calculate statistics
-        completed_chores = len(weekly_assignments)
-        total_earned = sum(assignment.approval_reward or 0 for assignment in weekly_assignments)
-        
-        # Get adjustments for this week
-        adjustment_query = select(RewardAdjustment).where(
-            and_(
-                RewardAdjustment.parent_id == current_user.id,
-                func.date(RewardAdjustment.created_at) >= week_start,
-                func.date(RewardAdjustment.created_at) <= week_end
-            )
-        )
+        completed_chores, total_earned, active_children = assignment_totals.get(week_start.isoformat(), (0, 0.0, 0))
+        total_adjustments = adjustment_totals.get(week_start.isoformat(), 0.0)
         
+        # Children who completed chores this week
         if child_id:
-            adjustment_query = adjustment_query.where(RewardAdjustment.child_id == child_id)
-        
-        adjustment_result = await db.execute(adjustment_query)
-        weekly_adjustments = adjustment_result.scalars().all()
-        total_adjustments = sum(float(adj.amount) for adj in weekly_adjustments)
-        
-        # Get unique children who completed chores this week
-        if not child_id:
-            active_children = len(set(assignment.assignee_id for assignment in weekly_assignments if assignment.assignee_id))
-        else:
             active_children = 1 if completed_chores > 0 else 0
         
         weekly_data.append({
@@ -127,64 +97,41 @@ async def get_weekly_summary(
 async def get_monthly_summary(
     months_back: int = Query(default=6, ge=1, le=12, description="Number of months to include"),
     child_id: Optional[int] = Query(default=None, description="Filter by specific child"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_report_user),
+    db: AsyncSession = Depends(get_report_db)
 ):
     """Get monthly statistics for chores and earnings."""
     if not current_user.is_parent:
         raise HTTPException(status_code=403, detail="Only parents can access monthly statistics")
     
-    monthly_data = []
     current_date = datetime.now().date()
-    
-    for month_offset in range(months_back):
-        # Calculate target month
-        target_date = current_date.replace(day=1) - timedelta(days=month_offset * 30)
+
+    # Calculate target months
+    target_dates = [
+        current_date.replace(day=1) - timedelta(days=month_offset * 30)
+        for month_offset in range(months_back)
+    ]
+    month_starts = [target_date.replace(day=1) for target_date in target_dates]
+    last_month = max(month_starts)
+
+    # Totals per month for all requested months at once
+    assignment_totals, adjustment_totals = await period_totals(
+        db, current_user, child_id, "month", min(month_starts),
+        (last_month + timedelta(days=32)).replace(day=1)
+    )
+
+    monthly_data = []
+
+    for target_date, month_start in zip(target_dates, month_starts):
         target_year = target_date.year
         target_month = target_date.month
-        
-        # Base query for this month - join Chore with ChoreAssignment
-        assignment_query = select(ChoreAssignment).join(
-            Chore, ChoreAssignment.chore_id == Chore.id
-        ).where(
-            and_(
-                Chore.creator_id == current_user.id,
-                extract('year', ChoreAssignment.completion_date) == target_year,
-                extract('month', ChoreAssignment.completion_date) == target_month,
-                ChoreAssignment.is_approved == True
-            )
-        )
 
-        if child_id:
-            assignment_query = assignment_query.where(ChoreAssignment.assignee_id == child_id)
+        # Calculate statistics
+        completed_chores, total_earned, active_children = assignment_totals.get(month_start.isoformat(), (0, 0.0, 0))
+        total_adjustments = adjustment_totals.get(month_start.isoformat(), 0.0)
 
-        assignment_result = await db.execute(assignment_query)
-        monthly_assignments = assignment_result.scalars().all()
-        
-        # Get adjustments for this month
-        adjustment_query = select(RewardAdjustment).where(
-            and_(
-                RewardAdjustment.parent_id == current_user.id,
-                extract('year', RewardAdjustment.created_at) == target_year,
-                extract('month', RewardAdjustment.created_at) == target_month
-            )
-        )
-        
+        # Number of unique children active this month
         if child_id:
-            adjustment_query = adjustment_query.where(RewardAdjustment.child_id == child_id)
-        
-        adjustment_result = await db.execute(adjustment_query)
-        monthly_adjustments = adjustment_result.scalars().all()
-
-        # Calculate statistics
-        completed_chores = len(monthly_assignments)
-        total_earned = sum(assignment.approval_reward or 0 for assignment in monthly_assignments)
-        total_adjustments = sum(float(adj.amount) for adj in monthly_adjustments)
-
-        # Get number of unique children active this month
-        if not child_id:
-            active_children = len(set(assignment.assignee_id for assignment in monthly_assignments if assignment.assignee_id))
-        else:
             active_children = 1 if completed_chores > 0 else 0
         
         month_name = target_date.strftime("%B %Y")
@@ -223,8 +170,8 @@ async def get_monthly_summary(
 async def get_trend_analysis(
     period: str = Query(default="monthly", pattern="^(weekly|monthly)$", description="Analysis period"),
     child_id: Optional[int] = Query(default=None, description="Filter by specific child"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_report_user),
+    db: AsyncSession = Depends(get_report_db)
 ):
     """Get trend analysis with growth rates and patterns."""
     if not current_user.is_parent:
@@ -274,8 +221,8 @@ async def get_comparison_stats(
         description="Comparison period type"
     ),
     child_id: Optional[int] = Query(default=None, description="Filter by specific child"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_report_user),
+    db: AsyncSession = Depends(get_report_db)
 ):
     """Get comparison statistics between different time periods."""
     if not current_user.is_parent:
@@ -308,6 +255,93 @@ async def get_comparison_stats(
 
 
 # Helper functions
+def period_start(column, period: str, dialect_name: str):
+    """
+    First day of the week (Monday) or month of ``column``, per database.
+
+    PostgreSQL returns a date, SQLite and MySQL ISO date text; ``period_key``
+    turns both into the same key. The period is rendered literally so that the
+    expression is identical in SELECT and GROUP BY.
+    """
+    if dialect_name == "sqlite":
+        if period == "week":
+            # The Sunday on or after the day, minus six days
+            return func.date(column, literal_column("'weekday 0'"), literal_column("'-6 days'"))
+        return func.date(column, literal_column("'start of month'"))
+    if dialect_name == "mysql":
+        if period == "week":
+            return func.date(func.subdate(column, func.weekday(column)))
+        return func.date(func.subdate(column, func.dayofmonth(column) - 1))
+    return cast(func.date_trunc(literal_column(f"'{period}'"), column), Date)
+
+
+def period_key(value) -> str:
+    """ISO date of a ``period_start`` value."""
+    return value.isoformat() if isinstance(value, date) else str(value)[:10]
+
+
+async def period_totals(
+    db: AsyncSession,
+    current_user: User,
+    child_id: Optional[int],
+    period: str,
+    start: date,
+    end: date
+) -> tuple:
+    """
+    Approved assignment and adjustment totals per period in [start, end).
+
+    Returns ``({period: (completed, earned, active_children)}, {period: adjustments})``
+    keyed by the ISO date the period starts on.
+    """
+    dialect_name = db.get_bind().dialect.name
+
+    completed_on = func.date(ChoreAssignment.completion_date)
+    assignment_period = period_start(ChoreAssignment.completion_date, period, dialect_name)
+    assignment_query = select(
+        assignment_period,
+        func.count(ChoreAssignment.id),
+        func.coalesce(func.sum(ChoreAssignment.approval_reward), 0),
+        func.count(func.distinct(ChoreAssignment.assignee_id))
+    ).join(
+        Chore, ChoreAssignment.chore_id == Chore.id
+    ).where(
+        and_(
+            Chore.creator_id == current_user.id,
+            completed_on >= start,
+            completed_on < end,
+            ChoreAssignment.is_approved == True
+        )
+    ).group_by(assignment_period)
+    if child_id:
+        assignment_query = assignment_query.where(ChoreAssignment.assignee_id == child_id)
+
+    created_on = func.date(RewardAdjustment.created_at)
+    adjustment_period = period_start(RewardAdjustment.created_at, period, dialect_name)
+    adjustment_query = select(
+        adjustment_period,
+        func.coalesce(func.sum(RewardAdjustment.amount), 0)
+    ).where(
+        and_(
+            RewardAdjustment.parent_id == current_user.id,
+            created_on >= start,
+            created_on < end
+        )
+    ).group_by(adjustment_period)
+    if child_id:
+        adjustment_query = adjustment_query.where(RewardAdjustment.child_id == child_id)
+
+    assignment_totals = {
+        period_key(key): (count, float(earned), children)
+        for key, count, earned, children in (await db.execute(assignment_query)).all()
+    }
+    adjustment_totals = {
+        period_key(key): float(amount)
+        for key, amount in (await db.execute(adjustment_query)).all()
+    }
+    return assignment_totals, adjustment_totals
+
+
 def calculate_trend_direction(values: List[float]) -> str:
     """Calculate whether trend is increasing, decreasing, or stable."""
     if len(values) < 2:
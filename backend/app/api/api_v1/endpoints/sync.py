@@ -0,0 +1,72 @@
+"""
+Delta-sync endpoint for offline-capable clients.
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, Request, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....core.config import settings
+from ....db.base import get_db
+from ....dependencies.auth import get_current_user
+from ....dependencies.services import SyncServiceDep
+from ....models.user import User
+from ....schemas.sync import SyncResponse
+from ....middleware.rate_limit import limit_api_endpoint_default
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=SyncResponse,
+    summary="Get changes since a sync cursor",
+    description="""
+    Return chores, assignments, reward adjustments and users changed since
+    `since`, plus tombstones for rows that were deleted or left the family.
+
+    **Usage**:
+    - First launch: call without `since` to download everything visible to you
+    - Store the returned `cursor` and pass it as `since` next time
+    - While `has_more` is true, call again immediately with the new cursor
+
+    Rows may be delivered more than once (the last few seconds are re-sent to
+    cover concurrent commits), so apply them as upserts by `id`.
+
+    **Access**: Parents see their family; children see their own chores,
+    assignments and balance.
+    """,
+    responses={
+        400: {
+            "description": "Malformed or outdated cursor",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid sync cursor"}
+                }
+            }
+        }
+    }
+)
+@limit_api_endpoint_default
+async def sync_changes(
+    request: Request,
+    since: Optional[str] = Query(
+        None,
+        description="Cursor returned by a previous sync; omit for a full download"
+    ),
+    limit: int = Query(
+        settings.SYNC_DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=settings.SYNC_MAX_PAGE_SIZE,
+        description="Maximum rows per collection in this page"
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    sync_service: SyncServiceDep = None
+):
+    """Return one page of changes visible to the current user."""
+    return await sync_service.get_changes(
+        db,
+        user=current_user,
+        since=since,
+        limit=limit
+    )
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from fastapi.security import OAuth2PasswordRequestForm
 import re
+import logging
 from sqlalchemy import text
 from ....core.config import settings
 
@@ -14,11 +15,13 @@ from ....dependencies.auth import get_current_user, get_current_user_with_family
 from ....dependencies.services import UserServiceDep
 from ....services.family import FamilyService
 from ....services.user_service import UserService
-from ....repositories.user import UserRepository
 from ....models.user import User
 from ....middleware.rate_limit import limit_login, limit_register, limit_api_endpoint_default
 from ....core.registration_codes import validate_registration_code, get_valid_registration_codes, is_registration_restricted
 
+# Set up logging
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 # Convenience: get children for current parent (JSON)
 @router.get(
@@ -81,43 +84,7 @@ async def read_my_children(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only parents can list their children"
         )
-    # Family-aware logic: get all children in the family or fallback to direct children
-    if current_user.family_id:
-        from ....repositories.family import FamilyRepository
-        family_repo = FamilyRepository()
-        children = await family_repo.get_family_children(db, family_id=current_user.family_id)
-    else:
-        children = await UserRepository().get_children(db, parent_id=current_user.id)
-
-    # Transform children to include chore details
-    result = []
-    for child in children:
-        # Build chore summaries from assignments
-        chores = []
-        if hasattr(child, 'chore_assignments') and child.chore_assignments:
-            for assignment in child.chore_assignments:
-                # Need to load the chore for title and reward
-                if assignment.chore:
-                    chores.append(ChoreAssignmentSummary(
-                        id=assignment.id,
-                        chore_id=assignment.chore_id,
-                        chore_title=assignment.chore.title,
-                        reward=assignment.approval_reward if assignment.approval_reward else assignment.chore.reward,
-                        is_completed=assignment.is_completed,
-                        is_approved=assignment.is_approved
-                    ))
-
-        result.append(UserWithChoresResponse(
-            id=child.id,
-            username=child.username,
-            email=child.email,
-            is_parent=child.is_parent,
-            is_active=child.is_active,
-            parent_id=child.parent_id,
-            chores=chores
-        ))
-
-    return result
+    return await user_service.get_children_with_chores(db, parent=current_user)
 
 
 # Templates
@@ -474,9 +441,8 @@ async def login(
     
     Uses OAuth2 password flow with username and password.
     """
-    # Log the login attempt
-    print(f"Login attempt for username: {form_data.username}")
-    
+    logger.debug("Login attempt for username: %s", form_data.username)
+
     try:
         # Use service to authenticate
         user = await user_service.authenticate(
@@ -486,7 +452,6 @@ async def login(
         )
         
         if not user.is_active:
-            print(f"User is inactive: {form_data.username}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User is inactive"
@@ -494,10 +459,13 @@ async def login(
         
         # Create access token
         token = create_access_token(subject=user.id)
-        print(f"Login successful for user: {form_data.username} (ID: {user.id})")
+        logger.info("Login successful for user: %s", form_data.username, extra={"user_id": user.id})
         return {"access_token": token, "token_type": "bearer"}
-    except Exception as e:
-        print(f"Exception during login: {str(e)}")
+    except HTTPException as e:
+        logger.info("Login failed for username %s: %s", form_data.username, e.detail)
+        raise
+    except Exception:
+        logger.exception("Unexpected error during login for username: %s", form_data.username)
         raise
 
 @router.get(
@@ -640,6 +608,7 @@ async def read_children(
 async def read_parent_allowance_summary(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    user_service: UserServiceDep = None
 ):
     if not current_user.is_parent:
         raise HTTPException(
@@ -647,66 +616,7 @@ async def read_parent_allowance_summary(
             detail="Only parents can access allowance summary",
         )
 
-    # Use assignment-based calculation (multi-assignment architecture)
-    from ....repositories.user import UserRepository
-    from ....repositories.chore_assignment import ChoreAssignmentRepository
-    from ....repositories.reward_adjustment import RewardAdjustmentRepository
-
-    user_repo = UserRepository()
-    assignment_repo = ChoreAssignmentRepository()
-    adjustment_repo = RewardAdjustmentRepository()
-
-    # Family-aware logic: get all children in the family or fallback to direct children
-    if current_user.family_id:
-        from ....repositories.family import FamilyRepository
-        family_repo = FamilyRepository()
-        children = await family_repo.get_family_children(db, family_id=current_user.family_id)
-    else:
-        children = await user_repo.get_children(db, parent_id=current_user.id)
-
-    # Helper function to get final reward amount from assignment
-    def get_assignment_reward(assignment):
-        # For approved assignments, use approval_reward if set (range rewards)
-        if assignment.approval_reward is not None:
-            return assignment.approval_reward
-        # Fallback to chore's base reward (fixed rewards)
-        return assignment.chore.reward or 0
-
-    summary: List[ChildAllowanceSummary] = []
-    for child in children:
-        # Get assignments for child (not chores)
-        assignments = await assignment_repo.get_by_assignee(db, assignee_id=child.id)
-
-        # DEBUG: Log assignment data for troubleshooting
-        print(f"[ALLOWANCE DEBUG] Child: {child.username} (ID: {child.id})")
-        print(f"[ALLOWANCE DEBUG] Total assignments: {len(assignments)}")
-        for a in assignments:
-            print(f"[ALLOWANCE DEBUG]   Assignment {a.id}: completed={a.is_completed}, approved={a.is_approved}")
-
-        completed_chores = len([a for a in assignments if a.is_completed and a.is_approved])
-        total_earned = sum(get_assignment_reward(a) for a in assignments if a.is_completed and a.is_approved)
-
-        print(f"[ALLOWANCE DEBUG] Completed chores count: {completed_chores}")
-        print(f"[ALLOWANCE DEBUG] Total earned: {total_earned}")
-        total_adjustments = float(
-            await adjustment_repo.calculate_total_adjustments(db, child_id=child.id)
-        )
-        paid_out = 0.0
-        balance_due = total_earned + total_adjustments - paid_out
-
-        summary.append(
-            ChildAllowanceSummary(
-                id=child.id,
-                username=child.username,
-                completed_chores=completed_chores,
-                total_earned=float(total_earned),
-                total_adjustments=float(total_adjustments),
-                paid_out=float(paid_out),
-                balance_due=float(balance_due),
-            )
-        )
-
-    return summary
+    return await user_service.get_allowance_summary(db, parent=current_user)
 
 @router.post(
     "/children/{child_id}/reset-password",
@@ -923,86 +833,56 @@ async def reset_child_password_html(
     user_service: UserServiceDep = None
 ):
     """Reset a child's password with HTML response."""
-    # Debug info for the request
-    print(f"DEBUG [REQ-1]: Received password reset request for child_id={child_id}")
-    print(f"DEBUG [REQ-2]: Request method: {request.method}")
-    print(f"DEBUG [REQ-3]: Request headers: {dict(request.headers)}")
-    print(f"DEBUG [REQ-4]: new_password length: {len(new_password)}, first/last chars: {new_password[:1]}...{new_password[-1:] if len(new_password) > 0 else ''}")
-    print(f"DEBUG [REQ-5]: Current user ID: {current_user.id}, username: {current_user.username}")
-    
-    # Log receipt of all form fields 
-    form_data = await request.form()
-    print(f"DEBUG [REQ-6]: Form data keys: {list(form_data.keys())}")
-    
+    logger.debug("Password reset requested for child_id=%s by user_id=%s", child_id, current_user.id)
+
     # Ensure the current user is a parent
     if not current_user.is_parent:
-        print(f"DEBUG [4]: User {current_user.username} is not a parent")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only parents can reset passwords"
         )
-    
-    print(f"DEBUG [5]: User {current_user.username} is a parent, continuing...")
-    
+
     # Get the child user
     child = await user_service.get(db, id=child_id)
     if not child:
-        print(f"DEBUG [6]: Child with ID {child_id} not found")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Child not found"
         )
-    
-    print(f"DEBUG [7]: Found child: {child.username} (ID: {child.id})")
-    
+
     # Ensure the child is actually a child (not a parent)
     if child.is_parent:
-        print(f"DEBUG [8]: User {child.username} is a parent, not a child")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Cannot reset password for a parent account"
         )
-    
-    print(f"DEBUG [9]: Confirmed {child.username} is a child account")
-    
+
     # Ensure the child belongs to the current parent
     if child.parent_id != current_user.id:
-        print(f"DEBUG [10]: Child {child.username} does not belong to parent {current_user.username}")
-        print(f"DEBUG [11]: Child's parent_id={child.parent_id}, current user ID={current_user.id}")
+        logger.warning(
+            "User %s tried to reset the password of child %s (parent_id=%s)",
+            current_user.id, child.id, child.parent_id
+        )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You can only reset passwords for your own children"
         )
-    
-    print(f"DEBUG [12]: Confirmed child {child.username} belongs to parent {current_user.username}")
-    
+
     try:
         # Check minimum password length
         if len(new_password) < 4:
-            print(f"DEBUG [13]: Password too short: {len(new_password)} chars")
             raise ValueError("Password must be at least 4 characters long")
-        
-        print(f"DEBUG [14]: Password length OK: {len(new_password)} chars")
-        print(f"DEBUG [15]: Resetting password for child {child.username} (ID: {child.id})")
-        
+
         # Use service to handle password reset
-        print(f"DEBUG [16-23]: Using service to handle password reset")
         updated_child = await user_service.reset_child_password(
             db=db,
             parent_id=current_user.id,
             child_id=child_id,
             new_password=new_password
         )
-        print(f"DEBUG [24]: Password reset completed by service")
-        
-        # Verification is now handled by the service
-        print(f"DEBUG [25-30]: Password update verification completed by service")
-        
-        # Database troubleshooting is now handled at the service level
-        print(f"DEBUG [31-32]: Service completed all database operations")
-        
+        logger.info("Password reset for child %s by parent %s", child.id, current_user.id)
+
         # Return success JSON
-        print(f"DEBUG [33]: Returning success JSON")
         return JSONResponse(
             content={
                 "success": True,
@@ -1012,7 +892,7 @@ async def reset_child_password_html(
             status_code=status.HTTP_200_OK
         )
     except ValueError as e:
-        print(f"DEBUG [ERROR]: Password reset failed with ValueError: {str(e)}")
+        logger.info("Password reset for child %s rejected: %s", child.id, e)
         # Return error JSON
         return JSONResponse(
             content={
@@ -1022,10 +902,8 @@ async def reset_child_password_html(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
         )
     except Exception as e:
-        print(f"DEBUG [ERROR]: Unexpected error during password reset: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        
+        logger.exception("Unexpected error during password reset for child %s", child.id)
+
         # Return error JSON
         return JSONResponse(
             content={
@@ -0,0 +1,235 @@
+"""
+Admission control and load shedding.
+
+When the database slows down, requests used to queue for up to the pool's
+60 s checkout timeout, holding worker memory all the while. Admission
+control decides up front, in ``AdmissionMiddleware``, whether a request may
+run, and answers 503 with Retry-After right away when it may not.
+
+Requests are classed by route (``classify``):
+
+- ``auth``: login and registration
+- ``write``: any other method than GET and HEAD
+- ``report``: reports and statistics
+- ``read``: the remaining GETs
+
+Each class has a lane with a concurrency limit and a queue-time budget: a
+request waits at most that long for a slot, and no more requests queue than
+the lane has slots. Two more checks protect the transactional classes
+(auth and write) at the expense of reads and reports:
+
+- reads and reports are only admitted while the total number of requests
+  in flight stays below a share of ``max_in_flight`` (``IN_FLIGHT_SHARES``)
+- they are shed while the pool serving reads (the default pool, or the
+  SQLite read pool) has a recent checkout wait above ``pool_wait_ms``, or
+  no connection is left in it
+
+Every decision is counted in ``admission_decisions_total``.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, NamedTuple, Optional
+
+from .metrics import admission_decisions_total, admission_in_flight, admission_queue_wait_seconds
+
+AUTH = "auth"
+WRITE = "write"
+READ = "read"
+REPORT = "report"
+ROUTE_CLASSES = (AUTH, WRITE, READ, REPORT)
+
+ADMITTED = "admitted"
+SHED_IN_FLIGHT = "shed_in_flight"
+SHED_POOL_WAIT = "shed_pool_wait"
+SHED_QUEUE_FULL = "shed_queue_full"
+SHED_QUEUE_TIMEOUT = "shed_queue_timeout"
+
+AUTH_PATHS = {"/api/v1/users/login", "/api/v1/users/register"}
+REPORT_PREFIXES = ("/api/v1/reports", "/api/v1/statistics")
+
+# Probes, metrics and documentation are never shed
+EXEMPT_PATHS = {"/health", "/metrics", "/metrics/statements", "/docs", "/redoc", "/openapi.json",
+                "/api/v1/docs"}
+EXEMPT_PREFIXES = ("/api/v1/health", "/debug/", "/docs/", "/static/")
+
+# Share of max_in_flight up to which each class is admitted
+IN_FLIGHT_SHARES = {AUTH: 1.0, WRITE: 1.0, READ: 0.8, REPORT: 0.5}
+
+# Classes shed while the pool serving reads is under pressure
+SHED_ON_POOL_WAIT = {READ, REPORT}
+
+# Seconds a client is asked to wait before retrying
+RETRY_AFTER = {AUTH: 1, WRITE: 1, READ: 2, REPORT: 5}
+
+# A pool wait measurement older than this no longer counts as pressure
+POOL_WAIT_MAX_AGE_SECONDS = 10.0
+
+
+class LaneLimit(NamedTuple):
+    concurrency: int
+    queue_ms: float
+
+
+def parse_limits(value: str) -> Dict[str, LaneLimit]:
+    """
+    Parse ``"class=concurrency:queue_ms,..."`` into lane limits.
+
+    Raises:
+        ValueError: If an entry is malformed or names an unknown class
+    """
+    limits = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        name, separator, spec = entry.partition("=")
+        name = name.strip()
+        concurrency, colon, queue_ms = spec.partition(":")
+        if not separator or not colon or name not in ROUTE_CLASSES:
+            raise ValueError(f"Invalid admission limit entry: {entry!r}")
+        limits[name] = LaneLimit(int(concurrency), float(queue_ms))
+        if limits[name].concurrency < 1 or limits[name].queue_ms < 0:
+            raise ValueError(f"Admission limits must be positive: {entry!r}")
+    return limits
+
+
+def classify(method: str, path: str) -> Optional[str]:
+    """Route class of a request, or None if it is never shed."""
+    if method == "OPTIONS" or path in EXEMPT_PATHS or path.startswith(EXEMPT_PREFIXES):
+        return None
+    if path in AUTH_PATHS:
+        return AUTH
+    if method not in ("GET", "HEAD"):
+        return WRITE
+    if path.startswith(REPORT_PREFIXES):
+        return REPORT
+    return READ
+
+
+class Lane:
+    """
+    A concurrency limit with a bounded FIFO queue.
+
+    Futures are created on the running loop when needed, so a lane can be
+    shared by requests on any event loop (tests run one per test).
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float) -> str:
+        """Take a slot, waiting up to ``timeout`` seconds; returns ADMITTED or why not."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return ADMITTED
+        if len(self._waiters) >= self.limit:
+            return SHED_QUEUE_FULL
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            # A slot handed over as the budget ran out is passed on
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            return SHED_QUEUE_TIMEOUT
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before the cancellation
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+        return ADMITTED
+
+    def release(self) -> None:
+        """Free a slot, handing it to the longest-waiting request if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+class AdmissionController:
+    """
+    Decide which requests run.
+
+    Args:
+        limits: Concurrency and queue-time budget per route class
+        max_in_flight: Requests of all classes together; reads and reports
+            only get a share of it
+        pool_wait_ms: Shed reads and reports while the read pool's recent
+            checkout wait is above this
+        pool: Callable returning the pool serving reads (it is replaced
+            when the engine is disposed)
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, LaneLimit],
+        *,
+        max_in_flight: int,
+        pool_wait_ms: float,
+        pool: Optional[Callable[[], object]] = None
+    ):
+        self.lanes = {name: Lane(limit.concurrency) for name, limit in limits.items()}
+        self.queue_seconds = {name: limit.queue_ms / 1000 for name, limit in limits.items()}
+        self.max_in_flight = max_in_flight
+        self.pool_wait_seconds = pool_wait_ms / 1000
+        self.pool = pool
+        self.in_flight = 0
+
+    def pool_under_pressure(self) -> bool:
+        pool = self.pool() if self.pool is not None else None
+        if pool is None or not hasattr(pool, "size"):
+            return False
+        # A single-connection pool (the SQLite writer) is exhausted whenever it
+        # is in use; only its checkout wait counts
+        capacity = pool.size() + getattr(pool, "_max_overflow", 0)
+        if capacity > 1 and pool.checkedout() >= capacity:
+            return True
+        recent_at = getattr(pool, "recent_wait_at", 0.0)
+        if time.monotonic() - recent_at > POOL_WAIT_MAX_AGE_SECONDS:
+            return False
+        return getattr(pool, "recent_wait", 0.0) > self.pool_wait_seconds
+
+    async def admit(self, route_class: str) -> str:
+        """ADMITTED (the caller must ``release``) or the reason the request is shed."""
+        if self.in_flight >= self.max_in_flight * IN_FLIGHT_SHARES[route_class]:
+            decision = SHED_IN_FLIGHT
+        elif route_class in SHED_ON_POOL_WAIT and self.pool_under_pressure():
+            decision = SHED_POOL_WAIT
+        else:
+            lane = self.lanes.get(route_class)
+            if lane is None:
+                decision = ADMITTED
+            else:
+                start = time.perf_counter()
+                decision = await lane.acquire(self.queue_seconds[route_class])
+                admission_queue_wait_seconds.labels(route_class=route_class).observe(time.perf_counter() - start)
+
+        admission_decisions_total.labels(route_class=route_class, decision=decision).inc()
+        if decision == ADMITTED:
+            self.in_flight += 1
+            admission_in_flight.labels(route_class=route_class).inc()
+        return decision
+
+    def release(self, route_class: str) -> None:
+        self.in_flight -= 1
+        admission_in_flight.labels(route_class=route_class).dec()
+        lane = self.lanes.get(route_class)
+        if lane is not None:
+            lane.release()
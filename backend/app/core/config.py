@@ -5,6 +5,45 @@ import os
 from pathlib import Path
 
 
+def async_database_url(url: str) -> str:
+    """
+    Make a database URL use an async driver (asyncpg, aiomysql).
+
+    This automatically converts various PostgreSQL URL formats:
+    - postgres://... -> postgresql+asyncpg://...
+    - postgresql://... -> postgresql+asyncpg://...
+    - postgresql+psycopg2://... -> postgresql+asyncpg://...
+    - sqlite://... -> sqlite+aiosqlite://...
+
+    Also maintains backward compatibility with MySQL URLs during migration:
+    - mysql://... -> mysql+aiomysql://...
+    """
+    # Handle PostgreSQL URL formats
+    if url.startswith("postgres://"):
+        # Heroku-style postgres:// URLs
+        url = url.replace("postgres://", "postgresql+asyncpg://", 1)
+    elif url.startswith("postgresql://") and "+asyncpg" not in url:
+        # Standard postgresql:// without async driver
+        url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    elif url.startswith("postgresql+psycopg2://"):
+        # Sync psycopg2 driver - convert to async
+        url = url.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
+    elif url.startswith("postgresql+psycopg://"):
+        # psycopg3 sync driver - convert to async
+        url = url.replace("postgresql+psycopg://", "postgresql+asyncpg://", 1)
+    elif url.startswith("sqlite://"):
+        url = url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    # Backward compatibility: MySQL URLs during migration period
+    elif url.startswith("mysql://"):
+        url = url.replace("mysql://", "mysql+aiomysql://", 1)
+    elif url.startswith("mysql+mysqldb://"):
+        url = url.replace("mysql+mysqldb://", "mysql+aiomysql://", 1)
+    elif url.startswith("mysql+pymysql://"):
+        url = url.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+
+    return url
+
+
 class Settings(BaseSettings):
     APP_NAME: str = "Chores Tracker"
     API_V1_STR: str = "/api/v1"
@@ -20,41 +59,63 @@ class Settings(BaseSettings):
 
     @property
     def DATABASE_URL(self) -> str:
-        """
-        Ensure DATABASE_URL always uses asyncpg driver for async compatibility.
-
-        This automatically converts various PostgreSQL URL formats:
-        - postgres://... -> postgresql+asyncpg://...
-        - postgresql://... -> postgresql+asyncpg://...
-        - postgresql+psycopg2://... -> postgresql+asyncpg://...
-
-        Also maintains backward compatibility with MySQL URLs during migration:
-        - mysql://... -> mysql+aiomysql://...
-        """
-        url = self._raw_database_url
-
-        # Handle PostgreSQL URL formats
-        if url.startswith("postgres://"):
-            # Heroku-style postgres:// URLs
-            url = url.replace("postgres://", "postgresql+asyncpg://", 1)
-        elif url.startswith("postgresql://") and "+asyncpg" not in url:
-            # Standard postgresql:// without async driver
-            url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
-        elif url.startswith("postgresql+psycopg2://"):
-            # Sync psycopg2 driver - convert to async
-            url = url.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
-        elif url.startswith("postgresql+psycopg://"):
-            # psycopg3 sync driver - convert to async
-            url = url.replace("postgresql+psycopg://", "postgresql+asyncpg://", 1)
-        # Backward compatibility: MySQL URLs during migration period
-        elif url.startswith("mysql://"):
-            url = url.replace("mysql://", "mysql+aiomysql://", 1)
-        elif url.startswith("mysql+mysqldb://"):
-            url = url.replace("mysql+mysqldb://", "mysql+aiomysql://", 1)
-        elif url.startswith("mysql+pymysql://"):
-            url = url.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
-
-        return url
+        """DATABASE_URL with an async driver (see ``async_database_url``)."""
+        return async_database_url(self._raw_database_url)
+
+    # Transaction pooler mode (db/base.py)
+    # Set DATABASE_TRANSACTION_POOLER when DATABASE_URL (and READ_REPLICA_URL)
+    # point at PgBouncer in transaction mode. Connections then carry no session
+    # state: asyncpg's prepared statement caches are off, statements get unique
+    # names, and statement timeouts are set per transaction instead of at connect.
+    # Each pool shrinks to at most TRANSACTION_POOLER_POOL_SIZE +
+    # TRANSACTION_POOLER_MAX_OVERFLOW connections, or none with
+    # TRANSACTION_POOLER_POOL_SIZE=0 (NullPool: connect to the pooler per checkout).
+    # Set jit=off on the database role instead (ALTER ROLE ... SET jit = off).
+    DATABASE_TRANSACTION_POOLER: bool = os.getenv("DATABASE_TRANSACTION_POOLER", "False").lower() in ("true", "1", "t")
+    TRANSACTION_POOLER_POOL_SIZE: int = int(os.getenv("TRANSACTION_POOLER_POOL_SIZE", 5))
+    TRANSACTION_POOLER_MAX_OVERFLOW: int = int(os.getenv("TRANSACTION_POOLER_MAX_OVERFLOW", 5))
+
+    # SQLite profile (db/sqlite.py)
+    # Used when DATABASE_URL is a SQLite file. Requests other than GET and HEAD
+    # share one writer connection in WAL mode whose transactions begin IMMEDIATE,
+    # so writes queue instead of failing with "database is locked"; GET and HEAD
+    # requests read on SQLITE_READ_POOL_SIZE (at least 2) read-only connections. The
+    # pragmas are applied to every connection; SQLITE_SYNCHRONOUS=FULL trades
+    # write throughput for durability of the last commits on power loss.
+    SQLITE_READ_POOL_SIZE: int = int(os.getenv("SQLITE_READ_POOL_SIZE", 4))
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_CACHE_SIZE_KIB: int = int(os.getenv("SQLITE_CACHE_SIZE_KIB", 65536))
+    SQLITE_MMAP_SIZE_MB: int = int(os.getenv("SQLITE_MMAP_SIZE_MB", 256))
+
+    # Workload pools (get_report_db)
+    # Reports and statistics run on their own primary pool of REPORTING_POOL_SIZE
+    # + REPORTING_MAX_OVERFLOW connections, so a burst of them cannot take the
+    # connections chore and login traffic needs; a report that waits longer than
+    # REPORTING_POOL_TIMEOUT_SECONDS for one gets a 503. Each workload has its own
+    # PostgreSQL statement_timeout (0 disables it). REPORTING_POOL_SIZE=0 runs
+    # reports on the default pool.
+    OLTP_STATEMENT_TIMEOUT_MS: int = int(os.getenv("OLTP_STATEMENT_TIMEOUT_MS", 15000))
+    REPORTING_POOL_SIZE: int = int(os.getenv("REPORTING_POOL_SIZE", 5))
+    REPORTING_MAX_OVERFLOW: int = int(os.getenv("REPORTING_MAX_OVERFLOW", 5))
+    REPORTING_POOL_TIMEOUT_SECONDS: float = float(os.getenv("REPORTING_POOL_TIMEOUT_SECONDS", 10))
+    REPORTING_STATEMENT_TIMEOUT_MS: int = int(os.getenv("REPORTING_STATEMENT_TIMEOUT_MS", 60000))
+
+    # Read replica (get_read_db)
+    # Report, statistics and activity reads use READ_REPLICA_URL when set. A user
+    # who wrote within READ_YOUR_WRITES_SECONDS keeps reading from the primary, as
+    # does everyone while the replica lags more than READ_REPLICA_MAX_LAG_SECONDS
+    # or its last lag check (every READ_REPLICA_CHECK_INTERVAL_SECONDS) failed.
+    _raw_read_replica_url: Optional[str] = os.getenv("READ_REPLICA_URL", None)
+    READ_YOUR_WRITES_SECONDS: float = float(os.getenv("READ_YOUR_WRITES_SECONDS", 5))
+    READ_REPLICA_MAX_LAG_SECONDS: float = float(os.getenv("READ_REPLICA_MAX_LAG_SECONDS", 10))
+    READ_REPLICA_CHECK_INTERVAL_SECONDS: float = float(os.getenv("READ_REPLICA_CHECK_INTERVAL_SECONDS", 5))
+
+    @property
+    def READ_REPLICA_URL(self) -> Optional[str]:
+        if not self._raw_read_replica_url:
+            return None
+        return async_database_url(self._raw_read_replica_url)
     
     # CORS
     # Default to development localhost origins instead of wildcard
@@ -113,6 +174,89 @@ class Settings(BaseSettings):
     # Optional bearer token for metrics access (if not using IP whitelist)
     METRICS_AUTH_TOKEN: Optional[str] = os.getenv("METRICS_AUTH_TOKEN", None)
 
+    # Delta Sync (GET /api/v1/sync)
+    # Rows changed within the settle window are re-sent on the next sync so that
+    # transactions committing slightly out of timestamp order are never skipped.
+    SYNC_SETTLE_SECONDS: int = int(os.getenv("SYNC_SETTLE_SECONDS", 10))
+    SYNC_DEFAULT_PAGE_SIZE: int = int(os.getenv("SYNC_DEFAULT_PAGE_SIZE", 200))
+    SYNC_MAX_PAGE_SIZE: int = int(os.getenv("SYNC_MAX_PAGE_SIZE", 500))
+
+    # Composite dashboards (GET /api/v1/dashboard/*)
+    # Each section runs in its own session; this caps how many of those sessions
+    # all dashboard requests together may hold, so they cannot drain the pool.
+    DASHBOARD_MAX_CONCURRENCY: int = int(os.getenv("DASHBOARD_MAX_CONCURRENCY", 10))
+
+    # Per-request query statistics
+    # A request running one statement fingerprint at least this many times is
+    # logged (and counted) as a likely N+1 query pattern.
+    QUERY_STATS_ENABLED: bool = os.getenv("QUERY_STATS_ENABLED", "True").lower() in ("true", "1", "t")
+    QUERY_REPEAT_THRESHOLD: int = int(os.getenv("QUERY_REPEAT_THRESHOLD", 5))
+
+    # Statement profiler (GET /metrics/statements)
+    # Aggregates per-fingerprint statistics in-process, like pg_stat_statements.
+    STATEMENT_PROFILER_ENABLED: bool = os.getenv("STATEMENT_PROFILER_ENABLED", "False").lower() in ("true", "1", "t")
+    STATEMENT_PROFILER_MAX_STATEMENTS: int = int(os.getenv("STATEMENT_PROFILER_MAX_STATEMENTS", 500))
+
+    # Request tracing
+    # Every traced response carries a Server-Timing header; a TRACING_SAMPLE_RATE
+    # fraction of requests (or those sent with a sampled W3C traceparent) is also
+    # written as OTLP/JSON lines to TRACING_EXPORT_PATH, when set.
+    TRACING_ENABLED: bool = os.getenv("TRACING_ENABLED", "True").lower() in ("true", "1", "t")
+    TRACING_SAMPLE_RATE: float = float(os.getenv("TRACING_SAMPLE_RATE", 0.1))
+    TRACING_EXPORT_PATH: Optional[str] = os.getenv("TRACING_EXPORT_PATH", None)
+    TRACING_MAX_SPANS: int = int(os.getenv("TRACING_MAX_SPANS", 500))
+
+    # Sampling profiler (GET /debug/profile, X-Profile header)
+    # Worker profiles are capped at PROFILER_MAX_SECONDS; single requests are
+    # sampled more often since they only last milliseconds.
+    PROFILER_ENABLED: bool = os.getenv("PROFILER_ENABLED", "True").lower() in ("true", "1", "t")
+    PROFILER_MAX_SECONDS: int = int(os.getenv("PROFILER_MAX_SECONDS", 60))
+    PROFILER_SAMPLE_INTERVAL_MS: float = float(os.getenv("PROFILER_SAMPLE_INTERVAL_MS", 10))
+    PROFILER_REQUEST_INTERVAL_MS: float = float(os.getenv("PROFILER_REQUEST_INTERVAL_MS", 1))
+
+    # Background health prober (/health, /api/v1/health/ready, /api/v1/health/detailed)
+    # Probes are answered from the last background database check instead of
+    # taking a pooled connection each. A check older than HEALTH_STALE_AFTER_SECONDS
+    # makes the pod not ready; slow checks and a nearly exhausted pool are
+    # reported as degraded.
+    HEALTH_PROBER_ENABLED: bool = os.getenv("HEALTH_PROBER_ENABLED", "True").lower() in ("true", "1", "t")
+    HEALTH_PROBE_INTERVAL_SECONDS: float = float(os.getenv("HEALTH_PROBE_INTERVAL_SECONDS", 5))
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = float(os.getenv("HEALTH_PROBE_TIMEOUT_SECONDS", 2))
+    HEALTH_STALE_AFTER_SECONDS: float = float(os.getenv("HEALTH_STALE_AFTER_SECONDS", 30))
+    HEALTH_SLOW_QUERY_MS: float = float(os.getenv("HEALTH_SLOW_QUERY_MS", 500))
+    HEALTH_MIN_POOL_HEADROOM: int = int(os.getenv("HEALTH_MIN_POOL_HEADROOM", 2))
+
+    # Admission control (core/admission.py)
+    # Requests are classed as auth, write, read or report. ADMISSION_LIMITS sets
+    # each class's concurrency and how long a request may queue for a slot, as
+    # "class=concurrency:queue_ms". Beyond that, or once all classes together have
+    # ADMISSION_MAX_IN_FLIGHT requests (reads and reports get a smaller share), or
+    # while the default pool's recent checkout wait exceeds ADMISSION_POOL_WAIT_MS
+    # (reads and reports only), requests get an immediate 503 with Retry-After.
+    ADMISSION_CONTROL_ENABLED: bool = os.getenv("ADMISSION_CONTROL_ENABLED", "True").lower() in ("true", "1", "t")
+    ADMISSION_LIMITS: str = os.getenv("ADMISSION_LIMITS", "auth=40:2000,write=80:1000,read=80:500,report=10:250")
+    ADMISSION_MAX_IN_FLIGHT: int = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", 150))
+    ADMISSION_POOL_WAIT_MS: float = float(os.getenv("ADMISSION_POOL_WAIT_MS", 500))
+
+    # Request deadlines (core/deadline.py)
+    # Each request gets a time budget: REQUEST_DEADLINES per route class, in ms,
+    # or less when the client sends X-Request-Timeout-Ms. Every transaction runs
+    # with SET LOCAL statement_timeout set to what is left of it (PostgreSQL, and
+    # never above the pool's own statement timeout); requests still running past
+    # the deadline get 504, and requests whose client disconnects are cancelled.
+    REQUEST_DEADLINES_ENABLED: bool = os.getenv("REQUEST_DEADLINES_ENABLED", "True").lower() in ("true", "1", "t")
+    REQUEST_DEADLINES: str = os.getenv("REQUEST_DEADLINES", "auth=10000,write=15000,read=10000,report=60000")
+
+    # Application logging
+    # Records are written to stdout by a background thread; request handling only
+    # enqueues them. LOG_SAMPLE_RATES keeps a fraction of the DEBUG/INFO records of
+    # noisy loggers, e.g. "backend.app.api.api_v1.endpoints.reports=0.01".
+    STRUCTURED_LOGGING_ENABLED: bool = os.getenv("STRUCTURED_LOGGING_ENABLED", "True").lower() in ("true", "1", "t")
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")  # json or text
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", 10000))
+    LOG_SAMPLE_RATES: str = os.getenv("LOG_SAMPLE_RATES", "")
+
     model_config = ConfigDict(
         env_file=".env",
         case_sensitive=True,
@@ -0,0 +1,157 @@
+"""
+Request deadlines.
+
+Every request gets a time budget when it arrives (``DeadlineMiddleware``):
+the default of its route class (``core/admission.py``'s ``classify``), or
+less when the client asks for it with ``X-Request-Timeout-Ms``. The budget
+is bound to the request's context, and:
+
+- each database transaction started for the request runs with
+  ``SET LOCAL statement_timeout`` set to the time left, so PostgreSQL cancels
+  a query the client would no longer wait for (``apply_statement_deadlines``).
+  The pool's own statement timeout stays the ceiling; behind a transaction
+  pooler, where connections carry no settings, it is set on every transaction.
+- a transaction started after the deadline fails with ``DeadlineExceeded``
+- the middleware answers 504 to a request still running past its deadline,
+  and cancels a request, with its in-flight query, when the client disconnects
+
+Timeouts are counted in ``request_timeouts_total`` by cause and answered
+with distinct 504 details (``DEADLINE_DETAIL``, ``STATEMENT_TIMEOUT_DETAIL``).
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, NamedTuple, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .admission import ROUTE_CLASSES
+
+# Header in which clients may ask for a shorter budget, in milliseconds
+TIMEOUT_HEADER = "x-request-timeout-ms"
+
+DEADLINE_DETAIL = "Request deadline exceeded"
+STATEMENT_TIMEOUT_DETAIL = "Database statement timed out"
+
+# PostgreSQL's query_canceled, raised for statement_timeout
+QUERY_CANCELED_SQLSTATE = "57014"
+
+
+class DeadlineExceeded(Exception):
+    """The request's budget ran out before it could start a transaction."""
+
+
+class Deadline(NamedTuple):
+    route_class: str
+    expires_at: float  # time.monotonic()
+    budget_seconds: float
+
+    @property
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+
+_deadline: ContextVar[Optional[Deadline]] = ContextVar("request_deadline", default=None)
+
+
+def parse_deadlines(value: str) -> Dict[str, float]:
+    """
+    Parse ``"class=ms,class=ms"`` into budgets in seconds per route class.
+
+    Raises:
+        ValueError: If an entry is malformed, names an unknown class or is not positive
+    """
+    budgets = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        name, separator, milliseconds = entry.partition("=")
+        name = name.strip()
+        if not separator or name not in ROUTE_CLASSES:
+            raise ValueError(f"Invalid request deadline entry: {entry!r}")
+        milliseconds = float(milliseconds)
+        if milliseconds <= 0:
+            raise ValueError(f"Request deadline must be positive: {entry!r}")
+        budgets[name] = milliseconds / 1000
+    return budgets
+
+
+def request_deadline(route_class: str, default_seconds: float, requested_ms: Optional[str] = None) -> Deadline:
+    """
+    Deadline of a request starting now.
+
+    ``requested_ms`` (the client's header) can only shorten the class default;
+    malformed values are ignored.
+    """
+    budget = default_seconds
+    if requested_ms:
+        try:
+            requested = float(requested_ms) / 1000
+        except ValueError:
+            requested = 0
+        if requested > 0:
+            budget = min(budget, requested)
+    return Deadline(route_class, time.monotonic() + budget, budget)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _deadline.get()
+
+
+@contextmanager
+def bind_deadline(deadline: Deadline) -> Iterator[None]:
+    """Apply ``deadline`` to the database work started inside the block."""
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def is_statement_timeout(error: exc.DBAPIError) -> bool:
+    """Whether ``error`` is PostgreSQL cancelling a statement (statement_timeout)."""
+    orig = error.orig
+    return (getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)) == QUERY_CANCELED_SQLSTATE
+
+
+def statement_timeout_ms(ceiling_ms: int = 0, per_transaction: bool = False) -> Optional[int]:
+    """
+    statement_timeout for a transaction starting now, or None to keep the connection's.
+
+    With ``per_transaction`` the connection has no statement_timeout of its
+    own (behind a transaction pooler), so the ceiling is returned instead of None.
+
+    Raises:
+        DeadlineExceeded: If the current request's deadline has passed
+    """
+    ceiling = (ceiling_ms or None) if per_transaction else None
+    deadline = _deadline.get()
+    if deadline is None:
+        return ceiling
+    remaining_ms = int(deadline.remaining * 1000)
+    if remaining_ms <= 0:
+        raise DeadlineExceeded(DEADLINE_DETAIL)
+    if ceiling_ms and remaining_ms >= ceiling_ms:
+        return ceiling
+    return remaining_ms
+
+
+def apply_statement_deadlines(engine: AsyncEngine, ceiling_ms: int = 0, per_transaction: bool = False) -> None:
+    """
+    Limit each transaction of ``engine`` to the current request's remaining budget.
+
+    Args:
+        engine: Engine whose transactions are limited
+        ceiling_ms: The pool's own statement_timeout (0 = none); the budget
+            only ever lowers it
+        per_transaction: Connections do not carry ``ceiling_ms`` (transaction
+            pooler mode), so every transaction sets it
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "begin")
+    def on_begin(conn):
+        timeout_ms = statement_timeout_ms(ceiling_ms, per_transaction)
+        if timeout_ms is not None and conn.dialect.name == "postgresql":
+            conn.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
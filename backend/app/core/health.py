@@ -0,0 +1,261 @@
+"""
+Background database health prober.
+
+Kubelet probes used to check out a pooled connection and run SQL on every
+call. They competed with user traffic for the pool and, once the pool was
+saturated, timed out and got the pod restarted. Instead, ``HealthProber``
+checks the database every few seconds from a background task on a
+dedicated one-connection engine. The probe endpoints answer from the last
+result (``DatabaseCheck``) plus the pool's live counters, which are read
+without taking a connection.
+
+``evaluate()`` turns both into a verdict:
+
+- not ready: the last check failed, or it is older than the staleness
+  threshold (the prober is stuck, e.g. the event loop is blocked)
+- degraded: the check was slow, or the pool has little headroom left. The
+  pod stays ready, since restarting a busy pod only moves its load elsewhere.
+- ready otherwise
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+READY = "ready"
+DEGRADED = "degraded"
+NOT_READY = "not_ready"
+
+# Component statuses
+HEALTHY = "healthy"
+UNHEALTHY = "unhealthy"
+
+
+class DatabaseCheck(NamedTuple):
+    """Outcome of one database connectivity check."""
+    ok: bool
+    checked_at: datetime
+    checked_monotonic: float
+    latency_ms: Optional[float] = None
+    version: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.checked_monotonic
+
+    @classmethod
+    def failed(cls, error: BaseException) -> "DatabaseCheck":
+        return cls(
+            ok=False,
+            checked_at=datetime.utcnow(),
+            checked_monotonic=time.monotonic(),
+            error=str(error) or type(error).__name__
+        )
+
+
+class HealthReport(NamedTuple):
+    """Verdict served to probes: READY, DEGRADED or NOT_READY, and why."""
+    status: str
+    database: DatabaseCheck
+    database_status: str
+    pool: Dict[str, int]
+    pool_status: str
+    issues: List[str]
+
+    @property
+    def ready(self) -> bool:
+        return self.status != NOT_READY
+
+
+async def check_database(conn: AsyncConnection, fetch_version: bool = True) -> DatabaseCheck:
+    """Run a trivial query on ``conn`` and time it."""
+    start = time.perf_counter()
+    await conn.execute(text("SELECT 1"))
+    latency_ms = (time.perf_counter() - start) * 1000
+
+    version = None
+    if fetch_version:
+        if conn.dialect.name == "postgresql":
+            version = (await conn.execute(text("SELECT version()"))).scalar()
+        elif conn.dialect.server_version_info:
+            version = ".".join(str(part) for part in conn.dialect.server_version_info)
+    return DatabaseCheck(
+        ok=True,
+        checked_at=datetime.utcnow(),
+        checked_monotonic=time.monotonic(),
+        latency_ms=latency_ms,
+        version=version
+    )
+
+
+async def check_session(db: AsyncSession) -> DatabaseCheck:
+    """Check the database on a request's session (used when no prober runs)."""
+    try:
+        return await check_database(await db.connection())
+    except Exception as e:
+        return DatabaseCheck.failed(e)
+
+
+def pool_status(pool) -> Dict[str, int]:
+    """Size, usage and remaining capacity of a queue pool, read without a checkout."""
+    if not hasattr(pool, "size"):
+        return {}
+    size = pool.size()
+    max_overflow = max(0, getattr(pool, "_max_overflow", 0))
+    checked_out = pool.checkedout()
+    return {
+        "size": size,
+        "max_overflow": max_overflow,
+        "checked_out": checked_out,
+        "overflow": max(0, pool.overflow()),
+        "headroom": max(0, size + max_overflow - checked_out),
+    }
+
+
+def evaluate(
+    check: DatabaseCheck,
+    pool: Dict[str, int],
+    *,
+    stale_after: float,
+    slow_ms: float,
+    min_headroom: int
+) -> HealthReport:
+    """Classify the last database check and the pool state as ready, degraded or not ready."""
+    issues = []
+    database_status = pool_status = HEALTHY
+    if pool and pool["headroom"] < min_headroom:
+        pool_status = DEGRADED
+        issues.append(f"connection pool headroom {pool['headroom']}")
+
+    if not check.ok:
+        issues.insert(0, f"database check failed: {check.error}")
+        return HealthReport(NOT_READY, check, UNHEALTHY, pool, pool_status, issues)
+    if check.age_seconds > stale_after:
+        issues.insert(0, f"database check is stale ({check.age_seconds:.0f}s old)")
+        return HealthReport(NOT_READY, check, UNHEALTHY, pool, pool_status, issues)
+
+    if check.latency_ms is not None and check.latency_ms > slow_ms:
+        database_status = DEGRADED
+        issues.insert(0, f"database latency {check.latency_ms:.0f}ms")
+    return HealthReport(DEGRADED if issues else READY, check, database_status, pool, pool_status, issues)
+
+
+class HealthProber:
+    """
+    Check the database periodically and keep the last result.
+
+    Args:
+        engine: Engine used for the checks; a dedicated one-connection engine
+            keeps them out of the application pool
+        interval: Seconds between checks
+        timeout: A check taking longer than this fails
+    """
+
+    def __init__(self, engine: AsyncEngine, *, interval: float = 5.0, timeout: float = 2.0):
+        self.engine = engine
+        self.interval = interval
+        self.timeout = timeout
+        self.last: Optional[DatabaseCheck] = None
+        self._version: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def probe(self) -> DatabaseCheck:
+        """Run one check and store its result."""
+        try:
+            check = await asyncio.wait_for(self._check(), self.timeout)
+        except asyncio.TimeoutError:
+            check = DatabaseCheck.failed(TimeoutError(f"no response within {self.timeout:g}s"))
+        except Exception as e:
+            check = DatabaseCheck.failed(e)
+
+        if check.ok:
+            self._version = check.version or self._version
+            check = check._replace(version=self._version)
+        if self.last is not None and check.ok != self.last.ok:
+            if check.ok:
+                logger.info("Database health check recovered (%.1f ms)", check.latency_ms)
+            else:
+                logger.warning("Database health check failed: %s", check.error)
+        self.last = check
+        return check
+
+    async def _check(self) -> DatabaseCheck:
+        async with self.engine.connect() as conn:
+            return await check_database(conn, fetch_version=self._version is None)
+
+    async def start(self) -> None:
+        """Run a first check, then keep checking in the background."""
+        await self.probe()
+        self._task = asyncio.create_task(self._run(), name="health-prober")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.probe()
+
+    async def stop(self) -> None:
+        """Stop checking and close the engine's connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.engine.dispose()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+# Started by the application lifespan; None when probes check the database themselves
+prober: Optional[HealthProber] = None
+
+
+async def start_health_prober(engine: AsyncEngine, *, interval: float, timeout: float) -> HealthProber:
+    global prober
+    await stop_health_prober()
+    prober = HealthProber(engine, interval=interval, timeout=timeout)
+    await prober.start()
+    return prober
+
+
+async def stop_health_prober() -> None:
+    global prober
+    if prober is not None:
+        await prober.stop()
+        prober = None
+
+
+def cached_check() -> Optional[DatabaseCheck]:
+    """The prober's last result, if a prober is running."""
+    if prober is None or not prober.running:
+        return None
+    return prober.last
+
+
+async def current_health(db: AsyncSession, pool) -> HealthReport:
+    """
+    Health of this worker for the probe endpoints.
+
+    Uses the prober's last check when it runs; otherwise checks the database
+    on ``db``. ``pool`` is the application's connection pool.
+    """
+    check = cached_check() or await check_session(db)
+    return evaluate(
+        check,
+        pool_status(pool),
+        stale_after=settings.HEALTH_STALE_AFTER_SECONDS,
+        slow_ms=settings.HEALTH_SLOW_QUERY_MS,
+        min_headroom=settings.HEALTH_MIN_POOL_HEADROOM
+    )
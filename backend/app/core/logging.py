@@ -1,19 +1,33 @@
 """
 Query performance logging configuration.
 
-This module sets up logging for SQL queries to help identify performance issues.
+This module sets up logging for SQL queries to help identify performance issues,
+and an in-process statement profiler (see ``StatementProfiler``) that aggregates
+statistics per statement fingerprint, similar to ``pg_stat_statements``.
 """
 
+import heapq
 import logging
+import sys
+import threading
 import time
-from typing import Any
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
 from sqlalchemy.pool import Pool
 
-# Configure query logger
+from .query_stats import fingerprint
+
+try:
+    import greenlet
+except ImportError:  # pragma: no cover - only needed by the async engine
+    greenlet = None
+
+# Configure query logger. SQLAlchemy logs every statement once this is at INFO,
+# so that is left to setup_query_logging(enable_all_queries=True).
 query_logger = logging.getLogger("sqlalchemy.engine")
-query_logger.setLevel(logging.INFO)
+query_logger.setLevel(logging.WARNING)
 
 # Configure slow query logger
 slow_query_logger = logging.getLogger("app.slow_queries")
@@ -75,6 +89,189 @@ def setup_connection_pool_logging():
         logging.debug("Connection returned to pool")
 
 
+# Statement profiler
+_PROFILER_START_TIMES_KEY = "statement_profiler_start_times"
+_REPOSITORY_PACKAGE = __name__.rsplit(".", 2)[0] + ".repositories"
+_profiler_installed = False
+
+
+class StatementStats:
+    """Aggregated statistics of one statement fingerprint."""
+
+    __slots__ = ("query", "calls", "total_time", "min_time", "max_time", "rows", "samples", "callers")
+
+    def __init__(self, query: str, sample_size: int):
+        self.query = query
+        self.calls = 0
+        self.total_time = 0.0
+        self.min_time = float("inf")
+        self.max_time = 0.0
+        self.rows = 0
+        # Most recent durations, for percentiles in bounded memory
+        self.samples: deque = deque(maxlen=sample_size)
+        self.callers: Counter = Counter()
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    @property
+    def p95_time(self) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise for the statements endpoint (times in milliseconds)."""
+        return {
+            "query": self.query,
+            "calls": self.calls,
+            "total_time_ms": round(self.total_time * 1000, 3),
+            "mean_time_ms": round(self.mean_time * 1000, 3),
+            "p95_time_ms": round(self.p95_time * 1000, 3),
+            "min_time_ms": round(self.min_time * 1000, 3),
+            "max_time_ms": round(self.max_time * 1000, 3),
+            "rows": self.rows,
+            "callers": [
+                {"caller": caller, "calls": calls} for caller, calls in self.callers.most_common(3)
+            ],
+        }
+
+
+class StatementProfiler:
+    """
+    pg_stat_statements-style statistics, collected in the application.
+
+    Statements are grouped by fingerprint (literals and IN-lists collapsed) and
+    attributed to the innermost repository method on the calling stack. At most
+    ``max_statements`` fingerprints are kept; when a new one arrives at capacity
+    the least-called 5% are evicted, as pg_stat_statements does. The p95 is
+    computed over the last ``sample_size`` calls of each fingerprint.
+    """
+
+    ORDER_BY = ("total_time", "calls", "mean_time", "p95_time", "rows")
+
+    def __init__(self, max_statements: int = 500, sample_size: int = 128):
+        self.max_statements = max_statements
+        self.sample_size = sample_size
+        self.enabled = False
+        self.deallocations = 0
+        self._stats: Dict[str, StatementStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, statement: str, duration: float, rows: Optional[int] = 0, caller: Optional[str] = None
+    ) -> None:
+        """Record one executed statement (``duration`` in seconds, ``rows`` None when unknown)."""
+        key = fingerprint(statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self.max_statements:
+                    self._evict()
+                stats = self._stats[key] = StatementStats(key, self.sample_size)
+            stats.calls += 1
+            stats.total_time += duration
+            if duration < stats.min_time:
+                stats.min_time = duration
+            if duration > stats.max_time:
+                stats.max_time = duration
+            if rows is not None:
+                stats.rows += rows
+            stats.samples.append(duration)
+            if caller is not None:
+                stats.callers[caller] += 1
+
+    def _evict(self) -> None:
+        """Drop the least-called 5% of fingerprints (at least one)."""
+        count = max(1, self.max_statements // 20)
+        for stats in heapq.nsmallest(count, self._stats.values(), key=lambda s: s.calls):
+            del self._stats[stats.query]
+        self.deallocations += 1
+
+    def top(self, limit: int = 20, order_by: str = "total_time") -> List[Dict[str, Any]]:
+        """Return the ``limit`` heaviest fingerprints by ``order_by``, descending."""
+        if order_by not in self.ORDER_BY:
+            raise ValueError(f"order_by must be one of {', '.join(self.ORDER_BY)}")
+        with self._lock:
+            ranked = heapq.nlargest(limit, self._stats.values(), key=lambda s: getattr(s, order_by))
+            return [stats.to_dict() for stats in ranked]
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def reset(self) -> None:
+        """Discard all collected statistics."""
+        with self._lock:
+            self._stats.clear()
+            self.deallocations = 0
+
+
+statement_profiler = StatementProfiler()
+
+
+def _find_repository_caller(frame) -> Optional[str]:
+    """Name the innermost repository method on the stack, e.g. ``ChoreRepository.get``."""
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith(_REPOSITORY_PACKAGE):
+            code = frame.f_code
+            return getattr(code, "co_qualname", code.co_name)
+        frame = frame.f_back
+    return None
+
+
+def calling_repository_method() -> Optional[str]:
+    """
+    Find the repository method that issued the current statement.
+
+    With the async engine the cursor runs in a greenlet whose own stack ends at
+    SQLAlchemy's ``greenlet_spawn``; the awaiting coroutines (repository,
+    service, endpoint) are on the stack of the parent greenlet.
+    """
+    caller = _find_repository_caller(sys._getframe(2))
+    if caller is None and greenlet is not None:
+        parent = greenlet.getcurrent().parent
+        if parent is not None:
+            caller = _find_repository_caller(parent.gr_frame)
+    return caller
+
+
+def _profiler_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if statement_profiler.enabled:
+        conn.info.setdefault(_PROFILER_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _profiler_after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get(_PROFILER_START_TIMES_KEY)
+    if not statement_profiler.enabled or not start_times:
+        return
+    duration = time.perf_counter() - start_times.pop()
+
+    # The DB-API rowcount; drivers report -1 where it is not known (usually SELECTs)
+    rows = cursor.rowcount
+    if rows is None or rows < 0:
+        rows = None
+    statement_profiler.record(statement, duration, rows, calling_repository_method())
+
+
+def setup_statement_profiler(max_statements: Optional[int] = None):
+    """
+    Enable the statement profiler.
+
+    Args:
+        max_statements: Maximum number of fingerprints to keep (default 500).
+    """
+    global _profiler_installed
+    if max_statements is not None:
+        statement_profiler.max_statements = max_statements
+    if not _profiler_installed:
+        event.listen(Engine, "before_cursor_execute", _profiler_before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _profiler_after_cursor_execute)
+        _profiler_installed = True
+    statement_profiler.enabled = True
+
+
 # Query analysis helpers
 def format_query_plan(query_plan: str) -> str:
     """Format a query execution plan for better readability."""
@@ -4,8 +4,18 @@ Prometheus metrics for chores-tracker application.
 This module defines custom business metrics that track key application
 events and states. These metrics complement the automatic HTTP metrics
 provided by prometheus-fastapi-instrumentator.
+
+Multi-worker deployments (``uvicorn --workers N``, gunicorn) must set
+PROMETHEUS_MULTIPROC_DIR to an empty, writable directory before the workers
+start. Every worker then writes its samples to memory-mapped files in that
+directory and ``generate_metrics()`` aggregates all of them, so a scrape sees
+the whole pod no matter which worker answers it. Each gauge declares how its
+per-worker values are combined (``multiprocess_mode``).
 """
-from prometheus_client import Counter, Gauge, Histogram
+import os
+from typing import Optional
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
 
 # ============================================================================
 # CHORE METRICS
@@ -67,7 +77,8 @@ assignments_claimed_total = Counter(
 
 pending_approvals_count = Gauge(
     'pending_approvals_count',
-    'Current number of completed chores awaiting parent approval'
+    'Current number of completed chores awaiting parent approval',
+    multiprocess_mode='mostrecent'  # Same value in every worker; keep the latest
 )
 
 # ============================================================================
@@ -93,7 +104,8 @@ user_login_failures_total = Counter(
 
 active_users_count = Gauge(
     'active_users_count',
-    'Current number of users with active sessions'
+    'Current number of users with active sessions',
+    multiprocess_mode='mostrecent'  # Same value in every worker; keep the latest
 )
 
 # ============================================================================
@@ -112,7 +124,8 @@ family_joins_total = Counter(
 
 families_active_count = Gauge(
     'families_active_count',
-    'Current number of active families with at least one parent'
+    'Current number of active families with at least one parent',
+    multiprocess_mode='mostrecent'  # Same value in every worker; keep the latest
 )
 
 # ============================================================================
@@ -153,6 +166,143 @@ database_errors_total = Counter(
     ['operation']  # select, insert, update, delete
 )
 
+# ============================================================================
+# DATABASE QUERY METRICS
+# ============================================================================
+
+db_queries_per_request = Histogram(
+    'db_queries_per_request',
+    'Number of SQL statements executed per HTTP request',
+    ['method', 'route'],
+    buckets=[1, 2, 5, 10, 20, 50, 100, float('inf')]
+)
+
+db_time_per_request_seconds = Histogram(
+    'db_time_per_request_seconds',
+    'Total time spent executing SQL statements per HTTP request (seconds)',
+    ['method', 'route'],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, float('inf')]
+)
+
+db_n_plus_one_requests_total = Counter(
+    'db_n_plus_one_requests_total',
+    'Total number of HTTP requests that repeated one SQL statement past the N+1 threshold',
+    ['method', 'route']
+)
+
+# ============================================================================
+# CONNECTION POOL METRICS
+# ============================================================================
+
+db_pool_size = Gauge(
+    'db_pool_size',
+    'Configured number of persistent connections in the pool',
+    ['pool'],
+    multiprocess_mode='livesum'  # Each worker has its own pool
+)
+
+db_pool_checked_out_connections = Gauge(
+    'db_pool_checked_out_connections',
+    'Connections currently checked out of the pool',
+    ['pool'],
+    multiprocess_mode='livesum'  # Each worker has its own pool
+)
+
+db_pool_overflow_connections = Gauge(
+    'db_pool_overflow_connections',
+    'Connections currently open beyond the configured pool size',
+    ['pool'],
+    multiprocess_mode='livesum'  # Each worker has its own pool
+)
+
+db_pool_checkout_wait_seconds = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent waiting to check a connection out of the pool (seconds)',
+    ['pool'],
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30, 60, float('inf')]
+)
+
+db_pool_connection_hold_seconds = Histogram(
+    'db_pool_connection_hold_seconds',
+    'Time a connection stays checked out, by the route that held it (seconds)',
+    ['pool', 'route'],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10, float('inf')]
+)
+
+db_pool_checkout_timeouts_total = Counter(
+    'db_pool_checkout_timeouts_total',
+    'Total number of checkouts that timed out waiting for a connection',
+    ['pool']
+)
+
+db_pool_invalidations_total = Counter(
+    'db_pool_invalidations_total',
+    'Total number of pooled connections invalidated',
+    ['pool', 'kind']  # hard, soft
+)
+
+db_pool_pre_ping_failures_total = Counter(
+    'db_pool_pre_ping_failures_total',
+    'Total number of pooled connections that failed the pre-ping check',
+    ['pool']
+)
+
+# ============================================================================
+# READ REPLICA METRICS
+# ============================================================================
+
+db_read_routing_total = Counter(
+    'db_read_routing_total',
+    'Read-only requests by the database they were routed to and why',
+    ['target', 'reason']  # replica/primary; replica, recent_write, replica_unavailable
+)
+
+db_replica_lag_seconds = Gauge(
+    'db_replica_lag_seconds',
+    'Replication lag of the read replica at its last check (seconds)',
+    multiprocess_mode='livemax'  # Each worker checks the replica itself
+)
+
+db_replica_available = Gauge(
+    'db_replica_available',
+    'Whether reads are routed to the replica (1) or fall back to the primary (0)',
+    multiprocess_mode='livemin'  # 0 when any worker falls back
+)
+
+# ============================================================================
+# ADMISSION CONTROL METRICS
+# ============================================================================
+
+admission_decisions_total = Counter(
+    'admission_decisions_total',
+    'Requests admitted or shed by admission control',
+    ['route_class', 'decision']  # auth/write/read/report; admitted, shed_*
+)
+
+admission_queue_wait_seconds = Histogram(
+    'admission_queue_wait_seconds',
+    'Time requests waited for a slot in their route class lane (seconds)',
+    ['route_class'],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, float('inf')]
+)
+
+admission_in_flight = Gauge(
+    'admission_in_flight',
+    'Admitted requests currently running, by route class',
+    ['route_class'],
+    multiprocess_mode='livesum'  # Each worker admits its own requests
+)
+
+# ============================================================================
+# REQUEST DEADLINE METRICS
+# ============================================================================
+
+request_timeouts_total = Counter(
+    'request_timeouts_total',
+    'Requests ended by their deadline or by the client going away',
+    ['route_class', 'cause']  # cause: deadline, statement_timeout, client_disconnect
+)
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -333,3 +483,79 @@ def update_active_families(count: int) -> None:
         families_active_count.set(count)
     except Exception as e:
         print(f"Error updating active families metric: {e}")
+
+
+def record_request_queries(
+    method: str,
+    route: str,
+    query_count: int,
+    db_seconds: float,
+    n_plus_one: bool = False
+) -> None:
+    """
+    Record the database work of one HTTP request.
+
+    Args:
+        method: HTTP method
+        route: Route path template (e.g. /api/v1/chores/{chore_id})
+        query_count: Number of SQL statements executed
+        db_seconds: Total time spent executing them
+        n_plus_one: Whether a statement repeated past the N+1 threshold
+    """
+    try:
+        db_queries_per_request.labels(method=method, route=route).observe(query_count)
+        db_time_per_request_seconds.labels(method=method, route=route).observe(db_seconds)
+        if n_plus_one:
+            db_n_plus_one_requests_total.labels(method=method, route=route).inc()
+    except Exception as e:
+        print(f"Error recording request query metrics: {e}")
+
+
+# ============================================================================
+# LOGGING METRICS
+# ============================================================================
+
+log_records_dropped_total = Counter(
+    'log_records_dropped_total',
+    'Log records discarded before being written',
+    ['reason']  # sampled, queue_full
+)
+
+
+# ============================================================================
+# EXPOSITION
+# ============================================================================
+
+def multiprocess_mode_enabled() -> bool:
+    """Whether metrics are shared between workers through PROMETHEUS_MULTIPROC_DIR."""
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def generate_metrics() -> bytes:
+    """
+    Render the metrics in the Prometheus text format.
+
+    In multiprocess mode the samples of all workers (live and exited) are
+    aggregated from PROMETHEUS_MULTIPROC_DIR; otherwise this process's
+    registry is rendered.
+    """
+    if multiprocess_mode_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def mark_worker_dead(pid: Optional[int] = None) -> None:
+    """
+    Remove an exiting worker's live gauge files in multiprocess mode.
+
+    Counters and histograms of the worker stay in the directory, so totals
+    do not drop when a worker restarts.
+    """
+    if not multiprocess_mode_enabled():
+        return
+    try:
+        multiprocess.mark_process_dead(pid or os.getpid())
+    except Exception as e:
+        print(f"Error cleaning up multiprocess metrics: {e}")
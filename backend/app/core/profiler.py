@@ -0,0 +1,215 @@
+"""
+On-demand sampling profiler.
+
+``SamplingProfiler`` runs a background thread that periodically captures the
+Python stack of every thread (``sys._current_frames``) and, optionally, the
+await chain of every asyncio task, i.e. where each coroutine is suspended.
+Nothing is instrumented, so the cost is a few microseconds per sample on the
+sampler thread and none at all while no profile is running.
+
+Results are rendered in the collapsed-stack format understood by
+``flamegraph.pl``, speedscope and most flame graph viewers: one line per
+unique stack, frames separated by ``;`` (outermost first), followed by the
+number of samples.
+
+Two modes are exposed (see ``main.py`` and ``ProfilingMiddleware``):
+
+- a time-boxed profile of the whole worker (``GET /debug/profile``)
+- a profile of a single request, for trusted callers sending ``X-Profile``
+"""
+import asyncio
+import sys
+import threading
+import uuid
+from collections import Counter, OrderedDict
+from typing import Iterable, List, Optional, Set
+
+# Per-request profiles kept for retrieval by id
+MAX_STORED_PROFILES = 20
+
+_worker_profile_lock = threading.Lock()
+_stored_profiles: "OrderedDict[str, str]" = OrderedDict()
+_stored_profiles_lock = threading.Lock()
+
+
+class ProfilerBusyError(Exception):
+    """Raised when a worker profile is requested while another one is running."""
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({frame.f_globals.get('__name__', '?')}:{frame.f_lineno})"
+
+
+def _thread_stack(frame) -> List[str]:
+    """Labels of a thread's stack, outermost frame first."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+def _task_stack(task: asyncio.Task) -> List[str]:
+    """
+    Labels of a task's await chain, outermost coroutine first.
+
+    ``Task.get_stack()`` only returns the outermost frame of a suspended task;
+    following ``cr_await`` reaches the coroutine that is actually waiting.
+    """
+    labels = []
+    awaitable = task.get_coro()
+    while awaitable is not None:
+        frame = (
+            getattr(awaitable, "cr_frame", None)
+            or getattr(awaitable, "gi_frame", None)
+            or getattr(awaitable, "ag_frame", None)
+        )
+        if frame is None:
+            break
+        labels.append(_frame_label(frame))
+        awaitable = (
+            getattr(awaitable, "cr_await", None)
+            or getattr(awaitable, "gi_yieldfrom", None)
+            or getattr(awaitable, "ag_await", None)
+        )
+    return labels
+
+
+class SamplingProfiler:
+    """
+    Sample thread stacks and asyncio task stacks from a background thread.
+
+    Args:
+        interval: Seconds between samples
+        thread_ids: Only sample these threads (default: all but the sampler)
+        loop: Event loop whose tasks are sampled when ``include_tasks`` is set
+        include_tasks: Also record where every pending task is suspended
+        task: Profile a single task: its thread's stack while it runs,
+            otherwise the point where it is waiting (prefixed ``(waiting)``).
+            The profiler must then be created on the task's event loop thread.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.01,
+        *,
+        thread_ids: Optional[Set[int]] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        include_tasks: bool = False,
+        task: Optional[asyncio.Task] = None
+    ):
+        self.interval = interval
+        self.thread_ids = thread_ids
+        self.loop = loop
+        self.include_tasks = include_tasks
+        self.task = task
+        self._task_thread = threading.get_ident() if task is not None else None
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample(exclude=own_id)
+            except Exception:
+                # Stacks change under our feet; a torn sample is simply skipped
+                continue
+
+    def sample(self, exclude: Optional[int] = None) -> None:
+        """Take one sample of all selected threads and tasks."""
+        self.samples += 1
+        frames = sys._current_frames()
+        if self.task is not None:
+            self._sample_task(frames)
+            return
+
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in frames.items():
+            if thread_id == exclude or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                continue
+            stack = [f"thread:{names.get(thread_id, thread_id)}"] + _thread_stack(frame)
+            self.stacks[";".join(stack)] += 1
+
+        if self.include_tasks and self.loop is not None:
+            for task in _pending_tasks(self.loop):
+                stack = [f"task:{task.get_name()}"] + _task_stack(task)
+                self.stacks[";".join(stack)] += 1
+
+    def _sample_task(self, frames) -> None:
+        task = self.task
+        if task.done():
+            return
+        if asyncio.current_task(task.get_loop()) is task and self._task_thread in frames:
+            self.stacks[";".join(_thread_stack(frames[self._task_thread]))] += 1
+        else:
+            self.stacks[";".join(["(waiting)"] + _task_stack(task))] += 1
+
+    def collapsed(self) -> str:
+        """Render the samples as collapsed stacks, most frequent first."""
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+
+def _pending_tasks(loop: asyncio.AbstractEventLoop) -> Iterable[asyncio.Task]:
+    # all_tasks() retries if the task set changes while it is being copied
+    return [task for task in asyncio.all_tasks(loop) if not task.done()]
+
+
+async def profile_worker(seconds: float, interval: float, include_tasks: bool = True) -> SamplingProfiler:
+    """
+    Profile every thread of this worker for ``seconds``.
+
+    The event loop keeps serving requests while the profile runs. Only one
+    worker profile runs at a time.
+
+    Raises:
+        ProfilerBusyError: If another worker profile is in progress
+    """
+    if not _worker_profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running on this worker")
+    try:
+        profiler = SamplingProfiler(
+            interval,
+            loop=asyncio.get_running_loop(),
+            include_tasks=include_tasks
+        ).start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.stop()
+        return profiler
+    finally:
+        _worker_profile_lock.release()
+
+
+def new_profile_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def store_profile(profile_id: str, collapsed: str) -> None:
+    """Keep a per-request profile for later retrieval (the oldest are evicted)."""
+    with _stored_profiles_lock:
+        _stored_profiles[profile_id] = collapsed
+        while len(_stored_profiles) > MAX_STORED_PROFILES:
+            _stored_profiles.popitem(last=False)
+
+
+def get_stored_profile(profile_id: str) -> Optional[str]:
+    with _stored_profiles_lock:
+        return _stored_profiles.get(profile_id)
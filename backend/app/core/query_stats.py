@@ -0,0 +1,113 @@
+"""
+Per-request database query statistics.
+
+``setup_query_logging`` looks at statements one at a time, so a request that
+runs the same cheap SELECT once per row (an N+1 pattern) never shows up. This
+module records every statement executed inside a ``record_queries()`` block:
+how many ran, the total time spent in the database, and how often each
+statement *fingerprint* (the SQL with literals and IN-lists collapsed)
+repeated.
+
+Recorders live in a context variable, so concurrent requests never see each
+other's statements, while tasks spawned by a request (``asyncio.gather``)
+share its recorder. Nested blocks also report to the enclosing recorder,
+which lets a test wrap an API call while the middleware records the request.
+The engine listeners are installed once and do nothing outside a block.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_current_recorder: ContextVar[Optional["QueryRecorder"]] = ContextVar("query_recorder", default=None)
+_START_TIMES_KEY = "query_recorder_start_times"
+_installed = False
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\((?:\s*(?:\?|%s|\$\d+|:\w+)\s*,)+\s*(?:\?|%s|\$\d+|:\w+)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """
+    Normalise a SQL statement so repetitions with different values match.
+
+    String and number literals become ``?`` and parameter lists such as
+    ``IN (?, ?, ?)`` become ``(?)``.
+    """
+    normalised = _STRING_LITERAL.sub("?", statement)
+    normalised = _NUMBER_LITERAL.sub("?", normalised)
+    normalised = _PARAMETER_LIST.sub("(?)", normalised)
+    return _WHITESPACE.sub(" ", normalised).strip()
+
+
+class QueryRecorder:
+    """Statement count, database time and fingerprint repetitions of one scope."""
+
+    def __init__(self, parent: Optional["QueryRecorder"] = None):
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        """Record one executed statement (``duration`` in seconds)."""
+        recorder = self
+        key = fingerprint(statement)
+        while recorder is not None:
+            recorder.count += 1
+            recorder.duration += duration
+            recorder.fingerprints[key] += 1
+            recorder = recorder.parent
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Fingerprints executed at least ``threshold`` times, most frequent first."""
+        return [(key, count) for key, count in self.fingerprints.most_common() if count >= threshold]
+
+
+def current_recorder() -> Optional[QueryRecorder]:
+    """Return the recorder of the current context, if any."""
+    return _current_recorder.get()
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryRecorder]:
+    """Record the statements executed in this block (and tasks it spawns)."""
+    install_query_recorder()
+    recorder = QueryRecorder(parent=_current_recorder.get())
+    token = _current_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_recorder.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_recorder.get() is not None:
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    recorder = _current_recorder.get()
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if recorder is None or not start_times:
+        return
+    recorder.record(statement, time.perf_counter() - start_times.pop())
+
+
+def install_query_recorder() -> None:
+    """Register the engine listeners (idempotent)."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _installed = True
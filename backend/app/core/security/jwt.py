@@ -1,14 +1,17 @@
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
-from jose import jwt
-
 from ...core.config import settings
 
+# python-jose loads its cryptography backend on import (~50 ms), so the token
+# functions import it on first use rather than at application startup.
+
 def create_access_token(
     subject: Any, expires_delta: Optional[timedelta] = None
 ) -> str:
     """Create a new access token."""
+    from jose import jwt
+
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
@@ -21,6 +24,8 @@ def create_access_token(
 
 def verify_token(token: str) -> Optional[str]:
     """Verify a token and return the user ID if valid."""
+    from jose import jwt
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
         return payload["sub"]
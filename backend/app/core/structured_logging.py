@@ -0,0 +1,253 @@
+"""
+Structured, non-blocking application logging.
+
+``setup_logging()`` sends every log record through a bounded in-memory queue.
+The code that logs only renders the message and enqueues the record
+(``NonBlockingQueueHandler``); a ``QueueListener`` thread formats it (one JSON
+object per line by default) and writes it to stdout. A slow stdout, such as a
+full pipe to the container runtime, therefore never stalls the event loop. If
+the queue fills up, records are dropped and counted in
+``log_records_dropped_total`` rather than blocking the caller.
+
+Every record carries the id of the request it was logged from
+(``request_id``, bound by ``RequestIdMiddleware``) and, when the request is
+traced, its ``trace_id``.
+
+Hot debug logs can be sampled per logger (``LOG_SAMPLE_RATES``): DEBUG and
+INFO records of a sampled logger, or of its children, are kept with the
+configured probability. Warnings and errors are never sampled.
+"""
+import copy
+import logging
+import queue
+import random
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+import orjson
+
+from .metrics import log_records_dropped_total
+from .tracing import current_trace
+
+# Loggers configured by uvicorn with their own (synchronous) stream handlers
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message", "asctime", "request_id", "trace_id"
+}
+
+_listener: Optional[QueueListener] = None
+_saved_handlers: List[Tuple[logging.Logger, List[logging.Handler], bool]] = []
+_saved_root_level: int = logging.WARNING
+
+
+def current_request_id() -> Optional[str]:
+    """Id of the request being handled, if any."""
+    return _request_id.get()
+
+
+@contextmanager
+def bind_request_id(request_id: str) -> Iterator[None]:
+    """Attach ``request_id`` to every record logged inside the block."""
+    token = _request_id.set(request_id)
+    try:
+        yield
+    finally:
+        _request_id.reset(token)
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """
+    Parse ``"logger=rate,logger=rate"`` into a dict.
+
+    Raises:
+        ValueError: If an entry is malformed or a rate is outside [0, 1]
+    """
+    rates = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        name, separator, rate = entry.partition("=")
+        name = name.strip()
+        if not separator or not name:
+            raise ValueError(f"Invalid log sample rate entry: {entry!r}")
+        rate = float(rate)
+        if not 0 <= rate <= 1:
+            raise ValueError(f"Log sample rate must be between 0 and 1: {entry!r}")
+        rates[name] = rate
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a fraction of the DEBUG and INFO records of selected loggers.
+
+    A logger's rate is the one configured for its closest configured ancestor
+    (``"backend.app.api"`` covers every endpoint module); unconfigured loggers
+    are not sampled.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = dict(rates)
+        self._resolved: Dict[str, float] = {}
+
+    def rate_for(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1.0
+            candidate = name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rate_for(record.name)
+        if rate >= 1 or random.random() < rate:
+            return True
+        log_records_dropped_total.labels(reason="sampled").inc()
+        return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Enqueue records for the listener thread without ever blocking.
+
+    The message is rendered here, while its arguments are still what the
+    caller passed, and the request and trace ids are read from the caller's
+    context. Everything else (formatting, I/O) happens on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.request_id = _request_id.get()
+        trace = current_trace()
+        record.trace_id = trace.trace_id if trace is not None else None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            log_records_dropped_total.labels(reason="queue_full").inc()
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("request_id", "trace_id"):
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return orjson.dumps(entry, default=str).decode()
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable format for local development, with the request id appended."""
+
+    def __init__(self):
+        super().__init__(TEXT_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        request_id = getattr(record, "request_id", None)
+        return f"{line} [request_id={request_id}]" if request_id else line
+
+
+def setup_logging(
+    level: str = "INFO",
+    json_format: bool = True,
+    sample_rates: Optional[Dict[str, float]] = None,
+    queue_size: int = 10000,
+    stream: Optional[TextIO] = None
+) -> QueueListener:
+    """
+    Route all application and uvicorn logs through the background writer.
+
+    Replaces the root logger's handlers and makes uvicorn's loggers propagate
+    to it. Call ``shutdown_logging()`` to flush pending records and restore
+    the previous configuration.
+
+    Args:
+        level: Root log level
+        json_format: Write JSON lines (otherwise plain text)
+        sample_rates: Fraction of DEBUG/INFO records kept, by logger name
+        queue_size: Records buffered before new ones are dropped
+        stream: Where records are written (default: stdout)
+    """
+    global _listener, _saved_root_level
+    if _listener is not None:
+        shutdown_logging()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JSONFormatter() if json_format else TextFormatter())
+
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=queue_size))
+    if sample_rates:
+        handler.addFilter(SamplingFilter(sample_rates))
+
+    root = logging.getLogger()
+    _saved_root_level = root.level
+    _saved_handlers.append((root, root.handlers[:], root.propagate))
+    root.handlers = [handler]
+    root.setLevel(level.upper())
+    for name in UVICORN_LOGGERS:
+        logger = logging.getLogger(name)
+        _saved_handlers.append((logger, logger.handlers[:], logger.propagate))
+        logger.handlers = []
+        logger.propagate = True
+
+    _listener = QueueListener(handler.queue, output, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Write out the queued records and restore the previous handlers."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+    for logger, handlers, propagate in reversed(_saved_handlers):
+        logger.handlers = handlers
+        logger.propagate = propagate
+    _saved_handlers.clear()
+    logging.getLogger().setLevel(_saved_root_level)
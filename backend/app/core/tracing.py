@@ -0,0 +1,317 @@
+"""
+Lightweight request tracing.
+
+A ``Trace`` is started per HTTP request by ``TracingMiddleware`` and kept in a
+context variable; ``span(name)`` records a timed span in it (and does nothing
+outside a request). Spans are recorded for:
+
+- the whole request (``request``) and the self time of wrapped middleware
+  (``validation``, ``ratelimit``, see ``TracedMiddleware``)
+- the authentication dependency (``auth``)
+- every SQL statement (``db``, via engine events)
+- response rendering (``render``)
+
+Every traced response carries a ``Server-Timing`` header that sums the spans
+by name. Sampled traces are additionally exported in the OTLP/JSON encoding
+(one ``ExportTraceServiceRequest`` per line) to a local file, which any OTLP
+collector's file receiver, or a human with ``jq``, can read.
+"""
+import functools
+import json
+import os
+import queue
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_DB_SPANS_KEY = "tracing_db_spans"
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("trace", default=None)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("trace_span", default=None)
+_db_tracing_installed = False
+
+# Set by setup_tracing_exporter(); sampled traces are dropped while it is None
+exporter: Optional["FileSpanExporter"] = None
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    """One timed operation of a trace."""
+
+    __slots__ = ("name", "kind", "span_id", "parent_id", "start_ns", "_start", "duration", "attributes")
+
+    def __init__(self, name: str, parent_id: Optional[str], kind: int = SPAN_KIND_INTERNAL, attributes=None):
+        self.name = name
+        self.kind = kind
+        self.span_id = _new_id(64)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self._start = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.attributes: Dict[str, Any] = attributes or {}
+
+    def end(self) -> None:
+        self.duration = time.perf_counter() - self._start
+
+    def elapsed(self) -> float:
+        """Duration in seconds, or the time since start while the span is open."""
+        return self.duration if self.duration is not None else time.perf_counter() - self._start
+
+
+class Trace:
+    """The spans of one request."""
+
+    def __init__(
+        self,
+        trace_id: Optional[str] = None,
+        parent_span_id: Optional[str] = None,
+        sampled: bool = False,
+        max_spans: int = 500
+    ):
+        self.trace_id = trace_id or _new_id(128)
+        self.parent_span_id = parent_span_id
+        self.sampled = sampled
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self.dropped = 0
+
+    @classmethod
+    def from_traceparent(cls, traceparent: Optional[str], sample_rate: float, max_spans: int = 500) -> "Trace":
+        """
+        Continue a W3C ``traceparent`` if one was sent, otherwise start a trace.
+
+        An incoming trace keeps the caller's sampling decision; new traces are
+        sampled with probability ``sample_rate``.
+        """
+        match = _TRACEPARENT.match(traceparent.strip().lower()) if traceparent else None
+        if match:
+            trace_id, parent_id, flags = match.groups()
+            return cls(trace_id, parent_id, sampled=bool(int(flags, 16) & 1), max_spans=max_spans)
+        return cls(sampled=random.random() < sample_rate, max_spans=max_spans)
+
+    def start_span(self, name: str, kind: int = SPAN_KIND_INTERNAL, attributes=None) -> Optional[Span]:
+        """Open a span under the current span; None once ``max_spans`` is reached."""
+        if len(self.spans) >= self.max_spans:
+            self.dropped += 1
+            return None
+        parent = _current_span.get()
+        new_span = Span(name, parent.span_id if parent else self.parent_span_id, kind, attributes)
+        self.spans.append(new_span)
+        return new_span
+
+    def server_timing(self) -> str:
+        """Sum span durations by name as a ``Server-Timing`` header value."""
+        totals: Dict[str, Tuple[float, int]] = {}
+        for recorded in self.spans:
+            duration, count = totals.get(recorded.name, (0.0, 0))
+            totals[recorded.name] = (duration + recorded.elapsed(), count + 1)
+
+        entries = []
+        for name, (duration, count) in totals.items():
+            entry = f"{name};dur={duration * 1000:.1f}"
+            if count > 1:
+                entry += f';desc="{count}x"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+    def to_otlp(self, service_name: str) -> Dict[str, Any]:
+        """Encode the finished spans as an OTLP/JSON ``ExportTraceServiceRequest``."""
+        spans = []
+        for recorded in self.spans:
+            end_ns = recorded.start_ns + int(recorded.elapsed() * 1e9)
+            encoded = {
+                "traceId": self.trace_id,
+                "spanId": recorded.span_id,
+                "name": recorded.name,
+                "kind": recorded.kind,
+                "startTimeUnixNano": str(recorded.start_ns),
+                "endTimeUnixNano": str(end_ns),
+                "attributes": [_otlp_attribute(key, value) for key, value in recorded.attributes.items()],
+            }
+            if recorded.parent_id:
+                encoded["parentSpanId"] = recorded.parent_id
+            spans.append(encoded)
+
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", service_name)]},
+                "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+            }]
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+def current_trace() -> Optional[Trace]:
+    """Return the trace of the current request, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def activate_trace(trace: Trace) -> Iterator[Trace]:
+    """Make ``trace`` the current trace for this block (and the tasks it spawns)."""
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Record the block as a span of the current trace (no-op outside a trace)."""
+    trace = _current_trace.get()
+    opened = trace.start_span(name, kind, attributes) if trace is not None else None
+    if opened is None:
+        yield None
+        return
+
+    token = _current_span.set(opened)
+    try:
+        yield opened
+    finally:
+        _current_span.reset(token)
+        opened.end()
+
+
+def traced(name: str) -> Callable:
+    """Decorator recording each call of an async function as a span named ``name``."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TracedJSONResponse(JSONResponse):
+    """``JSONResponse`` whose encoding is recorded as a ``render`` span."""
+
+    def render(self, content: Any) -> bytes:
+        with span("render"):
+            return super().render(content)
+
+
+# Database spans
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    trace = _current_trace.get()
+    if trace is not None:
+        conn.info.setdefault(_DB_SPANS_KEY, []).append(trace.start_span("db", SPAN_KIND_CLIENT))
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    trace = _current_trace.get()
+    open_spans = conn.info.get(_DB_SPANS_KEY)
+    if trace is None or not open_spans:
+        return
+    db_span = open_spans.pop()
+    if db_span is None:
+        return
+    db_span.end()
+    if trace.sampled:
+        # Only exported traces need the (comparatively expensive) attributes
+        from .logging import calling_repository_method
+        from .query_stats import fingerprint
+
+        db_span.attributes["db.statement"] = fingerprint(statement)
+        caller = calling_repository_method()
+        if caller:
+            db_span.attributes["code.function"] = caller
+
+
+def install_db_tracing() -> None:
+    """Register the engine listeners recording ``db`` spans (idempotent)."""
+    global _db_tracing_installed
+    if _db_tracing_installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _db_tracing_installed = True
+
+
+# Export
+
+class FileSpanExporter:
+    """
+    Append sampled traces to a file as OTLP/JSON lines.
+
+    Traces are encoded and written by a background thread so exporting never
+    blocks the event loop; when the queue is full, traces are dropped.
+    """
+
+    def __init__(self, path: str, service_name: str = "chores-tracker", max_queue: int = 1000):
+        self.path = path
+        self.service_name = service_name
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Trace]]" = queue.Queue(maxsize=max_queue)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, trace: Trace) -> None:
+        """Queue a finished trace for writing."""
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as output:
+            while True:
+                trace = self._queue.get()
+                if trace is None:
+                    return
+                output.write(json.dumps(trace.to_otlp(self.service_name), separators=(",", ":")) + "\n")
+                if self._queue.empty():
+                    output.flush()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Write the queued traces and stop the background thread."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+
+def setup_tracing_exporter(path: str, service_name: str = "chores-tracker") -> FileSpanExporter:
+    """Start exporting sampled traces to ``path``."""
+    global exporter
+    exporter = FileSpanExporter(path, service_name=service_name)
+    return exporter
+
+
+def shutdown_tracing_exporter() -> None:
+    """Flush and stop the exporter, if one is running."""
+    global exporter
+    if exporter is not None:
+        exporter.shutdown()
+        exporter = None
@@ -1,6 +1,15 @@
+import uuid
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from ..core.config import settings
+from ..core.deadline import apply_statement_deadlines
+from .pool import InstrumentedAsyncAdaptedQueuePool, instrument_engine
+from .replica import REPLICA, ReadRouter, cookie_primary_until, request_principal
+from .sqlite import READ_ONLY_METHODS, SqlitePragmas, configure_sqlite_engine, is_sqlite_file
 
 # Import all the models, so that Base has them before being
 # imported by Alembic
@@ -9,34 +18,282 @@ from ..models.user import User  # noqa
 from ..models.chore import Chore  # noqa
 from ..models.family import Family  # noqa
 
-# Create async engine with optimized connection pool settings
+
+def postgresql_connect_args(url: str, statement_timeout_ms: int = 0, transaction_pooler: bool = False) -> dict:
+    """
+    asyncpg connection arguments, with the workload's statement_timeout (0 = none).
+
+    Behind a transaction pooler each transaction may run on a different server
+    connection, so nothing is set per connection: no startup settings (the
+    statement_timeout is set per transaction, see ``apply_statement_deadlines``)
+    and no prepared statements cached across transactions or reused by name.
+    """
+    if "postgresql" not in url:
+        return {}
+    # Client-side limit; leaves the server's statement_timeout to fire first
+    command_timeout = max(60, statement_timeout_ms / 1000 + 5)
+    if transaction_pooler:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": unique_statement_name,
+            "command_timeout": command_timeout,
+        }
+    server_settings = {
+        "jit": "off"     # Disable JIT for more predictable performance
+    }
+    if statement_timeout_ms:
+        server_settings["statement_timeout"] = str(statement_timeout_ms)
+    return {
+        "server_settings": server_settings,
+        "command_timeout": command_timeout,
+    }
+
+
+def unique_statement_name() -> str:
+    """Prepared statement name that cannot clash on a server connection shared through a pooler."""
+    return f"__asyncpg_{uuid.uuid4().hex}__"
+
+
+def pool_options(
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: float,
+    transaction_pooler: bool = False,
+    pool_pre_ping: bool = True
+) -> dict:
+    """
+    Pool arguments for ``create_async_engine``.
+
+    Behind a transaction pooler the pooler holds the server connections, so
+    each pod keeps at most TRANSACTION_POOLER_POOL_SIZE (+ overflow) client
+    connections to it, or none (NullPool) when that is 0. ``pool_pre_ping``
+    is pointless for SQLite files, whose connections cannot drop.
+    """
+    if transaction_pooler:
+        if settings.TRANSACTION_POOLER_POOL_SIZE <= 0:
+            return {"poolclass": NullPool}
+        pool_size = min(pool_size, settings.TRANSACTION_POOLER_POOL_SIZE)
+        max_overflow = min(max_overflow, settings.TRANSACTION_POOLER_MAX_OVERFLOW)
+    return {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool,  # Exports checkout wait time and timeouts
+        "pool_pre_ping": pool_pre_ping,  # Test connections before using them
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_recycle": 3600,        # Recycle connections after 1 hour (avoid PostgreSQL idle timeouts)
+        "pool_timeout": pool_timeout,
+    }
+
+
+transaction_pooler = settings.DATABASE_TRANSACTION_POOLER
+sqlite_file = is_sqlite_file(settings.DATABASE_URL)
+connect_args = postgresql_connect_args(settings.DATABASE_URL, settings.OLTP_STATEMENT_TIMEOUT_MS, transaction_pooler)
+
+# Create async engine with optimized connection pool settings: 20 connections
+# plus 40 overflow for peak load, waiting up to 60 s for one. On a SQLite file
+# it is the single writer connection (db/sqlite.py), and requests queue for it.
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
     future=True,
-    # Connection pool settings
-    pool_pre_ping=True,      # Test connections before using them
-    pool_size=20,            # Increased pool size for better concurrency
-    max_overflow=40,         # Allow more overflow connections during peak load
-    pool_recycle=3600,       # Recycle connections after 1 hour (avoid PostgreSQL idle timeouts)
-    pool_timeout=60,         # Increased timeout for getting connection from pool
-    connect_args={
-        "server_settings": {
-            "jit": "off"     # Disable JIT for more predictable performance
-        },
-        "command_timeout": 60,
-    } if "postgresql" in settings.DATABASE_URL else {}
+    connect_args=connect_args,
+    **(pool_options(1, 0, 60, pool_pre_ping=False) if sqlite_file else pool_options(20, 40, 60, transaction_pooler))
 )
 
+# One connection for the background health prober (core/health.py), so that
+# health checks never wait behind, or take a connection from, user traffic
+probe_engine = create_async_engine(
+    settings.DATABASE_URL,
+    pool_size=1,
+    max_overflow=0,
+    pool_pre_ping=False,     # The probe query itself detects dead connections
+    pool_recycle=3600,
+    connect_args=connect_args
+)
+
+# Export pool size, usage, wait/hold times and failures as Prometheus metrics
+instrument_engine(engine, "default")
+
+# Cap each transaction's statement_timeout at what is left of the request's deadline
+apply_statement_deadlines(engine, settings.OLTP_STATEMENT_TIMEOUT_MS, per_transaction=transaction_pooler)
+
+# SQLite file: WAL mode and tuned pragmas on every connection, and a pool of
+# read-only connections next to the writer for GET requests, get_read_db and
+# get_report_db. It keeps at least two: a GET's own session holds one while
+# get_session_factory's sessions (the dashboard sections) need another.
+SqliteReadSessionLocal = None
+if sqlite_file:
+    sqlite_pragmas = SqlitePragmas(
+        busy_timeout_ms=settings.SQLITE_BUSY_TIMEOUT_MS,
+        synchronous=settings.SQLITE_SYNCHRONOUS,
+        cache_size_kib=settings.SQLITE_CACHE_SIZE_KIB,
+        mmap_size_bytes=settings.SQLITE_MMAP_SIZE_MB * 1024 * 1024
+    )
+    configure_sqlite_engine(engine, sqlite_pragmas, writer=True)
+    configure_sqlite_engine(probe_engine, sqlite_pragmas, writer=False)
+    sqlite_read_engine = create_async_engine(
+        settings.DATABASE_URL,
+        **pool_options(
+            max(settings.SQLITE_READ_POOL_SIZE, 2), 0, settings.REPORTING_POOL_TIMEOUT_SECONDS,
+            pool_pre_ping=False
+        )
+    )
+    instrument_engine(sqlite_read_engine, "sqlite_read")
+    configure_sqlite_engine(sqlite_read_engine, sqlite_pragmas, writer=False)
+    apply_statement_deadlines(sqlite_read_engine)
+    SqliteReadSessionLocal = sessionmaker(sqlite_read_engine, class_=AsyncSession, expire_on_commit=False)
+
+# Reports and statistics (get_report_db) get their own, smaller pool with a
+# longer statement timeout, so they queue among themselves instead of taking
+# the connections of transactional requests
+reporting_engine = None
+ReportingSessionLocal = None
+if settings.REPORTING_POOL_SIZE > 0 and not sqlite_file:
+    reporting_engine = create_async_engine(
+        settings.DATABASE_URL,
+        connect_args=postgresql_connect_args(
+            settings.DATABASE_URL, settings.REPORTING_STATEMENT_TIMEOUT_MS, transaction_pooler
+        ),
+        **pool_options(
+            settings.REPORTING_POOL_SIZE,
+            settings.REPORTING_MAX_OVERFLOW,
+            settings.REPORTING_POOL_TIMEOUT_SECONDS,
+            transaction_pooler
+        )
+    )
+    instrument_engine(reporting_engine, "reporting")
+    apply_statement_deadlines(
+        reporting_engine, settings.REPORTING_STATEMENT_TIMEOUT_MS, per_transaction=transaction_pooler
+    )
+    ReportingSessionLocal = sessionmaker(reporting_engine, class_=AsyncSession, expire_on_commit=False)
+
+# Optional read replica for get_read_db, with the same pool settings and its
+# own pool metrics; the application lifespan starts its lag checks
+read_router = None
+if settings.READ_REPLICA_URL:
+    replica_engine = create_async_engine(
+        settings.READ_REPLICA_URL,
+        connect_args=postgresql_connect_args(
+            settings.READ_REPLICA_URL, settings.REPORTING_STATEMENT_TIMEOUT_MS, transaction_pooler
+        ),
+        **pool_options(20, 40, 60, transaction_pooler)
+    )
+    instrument_engine(replica_engine, "replica")
+    apply_statement_deadlines(
+        replica_engine, settings.REPORTING_STATEMENT_TIMEOUT_MS, per_transaction=transaction_pooler
+    )
+    read_router = ReadRouter(
+        replica_engine,
+        read_your_writes_seconds=settings.READ_YOUR_WRITES_SECONDS,
+        max_lag_seconds=settings.READ_REPLICA_MAX_LAG_SECONDS,
+        check_interval=settings.READ_REPLICA_CHECK_INTERVAL_SECONDS
+    )
+
 AsyncSessionLocal = sessionmaker(
     engine, 
     class_=AsyncSession, 
     expire_on_commit=False
 )
 
-async def get_db():
-    async with AsyncSessionLocal() as session:
+def get_read_session_factory():
+    """Session factory of the SQLite read pool; None unless DATABASE_URL is a SQLite file."""
+    return SqliteReadSessionLocal
+
+
+async def get_db(request: Request = None, read_sessions=Depends(get_read_session_factory)):
+    """
+    The request's session.
+
+    On a SQLite file, GET and HEAD requests get a session on the SQLite read
+    pool, so that reads neither wait for the single writer connection nor hold
+    its write lock; other requests (and callers without a request) get the writer.
+    """
+    sessions = AsyncSessionLocal
+    if request is not None and read_sessions is not None and request.method in READ_ONLY_METHODS:
+        sessions = read_sessions
+    async with sessions() as session:
         try:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_db(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    read_sessions=Depends(get_read_session_factory)
+):
+    """
+    Session for endpoints that only read.
+
+    On the SQLite read pool when running on a SQLite file, or on the read
+    replica when one is configured and ``read_router`` allows it for this
+    request's user; otherwise the request's primary session from ``get_db``,
+    which is only connected if used.
+    """
+    if read_sessions is not None:
+        async with read_sessions() as session:
+            yield session
+        return
+    router = read_router
+    if router is None or router.route(
+        request_principal(request.headers), cookie_primary_until(request.cookies)
+    ) != REPLICA:
+        yield db
+        return
+    async with router.sessions() as session:
+        yield session
+
+
+def get_reporting_session_factory():
+    """Session factory of the reporting pool; None runs reports on the default pool."""
+    return ReportingSessionLocal
+
+
+async def get_report_db(
+    db: AsyncSession = Depends(get_read_db),
+    primary_db: AsyncSession = Depends(get_db),
+    reporting_sessions=Depends(get_reporting_session_factory)
+):
+    """
+    Session for reports and statistics.
+
+    The read replica when ``get_read_db`` routes the request there; otherwise
+    a session on the reporting pool, connected up front so that a request
+    finding the pool exhausted fails fast with 503 instead of an error halfway.
+    """
+    if db is not primary_db or reporting_sessions is None:
+        yield db
+        return
+    async with reporting_sessions() as session:
+        try:
+            await session.connection()
+        except exc.TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many reports are running, please retry shortly",
+                headers={"Retry-After": "5"}
+            )
+        yield session
+
+
+def get_session_factory(read_sessions=Depends(get_read_session_factory)):
+    """
+    Session factory for endpoints that open several read-only sessions concurrently.
+
+    On a SQLite file the SQLite read pool: for requests other than GET and
+    HEAD the single writer connection is held by the request's own ``get_db``
+    session, so sessions waiting for it would never get it.
+    """
+    return read_sessions or AsyncSessionLocal
+
+
+def health_pool():
+    """
+    Pool serving reads, whose headroom /health reports and whose pressure
+    admission control sheds reads on: the default pool, or on a SQLite file
+    the read pool, since the single writer connection is busy by design.
+    """
+    if SqliteReadSessionLocal is not None:
+        return sqlite_read_engine.sync_engine.pool
+    return engine.sync_engine.pool
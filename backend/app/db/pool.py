@@ -0,0 +1,150 @@
+"""
+Connection-pool telemetry.
+
+Exports the state of an engine's connection pool through the Prometheus
+metrics in ``core/metrics.py``:
+
+- gauges for the configured size, checked-out and overflow connections
+- a histogram of checkout wait time and a counter of checkout timeouts
+
+(all measured by ``InstrumentedAsyncAdaptedQueuePool``)
+- a histogram of how long each connection is held, labelled by the route of
+  the request that checked it out (see ``PoolMetricsMiddleware``)
+- counters for invalidated connections and failed pre-pings
+
+Usage::
+
+    engine = create_async_engine(url, poolclass=InstrumentedAsyncAdaptedQueuePool, ...)
+    instrument_engine(engine, "default")
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from ..core.metrics import (
+    db_pool_checked_out_connections,
+    db_pool_checkout_timeouts_total,
+    db_pool_checkout_wait_seconds,
+    db_pool_connection_hold_seconds,
+    db_pool_invalidations_total,
+    db_pool_overflow_connections,
+    db_pool_pre_ping_failures_total,
+    db_pool_size,
+)
+
+_CHECKOUT_KEY = "pool_metrics_checkout"
+
+# Weight of the latest checkout in InstrumentedAsyncAdaptedQueuePool.recent_wait
+WAIT_SMOOTHING = 0.2
+
+_request_scope: ContextVar[Optional[dict]] = ContextVar("pool_request_scope", default=None)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that exports its usage, checkout wait time and timeouts.
+
+    The usage gauges are updated on every checkout and return rather than read
+    at scrape time, since callback gauges are not supported in Prometheus
+    multiprocess mode.
+    """
+
+    metrics_name = "default"
+
+    # Exponentially weighted checkout wait and when it was last updated, read
+    # by admission control (core/admission.py) to shed load early
+    recent_wait: float = 0.0
+    recent_wait_at: float = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            db_pool_checkout_timeouts_total.labels(pool=self.metrics_name).inc()
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            db_pool_checkout_wait_seconds.labels(pool=self.metrics_name).observe(wait)
+            self.recent_wait = WAIT_SMOOTHING * wait + (1 - WAIT_SMOOTHING) * self.recent_wait
+            self.recent_wait_at = time.monotonic()
+            self._update_usage()
+
+    def _do_return_conn(self, record) -> None:
+        try:
+            super()._do_return_conn(record)
+        finally:
+            self._update_usage()
+
+    def _update_usage(self) -> None:
+        db_pool_checked_out_connections.labels(pool=self.metrics_name).set(self.checkedout())
+        db_pool_overflow_connections.labels(pool=self.metrics_name).set(max(0, self.overflow()))
+
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        pool = super().recreate()
+        pool.metrics_name = self.metrics_name
+        return pool
+
+
+@contextmanager
+def bind_request_scope(scope: dict) -> Iterator[None]:
+    """Attribute connections checked out in this block to the request ``scope``."""
+    token = _request_scope.set(scope)
+    try:
+        yield
+    finally:
+        _request_scope.reset(token)
+
+
+def _route_label(scope: Optional[dict]) -> str:
+    """Route template of the request holding a connection ("none" outside requests)."""
+    if scope is None:
+        return "none"
+    return getattr(scope.get("route"), "path", None) or "unmatched"
+
+
+def instrument_engine(engine: AsyncEngine, name: str = "default") -> None:
+    """
+    Export the pool telemetry of ``engine`` under the ``pool`` label ``name``.
+
+    Pool size, usage, checkout wait time and timeouts are only recorded when
+    the engine uses ``InstrumentedAsyncAdaptedQueuePool``; hold time,
+    invalidations and pre-ping failures work with any pool.
+    """
+    sync_engine = engine.sync_engine
+    pool = sync_engine.pool
+    if isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        pool.metrics_name = name
+        db_pool_size.labels(pool=name).set(pool.size())
+        pool._update_usage()
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_conn, connection_record, connection_proxy):
+        connection_record.info[_CHECKOUT_KEY] = (time.perf_counter(), _request_scope.get())
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_conn, connection_record):
+        checkout = connection_record.info.pop(_CHECKOUT_KEY, None)
+        if checkout is not None:
+            start, scope = checkout
+            db_pool_connection_hold_seconds.labels(pool=name, route=_route_label(scope)).observe(
+                time.perf_counter() - start
+            )
+
+    @event.listens_for(pool, "invalidate")
+    def on_invalidate(dbapi_conn, connection_record, exception):
+        db_pool_invalidations_total.labels(pool=name, kind="hard").inc()
+
+    @event.listens_for(pool, "soft_invalidate")
+    def on_soft_invalidate(dbapi_conn, connection_record, exception):
+        db_pool_invalidations_total.labels(pool=name, kind="soft").inc()
+
+    @event.listens_for(sync_engine, "handle_error")
+    def on_error(context):
+        if context.is_pre_ping:
+            db_pool_pre_ping_failures_total.labels(pool=name).inc()
@@ -0,0 +1,198 @@
+"""
+Read-replica routing.
+
+``get_read_db`` (``db/base.py``) gives endpoints that only read a session on
+the read replica, when one is configured. ``ReadRouter`` decides per request:
+
+- primary when the user wrote within the read-your-writes window. Writes are
+  remembered per user in this process (``record_write``) and, so that other
+  workers see them too, in a short-lived cookie set on the write's response
+  (``ReadYourWritesMiddleware``).
+- primary while the replica is unavailable: its last lag check failed, is
+  older than a few check intervals, or measured more lag than allowed
+- the replica otherwise
+
+The lag is checked in the background on the replica's own pool, so a replica
+that is overloaded (no connection within the check timeout) also falls back.
+On PostgreSQL it is the age of the last replayed transaction, counted as zero
+while the replica has replayed everything it received, since an idle primary
+sends nothing to replay. Other databases, e.g. a second SQLite file for local
+testing, only get a connectivity check and report no lag.
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from ..core.metrics import db_read_routing_total, db_replica_available, db_replica_lag_seconds
+from ..core.security.jwt import verify_token
+
+logger = logging.getLogger(__name__)
+
+PRIMARY = "primary"
+REPLICA = "replica"
+
+# Cookie carrying the end of the read-your-writes window (Unix time) to other workers
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+POSTGRESQL_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+# Forgotten writes are pruned once this many principals are tracked
+MAX_TRACKED_WRITERS = 10000
+
+
+class ReplicaLag(NamedTuple):
+    """Outcome of one replica lag check."""
+    ok: bool
+    checked_monotonic: float
+    lag_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+class ReadRouter:
+    """
+    Route reads between the primary and a read replica.
+
+    Args:
+        engine: Engine of the read replica
+        read_your_writes_seconds: How long a user keeps reading from the
+            primary after a write
+        max_lag_seconds: Fall back to the primary above this replication lag
+        check_interval: Seconds between lag checks
+        check_timeout: A lag check taking longer than this fails
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        read_your_writes_seconds: float = 5.0,
+        max_lag_seconds: float = 10.0,
+        check_interval: float = 5.0,
+        check_timeout: float = 2.0
+    ):
+        self.engine = engine
+        self.sessions = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self.last: Optional[ReplicaLag] = None
+        # Principal -> monotonic time until which it reads from the primary
+        self._writers: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    # Read-your-writes
+
+    def record_write(self, principal: str) -> None:
+        now = time.monotonic()
+        if len(self._writers) >= MAX_TRACKED_WRITERS:
+            self._writers = {p: until for p, until in self._writers.items() if until > now}
+        self._writers[principal] = now + self.read_your_writes_seconds
+
+    def wrote_recently(self, principal: Optional[str], primary_until: Optional[float] = None) -> bool:
+        """Whether ``principal`` (or the cookie's ``primary_until``) is inside its write window."""
+        if primary_until is not None and primary_until > time.time():
+            return True
+        return principal is not None and self._writers.get(principal, 0.0) > time.monotonic()
+
+    # Replica availability
+
+    @property
+    def available(self) -> bool:
+        check = self.last
+        if check is None or not check.ok:
+            return False
+        if time.monotonic() - check.checked_monotonic > 3 * self.check_interval:
+            return False
+        return check.lag_seconds is None or check.lag_seconds <= self.max_lag_seconds
+
+    def route(self, principal: Optional[str], primary_until: Optional[float] = None) -> str:
+        """PRIMARY or REPLICA for a read by ``principal``; counted in ``db_read_routing_total``."""
+        if self.wrote_recently(principal, primary_until):
+            target, reason = PRIMARY, "recent_write"
+        elif not self.available:
+            target, reason = PRIMARY, "replica_unavailable"
+        else:
+            target, reason = REPLICA, "replica"
+        db_read_routing_total.labels(target=target, reason=reason).inc()
+        return target
+
+    async def check(self) -> ReplicaLag:
+        """Measure the replica's lag and store the result."""
+        try:
+            lag = await asyncio.wait_for(self._measure(), self.check_timeout)
+            check = ReplicaLag(ok=True, checked_monotonic=time.monotonic(), lag_seconds=lag)
+        except asyncio.TimeoutError:
+            check = ReplicaLag(False, time.monotonic(), error=f"no response within {self.check_timeout:g}s")
+        except Exception as e:
+            check = ReplicaLag(False, time.monotonic(), error=str(e) or type(e).__name__)
+
+        was_available = self.available if self.last is not None else None
+        self.last = check
+        if check.lag_seconds is not None:
+            db_replica_lag_seconds.set(check.lag_seconds)
+        db_replica_available.set(1 if self.available else 0)
+        if was_available is not None and was_available != self.available:
+            if self.available:
+                logger.info("Read replica available again (lag %.1fs)", check.lag_seconds or 0.0)
+            elif check.ok:
+                logger.warning("Read replica lag %.1fs, reading from the primary", check.lag_seconds)
+            else:
+                logger.warning("Read replica check failed, reading from the primary: %s", check.error)
+        return check
+
+    async def _measure(self) -> float:
+        async with self.engine.connect() as conn:
+            if conn.dialect.name == "postgresql":
+                return float((await conn.execute(POSTGRESQL_LAG_QUERY)).scalar() or 0.0)
+            await conn.execute(text("SELECT 1"))
+            return 0.0
+
+    async def start(self) -> None:
+        """Run a first check, then keep checking in the background."""
+        await self.check()
+        self._task = asyncio.create_task(self._run(), name="replica-lag-check")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.check()
+
+    async def stop(self) -> None:
+        """Stop checking and close the replica's connections."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.engine.dispose()
+
+
+def request_principal(headers: Dict[str, str]) -> Optional[str]:
+    """User id of the bearer token in ``headers`` (lower-cased names), if it is valid."""
+    authorization = headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return verify_token(token)
+
+
+def cookie_primary_until(cookies: Dict[str, str]) -> Optional[float]:
+    value = cookies.get(READ_PRIMARY_COOKIE)
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
@@ -0,0 +1,91 @@
+"""
+SQLite deployment profile.
+
+Self-hosted installs run on a SQLite file. With one pool of ordinary
+connections, concurrent chore completions fail with "database is locked":
+pysqlite starts transactions lazily, so two requests that read and then
+write both hold read snapshots, and the second one to write cannot upgrade.
+
+When ``DATABASE_URL`` is a SQLite file, ``db/base.py`` instead uses:
+
+- a writer engine with a single connection for ``get_db``, whose
+  transactions begin with ``BEGIN IMMEDIATE`` and so take the write lock up
+  front. Requests queue for that connection in its pool, in order, instead of
+  racing for the lock (``busy_timeout`` covers other processes).
+- a pool of read-only connections for the ``get_db`` sessions of GET and
+  HEAD requests, ``get_read_db``, ``get_report_db`` and
+  ``get_session_factory`` (reports, statistics, activity feeds and the
+  dashboard sections), which in WAL mode read the last committed state
+  without waiting for the writer
+
+Only requests with other methods run on the writer: their ``get_db``
+session begins IMMEDIATE on first use and holds the write lock until the
+request ends, so GET endpoints must not write.
+
+Every connection gets the pragmas of ``SqlitePragmas`` when it is opened.
+"""
+from typing import NamedTuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+# Requests whose get_db session is on the read pool
+READ_ONLY_METHODS = {"GET", "HEAD"}
+
+
+class SqlitePragmas(NamedTuple):
+    busy_timeout_ms: int = 5000
+    synchronous: str = "NORMAL"     # Durable across crashes in WAL mode; may lose the last commits on power loss
+    cache_size_kib: int = 65536
+    mmap_size_bytes: int = 256 * 1024 * 1024
+
+    def statements(self, writer: bool):
+        if self.synchronous.upper() not in SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid SQLite synchronous mode: {self.synchronous!r}")
+        yield f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}"
+        # Persistent in the file; whichever connection opens first switches it
+        yield "PRAGMA journal_mode = WAL"
+        yield f"PRAGMA synchronous = {self.synchronous}"
+        yield f"PRAGMA cache_size = -{int(self.cache_size_kib)}"
+        yield f"PRAGMA mmap_size = {int(self.mmap_size_bytes)}"
+        yield "PRAGMA temp_store = MEMORY"
+        if not writer:
+            yield "PRAGMA query_only = ON"
+
+
+def is_sqlite_file(url: str) -> bool:
+    """Whether ``url`` is a SQLite database file (not in-memory)."""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:")
+
+
+def configure_sqlite_engine(engine: AsyncEngine, pragmas: SqlitePragmas, *, writer: bool) -> None:
+    """
+    Apply ``pragmas`` to every new connection of ``engine`` and take over transaction control.
+
+    Args:
+        engine: Engine on a SQLite file
+        pragmas: Connection settings
+        writer: Begin transactions IMMEDIATE (the single writer connection);
+            otherwise connections are read-only and begin deferred transactions
+    """
+    sync_engine = engine.sync_engine
+    begin = "BEGIN IMMEDIATE" if writer else "BEGIN"
+
+    @event.listens_for(sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        # Stop pysqlite from beginning transactions itself, so they begin here
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in pragmas.statements(writer):
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    @event.listens_for(sync_engine, "begin")
+    def on_begin(conn):
+        conn.exec_driver_sql(begin)
@@ -3,10 +3,11 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db.base import get_db
+from ..db.base import get_db, get_read_db, get_report_db
 from ..repositories.user import UserRepository
 from ..repositories.family import FamilyRepository
 from ..core.security.jwt import verify_token
+from ..core.tracing import traced
 from ..models.user import User
 from ..models.family import Family
 
@@ -21,11 +22,8 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/login")
 user_repo = UserRepository()
 family_repo = FamilyRepository()
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get the current authenticated user."""
+async def _authenticate(token: str, db: AsyncSession, fallback_db: Optional[AsyncSession] = None) -> User:
+    """User of ``token``, looked up on ``db`` and, if missing there, on ``fallback_db``."""
     user_id = verify_token(token)
     if not user_id:
         raise HTTPException(
@@ -35,6 +33,8 @@ async def get_current_user(
         )
     
     user = await user_repo.get(db, id=int(user_id))
+    if not user and fallback_db is not None and fallback_db is not db:
+        user = await user_repo.get(fallback_db, id=int(user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -52,6 +52,39 @@ async def get_current_user(
     return user
 
 
+@traced("auth")
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Get the current authenticated user."""
+    return await _authenticate(token, db)
+
+
+def current_user_on(get_session):
+    """
+    Dependency authenticating the user on the session of ``get_session``.
+
+    For endpoints whose queries use a session other than ``get_db``'s (a read
+    replica, the reporting pool), so the request needs one connection; a user
+    that session's database does not have yet is looked up on the primary.
+    """
+    @traced("auth")
+    async def current_user(
+        token: str = Depends(oauth2_scheme),
+        db: AsyncSession = Depends(get_session),
+        primary_db: AsyncSession = Depends(get_db)
+    ) -> User:
+        return await _authenticate(token, db, fallback_db=primary_db)
+
+    return current_user
+
+
+# For endpoints reading through get_read_db and get_report_db
+get_current_read_user = current_user_on(get_read_db)
+get_current_report_user = current_user_on(get_report_db)
+
+
 async def get_current_user_with_family(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
@@ -4,7 +4,7 @@ Service dependencies for FastAPI dependency injection.
 from typing import Annotated
 from fastapi import Depends
 
-from ..services import UserService, ChoreService, RewardAdjustmentService
+from ..services import UserService, ChoreService, RewardAdjustmentService, SyncService, DashboardService
 
 
 def get_user_service() -> UserService:
@@ -22,7 +22,19 @@ def get_reward_adjustment_service() -> RewardAdjustmentService:
     return RewardAdjustmentService()
 
 
+def get_sync_service() -> SyncService:
+    """Get sync service instance."""
+    return SyncService()
+
+
+def get_dashboard_service() -> DashboardService:
+    """Get dashboard service instance."""
+    return DashboardService()
+
+
 # Type aliases for cleaner dependency injection
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 ChoreServiceDep = Annotated[ChoreService, Depends(get_chore_service)]
-RewardAdjustmentServiceDep = Annotated[RewardAdjustmentService, Depends(get_reward_adjustment_service)]
\ No newline at end of file
+RewardAdjustmentServiceDep = Annotated[RewardAdjustmentService, Depends(get_reward_adjustment_service)]
+SyncServiceDep = Annotated[SyncService, Depends(get_sync_service)]
+DashboardServiceDep = Annotated[DashboardService, Depends(get_dashboard_service)]
@@ -1,4 +1,4 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Query, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from datetime import datetime
@@ -7,14 +7,33 @@ from contextlib import asynccontextmanager
 
 from .dependencies.auth import get_current_user
 from . import models, schemas
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import AsyncSession
-from .db.base import get_db
-from typing import Optional
+from .db.base import get_db, health_pool, probe_engine, read_router
+from typing import Literal, Optional
 
 from .core.config import settings
 from .middleware.rate_limit import setup_rate_limiting
 from .middleware.request_validation import RequestValidationMiddleware
-from .core.logging import setup_query_logging, setup_connection_pool_logging
+from .middleware.query_stats import QueryStatsMiddleware
+from .middleware.pool_metrics import PoolMetricsMiddleware
+from .middleware.read_your_writes import ReadYourWritesMiddleware
+from .middleware.admission import AdmissionMiddleware
+from .core.admission import AdmissionController, parse_limits
+from .middleware.deadline import DeadlineMiddleware, deadline_exceeded_handler, statement_timeout_handler
+from .core.deadline import DeadlineExceeded, parse_deadlines
+from .middleware.profiling import ProfilingMiddleware
+from .middleware.request_id import RequestIdMiddleware
+from .middleware.tracing import TracedMiddleware, TracingMiddleware
+from .core.tracing import TracedJSONResponse, setup_tracing_exporter, shutdown_tracing_exporter
+from .core.structured_logging import parse_sample_rates, setup_logging, shutdown_logging
+from .core.health import current_health, start_health_prober, stop_health_prober
+from .core.logging import (
+    setup_query_logging,
+    setup_connection_pool_logging,
+    setup_statement_profiler,
+    statement_profiler,
+)
 
 from .api.api_v1.api import api_router
 
@@ -49,6 +68,15 @@ def redact_database_url(url: str) -> str:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown events."""
+    # Write logs from a background thread, as JSON lines with request ids
+    if settings.STRUCTURED_LOGGING_ENABLED:
+        setup_logging(
+            level=settings.LOG_LEVEL,
+            json_format=settings.LOG_FORMAT.lower() == "json",
+            sample_rates=parse_sample_rates(settings.LOG_SAMPLE_RATES),
+            queue_size=settings.LOG_QUEUE_SIZE
+        )
+
     # Startup
     print(f"Starting {settings.APP_NAME}...")
     print(f"Database URL: {redact_database_url(settings.DATABASE_URL)}")
@@ -63,6 +91,29 @@ async def lifespan(app: FastAPI):
     if os.getenv("LOG_CONNECTION_POOL") == "true":
         setup_connection_pool_logging()
 
+    # Setup the statement profiler if enabled
+    if settings.STATEMENT_PROFILER_ENABLED:
+        setup_statement_profiler(max_statements=settings.STATEMENT_PROFILER_MAX_STATEMENTS)
+
+    # Export sampled request traces if configured
+    if settings.TRACING_ENABLED and settings.TRACING_EXPORT_PATH:
+        setup_tracing_exporter(settings.TRACING_EXPORT_PATH, service_name=settings.APP_NAME)
+        print(f"✅ Exporting sampled traces to {settings.TRACING_EXPORT_PATH}")
+
+    # Check the database in the background; health probes serve the cached result
+    if settings.HEALTH_PROBER_ENABLED:
+        await start_health_prober(
+            probe_engine,
+            interval=settings.HEALTH_PROBE_INTERVAL_SECONDS,
+            timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS
+        )
+        print("✅ Background health prober started")
+
+    # Route report and statistics reads to the replica while its lag allows
+    if read_router is not None:
+        await read_router.start()
+        print(f"✅ Read replica: {redact_database_url(settings.READ_REPLICA_URL)}")
+
     # Import metrics to register them with Prometheus
     from .core import metrics  # noqa: F401 - Import to register metrics
 
@@ -80,12 +131,19 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print(f"Shutting down {settings.APP_NAME}...")
+    await stop_health_prober()
+    if read_router is not None:
+        await read_router.stop()
+    shutdown_tracing_exporter()
+    metrics.mark_worker_dead()
+    shutdown_logging()
 
 
 app = FastAPI(
     title=settings.APP_NAME,
     redirect_slashes=False,  # Disable automatic trailing slash redirects
     lifespan=lifespan,
+    default_response_class=TracedJSONResponse,
     description="""
 # Chores Tracker API
 
@@ -196,10 +254,16 @@ Min/max range defined at creation. Parent sets final amount on approval.
         {"name": "chores", "description": "Chore management operations"},
         {"name": "adjustments", "description": "Balance adjustments"},
         {"name": "families", "description": "Family management and multi-parent operations"},
+        {"name": "sync", "description": "Delta sync for offline clients"},
+        {"name": "dashboard", "description": "Composite startup data for the child and parent apps"},
         {"name": "admin", "description": "Administrative operations"},
     ]
 )
 
+# Profile single requests for trusted callers sending X-Profile (innermost middleware)
+if settings.PROFILER_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
 # Configure CORS with security best practices
 # Note: Never use allow_origins=["*"] with allow_credentials=True
 app.add_middleware(
@@ -208,15 +272,51 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],  # Explicit methods
     allow_headers=["Content-Type", "Authorization", "Accept"],  # Explicit headers
-    expose_headers=["Content-Length", "Content-Type"],
+    expose_headers=["Content-Length", "Content-Type", "X-Request-ID"],
     max_age=600,  # Cache preflight requests for 10 minutes
 )
 
 # Setup rate limiting
 setup_rate_limiting(app)
 
-# Add request validation middleware
-app.add_middleware(RequestValidationMiddleware)
+# Add request validation middleware (traced as "validation")
+app.add_middleware(TracedMiddleware, wrapped=RequestValidationMiddleware, name="validation")
+
+# Label connection-pool hold times with the route holding the connection
+app.add_middleware(PoolMetricsMiddleware)
+
+# Keep a user's reads on the primary right after their writes (no-op without a replica)
+app.add_middleware(ReadYourWritesMiddleware)
+
+# Record per-request query counts, DB time and likely N+1 patterns
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
+# Shed requests with an early 503 when the database cannot keep up
+if settings.ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(
+        AdmissionMiddleware,
+        controller=AdmissionController(
+            parse_limits(settings.ADMISSION_LIMITS),
+            max_in_flight=settings.ADMISSION_MAX_IN_FLIGHT,
+            pool_wait_ms=settings.ADMISSION_POOL_WAIT_MS,
+            pool=health_pool
+        )
+    )
+
+# Give each request a deadline, answered with 504 when it runs out, and cancel
+# requests whose client disconnects (outside admission, so queueing counts)
+if settings.REQUEST_DEADLINES_ENABLED:
+    app.add_middleware(DeadlineMiddleware, budgets=parse_deadlines(settings.REQUEST_DEADLINES))
+app.add_exception_handler(DeadlineExceeded, deadline_exceeded_handler)
+app.add_exception_handler(exc.DBAPIError, statement_timeout_handler)
+
+# Tag every log record with the request's id
+app.add_middleware(RequestIdMiddleware)
+
+# Trace requests and add the Server-Timing header (outermost, added last)
+if settings.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
 
 # Add API documentation routes before including the main API router
 @app.get("/api/v1/docs")
@@ -251,9 +351,11 @@ instrumentator = Instrumentator(
 instrumentator.instrument(app)
 
 # Manually create protected metrics endpoint with IP whitelist/token authentication
-from fastapi.responses import Response
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from fastapi.responses import PlainTextResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+from .core.metrics import generate_metrics
 from .core.metrics_auth import check_metrics_access
+from .core.profiler import ProfilerBusyError, get_stored_profile, profile_worker
 
 
 @app.get("/metrics", dependencies=[Depends(check_metrics_access)], include_in_schema=False)
@@ -266,12 +368,81 @@ async def metrics_endpoint() -> Response:
     - Internal networks (10.0.0.0/8, 172.16.0.0/12, 192.168.0.0/16)
     - Bearer token (if METRICS_AUTH_TOKEN env var is set)
 
+    With several workers (PROMETHEUS_MULTIPROC_DIR set), the samples of all
+    workers are aggregated, so every scrape sees the same totals whichever
+    worker answers it.
+
     Returns:
         Prometheus metrics in text format
     """
-    metrics_output = generate_latest()
+    metrics_output = generate_metrics()
     return Response(content=metrics_output, media_type=CONTENT_TYPE_LATEST)
 
+
+@app.get("/metrics/statements", dependencies=[Depends(check_metrics_access)], include_in_schema=False)
+async def statement_statistics(
+    limit: int = Query(20, ge=1, le=500),
+    order_by: Literal["total_time", "calls", "mean_time", "p95_time", "rows"] = "total_time"
+):
+    """
+    Top SQL statement fingerprints by total time, calls, mean/p95 time or rows (IP-restricted).
+
+    Statistics are collected per process while STATEMENT_PROFILER_ENABLED is set.
+    """
+    return {
+        "enabled": statement_profiler.enabled,
+        "tracked_statements": len(statement_profiler),
+        "deallocations": statement_profiler.deallocations,
+        "statements": statement_profiler.top(limit=limit, order_by=order_by),
+    }
+
+
+@app.delete("/metrics/statements", dependencies=[Depends(check_metrics_access)], include_in_schema=False)
+async def reset_statement_statistics():
+    """Discard the collected statement statistics (IP-restricted)."""
+    statement_profiler.reset()
+    return {"status": "reset"}
+
+
+@app.get("/debug/profile", dependencies=[Depends(check_metrics_access)], include_in_schema=False)
+async def sampling_profile(
+    seconds: float = Query(5, gt=0),
+    interval_ms: Optional[float] = Query(None, ge=1, le=1000),
+    tasks: bool = True
+) -> Response:
+    """
+    Sample the stacks of this worker for `seconds` (IP-restricted).
+
+    Returns collapsed stacks (`frame;frame;frame count`) for flame graph tools.
+    With `tasks=true`, the await chain of every asyncio task is included too.
+    """
+    if not settings.PROFILER_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiler is disabled")
+    if seconds > settings.PROFILER_MAX_SECONDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Profiles are limited to {settings.PROFILER_MAX_SECONDS} seconds"
+        )
+
+    try:
+        profiler = await profile_worker(
+            seconds,
+            interval=(interval_ms or settings.PROFILER_SAMPLE_INTERVAL_MS) / 1000,
+            include_tasks=tasks
+        )
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return PlainTextResponse(profiler.collapsed(), headers={"X-Profile-Samples": str(profiler.samples)})
+
+
+@app.get("/debug/profile/{profile_id}", dependencies=[Depends(check_metrics_access)], include_in_schema=False)
+async def request_profile(profile_id: str) -> Response:
+    """Collapsed stacks of a request profiled via the X-Profile header (IP-restricted)."""
+    collapsed = get_stored_profile(profile_id)
+    if collapsed is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return PlainTextResponse(collapsed)
+
 @app.get("/")
 async def root():
     """Root endpoint - returns API information."""
@@ -294,17 +465,17 @@ async def health_check(db: AsyncSession = Depends(get_db)):
     - GET /api/v1/health (basic liveness)
     - GET /api/v1/health/ready (readiness with DB check)
     - GET /api/v1/health/detailed (component diagnostics)
+
+    Like the readiness check, this is answered from the background health
+    prober's last database check.
     """
-    try:
-        # Try to execute a simple query
-        from sqlalchemy import text
-        result = await db.execute(text("SELECT 1"))
+    report = await current_health(db, health_pool())
+    if report.ready:
         return {"status": "healthy", "database": "connected"}
-    except Exception as e:
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={"status": "unhealthy", "database": "disconnected", "error": str(e)}
-        )
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "unhealthy", "database": "disconnected", "error": "; ".join(report.issues)}
+    )
 
 # Additional API endpoints that were mixed with HTML endpoints
 
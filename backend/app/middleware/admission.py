@@ -0,0 +1,49 @@
+"""
+Admission-control middleware.
+
+Asks ``core/admission.py``'s ``AdmissionController`` whether each request
+may run and answers 503 with Retry-After right away when it is shed, before
+any routing, authentication or database work. The request's lane slot is
+released once its response has been sent.
+"""
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ..core.admission import ADMITTED, RETRY_AFTER, AdmissionController, classify
+
+
+class AdmissionMiddleware:
+    """Middleware shedding requests that admission control does not admit."""
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        route_class = classify(scope["method"], scope["path"]) if scope["type"] == "http" else None
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        decision = await self.controller.admit(route_class)
+        if decision != ADMITTED:
+            await send_shed_response(send, RETRY_AFTER[route_class])
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(route_class)
+
+
+async def send_shed_response(send: Send, retry_after: int) -> None:
+    body = orjson.dumps({"detail": "Server is busy, please retry shortly"})
+    await send({
+        "type": "http.response.start",
+        "status": 503,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(retry_after).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
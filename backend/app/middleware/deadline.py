@@ -0,0 +1,156 @@
+"""
+Request deadline middleware.
+
+Gives each request its deadline (``core/deadline.py``) and runs it while
+listening for the client:
+
+- the request is cancelled, with any query it is waiting on, when the client
+  disconnects before the response is complete. Servers also report a
+  disconnect once the response has been sent, while the app may still be
+  cleaning up (closing its session); that one is not an abandoned request.
+- a request that has not started its response by the deadline (plus
+  ``GRACE_SECONDS``, so that the database's own statement timeout fires first
+  and the transaction is rolled back normally) is cancelled and gets 504
+
+The exception handlers turn deadline and statement timeout errors raised
+inside endpoints into 504s with distinct details.
+"""
+import asyncio
+from typing import Dict
+
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import exc
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.admission import classify
+from ..core.deadline import (
+    DEADLINE_DETAIL,
+    STATEMENT_TIMEOUT_DETAIL,
+    TIMEOUT_HEADER,
+    DeadlineExceeded,
+    bind_deadline,
+    current_deadline,
+    is_statement_timeout,
+    request_deadline,
+)
+from ..core.metrics import request_timeouts_total
+
+# Time past the deadline before the request itself is cancelled
+GRACE_SECONDS = 1.0
+
+
+class DeadlineMiddleware:
+    """Middleware enforcing request deadlines and cancelling abandoned requests."""
+
+    def __init__(self, app: ASGIApp, budgets: Dict[str, float]):
+        self.app = app
+        self.budgets = budgets
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        route_class = classify(scope["method"], scope["path"]) if scope["type"] == "http" else None
+        if route_class not in self.budgets:
+            await self.app(scope, receive, send)
+            return
+
+        requested = None
+        for name, value in scope["headers"]:
+            if name == TIMEOUT_HEADER.encode():
+                requested = value.decode("latin-1")
+        deadline = request_deadline(route_class, self.budgets[route_class], requested)
+
+        # Read the client's messages ahead, so that a disconnect is noticed
+        # while the endpoint is still working
+        messages: asyncio.Queue = asyncio.Queue()
+        disconnected = asyncio.Event()
+
+        async def listen() -> None:
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    disconnected.set()
+                    return
+
+        response_started = False
+        response_complete = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started, response_complete
+            if message["type"] == "http.response.start":
+                response_started = True
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        with bind_deadline(deadline):
+            app_task = asyncio.ensure_future(self.app(scope, messages.get, send_wrapper))
+        listener = asyncio.ensure_future(listen())
+        disconnect = asyncio.ensure_future(disconnected.wait())
+        try:
+            waiting = {app_task, disconnect}
+            while True:
+                timeout = None if response_started else max(0.0, deadline.remaining + GRACE_SECONDS)
+                done, _ = await asyncio.wait(waiting, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if app_task in done:
+                    app_task.result()
+                    return
+                if disconnect in done:
+                    if response_complete:
+                        # Reported after the response: let the app finish its cleanup
+                        waiting = {app_task}
+                        continue
+                    await cancel(app_task)
+                    request_timeouts_total.labels(route_class=route_class, cause="client_disconnect").inc()
+                    return
+                if not response_started:
+                    await cancel(app_task)
+                    request_timeouts_total.labels(route_class=route_class, cause="deadline").inc()
+                    await send_timeout_response(send, DEADLINE_DETAIL)
+                    return
+        finally:
+            for task in (app_task, listener, disconnect):
+                await cancel(task)
+
+
+async def cancel(task: asyncio.Future) -> None:
+    if task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def send_timeout_response(send: Send, detail: str) -> None:
+    body = orjson.dumps({"detail": detail})
+    await send({
+        "type": "http.response.start",
+        "status": 504,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def _timeout_response(request: Request, cause: str, detail: str) -> JSONResponse:
+    deadline = current_deadline()
+    route_class = deadline.route_class if deadline is not None else classify(request.method, request.url.path)
+    request_timeouts_total.labels(route_class=route_class or "none", cause=cause).inc()
+    return JSONResponse(status_code=504, content={"detail": detail})
+
+
+async def deadline_exceeded_handler(request: Request, error: DeadlineExceeded) -> JSONResponse:
+    """504 for a request whose budget ran out before a transaction started."""
+    return _timeout_response(request, "deadline", DEADLINE_DETAIL)
+
+
+async def statement_timeout_handler(request: Request, error: exc.DBAPIError) -> JSONResponse:
+    """504 for a statement cancelled by its statement_timeout; other database errors propagate."""
+    if not is_statement_timeout(error):
+        raise error
+    return _timeout_response(request, "statement_timeout", STATEMENT_TIMEOUT_DETAIL)
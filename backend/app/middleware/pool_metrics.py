@@ -0,0 +1,26 @@
+"""
+Connection-pool attribution middleware.
+
+Binds the ASGI scope of each request so that the pool telemetry in
+``db/pool.py`` can label connection hold time with the route that held the
+connection. The route is read when the connection is returned, after
+routing has filled it in.
+"""
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ..db.pool import bind_request_scope
+
+
+class PoolMetricsMiddleware:
+    """Middleware attributing pooled connections to the current request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with bind_request_scope(scope):
+            await self.app(scope, receive, send)
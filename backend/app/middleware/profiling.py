@@ -0,0 +1,71 @@
+"""
+Per-request profiling middleware.
+
+A trusted caller can profile a single request by sending an ``X-Profile``
+header. The caller is trusted if its IP address is allowed to read
+``/metrics``, or if the header value is the metrics bearer token (the
+``Authorization`` header carries the user's own token on API calls). Other
+callers' ``X-Profile`` headers are ignored.
+
+The response carries an ``X-Profile-Id`` header. The collapsed stacks can be
+fetched from ``GET /debug/profile/{profile_id}`` once the request has finished.
+
+This middleware must be the innermost one: Starlette's ``BaseHTTPMiddleware``
+runs the rest of the application in a new task, and only the task that runs
+the endpoint is profiled.
+"""
+import asyncio
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core import metrics_auth
+from ..core.config import settings
+from ..core.profiler import SamplingProfiler, new_profile_id, store_profile
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+def _is_trusted(scope: Scope, header_value: str) -> bool:
+    access_control = metrics_auth.metrics_access_control
+    if access_control is None:
+        return False
+    client = scope.get("client")
+    if client and access_control.is_ip_allowed(client[0]):
+        return True
+    return access_control.is_token_valid(header_value)
+
+
+class ProfilingMiddleware:
+    """Middleware profiling requests that carry a trusted X-Profile header."""
+
+    def __init__(self, app: ASGIApp, interval: Optional[float] = None):
+        self.app = app
+        self.interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header_value = Headers(scope=scope).get(PROFILE_HEADER)
+        if header_value is None or not _is_trusted(scope, header_value):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = new_profile_id()
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(PROFILE_ID_HEADER, profile_id)
+            await send(message)
+
+        interval = self.interval or settings.PROFILER_REQUEST_INTERVAL_MS / 1000
+        profiler = SamplingProfiler(interval, task=asyncio.current_task()).start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            store_profile(profile_id, profiler.collapsed())
@@ -0,0 +1,69 @@
+"""
+Per-request query statistics middleware.
+
+Records every SQL statement executed while handling a request, observes the
+count and database time in Prometheus histograms labelled by route template,
+and logs a warning when one statement fingerprint repeats often enough to
+suggest an N+1 query pattern.
+
+This is a plain ASGI middleware rather than a ``BaseHTTPMiddleware`` so the
+endpoint runs in the same context as the recorder (and streaming responses
+are not buffered).
+"""
+import logging
+from typing import Optional
+
+from prometheus_fastapi_instrumentator.routing import get_route_name
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ..core.config import settings
+from ..core.metrics import record_request_queries
+from ..core.query_stats import install_query_recorder, record_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """Middleware recording per-request query counts and N+1 suspects."""
+
+    def __init__(self, app: ASGIApp, repeat_threshold: Optional[int] = None):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+        install_query_recorder()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with record_queries() as recorder:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self._report(scope, recorder)
+
+    def _report(self, scope: Scope, recorder) -> None:
+        """Publish the statistics of a finished request."""
+        if not recorder.count:
+            return
+
+        # Same route template as the `handler` label of the HTTP metrics
+        path = get_route_name(HTTPConnection(scope), should_include_root_path=False)
+        if path is None:
+            # Unmatched paths (404s) would create one label set per URL
+            return
+
+        method = scope["method"]
+        repeated = recorder.repeated(self.repeat_threshold or settings.QUERY_REPEAT_THRESHOLD)
+        for statement, count in repeated:
+            logger.warning(
+                "Possible N+1 query: %s %s ran the same statement %d times (%d statements, %.1f ms in DB): %s",
+                method,
+                path,
+                count,
+                recorder.count,
+                recorder.duration * 1000,
+                statement[:200] + "..." if len(statement) > 200 else statement
+            )
+        record_request_queries(method, path, recorder.count, recorder.duration, n_plus_one=bool(repeated))
@@ -83,8 +83,9 @@ def setup_rate_limiting(app):
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
     
-    # Add SlowAPI middleware for request tracking
-    app.add_middleware(SlowAPIMiddleware)
+    # Add SlowAPI middleware for request tracking (traced as "ratelimit")
+    from .tracing import TracedMiddleware
+    app.add_middleware(TracedMiddleware, wrapped=SlowAPIMiddleware, name="ratelimit")
     
     logger.info("Rate limiting configured successfully")
 
@@ -0,0 +1,49 @@
+"""
+Read-your-writes middleware for read-replica routing.
+
+After a successful write (any method but GET, HEAD and OPTIONS answered
+below 400) the user's reads go to the primary for the read-your-writes
+window, so they see their own change even while the replica lags. The write
+is recorded with ``db/replica.py``'s ``ReadRouter`` for this process, and
+the end of the window is set in a short-lived cookie, honoured by
+``get_read_db`` in every worker.
+
+Does nothing unless a read replica is configured.
+"""
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..db import base
+from ..db.replica import READ_PRIMARY_COOKIE, request_principal
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadYourWritesMiddleware:
+    """Middleware keeping a user's reads on the primary right after their writes."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        router = base.read_router
+        if router is None or scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_marking_write(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                principal = request_principal(Headers(scope=scope))
+                if principal is not None:
+                    router.record_write(principal)
+                window = router.read_your_writes_seconds
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{READ_PRIMARY_COOKIE}={time.time() + window:.0f}; Max-Age={window:.0f}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_marking_write)
@@ -0,0 +1,45 @@
+"""
+Request id middleware.
+
+Gives every request an id and binds it for the duration of the request, so
+that each log record written while handling it carries the same
+``request_id`` (see ``core/structured_logging.py``). An ``X-Request-ID`` sent
+by the client or a proxy is reused when it looks like an id; otherwise a new
+one is generated. The id is returned in the ``X-Request-ID`` response header.
+"""
+import re
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.structured_logging import bind_request_id
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Ids are copied into every log line; reject anything else a client might send
+_VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._:-]{1,128}")
+
+
+class RequestIdMiddleware:
+    """Middleware binding a request id to each HTTP request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER)
+        if request_id is None or not _VALID_REQUEST_ID.fullmatch(request_id):
+            request_id = uuid.uuid4().hex
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        with bind_request_id(request_id):
+            await self.app(scope, receive, send_with_request_id)
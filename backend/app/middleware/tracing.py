@@ -0,0 +1,96 @@
+"""
+Request tracing middleware.
+
+``TracingMiddleware`` starts a trace for every HTTP request, adds the
+``Server-Timing`` header to the response and hands sampled traces to the
+exporter. It must be the outermost middleware so that the ``request`` span
+covers all the others.
+
+``TracedMiddleware`` wraps another middleware class and records the time it
+spends before calling the application as a span, e.g. ``validation`` for
+``RequestValidationMiddleware``.
+"""
+from typing import Optional
+
+from prometheus_fastapi_instrumentator.routing import get_route_name
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core import tracing
+from ..core.config import settings
+from ..core.tracing import SPAN_KIND_SERVER, Trace, activate_trace, current_trace, install_db_tracing, span
+
+
+class TracingMiddleware:
+    """Middleware tracing each request and reporting it as Server-Timing."""
+
+    def __init__(self, app: ASGIApp, sample_rate: Optional[float] = None):
+        self.app = app
+        self.sample_rate = sample_rate
+        install_db_tracing()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sample_rate = settings.TRACING_SAMPLE_RATE if self.sample_rate is None else self.sample_rate
+        trace = Trace.from_traceparent(
+            Headers(scope=scope).get("traceparent"),
+            sample_rate,
+            max_spans=settings.TRACING_MAX_SPANS
+        )
+
+        with activate_trace(trace):
+            with span("request", SPAN_KIND_SERVER, **{"http.method": scope["method"]}) as root:
+                async def send_with_timing(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        root.attributes["http.status_code"] = message["status"]
+                        MutableHeaders(scope=message).append("Server-Timing", trace.server_timing())
+                    await send(message)
+
+                try:
+                    await self.app(scope, receive, send_with_timing)
+                finally:
+                    route = get_route_name(HTTPConnection(scope), should_include_root_path=False)
+                    root.attributes["http.route"] = route or "unmatched"
+
+        if trace.sampled and tracing.exporter is not None:
+            tracing.exporter.export(trace)
+
+
+class TracedMiddleware:
+    """
+    Record the time a wrapped middleware spends before calling the application.
+
+        app.add_middleware(TracedMiddleware, wrapped=SlowAPIMiddleware, name="ratelimit")
+
+    The span ends when the middleware hands the request on, or when it returns
+    if it answers the request itself (e.g. a 415 or 429).
+    """
+
+    def __init__(self, app: ASGIApp, wrapped, name: str, **options):
+        self.app = app
+        self.name = name
+        self.middleware = wrapped(self._call_app, **options)
+        self._span_key = f"tracing.{name}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        trace = current_trace()
+        if scope["type"] != "http" or trace is None:
+            await self.middleware(scope, receive, send)
+            return
+
+        own = scope[self._span_key] = trace.start_span(self.name)
+        try:
+            await self.middleware(scope, receive, send)
+        finally:
+            if own is not None and own.duration is None:
+                own.end()
+
+    async def _call_app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        own = scope.pop(self._span_key, None)
+        if own is not None:
+            own.end()
+        await self.app(scope, receive, send)
@@ -4,4 +4,5 @@ from .chore_assignment import ChoreAssignment
 from .reward_adjustment import RewardAdjustment
 from .activity import Activity
 from .family import Family
+from .sync_tombstone import SyncTombstone
 from ..db.base_class import Base
\ No newline at end of file
@@ -1,6 +1,6 @@
 from typing import Optional, TYPE_CHECKING, List
 from datetime import datetime
-from sqlalchemy import String, Float, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import String, Float, Boolean, DateTime, ForeignKey, Text, Index, event, select
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from ..db.base_class import Base
@@ -41,6 +41,10 @@ class Chore(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
     creator_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    # The creator's family, denormalized so family-scoped queries need no join
+    # through users. Filled in on insert and moved along with the creator by
+    # UserRepository.update.
+    family_id: Mapped[Optional[int]] = mapped_column(ForeignKey("families.id"), nullable=True)
 
     # Relationships
     creator: Mapped["User"] = relationship(
@@ -55,6 +59,13 @@ class Chore(Base):
         foreign_keys="[ChoreAssignment.chore_id]"
     )
 
+    __table_args__ = (
+        # Keyset index for delta sync (GET /sync pages by updated_at, id)
+        Index('idx_chores_updated_at_id', 'updated_at', 'id'),
+        # Family chore lists and the unassigned pool
+        Index('idx_chores_family_status', 'family_id', 'is_disabled', 'assignment_mode'),
+    )
+
     # Properties
     @property
     def is_new(self) -> bool:
@@ -102,3 +113,13 @@ class Chore(Base):
             f"<Chore(id={self.id}, title='{self.title}', "
             f"assignment_mode='{self.assignment_mode}')>"
         )
+
+
+@event.listens_for(Chore, "before_insert")
+def default_family_id(mapper, connection, target: Chore) -> None:
+    """Insert chores into their creator's family unless one is given."""
+    if target.family_id is None:
+        from .user import User  # Import here to avoid circular import
+
+        # Looked up by the INSERT itself; the attribute is expired after the flush
+        target.family_id = select(User.family_id).where(User.id == target.creator_id).scalar_subquery()
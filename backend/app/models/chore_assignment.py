@@ -1,7 +1,7 @@
 """ChoreAssignment model for tracking individual chore assignments to users."""
 from typing import TYPE_CHECKING, Optional
 from datetime import datetime
-from sqlalchemy import Integer, Boolean, DateTime, Float, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import Integer, Boolean, DateTime, Float, Text, ForeignKey, UniqueConstraint, Index, event, select
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from ..db.base_class import Base
@@ -41,6 +41,13 @@ class ChoreAssignment(Base):
         nullable=False,
         index=True
     )
+    # The chore's family, denormalized so family-scoped queries need no join
+    # through chores and users. Filled in on insert.
+    family_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        ForeignKey("families.id"),
+        nullable=True
+    )
 
     # Completion tracking
     is_completed: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
@@ -75,6 +82,9 @@ class ChoreAssignment(Base):
     # Constraints
     __table_args__ = (
         UniqueConstraint('chore_id', 'assignee_id', name='unique_chore_assignee'),
+        Index('idx_assignments_updated_at_id', 'updated_at', 'id'),
+        # Pending approvals of a family
+        Index('idx_assignments_family_status', 'family_id', 'is_completed', 'is_approved'),
     )
 
     # Properties
@@ -131,3 +141,13 @@ class ChoreAssignment(Base):
             f"assignee_id={self.assignee_id}, completed={self.is_completed}, "
             f"approved={self.is_approved})>"
         )
+
+
+@event.listens_for(ChoreAssignment, "before_insert")
+def default_family_id(mapper, connection, target: ChoreAssignment) -> None:
+    """Insert assignments into their chore's family unless one is given."""
+    if target.family_id is None:
+        from .chore import Chore  # Import here to avoid circular import
+
+        # Looked up by the INSERT itself; the attribute is expired after the flush
+        target.family_id = select(Chore.family_id).where(Chore.id == target.chore_id).scalar_subquery()
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import String, ForeignKey, DateTime, DECIMAL
+from sqlalchemy import String, ForeignKey, DateTime, DECIMAL, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from ..db.base_class import Base
@@ -18,7 +18,13 @@ class RewardAdjustment(Base):
     amount: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), nullable=False)
     reason: Mapped[str] = mapped_column(String(500), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relationships
     child: Mapped["User"] = relationship("User", foreign_keys=[child_id], back_populates="adjustments_received")
-    parent: Mapped["User"] = relationship("User", foreign_keys=[parent_id], back_populates="adjustments_created")
\ No newline at end of file
+    parent: Mapped["User"] = relationship("User", foreign_keys=[parent_id], back_populates="adjustments_created")
+
+    # Keyset index for delta sync (GET /sync pages by updated_at, id)
+    __table_args__ = (
+        Index('idx_adjustments_updated_at_id', 'updated_at', 'id'),
+    )
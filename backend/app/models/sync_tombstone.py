@@ -0,0 +1,45 @@
+"""SyncTombstone model recording hard deletes for delta-sync clients."""
+from typing import Optional
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from ..db.base_class import Base
+
+
+class SyncTombstone(Base):
+    """
+    Marker left behind when a synced row disappears from a client's view.
+
+    Offline clients only receive rows whose ``updated_at`` moved past their
+    sync cursor, so a hard delete (or a user leaving a family) would otherwise
+    never reach them. A tombstone is written in the same transaction as the
+    delete and is scoped either to a family or, for legacy single-parent
+    accounts, to a user.
+
+    Entity types:
+    - 'chore': a chore was deleted (its assignments are gone with it)
+    - 'assignment': an assignment was removed while reassigning a chore
+    - 'user': a member was removed from the family
+    """
+    __tablename__ = "sync_tombstones"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    entity_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Visibility scope: family-wide, or a single user in legacy mode
+    family_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
+    user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
+
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        Index('idx_sync_tombstones_deleted_at_id', 'deleted_at', 'id'),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SyncTombstone(id={self.id}, entity_type='{self.entity_type}', "
+            f"entity_id={self.entity_id})>"
+        )
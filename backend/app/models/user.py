@@ -1,6 +1,6 @@
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
-from sqlalchemy import String, Boolean, ForeignKey, DateTime, func
+from sqlalchemy import String, Boolean, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..db.base_class import Base
 
@@ -76,3 +76,8 @@ class User(Base):
         back_populates="members",
         foreign_keys="User.family_id"
     )
+
+    # Keyset index for delta sync (GET /sync pages by updated_at, id)
+    __table_args__ = (
+        Index('idx_users_updated_at_id', 'updated_at', 'id'),
+    )
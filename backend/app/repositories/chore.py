@@ -1,14 +1,17 @@
 """Repository for Chore model - data access layer for multi-assignment chores."""
-from typing import Optional, Dict, Any, List
+import logging
+from typing import Optional, Dict, Any, List, Sequence
 from sqlalchemy import select, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import joinedload, selectinload, load_only, raiseload
 from datetime import datetime, timedelta
 
 from .base import BaseRepository
 from ..models.chore import Chore
 from ..models.chore_assignment import ChoreAssignment
 
+logger = logging.getLogger(__name__)
+
 
 class ChoreRepository(BaseRepository[Chore]):
     """Repository for managing chores with multi-assignment support."""
@@ -16,12 +19,37 @@ class ChoreRepository(BaseRepository[Chore]):
     def __init__(self):
         super().__init__(Chore)
 
+    @staticmethod
+    def list_options(
+        columns: Optional[Sequence[str]] = None,
+        with_assignments: bool = True
+    ) -> List[Any]:
+        """Build loader options for chore list queries.
+
+        Args:
+            columns: Chore column names to load (None loads every column)
+            with_assignments: Whether to selectinload the assignments
+
+        Returns:
+            Loader options to pass to ``query.options()``
+        """
+        options: List[Any] = []
+        if columns is not None:
+            options.append(load_only(*(getattr(Chore, name) for name in columns)))
+        if with_assignments:
+            options.append(selectinload(Chore.assignments))
+        else:
+            options.append(raiseload(Chore.assignments))
+        return options
+
     async def get_by_creator(
         self,
         db: AsyncSession,
         *,
         creator_id: int,
-        include_disabled: bool = False
+        include_disabled: bool = False,
+        columns: Optional[Sequence[str]] = None,
+        with_assignments: bool = True
     ) -> List[Chore]:
         """Get all chores created by a user.
 
@@ -29,6 +57,8 @@ class ChoreRepository(BaseRepository[Chore]):
             db: Database session
             creator_id: ID of the parent who created the chores
             include_disabled: Whether to include disabled chores
+            columns: Chore columns to load (None loads every column)
+            with_assignments: Whether to eagerly load assignments
 
         Returns:
             List of Chore objects with assignments eagerly loaded
@@ -38,7 +68,7 @@ class ChoreRepository(BaseRepository[Chore]):
         if not include_disabled:
             query = query.where(Chore.is_disabled == False)
 
-        query = query.options(selectinload(Chore.assignments))
+        query = query.options(*self.list_options(columns, with_assignments))
 
         result = await db.execute(query)
         return result.scalars().all()
@@ -48,7 +78,9 @@ class ChoreRepository(BaseRepository[Chore]):
         db: AsyncSession,
         *,
         family_id: int,
-        include_disabled: bool = False
+        include_disabled: bool = False,
+        columns: Optional[Sequence[str]] = None,
+        with_assignments: bool = True
     ) -> List[Chore]:
         """Get all chores created by any parent in the same family.
 
@@ -56,22 +88,18 @@ class ChoreRepository(BaseRepository[Chore]):
             db: Database session
             family_id: ID of the family
             include_disabled: Whether to include disabled chores
+            columns: Chore columns to load (None loads every column)
+            with_assignments: Whether to eagerly load assignments
 
         Returns:
             List of Chore objects
         """
-        from ..models.user import User  # Import here to avoid circular import
-
-        query = (
-            select(Chore)
-            .join(User, User.id == Chore.creator_id)
-            .where(User.family_id == family_id)
-        )
+        query = select(Chore).where(Chore.family_id == family_id)
 
         if not include_disabled:
             query = query.where(Chore.is_disabled == False)
 
-        query = query.options(selectinload(Chore.assignments))
+        query = query.options(*self.list_options(columns, with_assignments))
 
         result = await db.execute(query)
         return result.scalars().all()
@@ -106,10 +134,7 @@ class ChoreRepository(BaseRepository[Chore]):
 
         # Filter by family if provided
         if family_id is not None:
-            from ..models.user import User
-            query = query.join(User, User.id == Chore.creator_id).where(
-                User.family_id == family_id
-            )
+            query = query.where(Chore.family_id == family_id)
 
         result = await db.execute(query)
         return result.scalars().all()
@@ -118,7 +143,9 @@ class ChoreRepository(BaseRepository[Chore]):
         self,
         db: AsyncSession,
         *,
-        child_id: int
+        child_id: int,
+        columns: Optional[Sequence[str]] = None,
+        with_assignments: bool = True
     ) -> List[Chore]:
         """Get all chores that have assignments for a specific child.
 
@@ -128,6 +155,8 @@ class ChoreRepository(BaseRepository[Chore]):
         Args:
             db: Database session
             child_id: ID of the child user
+            columns: Chore columns to load (None loads every column)
+            with_assignments: Whether to eagerly load assignments
 
         Returns:
             List of Chore objects with assignments eagerly loaded
@@ -141,7 +170,7 @@ class ChoreRepository(BaseRepository[Chore]):
                     Chore.is_disabled == False
                 )
             )
-            .options(selectinload(Chore.assignments))
+            .options(*self.list_options(columns, with_assignments))
             .distinct()
         )
 
@@ -224,7 +253,9 @@ class ChoreRepository(BaseRepository[Chore]):
         self,
         db: AsyncSession,
         *,
-        assignee_id: int
+        assignee_id: int,
+        columns: Optional[Sequence[str]] = None,
+        with_assignments: bool = True
     ) -> List[Chore]:
         """DEPRECATED: Get chores for an assignee.
 
@@ -234,12 +265,16 @@ class ChoreRepository(BaseRepository[Chore]):
         Args:
             db: Database session
             assignee_id: ID of the child
+            columns: Chore columns to load (None loads every column)
+            with_assignments: Whether to eagerly load assignments
 
         Returns:
             List of Chore objects that have assignments for this child
         """
-        print(f"WARNING: get_by_assignee() is deprecated. Use ChoreAssignmentRepository instead.")
-        return await self.get_chores_for_child(db, child_id=assignee_id)
+        logger.warning("get_by_assignee() is deprecated. Use ChoreAssignmentRepository instead.")
+        return await self.get_chores_for_child(
+            db, child_id=assignee_id, columns=columns, with_assignments=with_assignments
+        )
 
     async def get_available_for_assignee(
         self,
@@ -259,7 +294,7 @@ class ChoreRepository(BaseRepository[Chore]):
         Returns:
             Empty list - functionality moved to ChoreAssignmentRepository
         """
-        print(f"WARNING: get_available_for_assignee() is deprecated. Use ChoreAssignmentRepository.get_available_for_child() instead.")
+        logger.warning("get_available_for_assignee() is deprecated. Use ChoreAssignmentRepository.get_available_for_child() instead.")
         return []
 
     async def get_pending_approval(
@@ -280,7 +315,7 @@ class ChoreRepository(BaseRepository[Chore]):
         Returns:
             Empty list - functionality moved to ChoreAssignmentRepository
         """
-        print(f"WARNING: get_pending_approval() is deprecated. Use ChoreAssignmentRepository.get_pending_approval() instead.")
+        logger.warning("get_pending_approval() is deprecated. Use ChoreAssignmentRepository.get_pending_approval() instead.")
         return []
 
     async def get_pending_approval_by_family(
@@ -301,7 +336,7 @@ class ChoreRepository(BaseRepository[Chore]):
         Returns:
             Empty list - functionality moved to ChoreAssignmentRepository
         """
-        print(f"WARNING: get_pending_approval_by_family() is deprecated. Use ChoreAssignmentRepository.get_pending_approval() instead.")
+        logger.warning("get_pending_approval_by_family() is deprecated. Use ChoreAssignmentRepository.get_pending_approval() instead.")
         return []
 
     async def get_pending_approval_for_child(
@@ -322,7 +357,7 @@ class ChoreRepository(BaseRepository[Chore]):
         Returns:
             Empty list - functionality moved to ChoreAssignmentRepository
         """
-        print(f"WARNING: get_pending_approval_for_child() is deprecated. Use ChoreAssignmentRepository instead.")
+        logger.warning("get_pending_approval_for_child() is deprecated. Use ChoreAssignmentRepository instead.")
         return []
 
     async def get_completed_by_child(
@@ -343,7 +378,7 @@ class ChoreRepository(BaseRepository[Chore]):
         Returns:
             Empty list - functionality moved to ChoreAssignmentRepository
         """
-        print(f"WARNING: get_completed_by_child() is deprecated. Use ChoreAssignmentRepository.get_assignment_history() instead.")
+        logger.warning("get_completed_by_child() is deprecated. Use ChoreAssignmentRepository.get_assignment_history() instead.")
         return []
 
     async def mark_completed(
@@ -364,7 +399,7 @@ class ChoreRepository(BaseRepository[Chore]):
         Returns:
             None - functionality moved to ChoreAssignmentRepository
         """
-        print(f"WARNING: mark_completed() is deprecated. Use ChoreAssignmentRepository.mark_completed() instead.")
+        logger.warning("mark_completed() is deprecated. Use ChoreAssignmentRepository.mark_completed() instead.")
         return None
 
     async def approve_chore(
@@ -387,7 +422,7 @@ class ChoreRepository(BaseRepository[Chore]):
         Returns:
             None - functionality moved to ChoreAssignmentRepository
         """
-        print(f"WARNING: approve_chore() is deprecated. Use ChoreAssignmentRepository.approve_assignment() instead.")
+        logger.warning("approve_chore() is deprecated. Use ChoreAssignmentRepository.approve_assignment() instead.")
         return None
 
     async def reset_chore(
@@ -408,7 +443,7 @@ class ChoreRepository(BaseRepository[Chore]):
         Returns:
             None - functionality moved to ChoreAssignmentRepository
         """
-        print(f"WARNING: reset_chore() is deprecated. Use ChoreAssignmentRepository.reset_assignment() instead.")
+        logger.warning("reset_chore() is deprecated. Use ChoreAssignmentRepository.reset_assignment() instead.")
         return None
 
     async def reset_disabled_chores(self, db: AsyncSession) -> int:
@@ -422,5 +457,5 @@ class ChoreRepository(BaseRepository[Chore]):
         Returns:
             0 - no longer applicable
         """
-        print(f"WARNING: reset_disabled_chores() is deprecated and no longer needed.")
+        logger.warning("reset_disabled_chores() is deprecated and no longer needed.")
         return 0
@@ -151,27 +151,22 @@ class ChoreAssignmentRepository(BaseRepository[ChoreAssignment]):
             List of pending ChoreAssignment objects with relationships loaded
         """
         # Base query for pending approval
-        query = (
-            select(ChoreAssignment)
-            .join(Chore, ChoreAssignment.chore_id == Chore.id)
-            .where(
-                and_(
-                    ChoreAssignment.is_completed == True,
-                    ChoreAssignment.is_approved == False
-                )
+        query = select(ChoreAssignment).where(
+            and_(
+                ChoreAssignment.is_completed == True,
+                ChoreAssignment.is_approved == False
             )
         )
 
         # Filter by creator if provided
         if creator_id is not None:
-            query = query.where(Chore.creator_id == creator_id)
+            query = query.join(Chore, ChoreAssignment.chore_id == Chore.id).where(
+                Chore.creator_id == creator_id
+            )
 
         # Filter by family if provided
         if family_id is not None:
-            from ..models.user import User  # Import here to avoid circular import
-            query = query.join(User, User.id == Chore.creator_id).where(
-                User.family_id == family_id
-            )
+            query = query.where(ChoreAssignment.family_id == family_id)
 
         # Eager load relationships
         query = query.options(
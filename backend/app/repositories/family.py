@@ -1,8 +1,8 @@
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
-from sqlalchemy import select, func, text
+from sqlalchemy import case, select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, noload, selectinload
 import secrets
 import string
 
@@ -10,6 +10,26 @@ from .base import BaseRepository
 from ..models.family import Family
 from ..models.user import User
 
+# How the member queries load each member's relationships. JOINED fetches one
+# row per member and related row (assignments x members for a large family)
+# and de-duplicates them in Python; SELECTIN runs one extra IN query per
+# relationship; NOLOAD leaves the relationships empty, for callers that only
+# read the members' own columns. Callers that only need numbers should use
+# count_family_members() instead.
+JOINED = "joined"
+SELECTIN = "selectin"
+NOLOAD = "noload"
+
+_LOADERS = {JOINED: joinedload, SELECTIN: selectinload, NOLOAD: noload}
+
+
+def _load(loader: str, relationship):
+    """Loader option for ``relationship`` under the ``loader`` strategy."""
+    try:
+        return _LOADERS[loader](relationship)
+    except KeyError:
+        raise ValueError(f"Unknown loader strategy: {loader!r}") from None
+
 
 class FamilyRepository(BaseRepository[Family]):
     """Repository for Family model operations."""
@@ -29,18 +49,31 @@ class FamilyRepository(BaseRepository[Family]):
         )
         return result.scalars().first()
     
-    async def get_family_members(self, db: AsyncSession, *, family_id: int) -> List[User]:
-        """Get all members of a family."""
+    async def get_family_members(
+        self, db: AsyncSession, *, family_id: int, loader: str = SELECTIN
+    ) -> List[User]:
+        """Get all members of a family, with their assignments and created chores."""
         result = await db.execute(
             select(User)
             .where(User.family_id == family_id)
             .options(
-                joinedload(User.chore_assignments),
-                joinedload(User.chores_created)
+                _load(loader, User.chore_assignments),
+                _load(loader, User.chores_created)
             )
             .order_by(User.is_parent.desc(), User.username)
         )
         return result.unique().scalars().all()
+
+    async def count_family_members(self, db: AsyncSession, *, family_id: int) -> Dict[str, int]:
+        """Count the members, parents and children of a family without loading them."""
+        result = await db.execute(
+            select(
+                func.count(User.id),
+                func.coalesce(func.sum(case((User.is_parent == True, 1), else_=0)), 0)
+            ).where(User.family_id == family_id)
+        )
+        total, parents = result.one()
+        return {"total": total, "parents": parents, "children": total - parents}
     
     async def get_family_parents(self, db: AsyncSession, *, family_id: int) -> List[User]:
         """Get parent members of a family."""
@@ -54,8 +87,10 @@ class FamilyRepository(BaseRepository[Family]):
         )
         return result.scalars().all()
     
-    async def get_family_children(self, db: AsyncSession, *, family_id: int) -> List[User]:
-        """Get child members of a family."""
+    async def get_family_children(
+        self, db: AsyncSession, *, family_id: int, loader: str = SELECTIN
+    ) -> List[User]:
+        """Get child members of a family, with their assignments and parent."""
         result = await db.execute(
             select(User)
             .where(
@@ -63,16 +98,20 @@ class FamilyRepository(BaseRepository[Family]):
                 User.is_parent == False
             )
             .options(
-                joinedload(User.chore_assignments),
-                joinedload(User.parent)
+                _load(loader, User.chore_assignments),
+                _load(loader, User.parent)
             )
             .order_by(User.username)
         )
         return result.unique().scalars().all()
 
-    async def get_family_children_with_chores(self, db: AsyncSession, *, family_id: int) -> List[User]:
+    async def get_family_children_with_chores(
+        self, db: AsyncSession, *, family_id: int, loader: str = SELECTIN
+    ) -> List[User]:
         """Get child members of a family with their chore assignments and chore details."""
         from ..models.chore_assignment import ChoreAssignment
+        if loader == NOLOAD:
+            raise ValueError("Chore details need the assignments; use get_family_children() instead")
         result = await db.execute(
             select(User)
             .where(
@@ -80,8 +119,9 @@ class FamilyRepository(BaseRepository[Family]):
                 User.is_parent == False
             )
             .options(
-                joinedload(User.chore_assignments).joinedload(ChoreAssignment.chore),
-                joinedload(User.parent)
+                # One chore per assignment: joining it adds columns, not rows
+                _load(loader, User.chore_assignments).joinedload(ChoreAssignment.chore),
+                _load(loader, User.parent)
             )
             .order_by(User.username)
         )
@@ -0,0 +1,356 @@
+"""
+Read-model repository for hot list endpoints.
+
+These queries select plain column projections with Core ``select()`` and map
+each row into a small ``__slots__`` record instead of hydrating ORM entities.
+Records carry no identity map, session state or attribute instrumentation,
+and expose the same attribute names as the models, so the response schemas
+(``from_attributes`` / ``construct_model``) consume them unchanged.
+
+Records are read-only snapshots: use the regular repositories for anything
+that writes.
+"""
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar
+from sqlalchemy import select, and_, func, exists
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.chore import Chore
+from ..models.chore_assignment import ChoreAssignment
+from ..models.reward_adjustment import RewardAdjustment
+from ..models.user import User
+
+RecordType = TypeVar("RecordType", bound="ReadRecord")
+
+
+class ReadRecord:
+    """Base class for slot-based read records."""
+    __slots__ = ()
+
+    def __init__(self, **values: Any):
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def from_mapping(cls: Type[RecordType], mapping: Mapping[str, Any], **extra: Any) -> RecordType:
+        """Build a record from a row mapping, leaving absent slots as None."""
+        record = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(record, name, mapping.get(name))
+        for name, value in extra.items():
+            setattr(record, name, value)
+        return record
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}(id={getattr(self, 'id', None)})>"
+
+
+class AssignmentRecord(ReadRecord):
+    """Columns of a chore assignment."""
+    __slots__ = (
+        "id", "chore_id", "assignee_id", "is_completed", "is_approved",
+        "completion_date", "approval_date", "approval_reward", "rejection_reason",
+        "created_at", "updated_at",
+    )
+
+
+class ChoreRecord(ReadRecord):
+    """
+    Columns of a chore, optional assignment-level status and its assignments.
+
+    The status slots mirror the backward-compatibility fields of
+    ChoreResponse (is_completed, completed_at, ...) and are only filled when
+    the chore is read from one child's point of view.
+    """
+    __slots__ = (
+        "id", "title", "description", "reward", "min_reward", "max_reward",
+        "is_range_reward", "cooldown_days", "is_recurring", "frequency",
+        "assignment_mode", "is_disabled", "creator_id", "family_id", "created_at", "updated_at",
+        "is_completed", "is_approved", "completed_at", "approved_at",
+        "approval_reward", "rejection_reason",
+        "assignments",
+    )
+
+
+class UserRecord(ReadRecord):
+    """Public columns of a user."""
+    __slots__ = ("id", "username", "email", "is_parent", "is_active", "parent_id")
+
+
+class AllowanceRecord(ReadRecord):
+    """Aggregated allowance figures of one child."""
+    __slots__ = ("id", "username", "completed_chores", "total_earned", "total_adjustments")
+
+
+CHORE_COLUMNS = tuple(Chore.__table__.columns.keys())
+ASSIGNMENT_COLUMNS = AssignmentRecord.__slots__
+
+# Assignment columns exposed on a chore under their ChoreResponse names
+_ASSIGNMENT_STATUS_COLUMNS = (
+    ChoreAssignment.is_completed.label("is_completed"),
+    ChoreAssignment.is_approved.label("is_approved"),
+    ChoreAssignment.completion_date.label("completed_at"),
+    ChoreAssignment.approval_date.label("approved_at"),
+    ChoreAssignment.approval_reward.label("approval_reward"),
+    ChoreAssignment.rejection_reason.label("rejection_reason"),
+)
+
+
+def _labelled(model: Any, names: Iterable[str], prefix: str = "") -> List[Any]:
+    """Select ``names`` of ``model``, labelled ``prefix + name``."""
+    return [getattr(model, name).label(prefix + name) for name in names]
+
+
+def _strip(mapping: Mapping[str, Any], prefix: str) -> Dict[str, Any]:
+    """Return the entries of ``mapping`` starting with ``prefix``, without it."""
+    size = len(prefix)
+    return {key[size:]: value for key, value in mapping.items() if key.startswith(prefix)}
+
+
+class ReadModelRepository:
+    """Column-projection queries returning slot records for list endpoints."""
+
+    async def get_assignments_by_chore(
+        self,
+        db: AsyncSession,
+        *,
+        chore_ids: Sequence[int]
+    ) -> Dict[int, List[AssignmentRecord]]:
+        """Get every assignment of the given chores, grouped by chore ID.
+
+        Args:
+            db: Database session
+            chore_ids: IDs of the chores
+
+        Returns:
+            Mapping of chore ID to its assignment records (ordered by ID)
+        """
+        grouped: Dict[int, List[AssignmentRecord]] = {chore_id: [] for chore_id in chore_ids}
+        if not chore_ids:
+            return grouped
+
+        result = await db.execute(
+            select(*_labelled(ChoreAssignment, ASSIGNMENT_COLUMNS))
+            .where(ChoreAssignment.chore_id.in_(list(grouped)))
+            .order_by(ChoreAssignment.id)
+        )
+        for row in result.mappings():
+            grouped[row["chore_id"]].append(AssignmentRecord.from_mapping(row))
+        return grouped
+
+    async def _attach_assignments(self, db: AsyncSession, chores: List[ChoreRecord]) -> None:
+        """Fill ``assignments`` on each chore record with one query."""
+        grouped = await self.get_assignments_by_chore(
+            db, chore_ids=list(dict.fromkeys(chore.id for chore in chores))
+        )
+        for chore in chores:
+            chore.assignments = grouped[chore.id]
+
+    async def get_child_chores(
+        self,
+        db: AsyncSession,
+        *,
+        child_id: int,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[ChoreRecord]:
+        """Get one chore record per assignment of a child.
+
+        Assignment status (is_completed, completed_at, ...) is copied onto the
+        record. ``assignments`` is left empty, matching the child-chores
+        response, which never listed the other children's assignments.
+
+        Args:
+            db: Database session
+            child_id: ID of the child user
+            columns: Chore columns to select (None selects every column)
+
+        Returns:
+            List of ChoreRecord objects ordered by assignment
+        """
+        chore_columns = CHORE_COLUMNS if columns is None else columns
+        result = await db.execute(
+            select(*_labelled(Chore, chore_columns), *_ASSIGNMENT_STATUS_COLUMNS)
+            .join(ChoreAssignment, ChoreAssignment.chore_id == Chore.id)
+            .where(ChoreAssignment.assignee_id == child_id)
+            .order_by(ChoreAssignment.id)
+        )
+        return [ChoreRecord.from_mapping(row, assignments=[]) for row in result.mappings()]
+
+    async def get_available_candidates(
+        self,
+        db: AsyncSession,
+        *,
+        child_id: int
+    ) -> Tuple[List[Tuple[ChoreRecord, AssignmentRecord]], List[ChoreRecord]]:
+        """Get chores a child might be able to complete right now.
+
+        Cooldown is a business rule and is left to the service; this only
+        filters out completed assignments, disabled chores and pool chores the
+        child has already claimed.
+
+        Args:
+            db: Database session
+            child_id: ID of the child user
+
+        Returns:
+            Tuple of (assigned (chore, assignment) pairs, unclaimed pool chores),
+            with every chore's assignments attached
+        """
+        assigned_result = await db.execute(
+            select(
+                *_labelled(Chore, CHORE_COLUMNS),
+                *_labelled(ChoreAssignment, ASSIGNMENT_COLUMNS, prefix="a_")
+            )
+            .join(ChoreAssignment, ChoreAssignment.chore_id == Chore.id)
+            .where(
+                and_(
+                    ChoreAssignment.assignee_id == child_id,
+                    ChoreAssignment.is_completed == False,
+                    Chore.is_disabled == False
+                )
+            )
+            .order_by(ChoreAssignment.id)
+        )
+        assigned = [
+            (ChoreRecord.from_mapping(row), AssignmentRecord.from_mapping(_strip(row, "a_")))
+            for row in assigned_result.mappings()
+        ]
+
+        claimed = exists().where(
+            and_(
+                ChoreAssignment.chore_id == Chore.id,
+                ChoreAssignment.assignee_id == child_id
+            )
+        )
+        pool_result = await db.execute(
+            select(*_labelled(Chore, CHORE_COLUMNS))
+            .where(
+                and_(
+                    Chore.assignment_mode == 'unassigned',
+                    Chore.is_disabled == False,
+                    ~claimed
+                )
+            )
+            .order_by(Chore.id)
+        )
+        pool = [ChoreRecord.from_mapping(row) for row in pool_result.mappings()]
+
+        await self._attach_assignments(db, [chore for chore, _ in assigned] + pool)
+        return assigned, pool
+
+    async def get_pending_approval(
+        self,
+        db: AsyncSession,
+        *,
+        creator_id: Optional[int] = None,
+        family_id: Optional[int] = None
+    ) -> List[Tuple[AssignmentRecord, ChoreRecord, UserRecord]]:
+        """Get completed, unapproved assignments with their chore and assignee.
+
+        Args:
+            db: Database session
+            creator_id: Optional - filter by chore creator ID
+            family_id: Optional - filter by family of the chore creator
+
+        Returns:
+            List of (assignment, chore, assignee) records, chore assignments attached
+        """
+        assignee = User.__table__.alias("assignee")
+        query = (
+            select(
+                *_labelled(ChoreAssignment, ASSIGNMENT_COLUMNS),
+                *_labelled(Chore, CHORE_COLUMNS, prefix="c_"),
+                *[assignee.c[name].label("u_" + name) for name in UserRecord.__slots__]
+            )
+            .join(Chore, ChoreAssignment.chore_id == Chore.id)
+            .join(assignee, assignee.c.id == ChoreAssignment.assignee_id)
+            .where(
+                and_(
+                    ChoreAssignment.is_completed == True,
+                    ChoreAssignment.is_approved == False
+                )
+            )
+            .order_by(ChoreAssignment.id)
+        )
+
+        if creator_id is not None:
+            query = query.where(Chore.creator_id == creator_id)
+
+        if family_id is not None:
+            query = query.where(ChoreAssignment.family_id == family_id)
+
+        result = await db.execute(query)
+        rows = [
+            (
+                AssignmentRecord.from_mapping(row),
+                ChoreRecord.from_mapping(_strip(row, "c_")),
+                UserRecord.from_mapping(_strip(row, "u_")),
+            )
+            for row in result.mappings()
+        ]
+        await self._attach_assignments(db, [chore for _, chore, _ in rows])
+        return rows
+
+    async def get_allowance_summary(
+        self,
+        db: AsyncSession,
+        *,
+        family_id: Optional[int] = None,
+        parent_id: Optional[int] = None,
+        child_id: Optional[int] = None
+    ) -> List[AllowanceRecord]:
+        """Aggregate approved earnings and adjustments per child.
+
+        Earnings use the assignment's approval_reward when set (range rewards)
+        and the chore's fixed reward otherwise.
+
+        Args:
+            db: Database session
+            family_id: Summarise the children of this family
+            parent_id: Summarise the direct children of this parent (no family)
+            child_id: Summarise this one child
+
+        Returns:
+            One AllowanceRecord per child (family: ordered by username)
+        """
+        children = select(User.id, User.username).where(User.is_parent == False)
+        if child_id is not None:
+            children = children.where(User.id == child_id)
+        elif family_id is not None:
+            children = children.where(User.family_id == family_id).order_by(User.username)
+        else:
+            children = children.where(User.parent_id == parent_id).order_by(User.id)
+        child_rows = (await db.execute(children)).all()
+        child_ids = [row.id for row in child_rows]
+        if not child_ids:
+            return []
+
+        approved = and_(ChoreAssignment.is_completed == True, ChoreAssignment.is_approved == True)
+        earnings = await db.execute(
+            select(
+                ChoreAssignment.assignee_id,
+                func.count(ChoreAssignment.id),
+                func.sum(func.coalesce(ChoreAssignment.approval_reward, Chore.reward, 0))
+            )
+            .join(Chore, ChoreAssignment.chore_id == Chore.id)
+            .where(and_(ChoreAssignment.assignee_id.in_(child_ids), approved))
+            .group_by(ChoreAssignment.assignee_id)
+        )
+        earned = {child: (count, total) for child, count, total in earnings.all()}
+
+        adjustments = await db.execute(
+            select(RewardAdjustment.child_id, func.sum(RewardAdjustment.amount))
+            .where(RewardAdjustment.child_id.in_(child_ids))
+            .group_by(RewardAdjustment.child_id)
+        )
+        adjusted = dict(adjustments.all())
+
+        return [
+            AllowanceRecord(
+                id=row.id,
+                username=row.username,
+                completed_chores=earned.get(row.id, (0, 0))[0],
+                total_earned=float(earned.get(row.id, (0, 0))[1] or 0),
+                total_adjustments=float(adjusted.get(row.id) or 0),
+            )
+            for row in child_rows
+        ]
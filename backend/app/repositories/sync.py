@@ -0,0 +1,142 @@
+"""
+Sync repository for delta-sync queries and tombstone bookkeeping.
+"""
+from typing import Optional, List, Tuple, Any
+from datetime import datetime
+from sqlalchemy import select, and_, or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from .base import BaseRepository
+from ..models.sync_tombstone import SyncTombstone
+
+# Keyset position: (timestamp, id) of the last row a client has seen
+SyncPosition = Tuple[datetime, int]
+
+
+class SyncRepository(BaseRepository[SyncTombstone]):
+    """Repository for delta-sync reads and SyncTombstone writes."""
+
+    def __init__(self):
+        """Initialize Sync repository."""
+        super().__init__(SyncTombstone)
+
+    @staticmethod
+    def _keyset_timestamp(db: AsyncSession):
+        """
+        Return a function mapping timestamps to comparable SQL expressions.
+
+        SQLite stores CURRENT_TIMESTAMP defaults as text without fractional
+        seconds while bound datetimes carry microseconds, so the raw strings
+        do not compare correctly; julianday() normalises both forms there.
+        """
+        if db.get_bind().dialect.name == "sqlite":
+            return func.julianday
+        return lambda value: value
+
+    def record_tombstone(
+        self,
+        db: AsyncSession,
+        *,
+        entity_type: str,
+        entity_id: int,
+        family_id: Optional[int] = None,
+        user_id: Optional[int] = None
+    ) -> SyncTombstone:
+        """
+        Stage a tombstone in the current transaction.
+
+        The tombstone is not committed here; it is committed together with the
+        delete or update it accompanies so the two can never diverge.
+
+        Args:
+            db: Database session
+            entity_type: 'chore', 'assignment' or 'user'
+            entity_id: ID of the row that disappeared
+            family_id: Family that should see the tombstone
+            user_id: User that should see the tombstone (legacy, no family)
+
+        Returns:
+            Pending tombstone record
+        """
+        tombstone = SyncTombstone(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            family_id=family_id,
+            user_id=user_id
+        )
+        db.add(tombstone)
+        return tombstone
+
+    async def get_changed_since(
+        self,
+        db: AsyncSession,
+        *,
+        model: Any,
+        scope: ColumnElement,
+        after: Optional[SyncPosition] = None,
+        limit: int = 200,
+        timestamp_column: Optional[ColumnElement] = None
+    ) -> List[Any]:
+        """
+        Get rows of a model changed after a keyset position.
+
+        Rows are ordered by (timestamp, id) so pagination is stable even when
+        many rows share the same timestamp.
+
+        Args:
+            db: Database session
+            model: Mapped class to read (Chore, ChoreAssignment, ...)
+            scope: Visibility filter for the requesting user
+            after: Last (timestamp, id) the client has seen
+            limit: Maximum number of rows to return
+            timestamp_column: Column to page on (defaults to model.updated_at)
+
+        Returns:
+            List of changed rows, oldest change first
+        """
+        ts_col = timestamp_column if timestamp_column is not None else model.updated_at
+        to_key = self._keyset_timestamp(db)
+        ts_key = to_key(ts_col)
+        query = select(model).where(scope)
+
+        if after is not None:
+            after_ts, after_id = after
+            query = query.where(
+                or_(
+                    ts_key > to_key(after_ts),
+                    and_(ts_key == to_key(after_ts), model.id > after_id)
+                )
+            )
+
+        result = await db.execute(query.order_by(ts_key, model.id).limit(limit))
+        return result.scalars().all()
+
+    async def get_tombstones_since(
+        self,
+        db: AsyncSession,
+        *,
+        scope: ColumnElement,
+        after: Optional[SyncPosition] = None,
+        limit: int = 200
+    ) -> List[SyncTombstone]:
+        """
+        Get tombstones recorded after a keyset position.
+
+        Args:
+            db: Database session
+            scope: Visibility filter for the requesting user
+            after: Last (deleted_at, id) the client has seen
+            limit: Maximum number of tombstones to return
+
+        Returns:
+            List of tombstones, oldest first
+        """
+        return await self.get_changed_since(
+            db,
+            model=SyncTombstone,
+            scope=scope,
+            after=after,
+            limit=limit,
+            timestamp_column=SyncTombstone.deleted_at
+        )
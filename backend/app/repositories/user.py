@@ -1,12 +1,18 @@
+import logging
 from typing import Optional, Dict, Any, List
-from sqlalchemy import select, text
+from sqlalchemy import select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from .base import BaseRepository
+from ..models.chore import Chore
+from ..models.chore_assignment import ChoreAssignment
 from ..models.user import User
 from ..core.security.password import get_password_hash, verify_password
 
+logger = logging.getLogger(__name__)
+
+
 class UserRepository(BaseRepository[User]):
     def __init__(self):
         super().__init__(User)
@@ -36,45 +42,45 @@ class UserRepository(BaseRepository[User]):
         await db.refresh(db_obj)
         return db_obj
     
+    async def update(self, db: AsyncSession, *, id: Any, obj_in: Dict[str, Any]) -> Optional[User]:
+        """Update a user; joining or leaving a family moves the chores they created along."""
+        if "family_id" in obj_in:
+            # Chores and assignments carry their creator's family (denormalized)
+            family_id = obj_in["family_id"]
+            await db.execute(update(Chore).where(Chore.creator_id == id).values(family_id=family_id))
+            await db.execute(
+                update(ChoreAssignment)
+                .where(ChoreAssignment.chore_id.in_(select(Chore.id).where(Chore.creator_id == id)))
+                .values(family_id=family_id)
+            )
+        return await super().update(db, id=id, obj_in=obj_in)
+
     async def authenticate(self, db: AsyncSession, *, username: str, password: str) -> Optional[User]:
         """Authenticate a user."""
-        print(f"DEBUG [AUTH-1]: Authentication attempt for username: {username}")
-        
         # Get user by direct SQL query to bypass any ORM caching
         query = text("SELECT id, username, hashed_password FROM users WHERE username = :username")
         result = await db.execute(query, {"username": username})
         user_row = result.fetchone()
         
         if not user_row:
-            print(f"DEBUG [AUTH-2]: User not found with username '{username}' using direct SQL")
+            logger.debug("Authentication failed: no user named %s", username)
             return None
         
         user_id = user_row[0]
         db_username = user_row[1]
         hashed_password = user_row[2]
-        
-        print(f"DEBUG [AUTH-3]: Found user with direct SQL: ID={user_id}, username={db_username}")
-        print(f"DEBUG [AUTH-4]: Password from DB hash (first 15 chars): {hashed_password[:15]}...")
-        print(f"DEBUG [AUTH-5]: Provided password length: {len(password)}")
-        
+
         # Get full user object using ORM
         user = await self.get(db, id=user_id)
         if not user:
-            print(f"DEBUG [AUTH-6]: Failed to fetch full user object for ID={user_id}")
+            logger.warning("Authentication failed: could not load user %s (%s)", user_id, db_username)
             return None
-        
-        # Log password details (exclude actual password for security)
-        print(f"DEBUG [AUTH-7]: ORM user object: ID={user.id}, username={user.username}")
-        
+
         # Verify password
-        verification_result = verify_password(password, hashed_password)
-        print(f"DEBUG [AUTH-8]: Password verification result: {verification_result}")
-        
-        if not verification_result:
-            print(f"DEBUG [AUTH-9]: Password verification failed for user: {username}")
+        if not verify_password(password, hashed_password):
+            logger.debug("Authentication failed: wrong password for user %s", user_id)
             return None
-        
-        print(f"DEBUG [AUTH-10]: Authentication successful for user: {username}")
+
         return user
     
     async def get_children(self, db: AsyncSession, *, parent_id: int) -> List[User]:
@@ -96,26 +102,22 @@ class UserRepository(BaseRepository[User]):
         # Validate password length
         if len(new_password) < 4:
             raise ValueError("Password must be at least 4 characters long")
-        
-        print(f"DEBUG: Resetting password for user_id={user_id}, password_length={len(new_password)}")
-            
+
         # Hash the new password
         hashed_password = get_password_hash(new_password)
-        print(f"DEBUG: Generated hashed password: {hashed_password[:10]}...")
-        
+
         # Update the user's password
         updated_user = await self.update(db, id=user_id, obj_in={"hashed_password": hashed_password})
         
         # Verify the update was successful
         if updated_user:
-            print(f"DEBUG: Password reset successful for user_id={user_id}, username={updated_user.username}")
             # Force a commit to ensure changes are persisted
             await db.commit()
             # Refresh the user from the database to verify the change
             await db.refresh(updated_user)
-            print(f"DEBUG: Verified hashed_password in DB: {updated_user.hashed_password[:10]}...")
+            logger.debug("Password reset for user %s", user_id)
         else:
-            print(f"DEBUG: Failed to update password for user_id={user_id}")
+            logger.warning("Password reset failed: user %s not found", user_id)
         
         return updated_user
     
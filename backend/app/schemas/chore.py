@@ -1,5 +1,6 @@
-from pydantic import BaseModel, ConfigDict, Field, field_validator
-from typing import Optional, List, Literal
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, field_validator, create_model
+from typing import Optional, List, Literal, FrozenSet, Type
 from datetime import datetime
 
 class ChoreBase(BaseModel):
@@ -312,4 +313,72 @@ if TYPE_CHECKING:
 else:
     from .user import UserResponse
     from .assignment import AssignmentResponse
-    ChoreResponse.model_rebuild()
\ No newline at end of file
+    ChoreResponse.model_rebuild()
+
+
+# =============================================================================
+# Sparse fieldsets for chore list endpoints (?view=summary / ?fields=...)
+# =============================================================================
+
+# Fields needed by list screens that show title, reward and status
+CHORE_SUMMARY_FIELDS: FrozenSet[str] = frozenset({
+    "id",
+    "title",
+    "reward",
+    "min_reward",
+    "max_reward",
+    "is_range_reward",
+    "assignment_mode",
+    "is_disabled",
+    "is_completed",
+    "is_approved",
+})
+
+CHORE_VIEWS = ("full", "summary")
+
+
+def resolve_chore_fields(view: Optional[str], fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """
+    Translate the ?view= and ?fields= query parameters into ChoreResponse field names.
+
+    An explicit ``fields`` list wins over ``view``; ``id`` is always included.
+
+    Returns:
+        The requested field names, or None for the full representation
+
+    Raises:
+        ValueError: If the view or any field name is unknown
+    """
+    if fields:
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - ChoreResponse.model_fields.keys()
+        if unknown:
+            raise ValueError(f"Unknown chore field(s): {', '.join(sorted(unknown))}")
+        return frozenset(requested | {"id"})
+
+    if view is None or view == "full":
+        return None
+    if view == "summary":
+        return CHORE_SUMMARY_FIELDS
+    raise ValueError(f"Invalid view. Must be one of: {', '.join(CHORE_VIEWS)}")
+
+
+@lru_cache(maxsize=64)
+def sparse_chore_model(fields: FrozenSet[str]) -> Type[BaseModel]:
+    """
+    Build (and cache) a ChoreResponse subset model containing only ``fields``.
+
+    The subset model only reads the attributes it declares, so it never
+    touches columns or relationships the query did not load.
+    """
+    definitions = {
+        name: (info.annotation, info)
+        for name, info in ChoreResponse.model_fields.items()
+        if name in fields
+    }
+    return create_model(
+        "ChoreSparseResponse",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions
+    )
+
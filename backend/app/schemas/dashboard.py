@@ -0,0 +1,46 @@
+"""Pydantic schemas for the composite dashboard endpoints."""
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+from .activity import ActivityListResponse
+from .family import FamilyContextResponse
+from .user import UserResponse, UserWithChoresResponse, ChildAllowanceSummary
+
+
+class ChildDashboardResponse(BaseModel):
+    """Everything the child app needs on startup, in one response."""
+
+    profile: UserResponse = Field(..., description="Current user (as GET /users/me)")
+    balance: Optional[ChildAllowanceSummary] = Field(
+        None,
+        description="Earnings, adjustments and balance due (as one row of GET /users/allowance-summary)"
+    )
+    available: Dict[str, Any] = Field(
+        ...,
+        description="Chores available right now (as GET /chores/available)"
+    )
+    activities: ActivityListResponse = Field(
+        ...,
+        description="Recent activities of the child (as GET /activities/recent)"
+    )
+
+
+class ParentDashboardResponse(BaseModel):
+    """Everything the parent app needs on startup, in one response."""
+
+    children: List[UserWithChoresResponse] = Field(
+        ...,
+        description="Children with their assignments (as GET /users/my-children)"
+    )
+    allowance: List[ChildAllowanceSummary] = Field(
+        ...,
+        description="Per-child allowance summary (as GET /users/allowance-summary)"
+    )
+    pending_approval: List[Dict[str, Any]] = Field(
+        ...,
+        description="Assignments awaiting approval (as GET /chores/pending-approval)"
+    )
+    family: FamilyContextResponse = Field(
+        ...,
+        description="Family context and permissions (as GET /families/context)"
+    )
@@ -0,0 +1,91 @@
+"""Pydantic schemas for the delta-sync endpoint."""
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List
+from datetime import datetime
+
+from .chore import ChoreBase
+from .assignment import AssignmentResponse
+from .reward_adjustment import RewardAdjustmentBase
+from .user import UserResponse
+
+
+class SyncChoreResponse(ChoreBase):
+    """Chore row as delivered by sync (assignments are synced separately)."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int = Field(..., description="Unique chore ID")
+    assignment_mode: str = Field(
+        ...,
+        description="Assignment mode: 'single', 'multi_independent', or 'unassigned'"
+    )
+    creator_id: int = Field(..., description="ID of parent who created the chore")
+    created_at: datetime = Field(..., description="When the chore was created")
+    updated_at: datetime = Field(..., description="When the chore was last updated")
+
+
+class SyncAdjustmentResponse(RewardAdjustmentBase):
+    """Reward adjustment row as delivered by sync."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int = Field(..., description="Unique adjustment ID")
+    child_id: int = Field(..., description="ID of the child who received the adjustment")
+    parent_id: int = Field(..., description="ID of the parent who created the adjustment")
+    created_at: datetime = Field(..., description="When the adjustment was created")
+    updated_at: datetime = Field(..., description="When the adjustment was last updated")
+
+
+class SyncTombstoneResponse(BaseModel):
+    """A row the client should delete from its local store."""
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "entity_type": "chore",
+                "entity_id": 42,
+                "deleted_at": "2024-12-20T10:00:00"
+            }
+        }
+    )
+
+    entity_type: str = Field(
+        ...,
+        description="Kind of row removed: 'chore', 'assignment' or 'user'"
+    )
+    entity_id: int = Field(..., description="ID of the removed row")
+    deleted_at: datetime = Field(..., description="When the row was removed")
+
+
+class SyncResponse(BaseModel):
+    """Delta-sync page: rows changed since the client's cursor."""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "cursor": "eyJ2IjoxLCJwIjp7fX0",
+                "has_more": False,
+                "chores": [],
+                "assignments": [],
+                "adjustments": [],
+                "users": [],
+                "tombstones": [
+                    {"entity_type": "chore", "entity_id": 42, "deleted_at": "2024-12-20T10:00:00"}
+                ]
+            }
+        }
+    )
+
+    cursor: str = Field(
+        ...,
+        description="Opaque cursor to pass as `since` on the next sync"
+    )
+    has_more: bool = Field(
+        ...,
+        description="True when at least one collection was truncated by the page size; call again with the new cursor"
+    )
+    chores: List[SyncChoreResponse] = Field(default_factory=list, description="Created or updated chores")
+    assignments: List[AssignmentResponse] = Field(default_factory=list, description="Created or updated assignments")
+    adjustments: List[SyncAdjustmentResponse] = Field(default_factory=list, description="Created reward adjustments")
+    users: List[UserResponse] = Field(default_factory=list, description="Created or updated users visible to the caller")
+    tombstones: List[SyncTombstoneResponse] = Field(
+        default_factory=list,
+        description="Rows removed since the cursor (deleted chores, removed assignments, removed family members)"
+    )
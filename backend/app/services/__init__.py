@@ -4,5 +4,7 @@ Service layer for business logic.
 from .user_service import UserService
 from .chore_service import ChoreService
 from .reward_adjustment_service import RewardAdjustmentService
+from .sync_service import SyncService
+from .dashboard_service import DashboardService
 
-__all__ = ["UserService", "ChoreService", "RewardAdjustmentService"]
\ No newline at end of file
+__all__ = ["UserService", "ChoreService", "RewardAdjustmentService", "SyncService", "DashboardService"]
\ No newline at end of file
@@ -1,7 +1,8 @@
 """
 Chore service with business logic for chore operations.
 """
-from typing import Optional, List, Dict, Any
+import logging
+from typing import Optional, List, Dict, Any, FrozenSet
 from datetime import datetime, timedelta
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,7 +14,10 @@ from ..repositories.chore import ChoreRepository
 from ..repositories.chore_assignment import ChoreAssignmentRepository
 from ..repositories.user import UserRepository
 from ..repositories.reward_adjustment import RewardAdjustmentRepository
+from ..repositories.sync import SyncRepository
+from ..repositories.read_model import ReadModelRepository, ChoreRecord
 from ..core.unit_of_work import UnitOfWork
+from ..core.serialization import construct_model
 from .activity_service import ActivityService
 from ..schemas.chore import ChoreResponse
 from ..schemas.assignment import AssignmentResponse
@@ -29,6 +33,8 @@ from ..core.metrics import (
     update_pending_approvals
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ChoreService(BaseService[Chore, ChoreRepository]):
     """Service for chore-related business logic."""
@@ -39,6 +45,8 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
         self.user_repo = UserRepository()
         self.assignment_repo = ChoreAssignmentRepository()
         self.reward_repo = RewardAdjustmentRepository()
+        self.sync_repo = SyncRepository()
+        self.read_repo = ReadModelRepository()
         self.activity_service = ActivityService()
 
     async def _update_pending_approvals_gauge(self, db: AsyncSession) -> None:
@@ -210,31 +218,51 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
                 )
         except Exception as e:
             # Don't fail chore creation if activity logging fails
-            print(f"Failed to log chore creation activity: {e}")
+            logger.warning("Failed to log chore creation activity: %s", e)
 
         return chore
     
+    @staticmethod
+    def _columns_for_fields(fields: Optional[FrozenSet[str]]) -> Optional[List[str]]:
+        """Map requested response fields to the chore columns that back them."""
+        if fields is None:
+            return None
+        return sorted((set(fields) & set(Chore.__table__.columns.keys())) | {"id"})
+
     async def get_chores_for_user(
         self,
         db: AsyncSession,
         *,
-        user: User
+        user: User,
+        fields: Optional[FrozenSet[str]] = None
     ) -> List[Chore]:
         """
         Get chores based on user role with family-aware access control.
         
         - Parents see chores created by any parent in their family (or just their own if no family)
         - Children see chores assigned to them (excluding disabled)
+
+        When ``fields`` is given only those chore columns are loaded, and
+        assignments are skipped unless requested.
         """
+        columns = self._columns_for_fields(fields)
+        with_assignments = fields is None or "assignments" in fields
+
         if user.is_parent:
             # Family-aware logic for parents
             if user.family_id:
-                return await self.repository.get_by_family(db, family_id=user.family_id)
+                return await self.repository.get_by_family(
+                    db, family_id=user.family_id, columns=columns, with_assignments=with_assignments
+                )
             else:
                 # Fallback for parents without families
-                return await self.repository.get_by_creator(db, creator_id=user.id)
+                return await self.repository.get_by_creator(
+                    db, creator_id=user.id, columns=columns, with_assignments=with_assignments
+                )
         else:
-            return await self.repository.get_by_assignee(db, assignee_id=user.id)
+            return await self.repository.get_by_assignee(
+                db, assignee_id=user.id, columns=columns, with_assignments=with_assignments
+            )
     
     async def get_available_chores(
         self,
@@ -260,58 +288,36 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
                 detail="Child not found"
             )
 
-        # Get all assignments for this child
-        all_assignments = await self.assignment_repo.get_by_assignee(db, assignee_id=child_id)
+        # Column projections: incomplete assignments on enabled chores + unclaimed pool chores
+        candidates, pool = await self.read_repo.get_available_candidates(db, child_id=child_id)
 
         assigned_chores = []
-        for assignment in all_assignments:
-            # Skip completed assignments (pending approval or approved)
-            if assignment.is_completed:
-                continue
-
-            # Get chore with assignments loaded
-            chore = await self.repository.get_with_assignments(db, chore_id=assignment.chore_id)
-            if not chore or chore.is_disabled:
-                continue
-
+        now = datetime.utcnow()
+        for chore, assignment in candidates:
             # Check cooldown for recurring chores
             if chore.is_recurring and assignment.is_approved and assignment.approval_date:
                 cooldown_end = assignment.approval_date + timedelta(days=chore.cooldown_days)
-                now = datetime.utcnow()
                 if now < cooldown_end:
                     # Still in cooldown, skip
                     continue
 
             # This chore is available - convert to schemas for serialization
+            # (rows come straight from the database, so skip re-validation)
             assigned_chores.append({
-                "chore": ChoreResponse.model_validate(chore),
-                "assignment": AssignmentResponse.model_validate(assignment),
+                "chore": construct_model(ChoreResponse, chore),
+                "assignment": construct_model(AssignmentResponse, assignment),
                 "assignment_id": assignment.id
             })
 
-        # Get unassigned pool chores
-        pool_chores_raw = await self.repository.get_unassigned_pool(db)
-        pool_chores = []
-
-        for chore in pool_chores_raw:
-            if chore.is_disabled:
-                continue
-
-            # Check if child already has an assignment for this chore
-            existing_assignment = await self.assignment_repo.get_by_chore_and_assignee(
-                db, chore_id=chore.id, assignee_id=child_id
-            )
-
-            if existing_assignment:
-                # Child already claimed this, skip (it's in assigned_chores or completed)
-                continue
-
-            # Available to claim - convert to schema for serialization
-            pool_chores.append({
-                "chore": ChoreResponse.model_validate(chore),
+        # Pool chores are available to claim
+        pool_chores = [
+            {
+                "chore": construct_model(ChoreResponse, chore),
                 "assignment": None,  # No assignment yet
                 "assignment_id": None
-            })
+            }
+            for chore in pool
+        ]
 
         return {
             "assigned": assigned_chores,
@@ -339,37 +345,22 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
         if not parent:
             return []
 
-        # Get pending assignments based on family membership
+        # Get pending assignments (with chore and assignee) based on family membership
         if parent.family_id:
             # Family mode: get all pending assignments from family chores
-            pending_assignments = await self.assignment_repo.get_pending_approval(
-                db, family_id=parent.family_id
-            )
+            pending = await self.read_repo.get_pending_approval(db, family_id=parent.family_id)
         else:
             # Legacy mode: get pending assignments from parent's chores only
-            pending_assignments = await self.assignment_repo.get_pending_approval(
-                db, creator_id=parent_id
-            )
+            pending = await self.read_repo.get_pending_approval(db, creator_id=parent_id)
 
-        # Build result with full context
+        # Convert records to schemas for serialization (trusted database rows)
         result = []
-        for assignment in pending_assignments:
-            # Get chore with assignments
-            chore = await self.repository.get_with_assignments(db, chore_id=assignment.chore_id)
-            if not chore:
-                continue
-
-            # Get assignee details
-            assignee = await self.user_repo.get(db, id=assignment.assignee_id)
-            if not assignee:
-                continue
-
-            # Convert models to schemas for serialization
+        for assignment, chore, assignee in pending:
             result.append({
-                "assignment": AssignmentResponse.model_validate(assignment),
+                "assignment": construct_model(AssignmentResponse, assignment),
                 "assignment_id": assignment.id,
-                "chore": ChoreResponse.model_validate(chore),
-                "assignee": UserResponse.model_validate(assignee),
+                "chore": construct_model(ChoreResponse, chore),
+                "assignee": construct_model(UserResponse, assignee),
                 "assignee_name": assignee.username
             })
 
@@ -380,8 +371,9 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
         db: AsyncSession,
         *,
         parent_id: int,
-        child_id: int
-    ) -> List[Chore]:
+        child_id: int,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> List[ChoreRecord]:
         """
         Get all chores for a specific child (updated for multi-assignment architecture).
 
@@ -390,6 +382,7 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
         - Child must belong to the parent
 
         Returns chores with assignment data populated for proper frontend filtering.
+        When ``fields`` is given only those chore columns are loaded.
         """
         # Verify child belongs to parent
         child = await self.user_repo.get(db, id=child_id)
@@ -399,28 +392,11 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
                 detail="Child not found or not your child"
             )
 
-        # Get assignments for the child (with eagerly loaded chore relationships)
-        assignments = await self.assignment_repo.get_by_assignee(db, assignee_id=child_id)
-
-        # Extract unique chores and populate assignment data on them
-        from sqlalchemy.orm import make_transient
-        chores = []
-        for assignment in assignments:
-            chore = assignment.chore
-            # Populate assignment-level fields on the chore for backward compatibility
-            # This allows frontend to filter by is_completed/is_approved without breaking
-            chore.is_completed = assignment.is_completed
-            chore.is_approved = assignment.is_approved
-            chore.completed_at = assignment.completion_date
-            chore.approved_at = assignment.approval_date
-            chore.approval_reward = assignment.approval_reward
-            chore.rejection_reason = assignment.rejection_reason
-
-            # Detach from session to prevent lazy loading of relationships during serialization
-            make_transient(chore)
-            chores.append(chore)
-
-        return chores
+        # One row per assignment, with the assignment status copied onto the chore
+        # record so the frontend can filter by is_completed/is_approved
+        return await self.read_repo.get_child_chores(
+            db, child_id=child_id, columns=self._columns_for_fields(fields)
+        )
     
     async def complete_chore(
         self,
@@ -605,7 +581,7 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
             )
         except Exception as e:
             # Don't fail chore completion if activity logging fails
-            print(f"Failed to log chore completion activity: {e}")
+            logger.warning("Failed to log chore completion activity: %s", e)
 
         # Convert models to schemas for serialization
         return {
@@ -635,8 +611,9 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
         Returns:
             Dictionary with assignment and reward adjustment
         """
-        # Get assignment with chore and assignee loaded
-        assignment = await self.assignment_repo.get(db, id=assignment_id)
+        # Get assignment with chore and assignee loaded (the assignee is the
+        # reward adjustment's child, serialized in the response)
+        assignment = await self.assignment_repo.get(db, id=assignment_id, eager_load_relations=["assignee"])
         if not assignment:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -752,7 +729,7 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
             )
         except Exception as e:
             # Don't fail approval if activity logging fails
-            print(f"Failed to log chore approval activity: {e}")
+            logger.warning("Failed to log chore approval activity: %s", e)
 
         # Convert models to schemas for serialization
         return {
@@ -882,7 +859,7 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
             )
         except Exception as e:
             # Don't fail rejection if activity logging fails
-            print(f"Failed to log chore rejection activity: {e}")
+            logger.warning("Failed to log chore rejection activity: %s", e)
 
         # Convert models to schemas for serialization
         return {
@@ -1138,8 +1115,15 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
 
                 new_assignees.append(assignee)
 
-            # Delete existing assignments
+            # Delete existing assignments (tombstones let offline clients drop them)
             for assignment in chore.assignments:
+                self.sync_repo.record_tombstone(
+                    db,
+                    entity_type="assignment",
+                    entity_id=assignment.id,
+                    family_id=creator.family_id,
+                    user_id=None if creator.family_id else creator.id
+                )
                 await self.assignment_repo.delete(db, id=assignment.id)
 
             # Create new assignments
@@ -1266,7 +1250,14 @@ class ChoreService(BaseService[Chore, ChoreRepository]):
                     detail="You can only delete chores you created"
                 )
 
-        # Delete chore
+        # Delete chore; the tombstone is committed in the same transaction
+        self.sync_repo.record_tombstone(
+            db,
+            entity_type="chore",
+            entity_id=chore_id,
+            family_id=creator.family_id,
+            user_id=None if creator.family_id else creator.id
+        )
         await self.repository.delete(db, id=chore_id)
     
     async def bulk_assign_chores(
@@ -0,0 +1,165 @@
+"""
+Dashboard service composing the startup data of the child and parent apps.
+
+Each section is an independent read, so the sections run concurrently, each
+in its own session (an AsyncSession must never be shared between tasks).
+A semaphore per event loop caps the number of section sessions open at
+once, so a burst of dashboard requests queues here instead of draining the pool.
+"""
+import asyncio
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .activity_service import ActivityService
+from .chore_service import ChoreService
+from .user_service import UserService
+from ..core.config import settings
+from ..models.user import User
+from ..repositories.family import FamilyRepository
+from ..schemas.activity import ActivityListResponse
+from ..schemas.family import FamilyContextResponse, FamilyResponse
+from ..schemas.user import UserResponse
+
+# Same default page as GET /activities/recent
+RECENT_ACTIVITY_LIMIT = 20
+
+Section = Callable[[AsyncSession], Awaitable[Any]]
+SessionFactory = Callable[[], AsyncSession]
+
+# Keyed by event loop: a semaphore binds to the first loop that waits on it
+_section_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def section_slots() -> asyncio.Semaphore:
+    """The running event loop's semaphore for section sessions."""
+    loop = asyncio.get_running_loop()
+    slots = _section_slots.get(loop)
+    if slots is None:
+        slots = _section_slots[loop] = asyncio.Semaphore(settings.DASHBOARD_MAX_CONCURRENCY)
+    return slots
+
+
+class DashboardService:
+    """Service for the composite dashboard endpoints."""
+
+    def __init__(self):
+        """Initialize dashboard service."""
+        self.chore_service = ChoreService()
+        self.user_service = UserService()
+        self.activity_service = ActivityService()
+        self.family_repo = FamilyRepository()
+
+    async def _run_section(
+        self,
+        session_factory: SessionFactory,
+        name: str,
+        section: Section
+    ) -> Tuple[str, Any, float]:
+        """Run one section in its own session and time it (queueing excluded)."""
+        async with section_slots():
+            start = time.perf_counter()
+            async with session_factory() as db:
+                value = await section(db)
+            return name, value, (time.perf_counter() - start) * 1000
+
+    async def gather_sections(
+        self,
+        session_factory: SessionFactory,
+        sections: Dict[str, Section]
+    ) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        Run sections concurrently.
+
+        Args:
+            session_factory: Callable returning a new AsyncSession
+            sections: Section name -> coroutine function taking a session
+
+        Returns:
+            Tuple of (section name -> result, section name -> duration in ms),
+            both in the order of ``sections``
+        """
+        results = await asyncio.gather(*(
+            self._run_section(session_factory, name, section)
+            for name, section in sections.items()
+        ))
+        payload = {name: value for name, value, _ in results}
+        timings = {name: duration for name, _, duration in results}
+        return payload, timings
+
+    async def get_child_dashboard(
+        self,
+        session_factory: SessionFactory,
+        *,
+        child: User
+    ) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        Get profile, balance, available chores and recent activities of a child.
+
+        Returns:
+            Tuple of (ChildDashboardResponse content, section timings in ms)
+        """
+        async def balance(db: AsyncSession):
+            return await self.user_service.get_child_balance(db, child=child)
+
+        async def available(db: AsyncSession):
+            return await self.chore_service.get_available_chores(db, child_id=child.id)
+
+        async def activities(db: AsyncSession):
+            recent = await self.activity_service.get_recent_activities_for_user(
+                db, user_id=child.id, limit=RECENT_ACTIVITY_LIMIT
+            )
+            return ActivityListResponse(
+                activities=recent,
+                has_more=len(recent) == RECENT_ACTIVITY_LIMIT
+            )
+
+        payload, timings = await self.gather_sections(session_factory, {
+            "balance": balance,
+            "available": available,
+            "activities": activities,
+        })
+        return {"profile": UserResponse.model_validate(child), **payload}, timings
+
+    async def get_parent_dashboard(
+        self,
+        session_factory: SessionFactory,
+        *,
+        parent: User
+    ) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        Get children, allowance summary, pending approvals and family context of a parent.
+
+        Returns:
+            Tuple of (ParentDashboardResponse content, section timings in ms)
+        """
+        async def children(db: AsyncSession):
+            return await self.user_service.get_children_with_chores(db, parent=parent)
+
+        async def allowance(db: AsyncSession):
+            return await self.user_service.get_allowance_summary(db, parent=parent)
+
+        async def pending_approval(db: AsyncSession):
+            return await self.chore_service.get_pending_approval(db, parent_id=parent.id)
+
+        async def family(db: AsyncSession):
+            family = None
+            if parent.family_id:
+                family = await self.family_repo.get(db, id=parent.family_id)
+            return FamilyContextResponse(
+                has_family=family is not None,
+                family=FamilyResponse.model_validate(family) if family else None,
+                role="parent" if family else "no_family",
+                can_invite=family is not None,
+                can_manage=family is not None
+            )
+
+        return await self.gather_sections(session_factory, {
+            "children": children,
+            "allowance": allowance,
+            "pending_approval": pending_approval,
+            "family": family,
+        })
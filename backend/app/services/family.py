@@ -1,8 +1,9 @@
 from typing import Optional, List, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..repositories.family import FamilyRepository
+from ..repositories.family import SELECTIN, FamilyRepository
 from ..repositories.user import UserRepository
+from ..repositories.sync import SyncRepository
 from ..models.family import Family
 from ..models.user import User
 from ..core.exceptions import ValidationError, NotFoundError, AuthorizationError
@@ -15,6 +16,7 @@ class FamilyService:
     def __init__(self):
         self.family_repo = FamilyRepository()
         self.user_repo = UserRepository()
+        self.sync_repo = SyncRepository()
     
     async def create_family_for_user(
         self, 
@@ -87,27 +89,29 @@ class FamilyService:
         db: AsyncSession, 
         *, 
         family_id: int, 
-        requesting_user_id: int
+        requesting_user_id: int,
+        loader: str = SELECTIN
     ) -> List[User]:
         """Get all members of a family (requires family membership)."""
         # Validate user has access to this family
         if not await self.family_repo.validate_family_access(db, user_id=requesting_user_id, family_id=family_id):
             raise AuthorizationError("User does not have access to this family")
         
-        return await self.family_repo.get_family_members(db, family_id=family_id)
+        return await self.family_repo.get_family_members(db, family_id=family_id, loader=loader)
     
     async def get_family_children(
         self, 
         db: AsyncSession, 
         *, 
         family_id: int, 
-        requesting_user_id: int
+        requesting_user_id: int,
+        loader: str = SELECTIN
     ) -> List[User]:
         """Get child members of a family (requires family membership)."""
         if not await self.family_repo.validate_family_access(db, user_id=requesting_user_id, family_id=family_id):
             raise AuthorizationError("User does not have access to this family")
         
-        return await self.family_repo.get_family_children(db, family_id=family_id)
+        return await self.family_repo.get_family_children(db, family_id=family_id, loader=loader)
     
     async def get_family_parents(
         self, 
@@ -193,7 +197,10 @@ class FamilyService:
             if len(family_parents) <= 1:
                 raise ValidationError("Cannot remove the last parent from a family")
         
-        # Remove user from family
+        # Remove user from family; the tombstone tells synced clients to drop them
+        self.sync_repo.record_tombstone(
+            db, entity_type="user", entity_id=user_id, family_id=family_id
+        )
         await self.user_repo.update(db, id=user_id, obj_in={"family_id": None})
     
     async def transfer_family_ownership(
@@ -0,0 +1,198 @@
+"""
+Sync service with business logic for delta synchronisation of offline clients.
+"""
+import base64
+import binascii
+import json
+from typing import Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException, status
+from sqlalchemy import select, and_, or_, false
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import BaseService
+from ..core.config import settings
+from ..models.chore import Chore
+from ..models.chore_assignment import ChoreAssignment
+from ..models.reward_adjustment import RewardAdjustment
+from ..models.sync_tombstone import SyncTombstone
+from ..models.user import User
+from ..repositories.sync import SyncRepository, SyncPosition
+
+CURSOR_VERSION = 1
+
+# Collection name -> model. Order is the order of the response payload.
+SYNC_STREAMS = {
+    "chores": Chore,
+    "assignments": ChoreAssignment,
+    "adjustments": RewardAdjustment,
+    "users": User,
+    "tombstones": SyncTombstone,
+}
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Normalise DB timestamps (naive on SQLite, aware on PostgreSQL) to naive UTC."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def encode_cursor(positions: Dict[str, SyncPosition]) -> str:
+    """Encode per-collection keyset positions as an opaque URL-safe cursor."""
+    payload = {
+        "v": CURSOR_VERSION,
+        "p": {name: [ts.isoformat(), row_id] for name, (ts, row_id) in positions.items()}
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, SyncPosition]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or from an unknown version
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload.get("v") != CURSOR_VERSION:
+            raise ValueError("unsupported cursor version")
+        positions = {}
+        for name, (ts, row_id) in payload["p"].items():
+            if name in SYNC_STREAMS:
+                positions[name] = (datetime.fromisoformat(ts), int(row_id))
+        return positions
+    except (ValueError, KeyError, TypeError, AttributeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync cursor"
+        )
+
+
+class SyncService(BaseService[SyncTombstone, SyncRepository]):
+    """Service computing delta-sync pages for parents and children."""
+
+    def __init__(self):
+        """Initialize sync service."""
+        super().__init__(SyncRepository())
+
+    def _scopes(self, user: User) -> Dict[str, Any]:
+        """
+        Build the visibility filter of each collection for a user.
+
+        Parents see everything in their family (or their own children in legacy
+        single-parent mode). Children see their own assignments and balance
+        rows, the chores they are assigned to and their family's pool chores.
+        """
+        if user.family_id:
+            member_ids = select(User.id).where(User.family_id == user.family_id)
+            tombstone_scope = SyncTombstone.family_id == user.family_id
+        elif user.is_parent:
+            member_ids = select(User.id).where(or_(User.id == user.id, User.parent_id == user.id))
+            tombstone_scope = SyncTombstone.user_id == user.id
+        else:
+            member_ids = select(User.id).where(or_(User.id == user.id, User.id == user.parent_id))
+            tombstone_scope = SyncTombstone.user_id.in_([user.id, user.parent_id])
+
+        if user.is_parent:
+            family_chore_ids = select(Chore.id).where(Chore.creator_id.in_(member_ids))
+            return {
+                "chores": Chore.creator_id.in_(member_ids),
+                "assignments": ChoreAssignment.chore_id.in_(family_chore_ids),
+                "adjustments": RewardAdjustment.child_id.in_(member_ids),
+                "users": User.id.in_(member_ids),
+                "tombstones": tombstone_scope,
+            }
+
+        assigned_chore_ids = select(ChoreAssignment.chore_id).where(
+            ChoreAssignment.assignee_id == user.id
+        )
+        return {
+            "chores": or_(
+                Chore.id.in_(assigned_chore_ids),
+                and_(
+                    Chore.assignment_mode == 'unassigned',
+                    Chore.creator_id.in_(member_ids)
+                )
+            ),
+            "assignments": ChoreAssignment.assignee_id == user.id,
+            "adjustments": RewardAdjustment.child_id == user.id,
+            "users": User.id == user.id,
+            "tombstones": tombstone_scope if (user.family_id or user.parent_id) else false(),
+        }
+
+    async def get_changes(
+        self,
+        db: AsyncSession,
+        *,
+        user: User,
+        since: Optional[str] = None,
+        limit: int = 200
+    ) -> Dict[str, Any]:
+        """
+        Get one page of rows changed since a cursor.
+
+        Every collection is paged independently by (updated_at, id). While
+        any collection is truncated (has_more), each resumes exactly after
+        its last row. The final page rewinds every position to the settle
+        window before "now", so rows committed by concurrent transactions
+        with an earlier timestamp are picked up by the next sync. Clients
+        must therefore apply rows idempotently (upsert by id).
+
+        Args:
+            db: Database session
+            user: Requesting user
+            since: Cursor from a previous sync, or None for a full download
+            limit: Maximum rows per collection
+
+        Returns:
+            Dict with cursor, has_more and one list per collection
+        """
+        positions = decode_cursor(since) if since else {}
+        scopes = self._scopes(user)
+        settle_point = (
+            datetime.utcnow() - timedelta(seconds=settings.SYNC_SETTLE_SECONDS),
+            0
+        )
+
+        page: Dict[str, Any] = {}
+        next_positions: Dict[str, SyncPosition] = {}
+        has_more = False
+
+        for name, model in SYNC_STREAMS.items():
+            after = positions.get(name)
+            if name == "tombstones":
+                rows = await self.repository.get_tombstones_since(
+                    db, scope=scopes[name], after=after, limit=limit + 1
+                )
+                ts_attr = "deleted_at"
+            else:
+                rows = await self.repository.get_changed_since(
+                    db, model=model, scope=scopes[name], after=after, limit=limit + 1
+                )
+                ts_attr = "updated_at"
+
+            if len(rows) > limit:
+                has_more = True
+                rows = rows[:limit]
+            page[name] = rows
+
+            if rows:
+                last = rows[-1]
+                next_positions[name] = (_to_naive_utc(getattr(last, ts_attr)), last.id)
+            elif after is not None:
+                next_positions[name] = after
+
+        if not has_more:
+            # Final page: rewind to the settle window so late commits are not skipped.
+            # Rewinding only here guarantees a multi-page pull always makes progress.
+            for name, position in next_positions.items():
+                if position > settle_point:
+                    next_positions[name] = settle_point
+
+        page["cursor"] = encode_cursor(next_positions)
+        page["has_more"] = has_more
+        return page
@@ -12,7 +12,8 @@ from ..models.chore import Chore
 from ..models.family import Family
 from ..repositories.user import UserRepository
 from ..repositories.family import FamilyRepository
-from ..schemas.user import UserCreate
+from ..repositories.read_model import ReadModelRepository
+from ..schemas.user import UserCreate, ChildAllowanceSummary, UserWithChoresResponse, ChoreAssignmentSummary
 from ..core.security.jwt import create_access_token, verify_token
 from ..core.security.password import verify_password
 from ..core.unit_of_work import UnitOfWork
@@ -31,6 +32,7 @@ class UserService(BaseService[User, UserRepository]):
         """Initialize user service."""
         super().__init__(UserRepository())
         self.family_repo = FamilyRepository()
+        self.read_repo = ReadModelRepository()
     
     async def register_user(
         self,
@@ -605,20 +607,101 @@ class UserService(BaseService[User, UserRepository]):
         # Add family context if user is in a family
         if user.family_id:
             family = await self.family_repo.get(db, id=user.family_id)
-            family_members = await self.family_repo.get_family_members(db, family_id=user.family_id)
-            family_children = await self.family_repo.get_family_children(db, family_id=user.family_id)
+            counts = await self.family_repo.count_family_members(db, family_id=user.family_id)
             
             stats["family_context"] = {
                 "family_id": family.id,
                 "family_name": family.name,
                 "invite_code": family.invite_code
             }
-            stats["children_count"] = len(family_children)
-            stats["family_members_count"] = len(family_members)
+            stats["children_count"] = counts["children"]
+            stats["family_members_count"] = counts["total"]
         
         elif user.is_parent:
             # Legacy mode: count direct children
             direct_children = await self.repository.get_children(db, parent_id=user.id)
             stats["children_count"] = len(direct_children)
         
-        return stats
\ No newline at end of file
+        return stats
+
+    async def get_children_with_chores(
+        self, db: AsyncSession, *, parent: User
+    ) -> List[UserWithChoresResponse]:
+        """
+        Get a parent's children with a summary of each of their assignments.
+
+        Family-aware: covers every child in the parent's family, or the
+        parent's direct children when they have no family.
+        """
+        if parent.family_id:
+            children = await self.family_repo.get_family_children_with_chores(db, family_id=parent.family_id)
+        else:
+            children = await self.repository.get_children(db, parent_id=parent.id)
+
+        result = []
+        for child in children:
+            chores = [
+                ChoreAssignmentSummary(
+                    id=assignment.id,
+                    chore_id=assignment.chore_id,
+                    chore_title=assignment.chore.title,
+                    reward=assignment.approval_reward if assignment.approval_reward else assignment.chore.reward,
+                    is_completed=assignment.is_completed,
+                    is_approved=assignment.is_approved
+                )
+                for assignment in child.chore_assignments
+                if assignment.chore
+            ]
+            result.append(UserWithChoresResponse(
+                id=child.id,
+                username=child.username,
+                email=child.email,
+                is_parent=child.is_parent,
+                is_active=child.is_active,
+                parent_id=child.parent_id,
+                chores=chores
+            ))
+        return result
+
+    async def get_allowance_summary(
+        self, db: AsyncSession, *, parent: User
+    ) -> List[ChildAllowanceSummary]:
+        """
+        Get per-child allowance figures for a parent's family.
+
+        Family-aware: covers every child in the parent's family, or the
+        parent's direct children when they have no family. Earnings and
+        adjustments are aggregated in SQL rather than per assignment.
+        """
+        if parent.family_id:
+            rows = await self.read_repo.get_allowance_summary(db, family_id=parent.family_id)
+        else:
+            rows = await self.read_repo.get_allowance_summary(db, parent_id=parent.id)
+
+        return [self._allowance_summary(row) for row in rows]
+
+    async def get_child_balance(
+        self, db: AsyncSession, *, child: User
+    ) -> Optional[ChildAllowanceSummary]:
+        """
+        Get the allowance figures of one child, as seen by their parents.
+
+        Returns:
+            The child's summary, or None if the user is not a child
+        """
+        rows = await self.read_repo.get_allowance_summary(db, child_id=child.id)
+        return self._allowance_summary(rows[0]) if rows else None
+
+    @staticmethod
+    def _allowance_summary(row) -> ChildAllowanceSummary:
+        """Build the response for one AllowanceRecord (payouts are not tracked yet)."""
+        paid_out = 0.0
+        return ChildAllowanceSummary(
+            id=row.id,
+            username=row.username,
+            completed_chores=row.completed_chores,
+            total_earned=row.total_earned,
+            total_adjustments=row.total_adjustments,
+            paid_out=paid_out,
+            balance_due=row.total_earned + row.total_adjustments - paid_out,
+        )
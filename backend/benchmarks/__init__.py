@@ -0,0 +1,7 @@
+"""
+Benchmarks for the chores-tracker backend.
+
+Each module is runnable on its own against an in-memory SQLite database:
+
+    python -m backend.benchmarks.chore_list_views
+"""
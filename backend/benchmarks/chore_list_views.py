@@ -0,0 +1,83 @@
+"""
+Payload size and latency of the chore list representations.
+
+Seeds a family with 500 chores and compares GET /api/v1/chores and
+GET /api/v1/chores/child/{id} in the full, ?view=summary and ?fields= forms.
+
+    python -m backend.benchmarks.chore_list_views [--chores 500] [--repeat 20]
+"""
+import argparse
+import asyncio
+
+from .common import (
+    auth_headers,
+    benchmark_client,
+    create_benchmark_database,
+    print_table,
+    seed_family,
+    time_async,
+)
+
+VIEWS = [
+    ("full", ""),
+    ("summary", "view=summary"),
+    ("fields=id,title,reward", "fields=title,reward"),
+]
+
+
+async def run(chores: int = 500, repeat: int = 20) -> None:
+    engine, session_factory = await create_benchmark_database()
+    async with session_factory() as session:
+        family = await seed_family(session, chores=chores)
+
+    endpoints = [
+        ("/api/v1/chores", "/api/v1/chores"),
+        ("/api/v1/chores/child/{id}", f"/api/v1/chores/child/{family.child_ids[0]}"),
+    ]
+    headers = auth_headers(family.parent_token)
+
+    rows = []
+    async with benchmark_client(session_factory) as client:
+        for label, path in endpoints:
+            full_bytes = None
+            for view_name, query in VIEWS:
+                url = f"{path}?{query}" if query else path
+                response = await client.get(url, headers=headers)
+                response.raise_for_status()
+                size = len(response.content)
+                full_bytes = full_bytes or size
+
+                result = await time_async(
+                    view_name,
+                    lambda url=url: client.get(url, headers=headers),
+                    repeat=repeat
+                )
+                rows.append([
+                    label,
+                    view_name,
+                    len(response.json()),
+                    f"{size / 1024:.1f}",
+                    f"{size / full_bytes:.0%}",
+                    f"{result.median:.1f}",
+                    f"{result.p95:.1f}",
+                ])
+
+    await engine.dispose()
+
+    print(f"\nChore list views, {chores} chores, {repeat} requests per case\n")
+    print_table(
+        ["endpoint", "view", "rows", "KiB", "vs full", "median ms", "p95 ms"],
+        rows
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chores", type=int, default=500, help="Chores in the seeded family")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed requests per case")
+    args = parser.parse_args()
+    asyncio.run(run(chores=args.chores, repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Shared helpers for benchmarks: an isolated database, seed data and timing.
+"""
+import os
+import statistics
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Dict, List
+
+# Rate limiting is disabled in testing mode; benchmarks hammer the same endpoint.
+os.environ.setdefault("TESTING", "true")
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app.db.base import Base, get_db, get_reporting_session_factory
+from backend.app.core.security.jwt import create_access_token
+from backend.app.models.chore import Chore
+from backend.app.models.chore_assignment import ChoreAssignment
+from backend.app.models.family import Family
+from backend.app.models.user import User
+
+BENCHMARK_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@dataclass
+class SeededFamily:
+    """IDs and tokens of a seeded benchmark family."""
+    family_id: int
+    parent_id: int
+    child_ids: List[int]
+    parent_token: str
+    child_tokens: List[str] = field(default_factory=list)
+
+
+@dataclass
+class TimingResult:
+    """Latency samples of one benchmark case, in milliseconds."""
+    name: str
+    samples: List[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+async def create_benchmark_database():
+    """Create an in-memory engine with the full schema and return (engine, session factory)."""
+    engine = create_async_engine(
+        BENCHMARK_DATABASE_URL,
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    return engine, session_factory
+
+
+async def seed_family(
+    session: AsyncSession,
+    *,
+    chores: int = 500,
+    children: int = 2,
+    completed_every: int = 3
+) -> SeededFamily:
+    """
+    Seed one family with a parent, children and ``chores`` chores.
+
+    Chores are round-robin assigned to the children; every ``completed_every``-th
+    assignment is completed so status filters have something to work with.
+    """
+    family = Family(name="Benchmark Family", invite_code="BENCH001")
+    session.add(family)
+    await session.flush()
+
+    parent = User(
+        username="bench_parent",
+        email="bench_parent@example.com",
+        hashed_password="not-a-real-hash",
+        is_parent=True,
+        family_id=family.id
+    )
+    session.add(parent)
+    await session.flush()
+
+    kids = [
+        User(
+            username=f"bench_child_{i}",
+            hashed_password="not-a-real-hash",
+            is_parent=False,
+            parent_id=parent.id,
+            family_id=family.id
+        )
+        for i in range(children)
+    ]
+    session.add_all(kids)
+    await session.flush()
+
+    for i in range(chores):
+        chore = Chore(
+            title=f"Chore {i}",
+            description=f"Benchmark chore number {i} with a realistic description length",
+            reward=float(i % 10) + 0.5,
+            cooldown_days=i % 7,
+            is_recurring=bool(i % 2),
+            assignment_mode="single",
+            creator_id=parent.id
+        )
+        session.add(chore)
+        await session.flush()
+        session.add(ChoreAssignment(
+            chore_id=chore.id,
+            assignee_id=kids[i % children].id,
+            is_completed=(i % completed_every == 0)
+        ))
+
+    await session.commit()
+
+    return SeededFamily(
+        family_id=family.id,
+        parent_id=parent.id,
+        child_ids=[kid.id for kid in kids],
+        parent_token=create_access_token(subject=str(parent.id)),
+        child_tokens=[create_access_token(subject=str(kid.id)) for kid in kids]
+    )
+
+
+@asynccontextmanager
+async def benchmark_client(session_factory) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield an HTTP client bound to the app, with get_db and the reporting pool on ``session_factory``."""
+    from backend.app.main import app
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_reporting_session_factory] = lambda: session_factory
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://bench"
+        ) as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_reporting_session_factory, None)
+
+
+async def time_async(
+    name: str,
+    func: Callable[[], Awaitable[object]],
+    *,
+    repeat: int = 20,
+    warmup: int = 2
+) -> TimingResult:
+    """Run ``func`` ``warmup + repeat`` times and keep the last ``repeat`` latencies."""
+    for _ in range(warmup):
+        await func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return TimingResult(name=name, samples=samples)
+
+
+def print_table(headers: List[str], rows: List[List[object]]) -> None:
+    """Print a fixed-width results table."""
+    widths = [
+        max(len(str(h)), *(len(str(r[i])) for r in rows)) if rows else len(str(h))
+        for i, h in enumerate(headers)
+    ]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(row, widths)))
+
+
+def auth_headers(token: str) -> Dict[str, str]:
+    """Bearer authorization header for a token."""
+    return {"Authorization": f"Bearer {token}"}
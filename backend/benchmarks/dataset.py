@@ -0,0 +1,457 @@
+"""
+Deterministic, production-scale synthetic data for benchmarks.
+
+``generate_batches()`` builds the rows of every table for a size profile:
+families with one or two parents and a varying number of children, chores in
+all three assignment modes, recurring chores with months of completion and
+approval history, rejections, manual reward adjustments and the activity feed.
+The history follows the service layer: each approval sets the assignment's
+``approval_reward`` and adds a reward adjustment and activities, and a
+recurring chore's single assignment is reset in place for every cycle, so
+past cycles survive in the adjustments and activities.
+
+``load_dataset()`` bulk-inserts the rows, a batch of families at a time:
+COPY through asyncpg on PostgreSQL, executemany elsewhere. Ids are assigned
+up front, above the largest id already present, so rows can reference each
+other without round trips; PostgreSQL sequences are moved past them
+afterwards. The same profile, seed and end date always produce the same
+rows. Every generated user's password is ``PASSWORD``.
+
+    python -m backend.benchmarks.dataset --database-url URL [--profile small] [--seed 1] [--create-schema]
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import orjson
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from backend.app.core.security.password import get_password_hash
+from backend.app.db.base import Base
+from backend.app.models.activity import Activity
+from backend.app.models.chore import Chore
+from backend.app.models.chore_assignment import ChoreAssignment
+from backend.app.models.family import Family
+from backend.app.models.reward_adjustment import RewardAdjustment
+from backend.app.models.user import User
+
+from .common import print_table
+
+PASSWORD = "benchmark-password"
+
+# Insert order; later tables reference earlier ones
+TABLES = [
+    Family.__table__,
+    User.__table__,
+    Chore.__table__,
+    ChoreAssignment.__table__,
+    RewardAdjustment.__table__,
+    Activity.__table__,
+]
+
+
+class SizeProfile(NamedTuple):
+    """How much data to generate."""
+    families: int
+    min_children: int
+    max_children: int
+    min_chores: int
+    max_chores: int
+    # Days of history before the end date
+    history_days: int
+    # Manual bonuses and deductions per child and 30 days
+    adjustments_per_month: float = 2.0
+
+
+PROFILES = {
+    "tiny": SizeProfile(families=10, min_children=1, max_children=3, min_chores=3, max_chores=10, history_days=30),
+    "small": SizeProfile(families=200, min_children=1, max_children=4, min_chores=5, max_chores=25, history_days=90),
+    "medium": SizeProfile(families=2000, min_children=1, max_children=5, min_chores=5, max_chores=40, history_days=120),
+    "large": SizeProfile(families=10000, min_children=1, max_children=6, min_chores=10, max_chores=60, history_days=180),
+}
+
+CHORE_TEMPLATES = [
+    ("Make your bed", "Straighten the sheets, fluff the pillow and fold the blanket"),
+    ("Feed the pets", "Fill the food and water bowls in the morning and evening"),
+    ("Take out the trash", "Empty every wastebasket and take the bins to the curb"),
+    ("Unload the dishwasher", "Put away all clean dishes, glasses and cutlery"),
+    ("Clean your room", "Pick up toys and clothes, dust the shelves and vacuum the floor"),
+    ("Water the plants", "Water the indoor plants and the vegetable garden"),
+    ("Set the table", "Set plates, cutlery and napkins for dinner"),
+    ("Fold laundry", "Fold the clean laundry and put it away"),
+    ("Walk the dog", "Take the dog for a twenty minute walk"),
+    ("Homework", "Finish all homework before dinner"),
+    ("Practice piano", "Thirty minutes of scales and pieces"),
+    ("Vacuum the living room", "Vacuum the carpet and under the sofa cushions"),
+    ("Wash the car", "Wash, rinse and dry the family car"),
+    ("Rake leaves", "Rake the front yard and bag the leaves"),
+    ("Clean the bathroom", "Wipe the sink and mirror, scrub the toilet and tub"),
+    ("Read for 30 minutes", "Read a book of your choice and tell us about it"),
+]
+
+ADJUSTMENT_REASONS = [
+    (5.0, "Helped a sibling with homework"),
+    (2.0, "Extra help with groceries"),
+    (10.0, "Great report card"),
+    (3.0, "Birthday bonus"),
+    (-2.0, "Left bike out in the rain"),
+    (-1.0, "Forgot to feed the pets"),
+    (-5.0, "Broke a house rule"),
+]
+
+REJECTION_REASONS = [
+    "Not finished, please do the rest",
+    "Please redo this more carefully",
+    "Toys are still on the floor",
+]
+
+# Weights of the assignment modes and of recurring chores
+MODE_WEIGHTS = [("single", 0.6), ("multi_independent", 0.25), ("unassigned", 0.15)]
+RECURRING_SHARE = 0.6
+COOLDOWN_DAYS = [1, 1, 1, 2, 3, 7, 7, 14]
+
+
+class IdCounters:
+    """Next id to use for each table."""
+
+    def __init__(self, start: Dict[str, int]):
+        self._next = dict(start)
+
+    def take(self, table: str) -> int:
+        value = self._next[table]
+        self._next[table] = value + 1
+        return value
+
+
+class FamilyBuilder:
+    """Generates the rows of one family."""
+
+    def __init__(self, rng: random.Random, ids: IdCounters, profile: SizeProfile, end: datetime, hashed_password: str):
+        self.rng = rng
+        self.ids = ids
+        self.profile = profile
+        self.end = end
+        self.start = end - timedelta(days=profile.history_days)
+        self.hashed_password = hashed_password
+        self.family_id: Optional[int] = None
+        self.rows: Dict[str, List[Dict[str, Any]]] = {table.name: [] for table in TABLES}
+
+    def moment(self, after: datetime, max_hours: float) -> datetime:
+        """A random moment up to ``max_hours`` after ``after``, capped at the end date."""
+        return min(self.end, after + timedelta(hours=self.rng.uniform(0.1, max_hours)))
+
+    def build(self) -> None:
+        rng = self.rng
+        family_id = self.family_id = self.ids.take("families")
+        created = self.start - timedelta(days=rng.randint(0, 365))
+        self.rows["families"].append({
+            "id": family_id,
+            "name": f"Family {family_id}",
+            "invite_code": f"D{family_id:07d}",
+            "invite_code_expires_at": None,
+            "created_at": created,
+            "updated_at": created,
+        })
+
+        parents = [self.user(family_id, None, created) for _ in range(2 if rng.random() < 0.6 else 1)]
+        children = [
+            self.user(family_id, parents[0], created)
+            for _ in range(rng.randint(self.profile.min_children, self.profile.max_children))
+        ]
+        for _ in range(rng.randint(self.profile.min_chores, self.profile.max_chores)):
+            self.chore(parents, children)
+        for child in children:
+            self.adjustments(parents, child)
+
+    def user(self, family_id: int, parent: Optional[int], created: datetime) -> int:
+        user_id = self.ids.take("users")
+        is_parent = parent is None
+        self.rows["users"].append({
+            "id": user_id,
+            "email": f"parent_{user_id}@example.com" if is_parent else None,
+            "username": f"{'parent' if is_parent else 'child'}_{user_id}",
+            "hashed_password": self.hashed_password,
+            "is_active": True,
+            "is_parent": is_parent,
+            "parent_id": parent,
+            "family_id": family_id,
+            "created_at": created,
+            "updated_at": created,
+        })
+        return user_id
+
+    def chore(self, parents: List[int], children: List[int]) -> None:
+        rng = self.rng
+        title, description = rng.choice(CHORE_TEMPLATES)
+        mode = rng.choices([m for m, _ in MODE_WEIGHTS], weights=[w for _, w in MODE_WEIGHTS])[0]
+        recurring = rng.random() < RECURRING_SHARE
+        cooldown = rng.choice(COOLDOWN_DAYS) if recurring else 0
+        is_range = rng.random() < 0.2
+        reward = float(rng.choice([0.5, 1, 1, 2, 2, 3, 5]))
+        min_reward, max_reward = (reward, reward * 3) if is_range else (None, None)
+        # Recurring chores are set up early to build up history
+        span = self.profile.history_days / (3 if recurring else 1)
+        created = self.start + timedelta(days=rng.uniform(0, span))
+        creator = rng.choice(parents)
+
+        chore_id = self.ids.take("chores")
+        self.rows["chores"].append({
+            "id": chore_id,
+            "title": title,
+            "description": description,
+            "reward": reward,
+            "min_reward": min_reward,
+            "max_reward": max_reward,
+            "is_range_reward": is_range,
+            "cooldown_days": cooldown,
+            "is_recurring": recurring,
+            "frequency": None,
+            "assignment_mode": mode,
+            "is_disabled": rng.random() < 0.03,
+            "created_at": created,
+            "updated_at": created,
+            "creator_id": creator,
+            "family_id": self.family_id,
+        })
+        self.activity(creator, "chore_created", f"Created chore: {title}", created, None, {
+            "chore_id": chore_id, "chore_title": title, "reward_amount": reward
+        })
+
+        if mode == "single":
+            assignees = [rng.choice(children)]
+        elif mode == "multi_independent":
+            assignees = children
+        else:
+            # Half of the pool chores have been claimed by a child
+            assignees = [rng.choice(children)] if rng.random() < 0.5 else []
+        chore = (chore_id, title, reward, min_reward, max_reward, cooldown)
+        for child in assignees:
+            self.assignment(chore, parents, child, created)
+
+    def assignment(self, chore: Tuple, parents: List[int], child: int, created: datetime) -> None:
+        """An assignment with its completion/approval history up to the end date."""
+        rng = self.rng
+        chore_id, title, reward, min_reward, max_reward, cooldown = chore
+        state = {
+            "is_completed": False,
+            "is_approved": False,
+            "completion_date": None,
+            "approval_date": None,
+            "approval_reward": None,
+            "rejection_reason": None,
+        }
+        updated = created
+        cursor = self.moment(created, 72)
+        while cursor < self.end:
+            # Not every chore gets done; non-recurring ones are open about a third of the time
+            if not cooldown and rng.random() < 0.35:
+                break
+            completed = cursor
+            self.activity(child, "chore_completed", f"Completed chore: {title}", completed, None, {
+                "chore_id": chore_id, "chore_title": title
+            })
+            state.update(is_completed=True, is_approved=False, completion_date=completed, rejection_reason=None)
+            updated = completed
+
+            reviewed = self.moment(completed, 48)
+            # Waiting for approval: done recently, or a one-off chore the parents forgot about
+            if reviewed >= self.end or (not cooldown and rng.random() < 0.15):
+                break
+            parent = rng.choice(parents)
+            if rng.random() < 0.05:
+                reason = rng.choice(REJECTION_REASONS)
+                self.activity(parent, "chore_rejected", f"Rejected chore '{title}': {reason}", reviewed, child, {
+                    "chore_id": chore_id, "chore_title": title, "rejection_reason": reason
+                })
+                state.update(is_completed=False, completion_date=None, rejection_reason=reason)
+                updated = reviewed
+                cursor = self.moment(reviewed, 24)
+                continue
+
+            amount = round(rng.uniform(min_reward, max_reward) * 4) / 4 if min_reward is not None else reward
+            self.reward(child, parent, amount, f"Approved chore: {title}", reviewed)
+            self.activity(parent, "chore_approved", f"Approved chore '{title}' for ${amount:.2f}", reviewed, child, {
+                "chore_id": chore_id, "chore_title": title, "reward_amount": amount
+            })
+            state.update(is_approved=True, approval_date=reviewed, approval_reward=amount)
+            updated = reviewed
+            if not cooldown:
+                break
+            # The next cycle starts once the cooldown is over, whenever the child gets to it
+            cursor = reviewed + timedelta(days=cooldown + rng.expovariate(1.0))
+            if cursor < self.end:
+                state.update(is_completed=False, is_approved=False, completion_date=None)
+
+        self.rows["chore_assignments"].append({
+            "id": self.ids.take("chore_assignments"),
+            "chore_id": chore_id,
+            "assignee_id": child,
+            "family_id": self.family_id,
+            **state,
+            "created_at": created,
+            "updated_at": updated,
+        })
+
+    def adjustments(self, parents: List[int], child: int) -> None:
+        rng = self.rng
+        count = int(self.profile.history_days / 30 * self.profile.adjustments_per_month * rng.uniform(0.5, 1.5))
+        for _ in range(count):
+            amount, reason = rng.choice(ADJUSTMENT_REASONS)
+            created = self.start + timedelta(days=rng.uniform(0, self.profile.history_days))
+            parent = rng.choice(parents)
+            adjustment_id = self.reward(child, parent, amount, reason, created)
+            kind = "bonus" if amount >= 0 else "deduction"
+            self.activity(parent, "adjustment_applied", f"Applied {kind} of ${abs(amount):.2f}: {reason}", created, child, {
+                "adjustment_id": adjustment_id, "amount": amount, "reason": reason, "adjustment_type": kind
+            })
+
+    def reward(self, child: int, parent: int, amount: float, reason: str, created: datetime) -> int:
+        adjustment_id = self.ids.take("reward_adjustments")
+        self.rows["reward_adjustments"].append({
+            "id": adjustment_id,
+            "child_id": child,
+            "parent_id": parent,
+            "amount": Decimal(f"{amount:.2f}"),
+            "reason": reason,
+            "created_at": created,
+            "updated_at": created,
+        })
+        return adjustment_id
+
+    def activity(self, user: int, kind: str, description: str, created: datetime, target: Optional[int], data: Dict) -> None:
+        self.rows["activities"].append({
+            "id": self.ids.take("activities"),
+            "user_id": user,
+            "activity_type": kind,
+            "description": description,
+            "target_user_id": target,
+            "activity_data": data,
+            "created_at": created,
+        })
+
+
+def generate_batches(
+    profile: SizeProfile,
+    *,
+    seed: int = 1,
+    end: datetime,
+    start_ids: Optional[Dict[str, int]] = None,
+    hashed_password: str = "",
+    batch_families: int = 200
+) -> Iterator[Dict[str, List[Dict[str, Any]]]]:
+    """
+    Yield the rows of ``batch_families`` families at a time, by table name.
+
+    ``start_ids`` gives the first id to use per table (default 1).
+    """
+    rng = random.Random(seed)
+    ids = IdCounters(start_ids or {table.name: 1 for table in TABLES})
+    for first in range(0, profile.families, batch_families):
+        batch = {table.name: [] for table in TABLES}
+        for _ in range(min(batch_families, profile.families - first)):
+            builder = FamilyBuilder(rng, ids, profile, end, hashed_password)
+            builder.build()
+            for name, rows in builder.rows.items():
+                batch[name].extend(rows)
+        yield batch
+
+
+async def next_ids(conn: AsyncConnection) -> Dict[str, int]:
+    """First free id of every table."""
+    ids = {}
+    for table in TABLES:
+        ids[table.name] = ((await conn.execute(select(func.max(table.c.id)))).scalar() or 0) + 1
+    return ids
+
+
+async def insert_rows(conn: AsyncConnection, table, rows: List[Dict[str, Any]]) -> None:
+    """Bulk-insert rows: COPY on PostgreSQL (asyncpg), executemany otherwise."""
+    if not rows:
+        return
+    if conn.dialect.name != "postgresql":
+        await conn.execute(table.insert(), rows)
+        return
+
+    columns = list(rows[0])
+    json_columns = {c.name for c in table.columns if c.type.__class__.__name__ == "JSON"}
+    records = [
+        tuple(
+            orjson.dumps(row[c]).decode() if c in json_columns and row[c] is not None else row[c]
+            for c in columns
+        )
+        for row in rows
+    ]
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(table.name, records=records, columns=columns)
+
+
+async def load_dataset(
+    engine: AsyncEngine,
+    profile: SizeProfile,
+    *,
+    seed: int = 1,
+    end: Optional[datetime] = None,
+    batch_families: int = 200
+) -> Dict[str, int]:
+    """Generate and insert a dataset; returns the number of rows per table."""
+    end = end or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    hashed_password = get_password_hash(PASSWORD)
+    counts = {table.name: 0 for table in TABLES}
+
+    async with engine.connect() as conn:
+        start_ids = await next_ids(conn)
+    batches = generate_batches(
+        profile, seed=seed, end=end, start_ids=start_ids,
+        hashed_password=hashed_password, batch_families=batch_families
+    )
+    for batch in batches:
+        async with engine.begin() as conn:
+            for table in TABLES:
+                await insert_rows(conn, table, batch[table.name])
+                counts[table.name] += len(batch[table.name])
+
+    if engine.dialect.name == "postgresql":
+        async with engine.begin() as conn:
+            for table in TABLES:
+                await conn.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                    f"(SELECT COALESCE(MAX(id), 1) FROM {table.name}))"
+                ))
+    return counts
+
+
+async def run(database_url: str, profile: str, seed: int, end: Optional[datetime], create_schema: bool) -> None:
+    engine = create_async_engine(database_url)
+    if create_schema:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    start = time.perf_counter()
+    counts = await load_dataset(engine, PROFILES[profile], seed=seed, end=end)
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+
+    total = sum(counts.values())
+    print(f"\nLoaded profile '{profile}' (seed {seed}) in {elapsed:.1f} s, {total / elapsed:,.0f} rows/s\n")
+    print_table(["table", "rows"], [[name, f"{count:,}"] for name, count in counts.items()])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", required=True, help="Async SQLAlchemy URL of the database to fill")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="small", help="Dataset size")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument("--end-date", type=datetime.fromisoformat, default=None,
+                        help="Last day of history (default: today)")
+    parser.add_argument("--create-schema", action="store_true", help="Create missing tables first")
+    args = parser.parse_args()
+    asyncio.run(run(args.database_url, args.profile, args.seed, args.end_date, args.create_schema))
+
+
+if __name__ == "__main__":
+    main()
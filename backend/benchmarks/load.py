@@ -0,0 +1,460 @@
+"""
+HTTP load test: role-based traffic mixes, throughput and per-route latency.
+
+A fixed number of virtual users loop over scenarios for their role, closed
+loop (each user waits for its response, then optionally thinks):
+
+- ``child``: polls available chores and now and then completes one
+- ``parent``: opens the approval inbox and approves up to ``--bulk`` assignments
+- ``reports``: a parent opening the allowance report and statistics pages
+
+Users are drawn from a ``dataset.py`` population, their role picked by the
+``--mix`` weights. A warmup phase runs the same traffic unrecorded (caches,
+connection pools, first-call imports), then the steady-state phase records
+every request under its route template: count, errors, requests/sec,
+percentiles and a latency histogram.
+
+By default the app runs in-process (ASGI transport) on a temporary SQLite
+file loaded with ``--profile``; latencies then include the client side of
+the event loop. ``--url`` drives a running server instead, e.g. a local
+uvicorn, with ``--database-url`` pointing at its (already loaded) database
+so users can be picked; tokens are minted locally, so the server must share
+``SECRET_KEY``, and should run with ``TESTING=true`` or rate limits will
+reject most of the traffic.
+
+``--output`` writes the report as JSON; ``--compare`` prints the change in
+throughput and latency against an earlier report.
+
+    python -m backend.benchmarks.load [--profile small] [--users 20] [--warmup 5] [--duration 30]
+        [--mix child=6,parent=3,reports=1] [--think-ms 0] [--bulk 5] [--seed 1]
+        [--url URL --database-url URL] [--output report.json] [--compare earlier.json]
+"""
+import argparse
+import asyncio
+import bisect
+import json
+import os
+import random
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.security.jwt import create_access_token
+from backend.app.db.base import Base
+from backend.app.models.user import User
+
+from .common import auth_headers, benchmark_client, print_table
+from .dataset import PROFILES, load_dataset
+
+API = "/api/v1"
+
+# Upper bounds of the latency histogram buckets, in ms; the last bucket is open
+HISTOGRAM_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+PERCENTILES = [50, 90, 99]
+
+
+class Member(NamedTuple):
+    """A user a virtual user can act as."""
+    user_id: int
+    family_id: int
+    is_parent: bool
+
+
+class RouteStats:
+    """Latencies and outcomes of one route during the recorded phase."""
+
+    def __init__(self):
+        self.samples: List[float] = []
+        self.errors = 0
+        self.statuses: Dict[int, int] = defaultdict(int)
+
+    def add(self, ms: float, status: int) -> None:
+        self.samples.append(ms)
+        self.statuses[status] += 1
+        if status >= 400:
+            self.errors += 1
+
+    def summary(self, seconds: float) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        for ms in ordered:
+            histogram[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, ms)] += 1
+        return {
+            "count": len(ordered),
+            "errors": self.errors,
+            "rps": round(len(ordered) / seconds, 2),
+            **{f"p{p}_ms": round(percentile(ordered, p), 2) for p in PERCENTILES},
+            "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+            "statuses": {str(code): n for code, n in sorted(self.statuses.items())},
+            "histogram": histogram,
+        }
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+class Recorder:
+    """Collects request timings per route while ``recording`` is set."""
+
+    def __init__(self):
+        self.recording = False
+        self.routes: Dict[str, RouteStats] = defaultdict(RouteStats)
+        self.transport_errors = 0
+
+    def add(self, route: str, ms: float, status: int) -> None:
+        if self.recording:
+            self.routes[route].add(ms, status)
+
+
+class VirtualUser:
+    """One simulated client: a user, its token and its own random stream."""
+
+    def __init__(self, client: httpx.AsyncClient, member: Member, recorder: Recorder, rng: random.Random, bulk: int):
+        self.client = client
+        self.member = member
+        self.recorder = recorder
+        self.rng = rng
+        self.bulk = bulk
+        self.headers = auth_headers(create_access_token(subject=str(member.user_id)))
+
+    async def request(self, method: str, route: str, path: Optional[str] = None, **kwargs) -> Optional[httpx.Response]:
+        """Send a request; ``route`` is the template it is recorded under."""
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, API + (path or route), headers=self.headers, **kwargs)
+        except httpx.HTTPError:
+            if self.recorder.recording:
+                self.recorder.transport_errors += 1
+            return None
+        self.recorder.add(f"{method} {route}", (time.perf_counter() - start) * 1000, response.status_code)
+        return response
+
+
+async def child_scenario(vu: VirtualUser) -> None:
+    """Poll available chores; complete one every few polls."""
+    response = await vu.request("GET", "/chores/available")
+    if response is None or response.status_code != 200 or vu.rng.random() >= 0.3:
+        return
+    available = response.json()
+    chores = [item["chore"]["id"] for item in available.get("assigned", []) + available.get("pool", [])]
+    if chores:
+        await vu.request("POST", "/chores/{chore_id}/complete", f"/chores/{vu.rng.choice(chores)}/complete")
+
+
+async def parent_scenario(vu: VirtualUser) -> None:
+    """Open the approval inbox and approve a batch of completed assignments."""
+    response = await vu.request("GET", "/chores/pending-approval")
+    if response is None or response.status_code != 200:
+        return
+    for item in response.json()[:vu.bulk]:
+        chore = item["chore"]
+        body = {"reward_value": chore["min_reward"]} if chore.get("is_range_reward") else {}
+        await vu.request(
+            "POST", "/assignments/{assignment_id}/approve", f"/assignments/{item['assignment_id']}/approve", json=body
+        )
+
+
+async def reports_scenario(vu: VirtualUser) -> None:
+    """Open one of the report pages."""
+    route, params = vu.rng.choice([
+        ("/reports/allowance-summary", None),
+        ("/statistics/weekly-summary", {"weeks_back": 4}),
+        ("/statistics/trends", {"period": "monthly"}),
+        ("/families/members", None),
+    ])
+    await vu.request("GET", route, params=params)
+
+
+class Scenario(NamedTuple):
+    parent: bool
+    run: Callable[[VirtualUser], Awaitable[None]]
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "child": Scenario(parent=False, run=child_scenario),
+    "parent": Scenario(parent=True, run=parent_scenario),
+    "reports": Scenario(parent=True, run=reports_scenario),
+}
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """``child=6,parent=3,reports=1`` -> weights per scenario."""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario '{name}' (choose from {', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def assign_users(members: List[Member], mix: Dict[str, float], users: int, rng: random.Random):
+    """Pick ``users`` (scenario, member) pairs, scenarios by weight."""
+    parents = [m for m in members if m.is_parent]
+    children = [m for m in members if not m.is_parent]
+    names = list(mix)
+    assignments = []
+    for name in rng.choices(names, weights=[mix[n] for n in names], k=users):
+        pool = parents if SCENARIOS[name].parent else children
+        assignments.append((name, rng.choice(pool)))
+    return assignments
+
+
+async def virtual_user_loop(vu: VirtualUser, scenario: Scenario, stop: asyncio.Event, think_ms: float) -> None:
+    while not stop.is_set():
+        await scenario.run(vu)
+        if think_ms:
+            await asyncio.sleep(vu.rng.expovariate(1 / think_ms) / 1000)
+        else:
+            await asyncio.sleep(0)
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    members: List[Member],
+    *,
+    users: int,
+    mix: Dict[str, float],
+    warmup: float,
+    duration: float,
+    think_ms: float,
+    bulk: int,
+    seed: int
+) -> Dict[str, Any]:
+    """Run warmup and steady state; returns the per-route report of the steady state."""
+    rng = random.Random(seed)
+    recorder = Recorder()
+    stop = asyncio.Event()
+    assignments = assign_users(members, mix, users, rng)
+    tasks = [
+        asyncio.create_task(virtual_user_loop(
+            VirtualUser(client, member, recorder, random.Random(rng.random()), bulk), SCENARIOS[name], stop, think_ms
+        ))
+        for name, member in assignments
+    ]
+    await asyncio.sleep(warmup)
+    recorder.recording = True
+    started = time.perf_counter()
+    await asyncio.sleep(duration)
+    recorder.recording = False
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await asyncio.gather(*tasks)
+
+    routes = {route: stats.summary(elapsed) for route, stats in sorted(recorder.routes.items())}
+    overall = RouteStats()
+    for stats in recorder.routes.values():
+        overall.samples.extend(stats.samples)
+        overall.errors += stats.errors
+        for code, n in stats.statuses.items():
+            overall.statuses[code] += n
+    return {
+        "seconds": round(elapsed, 2),
+        "virtual_users": {name: sum(1 for n, _ in assignments if n == name) for name in mix},
+        "transport_errors": recorder.transport_errors,
+        "total": overall.summary(elapsed),
+        "routes": routes,
+    }
+
+
+async def load_members(session_factory) -> List[Member]:
+    async with session_factory() as db:
+        rows = (await db.execute(
+            select(User.id, User.family_id, User.is_parent).where(User.family_id.is_not(None), User.is_active == True)
+        )).all()
+    return [Member(*row) for row in rows]
+
+
+@asynccontextmanager
+async def in_process_target(profile: str, seed: int) -> AsyncIterator[tuple]:
+    """Yield (client, members) for the app in-process on a temporary SQLite file."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(directory, 'load.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await load_dataset(engine, PROFILES[profile], seed=seed)
+        session_factory = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+        try:
+            members = await load_members(session_factory)
+            async with benchmark_client(session_factory) as client:
+                yield client, members
+        finally:
+            await engine.dispose()
+
+
+@asynccontextmanager
+async def remote_target(url: str, database_url: str) -> AsyncIterator[tuple]:
+    """Yield (client, members) for a running server and the database it uses."""
+    engine = create_async_engine(database_url)
+    try:
+        members = await load_members(sessionmaker(engine, expire_on_commit=False, class_=AsyncSession))
+    finally:
+        await engine.dispose()
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=url, timeout=30, limits=limits) as client:
+        yield client, members
+
+
+def print_report(report: Dict[str, Any], earlier: Optional[Dict[str, Any]] = None) -> None:
+    config = report["config"]
+    total = report["total"]
+    print(
+        f"\n{config['target']}, {config['users']} users {report['virtual_users']}, "
+        f"{report['seconds']:.0f} s steady state after {config['warmup']:.0f} s warmup\n"
+    )
+    print(
+        f"{total['count']} requests, {total['rps']:.1f} req/s, {total['errors']} errors, "
+        f"{report['transport_errors']} transport errors, "
+        + ", ".join(f"p{p} {total[f'p{p}_ms']:.1f} ms" for p in PERCENTILES)
+        + "\n"
+    )
+    headers = ["route", "count", "req/s", "errors"] + [f"p{p} ms" for p in PERCENTILES] + ["max ms"]
+    rows = [
+        [route, s["count"], f"{s['rps']:.1f}", s["errors"]] + [f"{s[f'p{p}_ms']:.1f}" for p in PERCENTILES]
+        + [f"{s['max_ms']:.1f}"]
+        for route, s in report["routes"].items()
+    ]
+    print_table(headers, rows)
+
+    print("\nLatency histogram, share of requests per bucket (ms)\n")
+    labels = [f"<={b}" for b in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}"]
+    used = [i for i in range(len(labels)) if any(s["histogram"][i] for s in report["routes"].values())]
+    print_table(
+        ["route"] + [labels[i] for i in used],
+        [
+            [route] + [f"{s['histogram'][i] / s['count']:.0%}" if s["count"] else "" for i in used]
+            for route, s in report["routes"].items()
+        ]
+    )
+
+    if earlier:
+        print_comparison(report, earlier)
+
+
+def change(current: float, base: Optional[float]) -> str:
+    if not base:
+        return ""
+    return f"{(current / base - 1) * 100:+.0f}%"
+
+
+def print_comparison(report: Dict[str, Any], earlier: Dict[str, Any]) -> None:
+    print(f"\nAgainst {earlier.get('generated_at', 'the earlier run')}\n")
+    differing = {
+        key: (earlier["config"].get(key), value)
+        for key, value in report["config"].items()
+        if earlier["config"].get(key) != value
+    }
+    if differing:
+        print("Configurations differ: " + ", ".join(f"{k} {a} -> {b}" for k, (a, b) in differing.items()) + "\n")
+    rows = []
+    for route, s in [("total", report["total"])] + list(report["routes"].items()):
+        before = earlier["total"] if route == "total" else earlier["routes"].get(route)
+        if before is None:
+            rows.append([route, f"{s['rps']:.1f}", "new", f"{s['p50_ms']:.1f}", "", f"{s['p99_ms']:.1f}", ""])
+            continue
+        rows.append([
+            route,
+            f"{s['rps']:.1f}", change(s["rps"], before["rps"]),
+            f"{s['p50_ms']:.1f}", change(s["p50_ms"], before["p50_ms"]),
+            f"{s['p99_ms']:.1f}", change(s["p99_ms"], before["p99_ms"]),
+        ])
+    print_table(["route", "req/s", "change", "p50 ms", "change", "p99 ms", "change"], rows)
+
+
+async def run(
+    profile: str = "small",
+    users: int = 20,
+    mix: Optional[Dict[str, float]] = None,
+    warmup: float = 5,
+    duration: float = 30,
+    think_ms: float = 0,
+    bulk: int = 5,
+    seed: int = 1,
+    url: Optional[str] = None,
+    database_url: Optional[str] = None,
+    output: Optional[str] = None,
+    compare: Optional[str] = None
+) -> Dict[str, Any]:
+    mix = mix or {"child": 6, "parent": 3, "reports": 1}
+    target = remote_target(url, database_url) if url else in_process_target(profile, seed)
+    async with target as (client, members):
+        report = await drive(
+            client, members, users=users, mix=mix, warmup=warmup, duration=duration,
+            think_ms=think_ms, bulk=bulk, seed=seed
+        )
+
+    report = {
+        "generated_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "config": {
+            "target": url or f"in-process, profile {profile}",
+            "users": users,
+            "mix": mix,
+            "warmup": warmup,
+            "duration": duration,
+            "think_ms": think_ms,
+            "bulk": bulk,
+            "seed": seed,
+        },
+        "histogram_bounds_ms": HISTOGRAM_BOUNDS_MS,
+        **report,
+    }
+    earlier = None
+    if compare:
+        with open(compare) as f:
+            earlier = json.load(f)
+    print_report(report, earlier)
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="small", help="Dataset for in-process runs")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--mix", type=parse_mix, default=None, help="Scenario weights, e.g. child=6,parent=3,reports=1")
+    parser.add_argument("--warmup", type=float, default=5, help="Unrecorded seconds before the steady state")
+    parser.add_argument("--duration", type=float, default=30, help="Recorded steady-state seconds")
+    parser.add_argument("--think-ms", type=float, default=0, help="Mean pause between scenario runs per user")
+    parser.add_argument("--bulk", type=int, default=5, help="Approvals per parent inbox visit")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the dataset and the virtual users")
+    parser.add_argument("--url", help="Base URL of a running server instead of the in-process app")
+    parser.add_argument("--database-url", help="Database of the server at --url, to pick users from")
+    parser.add_argument("--output", help="Write the report to this JSON file")
+    parser.add_argument("--compare", help="Earlier JSON report to compare against")
+    args = parser.parse_args()
+    if args.url and not args.database_url:
+        parser.error("--url requires --database-url")
+
+    asyncio.run(run(
+        profile=args.profile,
+        users=args.users,
+        mix=args.mix,
+        warmup=args.warmup,
+        duration=args.duration,
+        think_ms=args.think_ms,
+        bulk=args.bulk,
+        seed=args.seed,
+        url=args.url,
+        database_url=args.database_url,
+        output=args.output,
+        compare=args.compare
+    ))
+
+
+if __name__ == "__main__":
+    main()
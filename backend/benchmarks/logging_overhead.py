@@ -0,0 +1,161 @@
+"""
+Logging overhead on the event loop: a synchronous handler vs. the queued pipeline.
+
+Stdout is replaced by a stream whose writes take ``--write-us`` microseconds,
+like a pipe to a busy log collector. For each logging setup this measures the
+cost of a debug call made on the event loop, and the latency of concurrent
+allowance-summary requests, which log one debug line per assignment. The
+queued pipeline still writes every record; "drain ms" is how long its
+background thread needed to catch up after the load. The sampled setup only
+samples the endpoint loggers: DEBUG also enables the database driver's logs.
+
+    python -m backend.benchmarks.logging_overhead [--chores 200] [--requests 100] [--concurrency 10] [--write-us 50]
+"""
+import argparse
+import asyncio
+import io
+import logging
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from backend.app.core.structured_logging import JSONFormatter, setup_logging, shutdown_logging
+
+from .common import (
+    auth_headers,
+    benchmark_client,
+    create_benchmark_database,
+    print_table,
+    seed_family,
+)
+
+ENDPOINT = "/api/v1/reports/allowance-summary"
+CALLS = 2000
+
+MODES = [
+    "INFO level (debug off)",
+    "sync handler, DEBUG",
+    "queued, DEBUG",
+    "queued, DEBUG, 1% sampled",
+]
+
+
+class SlowStream(io.TextIOBase):
+    """A text stream whose writes block for a fixed time."""
+
+    def __init__(self, write_seconds: float):
+        self.write_seconds = write_seconds
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        time.sleep(self.write_seconds)
+        self.lines += text.count("\n")
+        return len(text)
+
+
+@contextmanager
+def configure(mode: str, stream: SlowStream) -> Iterator[List[float]]:
+    """Apply a logging setup; yields a list that receives the drain time in ms."""
+    drain = []
+    if mode.startswith("sync"):
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(JSONFormatter())
+        root.handlers = [handler]
+        root.setLevel(logging.DEBUG)
+        try:
+            yield drain
+        finally:
+            root.handlers = saved_handlers
+            root.setLevel(saved_level)
+        drain.append(0.0)
+        return
+
+    setup_logging(
+        level="INFO" if mode.startswith("INFO") else "DEBUG",
+        sample_rates={"backend.app.api": 0.01} if "sampled" in mode else None,
+        queue_size=1_000_000,
+        stream=stream
+    )
+    try:
+        yield drain
+    finally:
+        start = time.perf_counter()
+        shutdown_logging()
+        drain.append((time.perf_counter() - start) * 1000)
+
+
+def time_calls() -> float:
+    """Microseconds per debug call made on this thread."""
+    logger = logging.getLogger("backend.app.api.api_v1.endpoints.reports")
+    start = time.perf_counter()
+    for i in range(CALLS):
+        logger.debug("Assignment %s: completed=%s, approved=%s", i, True, False)
+    return (time.perf_counter() - start) / CALLS * 1e6
+
+
+async def run_load(client, headers, requests: int, concurrency: int) -> List[float]:
+    """Latencies in ms of ``requests`` requests issued ``concurrency`` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            (await client.get(ENDPOINT, headers=headers)).raise_for_status()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies
+
+
+async def run(chores: int = 200, requests: int = 100, concurrency: int = 10, write_us: float = 50) -> None:
+    engine, session_factory = await create_benchmark_database()
+    async with session_factory() as session:
+        family = await seed_family(session, chores=chores)
+    headers = auth_headers(family.parent_token)
+
+    rows = []
+    async with benchmark_client(session_factory) as client:
+        (await client.get(ENDPOINT, headers=headers)).raise_for_status()  # warm up
+        for mode in MODES:
+            stream = SlowStream(write_us / 1e6)
+            with configure(mode, stream) as drain:
+                per_call = time_calls()
+                start = time.perf_counter()
+                latencies = await run_load(client, headers, requests, concurrency)
+                elapsed = time.perf_counter() - start
+            ordered = sorted(latencies)
+            rows.append([
+                mode,
+                f"{per_call:.1f}",
+                f"{statistics.median(ordered):.1f}",
+                f"{ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]:.1f}",
+                f"{requests / elapsed:.0f}",
+                stream.lines,
+                f"{drain[0]:.0f}",
+            ])
+
+    await engine.dispose()
+
+    print(
+        f"\nLogging overhead, {chores} chores, {requests} requests x{concurrency} concurrent, "
+        f"{write_us:g} us per write\n"
+    )
+    print_table(["setup", "us/call", "p50 ms", "p95 ms", "req/s", "lines", "drain ms"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chores", type=int, default=200, help="Chores in the seeded family")
+    parser.add_argument("--requests", type=int, default=100, help="Requests per logging setup")
+    parser.add_argument("--concurrency", type=int, default=10, help="Requests in flight at once")
+    parser.add_argument("--write-us", type=float, default=50, help="Latency of each write to stdout")
+    args = parser.parse_args()
+    asyncio.run(run(chores=args.chores, requests=args.requests, concurrency=args.concurrency, write_us=args.write_us))
+
+
+if __name__ == "__main__":
+    main()
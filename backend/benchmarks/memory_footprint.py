@@ -0,0 +1,106 @@
+"""
+Peak memory per endpoint for a large family, with regression budgets.
+
+Seeds one family with many children and assignments, then records the
+tracemalloc peak of a single request to each family-wide endpoint, on a warm
+app and a fresh session. Each endpoint has a budget in KiB for the default
+scenario; ``--check`` exits non-zero when a peak exceeds its budget, so the
+suite can gate CI (``tests/test_memory_footprint.py`` runs the same check).
+
+    python -m backend.benchmarks.memory_footprint [--children 20] [--chores 2000] [--check]
+"""
+import argparse
+import asyncio
+import sys
+import tracemalloc
+from typing import Dict, List, NamedTuple
+
+from .common import auth_headers, benchmark_client, create_benchmark_database, print_table, seed_family
+
+# The scenario the budgets were set for
+CHILDREN = 20
+CHORES = 2000
+
+
+class Endpoint(NamedTuple):
+    name: str
+    path: str
+    budget_kib: int
+
+
+ENDPOINTS = [
+    Endpoint("family members", "/api/v1/families/members", 400),
+    Endpoint("family stats", "/api/v1/families/stats", 300),
+    Endpoint("user stats", "/api/v1/users/stats", 300),
+    Endpoint("allowance summary", "/api/v1/reports/allowance-summary", 2000),
+    Endpoint("children with chores", "/api/v1/users/my-children", 14000),
+    Endpoint("family children", "/api/v1/users/my-family-children", 14000),
+]
+
+
+async def measure_endpoints(children: int = CHILDREN, chores: int = CHORES) -> Dict[str, float]:
+    """Seed a family and return the peak KiB of one request to each endpoint."""
+    engine, session_factory = await create_benchmark_database()
+    async with session_factory() as session:
+        family = await seed_family(session, chores=chores, children=children)
+    headers = auth_headers(family.parent_token)
+
+    peaks = {}
+    try:
+        async with benchmark_client(session_factory) as client:
+            for endpoint in ENDPOINTS:
+                # Warm up so imports, caches and compiled statements are not counted
+                (await client.get(endpoint.path, headers=headers)).raise_for_status()
+                tracemalloc.start()
+                try:
+                    (await client.get(endpoint.path, headers=headers)).raise_for_status()
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+                peaks[endpoint.name] = peak / 1024
+    finally:
+        await engine.dispose()
+    return peaks
+
+
+def over_budget(peaks: Dict[str, float]) -> List[str]:
+    """Endpoints whose peak exceeds their budget, as readable lines."""
+    return [
+        f"{endpoint.name}: {peaks[endpoint.name]:.0f} KiB > {endpoint.budget_kib} KiB"
+        for endpoint in ENDPOINTS
+        if peaks[endpoint.name] > endpoint.budget_kib
+    ]
+
+
+async def run(children: int = CHILDREN, chores: int = CHORES, check: bool = False) -> int:
+    peaks = await measure_endpoints(children=children, chores=chores)
+
+    print(f"\nPeak memory per request, {children} children, {chores} assignments, tracemalloc\n")
+    print_table(
+        ["endpoint", "peak KiB", "budget KiB"],
+        [[e.name, f"{peaks[e.name]:.0f}", e.budget_kib] for e in ENDPOINTS]
+    )
+
+    if not check:
+        return 0
+    failures = over_budget(peaks)
+    if failures:
+        print("\nOver budget:\n  " + "\n  ".join(failures))
+        return 1
+    print("\nAll endpoints within budget")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--children", type=int, default=CHILDREN, help="Children in the seeded family")
+    parser.add_argument("--chores", type=int, default=CHORES, help="Assignments, spread over the children")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 when a peak exceeds its budget")
+    args = parser.parse_args()
+    if args.check and (args.children, args.chores) != (CHILDREN, CHORES):
+        parser.error("budgets only apply to the default scenario")
+    sys.exit(asyncio.run(run(children=args.children, chores=args.chores, check=args.check)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Memory and latency of ORM hydration vs. slot-based read models.
+
+Seeds a 500-chore family and runs each hot list path two ways: the previous
+ORM implementation (full entities, eager-loaded relationships) and the
+ReadModelRepository column projections. Each run uses a fresh session so the
+identity map starts empty, as it does per request.
+
+    python -m backend.benchmarks.read_models [--chores 500] [--repeat 10]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, List
+
+from sqlalchemy import update
+from sqlalchemy.orm import make_transient
+
+from backend.app.core.serialization import construct_model
+from backend.app.models.chore_assignment import ChoreAssignment
+from backend.app.repositories.chore import ChoreRepository
+from backend.app.repositories.chore_assignment import ChoreAssignmentRepository
+from backend.app.repositories.family import FamilyRepository
+from backend.app.repositories.read_model import ReadModelRepository
+from backend.app.repositories.reward_adjustment import RewardAdjustmentRepository
+from backend.app.repositories.user import UserRepository
+from backend.app.schemas.assignment import AssignmentResponse
+from backend.app.schemas.chore import ChoreResponse
+from backend.app.schemas.user import UserResponse
+
+from .common import SeededFamily, create_benchmark_database, print_table, seed_family
+
+chore_repo = ChoreRepository()
+assignment_repo = ChoreAssignmentRepository()
+family_repo = FamilyRepository()
+adjustment_repo = RewardAdjustmentRepository()
+user_repo = UserRepository()
+read_repo = ReadModelRepository()
+
+
+# --- ORM implementations (as the services did before the read-model layer) ---
+
+async def orm_child_chores(db, family: SeededFamily) -> List[Any]:
+    chores = []
+    for assignment in await assignment_repo.get_by_assignee(db, assignee_id=family.child_ids[0]):
+        chore = assignment.chore
+        chore.is_completed = assignment.is_completed
+        chore.is_approved = assignment.is_approved
+        make_transient(chore)
+        chores.append(construct_model(ChoreResponse, chore))
+    return chores
+
+
+async def orm_available(db, family: SeededFamily) -> List[Any]:
+    result = []
+    for assignment in await assignment_repo.get_by_assignee(db, assignee_id=family.child_ids[0]):
+        if assignment.is_completed:
+            continue
+        chore = await chore_repo.get_with_assignments(db, chore_id=assignment.chore_id)
+        result.append((construct_model(ChoreResponse, chore), construct_model(AssignmentResponse, assignment)))
+    return result
+
+
+async def orm_pending(db, family: SeededFamily) -> List[Any]:
+    result = []
+    for assignment in await assignment_repo.get_pending_approval(db, family_id=family.family_id):
+        chore = await chore_repo.get_with_assignments(db, chore_id=assignment.chore_id)
+        assignee = await user_repo.get(db, id=assignment.assignee_id)
+        result.append((
+            construct_model(AssignmentResponse, assignment),
+            construct_model(ChoreResponse, chore),
+            construct_model(UserResponse, assignee),
+        ))
+    return result
+
+
+async def orm_allowance(db, family: SeededFamily) -> List[Any]:
+    summary = []
+    for child in await family_repo.get_family_children(db, family_id=family.family_id):
+        assignments = await assignment_repo.get_by_assignee(db, assignee_id=child.id)
+        approved = [a for a in assignments if a.is_completed and a.is_approved]
+        earned = sum(a.approval_reward if a.approval_reward is not None else a.chore.reward for a in approved)
+        adjustments = await adjustment_repo.calculate_total_adjustments(db, child_id=child.id)
+        summary.append((child.id, len(approved), earned, float(adjustments)))
+    return summary
+
+
+# --- Read-model implementations ---
+
+async def read_child_chores(db, family: SeededFamily) -> List[Any]:
+    records = await read_repo.get_child_chores(db, child_id=family.child_ids[0])
+    return [construct_model(ChoreResponse, record) for record in records]
+
+
+async def read_available(db, family: SeededFamily) -> List[Any]:
+    assigned, _ = await read_repo.get_available_candidates(db, child_id=family.child_ids[0])
+    return [
+        (construct_model(ChoreResponse, chore), construct_model(AssignmentResponse, assignment))
+        for chore, assignment in assigned
+    ]
+
+
+async def read_pending(db, family: SeededFamily) -> List[Any]:
+    return [
+        (
+            construct_model(AssignmentResponse, assignment),
+            construct_model(ChoreResponse, chore),
+            construct_model(UserResponse, assignee),
+        )
+        for assignment, chore, assignee in await read_repo.get_pending_approval(db, family_id=family.family_id)
+    ]
+
+
+async def read_allowance(db, family: SeededFamily) -> List[Any]:
+    return await read_repo.get_allowance_summary(db, family_id=family.family_id)
+
+
+CASES = [
+    ("child chores", orm_child_chores, read_child_chores),
+    ("available", orm_available, read_available),
+    ("pending approval", orm_pending, read_pending),
+    ("allowance summary", orm_allowance, read_allowance),
+]
+
+
+async def measure(
+    session_factory,
+    family: SeededFamily,
+    func: Callable[[Any, SeededFamily], Awaitable[List[Any]]],
+    repeat: int
+):
+    """Return (rows, median ms, peak KiB) for ``func`` on fresh sessions."""
+    samples = []
+    for _ in range(repeat):
+        async with session_factory() as db:
+            start = time.perf_counter()
+            rows = await func(db, family)
+            samples.append((time.perf_counter() - start) * 1000)
+
+    async with session_factory() as db:
+        tracemalloc.start()
+        await func(db, family)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return len(rows), statistics.median(samples), peak / 1024
+
+
+async def run(chores: int = 500, repeat: int = 10) -> None:
+    engine, session_factory = await create_benchmark_database()
+    async with session_factory() as session:
+        family = await seed_family(session, chores=chores)
+        # Approve half of the completed assignments so both pending and earned totals are non-trivial
+        await session.execute(
+            update(ChoreAssignment)
+            .where(ChoreAssignment.is_completed == True, ChoreAssignment.id % 2 == 0)
+            .values(is_approved=True)
+        )
+        await session.commit()
+
+    rows = []
+    for name, orm_func, read_func in CASES:
+        count, orm_ms, orm_kib = await measure(session_factory, family, orm_func, repeat)
+        _, read_ms, read_kib = await measure(session_factory, family, read_func, repeat)
+        rows.append([
+            name,
+            count,
+            f"{orm_ms:.1f}",
+            f"{read_ms:.1f}",
+            f"{orm_ms / read_ms:.1f}x",
+            f"{orm_kib:.0f}",
+            f"{read_kib:.0f}",
+            f"{orm_kib / read_kib:.1f}x",
+        ])
+
+    await engine.dispose()
+
+    print(f"\nORM vs read model, {chores} chores, median of {repeat} runs, tracemalloc peak\n")
+    print_table(
+        ["path", "rows", "orm ms", "read ms", "speedup", "orm KiB", "read KiB", "less memory"],
+        rows
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chores", type=int, default=500, help="Chores in the seeded family")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per case")
+    args = parser.parse_args()
+    asyncio.run(run(chores=args.chores, repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    main()
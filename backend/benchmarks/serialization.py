@@ -0,0 +1,162 @@
+"""
+Microbenchmarks for serializing chore lists through the response schemas.
+
+Builds 1,000 in-memory Chore rows (each with assignments) and compares:
+
+- fastapi:    model_validate per row, response_model re-validation,
+              jsonable_encoder + json.dumps (what a plain endpoint does)
+- validate:   model_validate per row + cached TypeAdapter.dump_json
+- construct:  construct_model per row + cached TypeAdapter.dump_json
+              (core.serialization.dump_models_json)
+- orjson:     construct_model rows wrapped in dicts, rendered by
+              FastJSONResponse (the /available and /pending-approval shape)
+
+    python -m backend.benchmarks.serialization [--chores 1000] [--repeat 20]
+"""
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta
+from typing import Any, Callable, List
+
+from fastapi.encoders import jsonable_encoder
+
+from backend.app.core.serialization import (
+    FastJSONResponse,
+    construct_model,
+    dump_models_json,
+    orjson,
+    type_adapter,
+)
+from backend.app.models.chore import Chore
+from backend.app.models.chore_assignment import ChoreAssignment
+from backend.app.schemas.assignment import AssignmentResponse
+from backend.app.schemas.chore import ChoreResponse
+
+from .common import print_table
+
+
+def build_chores(count: int = 1000, assignments_per_chore: int = 2) -> List[Chore]:
+    """Build transient Chore rows with populated assignments (no database needed)."""
+    now = datetime(2024, 12, 20, 10, 0, 0)
+    chores = []
+    for i in range(count):
+        chore = Chore(
+            id=i + 1,
+            title=f"Chore {i}",
+            description=f"Benchmark chore number {i} with a realistic description length",
+            reward=float(i % 10) + 0.5,
+            min_reward=None,
+            max_reward=None,
+            is_range_reward=False,
+            cooldown_days=i % 7,
+            is_recurring=bool(i % 2),
+            frequency=None,
+            assignment_mode="multi_independent",
+            is_disabled=False,
+            creator_id=1,
+            created_at=now,
+            updated_at=now + timedelta(minutes=i),
+        )
+        chore.assignments = [
+            ChoreAssignment(
+                id=i * assignments_per_chore + j + 1,
+                chore_id=i + 1,
+                assignee_id=j + 2,
+                is_completed=bool((i + j) % 3 == 0),
+                is_approved=False,
+                completion_date=None,
+                approval_date=None,
+                approval_reward=None,
+                rejection_reason=None,
+                created_at=now,
+                updated_at=now,
+            )
+            for j in range(assignments_per_chore)
+        ]
+        chores.append(chore)
+    return chores
+
+
+def fastapi_default(chores: List[Chore]) -> bytes:
+    models = [ChoreResponse.model_validate(chore) for chore in chores]
+    revalidated = type_adapter(List[ChoreResponse]).validate_python(models, from_attributes=True)
+    return json.dumps(
+        jsonable_encoder(revalidated),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def validate_then_dump(chores: List[Chore]) -> bytes:
+    models = [ChoreResponse.model_validate(chore) for chore in chores]
+    return type_adapter(List[ChoreResponse]).dump_json(models)
+
+
+def construct_then_dump(chores: List[Chore]) -> bytes:
+    return dump_models_json(ChoreResponse, chores)
+
+
+def construct_orjson_dicts(chores: List[Chore]) -> bytes:
+    payload = [
+        {
+            "chore": construct_model(ChoreResponse, chore),
+            "assignment": construct_model(AssignmentResponse, chore.assignments[0]),
+            "assignment_id": chore.assignments[0].id,
+        }
+        for chore in chores
+    ]
+    return FastJSONResponse(content=payload).body
+
+
+CASES: List[tuple] = [
+    ("fastapi", fastapi_default),
+    ("validate", validate_then_dump),
+    ("construct", construct_then_dump),
+    ("orjson" if orjson is not None else "json (no orjson)", construct_orjson_dicts),
+]
+
+
+def measure(func: Callable[[Any], bytes], chores: List[Chore], repeat: int) -> float:
+    """Best-of-``repeat`` wall time of one call, in milliseconds."""
+    func(chores)  # warm caches (TypeAdapters, construct plans)
+    return min(timeit.repeat(lambda: func(chores), number=1, repeat=repeat)) * 1000
+
+
+def run(chores: int = 1000, repeat: int = 20) -> None:
+    rows_in = build_chores(chores)
+
+    # Sanity check: every list path must produce identical JSON
+    expected = json.loads(fastapi_default(rows_in))
+    for name, func in CASES[1:3]:
+        assert json.loads(func(rows_in)) == expected, f"{name} output differs from fastapi"
+
+    baseline = None
+    rows = []
+    for name, func in CASES:
+        elapsed = measure(func, rows_in, repeat)
+        baseline = baseline or elapsed
+        rows.append([
+            name,
+            f"{elapsed:.1f}",
+            f"{elapsed / chores * 1000:.1f}",
+            f"{baseline / elapsed:.1f}x",
+            f"{len(func(rows_in)) / 1024:.0f}",
+        ])
+
+    print(f"\nSerializing {chores} chores (2 assignments each), best of {repeat}\n")
+    print_table(["path", "ms", "us/chore", "speedup", "KiB"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chores", type=int, default=1000, help="Chores to serialize")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions")
+    args = parser.parse_args()
+    run(chores=args.chores, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
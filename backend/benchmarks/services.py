@@ -0,0 +1,376 @@
+"""
+Service-layer microbenchmarks with a committed baseline.
+
+Loads synthetic datasets of several sizes (``dataset.py`` profiles) into
+in-memory SQLite and runs the key operations of ChoreService, UserService,
+RewardAdjustmentService, FamilyService and the statistics endpoints' helpers
+for the largest family of each dataset. Each case reports median and p95
+latency, statements executed and tracemalloc peak.
+
+Every run of a case gets a fresh session inside a transaction that is rolled
+back afterwards (repository commits become savepoints), so write operations
+such as approvals see the same data each time.
+
+Results can be written as JSON and are compared against a baseline, by
+default ``baselines/services.json``: a case regresses when it runs more
+statements than the baseline, or when its median latency or peak memory
+grows by more than ``--threshold``. The command then exits with status 1.
+Latencies depend on the machine, so refresh the baseline with
+``--update-baseline`` on the machine that runs the comparison.
+
+    python -m backend.benchmarks.services [--profiles tiny,small] [--repeat 20] [--output results.json]
+        [--baseline PATH] [--threshold 0.25] [--update-baseline]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.api.api_v1.endpoints import statistics
+from backend.app.core.query_stats import record_queries
+from backend.app.models.chore import Chore
+from backend.app.models.chore_assignment import ChoreAssignment
+from backend.app.models.user import User
+from backend.app.schemas.reward_adjustment import RewardAdjustmentCreate
+from backend.app.services.chore_service import ChoreService
+from backend.app.services.family import FamilyService
+from backend.app.services.reward_adjustment_service import RewardAdjustmentService
+from backend.app.services.user_service import UserService
+
+from .common import TimingResult, create_benchmark_database, print_table
+from .dataset import PROFILES, load_dataset
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "services.json")
+
+# Latency changes smaller than this are noise, whatever the percentage
+MIN_REGRESSION_MS = 0.5
+
+# Fixed so that every run generates the same datasets
+SEED = 1
+END = datetime(2025, 6, 1)
+
+chore_service = ChoreService()
+user_service = UserService()
+adjustment_service = RewardAdjustmentService()
+family_service = FamilyService()
+
+
+class Subjects(NamedTuple):
+    """The family the cases run for: its first parent, busiest child and a pending assignment."""
+    family_id: int
+    parent: User
+    child: User
+    pending_assignment_id: Optional[int]
+    # Reward to approve the pending assignment with (range rewards need one)
+    pending_reward: Optional[float]
+
+
+Case = Callable[[AsyncSession, Subjects], Awaitable[Any]]
+
+
+async def approve_pending(db: AsyncSession, s: Subjects) -> Any:
+    return await chore_service.approve_assignment(
+        db, assignment_id=s.pending_assignment_id, parent_id=s.parent.id, reward_value=s.pending_reward
+    )
+
+
+async def create_adjustment(db: AsyncSession, s: Subjects) -> Any:
+    return await adjustment_service.create_adjustment(
+        db,
+        adjustment_data=RewardAdjustmentCreate(child_id=s.child.id, amount=2.5, reason="Benchmark bonus"),
+        current_user_id=s.parent.id
+    )
+
+
+async def trend_helpers(db: AsyncSession, s: Subjects) -> Any:
+    values = [float(i % 7) + i / 10 for i in range(52)]
+    return (
+        statistics.calculate_trend_direction(values),
+        statistics.calculate_growth_rate(values),
+        statistics.calculate_consistency_score(values),
+        statistics.generate_insights(values, values, "weekly"),
+    )
+
+
+CASES: Dict[str, Case] = {
+    "chore.available_chores": lambda db, s: chore_service.get_available_chores(db, child_id=s.child.id),
+    "chore.pending_approval": lambda db, s: chore_service.get_pending_approval(db, parent_id=s.parent.id),
+    "chore.child_chores": lambda db, s: chore_service.get_child_chores(db, parent_id=s.parent.id, child_id=s.child.id),
+    "chore.chores_for_parent": lambda db, s: chore_service.get_chores_for_user(db, user=s.parent),
+    "chore.approve_assignment": approve_pending,
+    "user.stats": lambda db, s: user_service.get_user_stats(db, user_id=s.parent.id),
+    "user.children_with_chores": lambda db, s: user_service.get_children_with_chores(db, parent=s.parent),
+    "user.allowance_summary": lambda db, s: user_service.get_allowance_summary(db, parent=s.parent),
+    "adjustment.child_adjustments": lambda db, s: adjustment_service.get_child_adjustments(
+        db, child_id=s.child.id, current_user_id=s.parent.id
+    ),
+    "adjustment.total": lambda db, s: adjustment_service.get_total_adjustments(
+        db, child_id=s.child.id, current_user_id=s.parent.id
+    ),
+    "adjustment.create": create_adjustment,
+    "family.members": lambda db, s: family_service.get_family_members(
+        db, family_id=s.family_id, requesting_user_id=s.parent.id
+    ),
+    "family.stats": lambda db, s: family_service.get_family_stats(
+        db, family_id=s.family_id, requesting_user_id=s.parent.id
+    ),
+    "statistics.weekly_summary": lambda db, s: statistics.get_weekly_summary(
+        weeks_back=4, child_id=None, current_user=s.parent, db=db
+    ),
+    "statistics.monthly_summary": lambda db, s: statistics.get_monthly_summary(
+        months_back=6, child_id=None, current_user=s.parent, db=db
+    ),
+    "statistics.trends": lambda db, s: statistics.get_trend_analysis(
+        period="monthly", child_id=None, current_user=s.parent, db=db
+    ),
+    "statistics.trend_helpers": trend_helpers,
+}
+
+
+class CaseResult(NamedTuple):
+    median_ms: float
+    p95_ms: float
+    queries: int
+    peak_kib: float
+
+
+async def pick_subjects(db: AsyncSession) -> Dict[str, Optional[int]]:
+    """Ids of the family with the most assignments, its first parent, busiest child and a pending assignment."""
+    assignments = func.count(ChoreAssignment.id)
+    family_id = (await db.execute(
+        select(User.family_id)
+        .join(ChoreAssignment, ChoreAssignment.assignee_id == User.id)
+        .group_by(User.family_id)
+        .order_by(assignments.desc(), User.family_id)
+        .limit(1)
+    )).scalar_one()
+    parent_id = (await db.execute(
+        select(func.min(User.id)).where(User.family_id == family_id, User.is_parent == True)
+    )).scalar_one()
+    child_id = (await db.execute(
+        select(User.id)
+        .join(ChoreAssignment, ChoreAssignment.assignee_id == User.id)
+        .where(User.family_id == family_id)
+        .group_by(User.id)
+        .order_by(assignments.desc(), User.id)
+        .limit(1)
+    )).scalar_one()
+    pending = (await db.execute(
+        select(ChoreAssignment.id, Chore.is_range_reward, Chore.min_reward)
+        .join(Chore, Chore.id == ChoreAssignment.chore_id)
+        .join(User, User.id == ChoreAssignment.assignee_id)
+        .where(User.family_id == family_id, ChoreAssignment.is_completed == True, ChoreAssignment.is_approved == False)
+        .order_by(ChoreAssignment.id)
+        .limit(1)
+    )).first()
+    return {
+        "family_id": family_id,
+        "parent_id": parent_id,
+        "child_id": child_id,
+        "pending_assignment_id": pending.id if pending else None,
+        "pending_reward": pending.min_reward if pending and pending.is_range_reward else None,
+    }
+
+
+def enable_savepoints(engine) -> None:
+    """
+    Let pysqlite roll back released savepoints.
+
+    The driver only emits BEGIN before DML, so a SAVEPOINT opened first starts
+    the transaction itself and its RELEASE commits it. Taking over transaction
+    control, as the SQLAlchemy documentation recommends, keeps the savepoints
+    inside the outer transaction.
+    """
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+async def run_once(engine, ids: Dict[str, Optional[int]], case: Case, observe: Callable) -> None:
+    """Run ``case`` in a session whose changes are rolled back; ``observe`` wraps the call."""
+    async with engine.connect() as conn:
+        await conn.begin()
+        db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        try:
+            subjects = Subjects(
+                family_id=ids["family_id"],
+                parent=await db.get(User, ids["parent_id"]),
+                child=await db.get(User, ids["child_id"]),
+                pending_assignment_id=ids["pending_assignment_id"],
+                pending_reward=ids["pending_reward"],
+            )
+            await observe(lambda: case(db, subjects))
+        finally:
+            await db.close()
+            await conn.rollback()
+
+
+async def measure_case(engine, ids, case: Case, repeat: int) -> CaseResult:
+    samples = []
+
+    async def timed(call):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    async def counted(call):
+        with record_queries() as recorder:
+            await call()
+        counted.queries = recorder.count
+
+    async def traced(call):
+        tracemalloc.start()
+        try:
+            await call()
+            traced.peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    for _ in range(2):  # Warm up
+        await run_once(engine, ids, case, timed)
+    samples.clear()
+    for _ in range(repeat):
+        await run_once(engine, ids, case, timed)
+    await run_once(engine, ids, case, counted)
+    await run_once(engine, ids, case, traced)
+
+    timing = TimingResult(name="", samples=samples)
+    return CaseResult(round(timing.median, 3), round(timing.p95, 3), counted.queries, round(traced.peak / 1024, 1))
+
+
+async def run_benchmarks(profiles: List[str], repeat: int) -> Dict[str, Dict[str, Any]]:
+    """Results keyed by ``profile/case``."""
+    results = {}
+    for profile in profiles:
+        engine, session_factory = await create_benchmark_database()
+        enable_savepoints(engine)
+        try:
+            await load_dataset(engine, PROFILES[profile], seed=SEED, end=END)
+            async with session_factory() as db:
+                ids = await pick_subjects(db)
+            for name, case in CASES.items():
+                if name == "chore.approve_assignment" and ids["pending_assignment_id"] is None:
+                    continue
+                results[f"{profile}/{name}"] = (await measure_case(engine, ids, case, repeat))._asdict()
+        finally:
+            await engine.dispose()
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Regressions of ``results`` against ``baseline``, as readable lines."""
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if current["queries"] > base["queries"]:
+            regressions.append(f"{key}: {current['queries']} statements (baseline {base['queries']})")
+        for metric, unit in (("median_ms", "ms"), ("peak_kib", "KiB")):
+            if metric == "median_ms" and current[metric] - base[metric] < MIN_REGRESSION_MS:
+                continue
+            if current[metric] > base[metric] * (1 + threshold):
+                regressions.append(
+                    f"{key}: {metric} {current[metric]:.1f} {unit} (baseline {base[metric]:.1f} {unit}, "
+                    f"+{(current[metric] / base[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def change(current: float, base: Optional[float]) -> str:
+    if not base:
+        return ""
+    return f"{(current / base - 1) * 100:+.0f}%"
+
+
+async def run(
+    profiles: List[str],
+    repeat: int = 20,
+    output: Optional[str] = None,
+    baseline_path: str = BASELINE_PATH,
+    threshold: float = 0.25,
+    update_baseline: bool = False
+) -> int:
+    results = await run_benchmarks(profiles, repeat)
+    baseline = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)["results"]
+
+    print(f"\nService operations, profiles {', '.join(profiles)}, median of {repeat} runs\n")
+    rows = []
+    for key, r in results.items():
+        base = baseline.get(key, {})
+        rows.append([
+            key,
+            f"{r['median_ms']:.2f}",
+            change(r["median_ms"], base.get("median_ms")),
+            f"{r['p95_ms']:.2f}",
+            r["queries"],
+            base.get("queries", ""),
+            f"{r['peak_kib']:.0f}",
+            change(r["peak_kib"], base.get("peak_kib")),
+        ])
+    print_table(["case", "p50 ms", "vs base", "p95 ms", "queries", "base", "peak KiB", "vs base"], rows)
+
+    document = {
+        "generated_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "results": results,
+    }
+    if output:
+        with open(output, "w") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+    if update_baseline:
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, "w") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {baseline_path}")
+        return 0
+
+    regressions = compare(results, baseline, threshold)
+    if regressions:
+        print(f"\nRegressions beyond {threshold:.0%}:\n  " + "\n  ".join(regressions))
+        return 1
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profiles", default="tiny,small", help="Comma-separated dataset profiles")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per case")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed latency/memory growth (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="Replace the baseline with this run")
+    args = parser.parse_args()
+
+    profiles = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    unknown = set(profiles) - set(PROFILES)
+    if unknown:
+        parser.error(f"unknown profiles: {', '.join(sorted(unknown))}")
+    sys.exit(asyncio.run(run(
+        profiles,
+        repeat=args.repeat,
+        output=args.output,
+        baseline_path=args.baseline,
+        threshold=args.threshold,
+        update_baseline=args.update_baseline
+    )))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Concurrent write throughput on a SQLite file: default pool vs the SQLite profile.
+
+Clients run read-then-write transactions concurrently, the shape of a chore
+completion: read a balance, update it and append an event row. Each client
+loops for ``--duration`` seconds against a fresh temporary database file in
+two configurations:
+
+- ``default``: what ``db/base.py`` used before the SQLite profile, a pool of
+  ordinary connections in rollback-journal mode with pysqlite's implicit
+  transactions. pysqlite only begins a transaction at the first write, so the
+  balance is read outside it and concurrent clients overwrite each other's
+  updates; where a transaction does hold a read lock when it writes, it
+  fails with "database is locked" once ``busy_timeout`` runs out.
+- ``profile``: ``db/sqlite.py``, one writer connection beginning IMMEDIATE
+  transactions in WAL mode with tuned pragmas
+
+The report shows committed transactions per second, latency, errors and lost
+updates (committed increments missing from the final balances);
+``--readers`` adds clients running read-only transactions, on the default
+pool or the profile's read pool.
+
+    python -m backend.benchmarks.sqlite_writes [--clients 20] [--readers 0] [--duration 5]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import List, NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.app.db.base import pool_options
+from backend.app.db.sqlite import SqlitePragmas, configure_sqlite_engine
+
+from .common import print_table
+
+ACCOUNTS = 10
+
+SCHEMA = [
+    "CREATE TABLE accounts (id INTEGER PRIMARY KEY, balance REAL NOT NULL)",
+    "CREATE TABLE events (id INTEGER PRIMARY KEY, account_id INTEGER NOT NULL, amount REAL NOT NULL)",
+]
+
+
+class ModeResult(NamedTuple):
+    mode: str
+    committed: int
+    errors: int
+    per_second: float
+    p50_ms: float
+    p95_ms: float
+    reads: int
+    lost_updates: int
+
+
+def build_engines(url: str, profile: bool):
+    """(writer engine, reader engine) as ``db/base.py`` builds them for the mode."""
+    if not profile:
+        engine = create_async_engine(url, **pool_options(20, 40, 60))
+        return engine, engine
+    pragmas = SqlitePragmas()
+    writer = create_async_engine(url, **pool_options(1, 0, 60, pool_pre_ping=False))
+    configure_sqlite_engine(writer, pragmas, writer=True)
+    reader = create_async_engine(url, **pool_options(4, 0, 60, pool_pre_ping=False))
+    configure_sqlite_engine(reader, pragmas, writer=False)
+    return writer, reader
+
+
+async def create_schema(url: str) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        for statement in SCHEMA:
+            await conn.execute(text(statement))
+        await conn.execute(
+            text("INSERT INTO accounts (id, balance) VALUES (:id, 0)"),
+            [{"id": i} for i in range(1, ACCOUNTS + 1)]
+        )
+    await engine.dispose()
+
+
+async def run_mode(mode: str, *, profile: bool, clients: int, readers: int, duration: float) -> ModeResult:
+    directory = tempfile.mkdtemp(prefix="sqlite-writes-")
+    url = f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}"
+    await create_schema(url)
+    writer, reader = build_engines(url, profile)
+    latencies: List[float] = []
+    errors = 0
+    reads = 0
+    stop_at = time.monotonic() + duration
+
+    async def write_client(number: int) -> None:
+        nonlocal errors
+        account = number % ACCOUNTS + 1
+        while time.monotonic() < stop_at:
+            start = time.perf_counter()
+            try:
+                async with writer.begin() as conn:
+                    balance = (await conn.execute(
+                        text("SELECT balance FROM accounts WHERE id = :id"), {"id": account}
+                    )).scalar()
+                    await conn.execute(
+                        text("UPDATE accounts SET balance = :balance WHERE id = :id"),
+                        {"balance": balance + 1, "id": account}
+                    )
+                    await conn.execute(
+                        text("INSERT INTO events (account_id, amount) VALUES (:id, 1)"), {"id": account}
+                    )
+                latencies.append((time.perf_counter() - start) * 1000)
+            except Exception:
+                errors += 1
+
+    async def read_client() -> None:
+        nonlocal reads
+        while time.monotonic() < stop_at:
+            async with reader.connect() as conn:
+                await conn.execute(text("SELECT count(*), sum(amount) FROM events"))
+            reads += 1
+
+    started = time.monotonic()
+    try:
+        await asyncio.gather(
+            *(write_client(i) for i in range(clients)), *(read_client() for _ in range(readers))
+        )
+        elapsed = time.monotonic() - started
+        async with writer.connect() as conn:
+            balances = (await conn.execute(text("SELECT sum(balance) FROM accounts"))).scalar()
+    finally:
+        await writer.dispose()
+        if reader is not writer:
+            await reader.dispose()
+
+    ordered = sorted(latencies) or [0.0]
+    return ModeResult(
+        mode=mode,
+        committed=len(latencies),
+        errors=errors,
+        per_second=len(latencies) / elapsed,
+        p50_ms=statistics.median(ordered),
+        p95_ms=ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        reads=reads,
+        lost_updates=len(latencies) - int(balances),
+    )
+
+
+async def run(args) -> List[ModeResult]:
+    return [
+        await run_mode(mode, profile=profile, clients=args.clients, readers=args.readers, duration=args.duration)
+        for mode, profile in (("default", False), ("profile", True))
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=20, help="Concurrent writing clients")
+    parser.add_argument("--readers", type=int, default=0, help="Concurrent reading clients")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per mode")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print_table(
+        ["mode", "committed", "errors", "lost updates", "tx/s", "p50 ms", "p95 ms", "reads"],
+        [[r.mode, r.committed, r.errors, r.lost_updates, f"{r.per_second:.0f}", f"{r.p50_ms:.2f}",
+          f"{r.p95_ms:.2f}", r.reads]
+         for r in results]
+    )
+
+
+if __name__ == "__main__":
+    main()
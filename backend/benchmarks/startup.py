@@ -0,0 +1,170 @@
+"""
+Cold start: import time, lifespan startup and time to first request.
+
+Each run starts a fresh interpreter that imports ``backend.app.main``, runs the
+application lifespan against an empty SQLite database and sends its first
+requests in-process, timing each step. "first request" is the time from
+interpreter start until ``/health`` has answered, what a new pod needs before
+it can pass its readiness probe; the steps after it are the first calls of
+paths that load more code (token decoding, the OpenAPI schema).
+
+``--imports N`` profiles the import of ``backend.app.main`` with
+``python -X importtime`` instead, printing the N slowest modules by own and by
+cumulative time and the total per top-level package.
+
+    python -m backend.benchmarks.startup [--runs 5] [--imports 0]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+from .common import print_table
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STEPS = ["import", "lifespan", "first request", "authenticated", "openapi"]
+
+# Runs in the fresh interpreter; prints the step times in ms as JSON
+CHILD = """
+import time
+started = time.perf_counter()
+
+import asyncio, json, sys
+
+import backend.app.main as main
+imported = time.perf_counter()
+
+async def run():
+    import httpx
+    times = {"import": (imported - started) * 1000}
+    transport = httpx.ASGITransport(app=main.app)
+    async with main.app.router.lifespan_context(main.app):
+        times["lifespan"] = (time.perf_counter() - imported) * 1000
+        async with httpx.AsyncClient(transport=transport, base_url="http://startup") as client:
+            (await client.get("/health")).raise_for_status()
+            times["first request"] = (time.perf_counter() - started) * 1000
+
+            step = time.perf_counter()
+            response = await client.get("/api/v1/users/me", headers={"Authorization": "Bearer not-a-token"})
+            assert response.status_code == 401, response.status_code
+            times["authenticated"] = (time.perf_counter() - step) * 1000
+
+            step = time.perf_counter()
+            (await client.get("/openapi.json")).raise_for_status()
+            times["openapi"] = (time.perf_counter() - step) * 1000
+    return times
+
+times = asyncio.run(run())
+sys.__stdout__.write("STARTUP " + json.dumps(times) + "\\n")
+"""
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def child_env(database_dir: str) -> Dict[str, str]:
+    return {
+        **os.environ,
+        "TESTING": "true",
+        "DATABASE_URL": f"sqlite+aiosqlite:///{os.path.join(database_dir, 'startup.db')}",
+        "STRUCTURED_LOGGING_ENABLED": "false",
+    }
+
+
+def measure_startup(runs: int) -> Dict[str, List[float]]:
+    """Step times in ms over ``runs`` fresh interpreters."""
+    samples = defaultdict(list)
+    with tempfile.TemporaryDirectory() as database_dir:
+        env = child_env(database_dir)
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, "-c", CHILD],
+                cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+            ).stdout
+            line = next(line for line in output.splitlines() if line.startswith("STARTUP "))
+            for step, ms in json.loads(line[len("STARTUP "):]).items():
+                samples[step].append(ms)
+    return samples
+
+
+def profile_imports() -> List[ImportTime]:
+    """Import times of every module loaded by ``import backend.app.main``."""
+    with tempfile.TemporaryDirectory() as database_dir:
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import backend.app.main"],
+            cwd=REPO_ROOT, env=child_env(database_dir), capture_output=True, text=True, check=True
+        ).stderr
+
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        imports.append(ImportTime(module.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def print_imports(top: int) -> None:
+    imports = profile_imports()
+    total_ms = sum(i.self_us for i in imports) / 1000
+
+    print(f"\nImport of backend.app.main: {len(imports)} modules, {total_ms:.0f} ms\n")
+    print("Slowest by own time (excluding imports they trigger):\n")
+    print_table(
+        ["module", "self ms", "cumulative ms"],
+        [[i.module, f"{i.self_us / 1000:.1f}", f"{i.cumulative_us / 1000:.1f}"]
+         for i in sorted(imports, key=lambda i: i.self_us, reverse=True)[:top]]
+    )
+
+    print("\nSlowest by cumulative time:\n")
+    print_table(
+        ["module", "cumulative ms", "self ms"],
+        [[i.module, f"{i.cumulative_us / 1000:.1f}", f"{i.self_us / 1000:.1f}"]
+         for i in sorted(imports, key=lambda i: i.cumulative_us, reverse=True)[:top]]
+    )
+
+    packages = defaultdict(lambda: [0, 0])
+    for i in imports:
+        package = "backend.app" if i.module.startswith("backend.") else i.module.split(".")[0]
+        packages[package][0] += 1
+        packages[package][1] += i.self_us
+    print("\nOwn time per top-level package:\n")
+    print_table(
+        ["package", "modules", "ms"],
+        [[name, count, f"{us / 1000:.1f}"]
+         for name, (count, us) in sorted(packages.items(), key=lambda p: p[1][1], reverse=True)[:top]]
+    )
+
+
+def run(runs: int = 5) -> None:
+    samples = measure_startup(runs)
+    print(f"\nCold start, median and max of {runs} fresh interpreters (ms)\n")
+    print_table(
+        ["step", "median", "max"],
+        [[step, f"{statistics.median(samples[step]):.0f}", f"{max(samples[step]):.0f}"] for step in STEPS]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time")
+    parser.add_argument("--imports", type=int, default=0, metavar="N",
+                        help="Profile imports instead, showing the N slowest")
+    args = parser.parse_args()
+    if args.imports:
+        print_imports(args.imports)
+    else:
+        run(runs=args.runs)
+
+
+if __name__ == "__main__":
+    main()
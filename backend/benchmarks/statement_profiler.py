@@ -0,0 +1,82 @@
+"""
+Request latency with the statement profiler disabled vs. enabled.
+
+Seeds a family and times hot endpoints with the profiler off and on,
+alternating rounds so drift affects both sides equally. In-memory SQLite makes
+each statement far cheaper than a networked PostgreSQL round trip, so the
+overhead reported here is an upper bound.
+
+    python -m backend.benchmarks.statement_profiler [--chores 500] [--repeat 50]
+"""
+import argparse
+import asyncio
+import statistics
+
+from backend.app.core.logging import setup_statement_profiler, statement_profiler
+from backend.app.core.query_stats import record_queries
+
+from .common import (
+    auth_headers,
+    benchmark_client,
+    create_benchmark_database,
+    print_table,
+    seed_family,
+    time_async,
+)
+
+ROUNDS = 5
+
+
+async def run(chores: int = 500, repeat: int = 50) -> None:
+    engine, session_factory = await create_benchmark_database()
+    async with session_factory() as session:
+        family = await seed_family(session, chores=chores)
+
+    endpoints = [
+        ("/api/v1/chores/available", auth_headers(family.child_tokens[0])),
+        ("/api/v1/chores/pending-approval", auth_headers(family.parent_token)),
+        ("/api/v1/chores", auth_headers(family.parent_token)),
+    ]
+    setup_statement_profiler()
+
+    rows = []
+    async with benchmark_client(session_factory) as client:
+        for path, headers in endpoints:
+            with record_queries() as recorder:
+                (await client.get(path, headers=headers)).raise_for_status()
+
+            off, on = [], []
+            for _ in range(ROUNDS):
+                for enabled, samples in ((False, off), (True, on)):
+                    statement_profiler.enabled = enabled
+                    result = await time_async(
+                        path, lambda path=path: client.get(path, headers=headers), repeat=repeat // ROUNDS
+                    )
+                    samples.extend(result.samples)
+
+            off_ms, on_ms = statistics.median(off), statistics.median(on)
+            rows.append([
+                path,
+                recorder.count,
+                f"{off_ms:.2f}",
+                f"{on_ms:.2f}",
+                f"{(on_ms - off_ms) / off_ms:+.1%}",
+            ])
+
+    statement_profiler.enabled = False
+    await engine.dispose()
+
+    print(f"\nStatement profiler overhead, {chores} chores, median of {repeat} requests\n")
+    print_table(["endpoint", "statements", "off ms", "on ms", "overhead"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chores", type=int, default=500, help="Chores in the seeded family")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed requests per case")
+    args = parser.parse_args()
+    asyncio.run(run(chores=args.chores, repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Tests for sparse fieldsets (?view= / ?fields=) on the chore list endpoints.
+"""
+from contextlib import contextmanager
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from backend.app.schemas.chore import CHORE_SUMMARY_FIELDS
+
+
+@contextmanager
+def capture_sql():
+    """Collect the SQL statements executed on any engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_default_view_is_unchanged(client: AsyncClient, parent_token, test_chore):
+    response = await client.get("/api/v1/chores", headers=auth(parent_token))
+    assert response.status_code == 200
+    chore = response.json()[0]
+    assert "assignments" in chore
+    assert "description" in chore
+
+
+@pytest.mark.asyncio
+async def test_summary_view_returns_summary_fields(client: AsyncClient, parent_token, test_chore):
+    response = await client.get("/api/v1/chores?view=summary", headers=auth(parent_token))
+    assert response.status_code == 200
+    chore = response.json()[0]
+    assert set(chore) == CHORE_SUMMARY_FIELDS
+    assert chore["id"] == test_chore.id
+    assert chore["title"] == test_chore.title
+
+
+@pytest.mark.asyncio
+async def test_fields_param_always_includes_id(client: AsyncClient, parent_token, test_chore):
+    response = await client.get("/api/v1/chores?fields=title,reward", headers=auth(parent_token))
+    assert response.status_code == 200
+    assert response.json() == [{"id": test_chore.id, "title": test_chore.title, "reward": test_chore.reward}]
+
+
+@pytest.mark.asyncio
+async def test_summary_view_skips_assignment_load_and_unused_columns(
+    client: AsyncClient, parent_token, test_chore
+):
+    with capture_sql() as full_sql:
+        await client.get("/api/v1/chores", headers=auth(parent_token))
+    with capture_sql() as summary_sql:
+        await client.get("/api/v1/chores?view=summary", headers=auth(parent_token))
+
+    assert any("FROM chore_assignments" in s for s in full_sql)
+    assert not any("FROM chore_assignments" in s for s in summary_sql)
+
+    chore_query = next(s for s in summary_sql if "FROM chores" in s)
+    assert "chores.description" not in chore_query
+    assert "chores.title" in chore_query
+
+
+@pytest.mark.asyncio
+async def test_fields_can_request_assignments(client: AsyncClient, parent_token, test_chore, test_child_user):
+    response = await client.get("/api/v1/chores?fields=assignments", headers=auth(parent_token))
+    assert response.status_code == 200
+    chore = response.json()[0]
+    assert set(chore) == {"id", "assignments"}
+    assert chore["assignments"][0]["assignee_id"] == test_child_user.id
+
+
+@pytest.mark.asyncio
+async def test_child_chores_summary_keeps_assignment_status(
+    client: AsyncClient, parent_token, test_child_user, test_chore
+):
+    response = await client.get(
+        f"/api/v1/chores/child/{test_child_user.id}?view=summary",
+        headers=auth(parent_token)
+    )
+    assert response.status_code == 200
+    chore = response.json()[0]
+    assert set(chore) == CHORE_SUMMARY_FIELDS
+    assert chore["is_completed"] is False
+    assert chore["is_approved"] is False
+
+
+@pytest.mark.asyncio
+async def test_child_sees_sparse_own_chores(client: AsyncClient, child_token, test_chore):
+    response = await client.get("/api/v1/chores?fields=title", headers=auth(child_token))
+    assert response.status_code == 200
+    assert response.json() == [{"id": test_chore.id, "title": test_chore.title}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", ["view=compact", "fields=title,hashed_password"])
+async def test_unknown_view_or_field_rejected(client: AsyncClient, parent_token, query):
+    response = await client.get(f"/api/v1/chores?{query}", headers=auth(parent_token))
+    assert response.status_code == 422
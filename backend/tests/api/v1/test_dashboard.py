@@ -0,0 +1,137 @@
+"""
+Tests for the composite dashboard endpoints (GET /api/v1/dashboard/*).
+"""
+import asyncio
+import weakref
+from contextlib import nullcontext
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from backend.app.models.chore_assignment import ChoreAssignment
+from backend.app.models.reward_adjustment import RewardAdjustment
+import backend.app.services.dashboard_service as dashboard_module
+from backend.app.services.dashboard_service import DashboardService
+
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def timing_names(response):
+    # The first Server-Timing header is the endpoint's; TracingMiddleware appends its own
+    own = response.headers.get_list("server-timing")[0]
+    return [entry.split(";")[0] for entry in own.split(", ")]
+
+
+@pytest.mark.asyncio
+async def test_child_dashboard_matches_individual_endpoints(
+    client: AsyncClient, db_session, child_token, test_parent_user, test_child_user, test_chore, test_range_chore
+):
+    await db_session.execute(
+        update(ChoreAssignment)
+        .where(ChoreAssignment.chore_id == test_chore.id)
+        .values(is_completed=True, is_approved=True)
+    )
+    db_session.add(RewardAdjustment(
+        child_id=test_child_user.id, parent_id=test_parent_user.id, amount=2, reason="Bonus"
+    ))
+    await db_session.commit()
+
+    response = await client.get("/api/v1/dashboard/child", headers=auth(child_token))
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["profile"] == (await client.get("/api/v1/users/me", headers=auth(child_token))).json()
+    assert data["available"] == (await client.get("/api/v1/chores/available", headers=auth(child_token))).json()
+    assert data["activities"] == (await client.get("/api/v1/activities/recent", headers=auth(child_token))).json()
+    assert data["balance"]["id"] == test_child_user.id
+    assert data["balance"]["total_earned"] == pytest.approx(5.0)
+    assert data["balance"]["balance_due"] == pytest.approx(7.0)
+
+    assert timing_names(response) == ["balance", "available", "activities", "total"]
+
+
+@pytest.mark.asyncio
+async def test_parent_dashboard_matches_individual_endpoints(
+    client: AsyncClient, db_session, parent_token, test_child_user, test_chore
+):
+    await db_session.execute(
+        update(ChoreAssignment)
+        .where(ChoreAssignment.chore_id == test_chore.id)
+        .values(is_completed=True)
+    )
+    await db_session.commit()
+
+    response = await client.get("/api/v1/dashboard/parent", headers=auth(parent_token))
+    assert response.status_code == 200
+    data = response.json()
+
+    headers = auth(parent_token)
+    assert data["children"] == (await client.get("/api/v1/users/my-children", headers=headers)).json()
+    assert data["allowance"] == (await client.get("/api/v1/users/allowance-summary", headers=headers)).json()
+    assert data["pending_approval"] == (await client.get("/api/v1/chores/pending-approval", headers=headers)).json()
+    assert data["family"] == (await client.get("/api/v1/families/context", headers=headers)).json()
+    assert len(data["pending_approval"]) == 1
+
+    assert timing_names(response) == ["children", "allowance", "pending_approval", "family", "total"]
+
+
+@pytest.mark.asyncio
+async def test_dashboards_are_role_specific(client: AsyncClient, parent_token, child_token):
+    response = await client.get("/api/v1/dashboard/child", headers=auth(parent_token))
+    assert response.status_code == 403
+
+    response = await client.get("/api/v1/dashboard/parent", headers=auth(child_token))
+    assert response.status_code == 403
+
+    response = await client.get("/api/v1/dashboard/parent")
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_sections_run_concurrently_in_separate_sessions(db_session, monkeypatch):
+    """Each section gets its own session, and the semaphore bounds how many run at once."""
+    monkeypatch.setattr(dashboard_module.settings, "DASHBOARD_MAX_CONCURRENCY", 2)
+    monkeypatch.setattr(dashboard_module, "_section_slots", weakref.WeakKeyDictionary())
+    sessions = []
+    running = 0
+    peak = 0
+
+    def factory():
+        session = db_session.__class__(bind=db_session.bind)
+        sessions.append(session)
+        return session
+
+    async def section(db):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return id(db)
+
+    payload, timings = await DashboardService().gather_sections(
+        factory, {name: section for name in ("a", "b", "c", "d")}
+    )
+
+    assert list(payload) == list(timings) == ["a", "b", "c", "d"]
+    assert len(set(payload.values())) == 4
+    assert peak == 2
+    assert all(duration >= 9 for duration in timings.values())
+
+
+def test_sections_queue_in_each_event_loop():
+    """Sections that queue for a slot work in any event loop, not only the first."""
+    names = [str(i) for i in range(dashboard_module.settings.DASHBOARD_MAX_CONCURRENCY + 1)]
+
+    async def section(db):
+        await asyncio.sleep(0)
+        return True
+
+    for _ in range(2):
+        payload, _ = asyncio.run(DashboardService().gather_sections(
+            nullcontext, {name: section for name in names}
+        ))
+        assert list(payload) == names and all(payload.values())
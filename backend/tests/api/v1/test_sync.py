@@ -0,0 +1,174 @@
+"""
+Tests for the delta-sync endpoint (GET /api/v1/sync).
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from backend.app.core.config import settings
+from backend.app.core.security.jwt import create_access_token
+from backend.app.models.chore import Chore
+from backend.app.models.user import User
+from backend.app.services.sync_service import encode_cursor, decode_cursor
+
+
+@pytest.fixture
+def no_settle_window(monkeypatch):
+    """Disable the settle window so an immediate re-sync is empty."""
+    monkeypatch.setattr(settings, "SYNC_SETTLE_SECONDS", 0)
+
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_initial_sync_returns_everything_visible(
+    client: AsyncClient, parent_token, test_parent_user, test_child_user, test_chore
+):
+    response = await client.get("/api/v1/sync", headers=auth(parent_token))
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["has_more"] is False
+    assert data["cursor"]
+    assert [c["id"] for c in data["chores"]] == [test_chore.id]
+    assert "assignments" not in data["chores"][0]
+    assert len(data["assignments"]) == 1
+    assert data["assignments"][0]["assignee_id"] == test_child_user.id
+    assert {u["id"] for u in data["users"]} == {test_parent_user.id, test_child_user.id}
+    assert all("hashed_password" not in u for u in data["users"])
+    assert data["tombstones"] == []
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_returns_only_changed_rows(
+    client: AsyncClient, db_session, parent_token, test_chore, test_range_chore, no_settle_window
+):
+    first = (await client.get("/api/v1/sync", headers=auth(parent_token))).json()
+    assert len(first["chores"]) == 2
+
+    # Nothing changed: a warm client gets an empty page
+    empty = (await client.get(f"/api/v1/sync?since={first['cursor']}", headers=auth(parent_token))).json()
+    assert empty["chores"] == [] and empty["assignments"] == [] and empty["users"] == []
+
+    # Touch one chore
+    await db_session.execute(
+        update(Chore)
+        .where(Chore.id == test_range_chore.id)
+        .values(title="Take out recycling", updated_at=datetime.utcnow() + timedelta(minutes=1))
+    )
+    await db_session.commit()
+
+    delta = (await client.get(f"/api/v1/sync?since={empty['cursor']}", headers=auth(parent_token))).json()
+    assert [c["id"] for c in delta["chores"]] == [test_range_chore.id]
+    assert delta["chores"][0]["title"] == "Take out recycling"
+
+
+@pytest.mark.asyncio
+async def test_sync_pages_are_bounded(
+    client: AsyncClient, parent_token, test_chore, test_range_chore, test_disabled_chore, no_settle_window
+):
+    seen = []
+    cursor = None
+    for _ in range(5):
+        url = "/api/v1/sync?limit=2" + (f"&since={cursor}" if cursor else "")
+        data = (await client.get(url, headers=auth(parent_token))).json()
+        assert len(data["chores"]) <= 2
+        seen.extend(c["id"] for c in data["chores"])
+        cursor = data["cursor"]
+        if not data["has_more"]:
+            break
+
+    assert sorted(seen) == sorted([test_chore.id, test_range_chore.id, test_disabled_chore.id])
+
+
+@pytest.mark.asyncio
+async def test_deleted_chore_produces_tombstone(
+    client: AsyncClient, parent_token, child_token, test_chore, no_settle_window
+):
+    parent_cursor = (await client.get("/api/v1/sync", headers=auth(parent_token))).json()["cursor"]
+    child_cursor = (await client.get("/api/v1/sync", headers=auth(child_token))).json()["cursor"]
+
+    response = await client.delete(f"/api/v1/chores/{test_chore.id}", headers=auth(parent_token))
+    assert response.status_code == 204
+
+    for token, cursor in ((parent_token, parent_cursor), (child_token, child_cursor)):
+        data = (await client.get(f"/api/v1/sync?since={cursor}", headers=auth(token))).json()
+        assert [(t["entity_type"], t["entity_id"]) for t in data["tombstones"]] == [("chore", test_chore.id)]
+
+
+@pytest.mark.asyncio
+async def test_removed_family_member_produces_tombstone(client: AsyncClient, db_session, no_settle_window):
+    from backend.app.repositories.user import UserRepository
+
+    user_repo = UserRepository()
+    parent1 = await user_repo.create(db_session, obj_in={
+        "username": "sync_parent1", "password": "testpass123", "email": "sp1@example.com", "is_parent": True
+    })
+    parent2 = await user_repo.create(db_session, obj_in={
+        "username": "sync_parent2", "password": "testpass123", "email": "sp2@example.com", "is_parent": True
+    })
+    headers1 = auth(create_access_token(subject=str(parent1.id)))
+    headers2 = auth(create_access_token(subject=str(parent2.id)))
+
+    invite_code = (await client.post(
+        "/api/v1/families/create", json={"name": "Sync Family"}, headers=headers1
+    )).json()["invite_code"]
+    await client.post("/api/v1/families/join", json={"invite_code": invite_code}, headers=headers2)
+
+    first = (await client.get("/api/v1/sync", headers=headers1)).json()
+    assert {u["id"] for u in first["users"]} == {parent1.id, parent2.id}
+
+    response = await client.request(
+        "DELETE",
+        f"/api/v1/families/members/{parent2.id}",
+        json={"user_id": parent2.id},
+        headers=headers1
+    )
+    assert response.status_code == 200
+
+    delta = (await client.get(f"/api/v1/sync?since={first['cursor']}", headers=headers1)).json()
+    assert ("user", parent2.id) in [(t["entity_type"], t["entity_id"]) for t in delta["tombstones"]]
+    assert parent2.id not in [u["id"] for u in delta["users"]]
+
+
+@pytest.mark.asyncio
+async def test_child_only_sees_own_rows(
+    client: AsyncClient, db_session, child_token, test_child_user, test_chore
+):
+    other_parent = User(username="other_parent", hashed_password="x", is_parent=True)
+    db_session.add(other_parent)
+    await db_session.flush()
+    db_session.add(Chore(
+        title="Other family chore", description="", reward=1.0,
+        assignment_mode="unassigned", creator_id=other_parent.id
+    ))
+    await db_session.commit()
+
+    data = (await client.get("/api/v1/sync", headers=auth(child_token))).json()
+    assert [c["id"] for c in data["chores"]] == [test_chore.id]
+    assert [u["id"] for u in data["users"]] == [test_child_user.id]
+    assert all(a["assignee_id"] == test_child_user.id for a in data["assignments"])
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_rejected(client: AsyncClient, parent_token):
+    response = await client.get("/api/v1/sync?since=not-a-cursor", headers=auth(parent_token))
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid sync cursor"
+
+
+@pytest.mark.asyncio
+async def test_limit_is_capped(client: AsyncClient, parent_token):
+    response = await client.get(
+        f"/api/v1/sync?limit={settings.SYNC_MAX_PAGE_SIZE + 1}", headers=auth(parent_token)
+    )
+    assert response.status_code == 422
+
+
+def test_cursor_round_trip():
+    positions = {"chores": (datetime(2024, 12, 20, 10, 0, 0, 123456), 7)}
+    assert decode_cursor(encode_cursor(positions)) == positions
@@ -1,5 +1,6 @@
 import asyncio
 import os
+from contextlib import contextmanager
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
@@ -11,12 +12,13 @@ import httpx
 os.environ["TESTING"] = "true"
 
 from backend.app.main import app
-from backend.app.db.base import Base, get_db
+from backend.app.db.base import Base, get_db, get_reporting_session_factory, get_session_factory
 from backend.app.models.user import User
 from backend.app.models.chore import Chore
 from backend.app.core.security.password import get_password_hash
 from backend.app.core.security.jwt import create_access_token
 from backend.app.middleware.rate_limit import reset_limiter
+from backend.app.core.query_stats import record_queries
 from prometheus_client import REGISTRY
 
 # Use an in-memory SQLite database for testing
@@ -39,6 +41,10 @@ async def db_session():
     async with TestingSessionLocal() as session:
         yield session
 
+    # The shared in-memory connection (and its asyncio lock) must not outlive
+    # the test's event loop once sessions have used it concurrently
+    await test_engine.dispose()
+
 
 @pytest_asyncio.fixture(scope="function")
 async def client(db_session):
@@ -69,12 +75,42 @@ async def client(db_session):
         )
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
+    # Reports share the test session instead of opening their own on the reporting pool
+    app.dependency_overrides[get_reporting_session_factory] = lambda: None
     app.dependency_overrides[check_metrics_access] = override_metrics_access
     async with AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
         yield client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def query_budget():
+    """
+    Assert how many SQL statements a block may run.
+
+        with query_budget(8):
+            await client.get("/api/v1/chores/available", headers=headers)
+
+    ``max_repeats`` additionally caps how often any one statement fingerprint
+    may run, which catches N+1 loops that stay under the total budget.
+    """
+    @contextmanager
+    def budget(max_queries, max_repeats=None):
+        with record_queries() as recorder:
+            yield recorder
+        statements = "\n".join(f"  {count}x {sql}" for sql, count in recorder.fingerprints.most_common())
+        assert recorder.count <= max_queries, (
+            f"Expected at most {max_queries} queries, ran {recorder.count}:\n{statements}"
+        )
+        if max_repeats is not None:
+            assert not recorder.repeated(max_repeats + 1), (
+                f"A statement ran more than {max_repeats} times:\n{statements}"
+            )
+
+    return budget
+
+
 @pytest_asyncio.fixture(scope="function")
 async def test_parent_user(db_session):
     """Create a test parent user."""
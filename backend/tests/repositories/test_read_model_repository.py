@@ -0,0 +1,155 @@
+import pytest
+from decimal import Decimal
+from sqlalchemy import update
+
+from backend.app.models.chore import Chore
+from backend.app.models.chore_assignment import ChoreAssignment
+from backend.app.models.reward_adjustment import RewardAdjustment
+from backend.app.repositories.read_model import (
+    ReadModelRepository,
+    ChoreRecord,
+    AssignmentRecord,
+    UserRecord,
+)
+from backend.app.core.serialization import construct_model
+from backend.app.schemas.chore import ChoreResponse
+
+
+class TestReadModelRepository:
+    """Test cases for ReadModelRepository."""
+
+    @pytest.fixture
+    def repo(self):
+        """Create ReadModelRepository instance."""
+        return ReadModelRepository()
+
+    @pytest.mark.asyncio
+    async def test_records_use_slots(self, db_session, repo, test_child_user, test_chore):
+        """Records have no instance __dict__ and are not tracked by the session."""
+        db_session.expunge_all()
+        chores = await repo.get_child_chores(db_session, child_id=test_child_user.id)
+
+        assert len(chores) == 1
+        assert isinstance(chores[0], ChoreRecord)
+        assert not hasattr(chores[0], "__dict__")
+        assert len(db_session.identity_map) == 0
+
+    @pytest.mark.asyncio
+    async def test_child_chores_carry_assignment_status(
+        self, db_session, repo, test_child_user, test_chore, test_range_chore
+    ):
+        """Assignment status is projected onto the chore record."""
+        await db_session.execute(
+            update(ChoreAssignment)
+            .where(ChoreAssignment.chore_id == test_chore.id)
+            .values(is_completed=True)
+        )
+        await db_session.commit()
+
+        chores = await repo.get_child_chores(db_session, child_id=test_child_user.id)
+
+        by_id = {c.id: c for c in chores}
+        assert by_id[test_chore.id].is_completed is True
+        assert by_id[test_range_chore.id].is_completed is False
+        assert by_id[test_range_chore.id].max_reward == 4.0
+        assert all(c.assignments == [] for c in chores)
+
+    @pytest.mark.asyncio
+    async def test_child_chores_column_subset(self, db_session, repo, test_child_user, test_chore):
+        """Only requested chore columns are selected."""
+        chores = await repo.get_child_chores(
+            db_session, child_id=test_child_user.id, columns=["id", "title"]
+        )
+
+        assert chores[0].title == test_chore.title
+        assert chores[0].description is None
+
+    @pytest.mark.asyncio
+    async def test_records_serialize_like_orm_objects(self, db_session, repo, test_child_user, test_chore):
+        """Response schemas consume records the same way as ORM rows."""
+        record = (await repo.get_child_chores(db_session, child_id=test_child_user.id))[0]
+
+        validated = ChoreResponse.model_validate(record)
+        constructed = construct_model(ChoreResponse, record)
+        assert validated.model_dump() == constructed.model_dump()
+        assert validated.title == test_chore.title
+
+    @pytest.mark.asyncio
+    async def test_available_candidates(
+        self, db_session, repo, test_parent_user, test_child_user, test_chore, test_disabled_chore
+    ):
+        """Disabled chores are excluded and pool chores are included until claimed."""
+        pool_chore = Chore(
+            title="Pool chore", description="", reward=1.0,
+            assignment_mode="unassigned", creator_id=test_parent_user.id
+        )
+        db_session.add(pool_chore)
+        await db_session.commit()
+
+        assigned, pool = await repo.get_available_candidates(db_session, child_id=test_child_user.id)
+
+        assert [(c.id, type(a)) for c, a in assigned] == [(test_chore.id, AssignmentRecord)]
+        assert [a.assignee_id for a in assigned[0][0].assignments] == [test_child_user.id]
+        assert [c.id for c in pool] == [pool_chore.id]
+
+        db_session.add(ChoreAssignment(chore_id=pool_chore.id, assignee_id=test_child_user.id))
+        await db_session.commit()
+
+        _, pool = await repo.get_available_candidates(db_session, child_id=test_child_user.id)
+        assert pool == []
+
+    @pytest.mark.asyncio
+    async def test_pending_approval(self, db_session, repo, test_parent_user, test_child_user, test_chore):
+        """Completed, unapproved assignments come back with chore and assignee records."""
+        assert await repo.get_pending_approval(db_session, creator_id=test_parent_user.id) == []
+
+        await db_session.execute(
+            update(ChoreAssignment)
+            .where(ChoreAssignment.chore_id == test_chore.id)
+            .values(is_completed=True)
+        )
+        await db_session.commit()
+
+        pending = await repo.get_pending_approval(db_session, creator_id=test_parent_user.id)
+
+        assert len(pending) == 1
+        assignment, chore, assignee = pending[0]
+        assert assignment.chore_id == chore.id == test_chore.id
+        assert isinstance(assignee, UserRecord)
+        assert assignee.username == test_child_user.username
+        assert [a.id for a in chore.assignments] == [assignment.id]
+
+    @pytest.mark.asyncio
+    async def test_allowance_summary(
+        self, db_session, repo, test_parent_user, test_child_user, test_chore, test_range_chore
+    ):
+        """Approved earnings prefer approval_reward and adjustments are summed."""
+        await db_session.execute(
+            update(ChoreAssignment)
+            .where(ChoreAssignment.chore_id == test_chore.id)
+            .values(is_completed=True, is_approved=True)
+        )
+        await db_session.execute(
+            update(ChoreAssignment)
+            .where(ChoreAssignment.chore_id == test_range_chore.id)
+            .values(is_completed=True, is_approved=True, approval_reward=3.5)
+        )
+        db_session.add(RewardAdjustment(
+            child_id=test_child_user.id, parent_id=test_parent_user.id,
+            amount=Decimal("-1.25"), reason="Broke a glass"
+        ))
+        await db_session.commit()
+
+        summary = await repo.get_allowance_summary(db_session, parent_id=test_parent_user.id)
+
+        assert len(summary) == 1
+        row = summary[0]
+        assert row.id == test_child_user.id
+        assert row.completed_chores == 2
+        assert row.total_earned == pytest.approx(8.5)
+        assert row.total_adjustments == pytest.approx(-1.25)
+
+    @pytest.mark.asyncio
+    async def test_allowance_summary_without_children(self, db_session, repo, test_parent_user):
+        """A parent without children gets an empty summary."""
+        assert await repo.get_allowance_summary(db_session, parent_id=test_parent_user.id) == []
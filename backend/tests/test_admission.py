@@ -0,0 +1,187 @@
+"""
+Tests for admission control (backend.app.core.admission) and its middleware.
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.app.core.admission import (
+    ADMITTED, AUTH, READ, REPORT, SHED_IN_FLIGHT, SHED_POOL_WAIT, SHED_QUEUE_FULL, SHED_QUEUE_TIMEOUT, WRITE,
+    AdmissionController, Lane, LaneLimit, classify, parse_limits
+)
+from backend.app.db.pool import InstrumentedAsyncAdaptedQueuePool
+from backend.app.middleware.admission import AdmissionMiddleware
+
+
+def decisions(route_class, decision):
+    return REGISTRY.get_sample_value(
+        "admission_decisions_total", {"route_class": route_class, "decision": decision}
+    ) or 0
+
+
+def controller(pool=None, max_in_flight=100, **limits):
+    lanes = {AUTH: LaneLimit(10, 1000), WRITE: LaneLimit(10, 1000), READ: LaneLimit(10, 1000),
+             REPORT: LaneLimit(10, 1000)}
+    lanes.update(limits)
+    return AdmissionController(lanes, max_in_flight=max_in_flight, pool_wait_ms=500, pool=pool)
+
+
+def test_parse_limits():
+    assert parse_limits("auth=40:2000, report=10:250,") == {
+        AUTH: LaneLimit(40, 2000.0), REPORT: LaneLimit(10, 250.0)
+    }
+    for value in ("auth=40", "batch=1:10", "auth:40:10", "read=0:10", "read=x:10"):
+        with pytest.raises(ValueError):
+            parse_limits(value)
+
+
+def test_classify():
+    assert classify("POST", "/api/v1/users/login") == AUTH
+    assert classify("POST", "/api/v1/users/register") == AUTH
+    assert classify("POST", "/api/v1/chores") == WRITE
+    assert classify("DELETE", "/api/v1/chores/1") == WRITE
+    assert classify("GET", "/api/v1/chores") == READ
+    assert classify("GET", "/api/v1/reports/allowance-summary") == REPORT
+    assert classify("GET", "/api/v1/statistics/weekly-summary") == REPORT
+    for method, path in [("GET", "/health"), ("GET", "/api/v1/healthcheck"), ("GET", "/metrics"),
+                         ("DELETE", "/metrics/statements"), ("GET", "/debug/profile"),
+                         ("OPTIONS", "/api/v1/chores")]:
+        assert classify(method, path) is None
+
+
+@pytest.mark.asyncio
+async def test_lane_queues_up_to_its_limit_within_the_budget():
+    lane = Lane(1)
+    assert await lane.acquire(1.0) == ADMITTED
+
+    waiter = asyncio.create_task(lane.acquire(1.0))
+    await asyncio.sleep(0)
+    assert lane.queued == 1
+    # The queue holds as many requests as the lane has slots
+    assert await lane.acquire(1.0) == SHED_QUEUE_FULL
+
+    lane.release()
+    assert await waiter == ADMITTED
+    assert lane.active == 1 and lane.queued == 0
+
+    assert await lane.acquire(0.01) == SHED_QUEUE_TIMEOUT
+    assert lane.queued == 0
+    lane.release()
+    assert lane.active == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_do_not_leak_slots():
+    lane = Lane(1)
+    assert await lane.acquire(1.0) == ADMITTED
+    waiter = asyncio.create_task(lane.acquire(1.0))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    lane.release()
+    assert lane.active == 0 and lane.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_reads_and_reports_get_a_smaller_share_of_the_in_flight_cap():
+    admission = controller(max_in_flight=10, **{READ: LaneLimit(20, 1000), WRITE: LaneLimit(20, 1000)})
+    shed_before = decisions(REPORT, SHED_IN_FLIGHT)
+
+    for _ in range(5):
+        assert await admission.admit(READ) == ADMITTED
+    assert await admission.admit(REPORT) == SHED_IN_FLIGHT
+    for _ in range(3):
+        assert await admission.admit(READ) == ADMITTED
+    assert await admission.admit(READ) == SHED_IN_FLIGHT
+    assert await admission.admit(WRITE) == ADMITTED
+    assert await admission.admit(AUTH) == ADMITTED
+    assert await admission.admit(AUTH) == SHED_IN_FLIGHT
+    assert decisions(REPORT, SHED_IN_FLIGHT) == shed_before + 1
+
+    admission.release(AUTH)
+    assert admission.in_flight == 9
+    assert await admission.admit(WRITE) == ADMITTED
+
+
+@pytest.mark.asyncio
+async def test_pool_pressure_sheds_reads_and_reports_only():
+    pool = SimpleNamespace(size=lambda: 5, checkedout=lambda: 0, _max_overflow=5,
+                           recent_wait=0.0, recent_wait_at=time.monotonic())
+    admission = controller(pool=lambda: pool)
+    assert await admission.admit(READ) == ADMITTED
+
+    pool.recent_wait = 0.8
+    assert await admission.admit(READ) == SHED_POOL_WAIT
+    assert await admission.admit(REPORT) == SHED_POOL_WAIT
+    assert await admission.admit(WRITE) == ADMITTED
+    assert await admission.admit(AUTH) == ADMITTED
+
+    # A stale measurement no longer counts
+    pool.recent_wait_at -= 60
+    assert await admission.admit(REPORT) == ADMITTED
+
+    # Neither does a wait while every connection is checked out
+    pool.checkedout = lambda: 10
+    assert await admission.admit(READ) == SHED_POOL_WAIT
+
+
+@pytest.mark.asyncio
+async def test_pool_tracks_recent_checkout_wait(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'admission.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool, pool_size=1, max_overflow=0, pool_timeout=1
+    )
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        pool = engine.sync_engine.pool
+        assert pool.recent_wait < 0.1
+        assert time.monotonic() - pool.recent_wait_at < 1
+
+        async def hold():
+            async with engine.connect():
+                await asyncio.sleep(0.3)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0.05)
+        async with engine.connect():
+            pass
+        await holder
+        assert pool.recent_wait > 0.03
+    finally:
+        await engine.dispose()
+
+
+async def slow_app(scope, receive, send):
+    await asyncio.sleep(0.1)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+@pytest.mark.asyncio
+async def test_middleware_sheds_with_retry_after():
+    admission = controller(**{REPORT: LaneLimit(1, 10)})
+    app = AdmissionMiddleware(slow_app, controller=admission)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        responses = await asyncio.gather(*[
+            client.get("/api/v1/reports/allowance-summary") for _ in range(3)
+        ])
+        assert sorted(r.status_code for r in responses) == [200, 503, 503]
+        shed = next(r for r in responses if r.status_code == 503)
+        assert shed.headers["retry-after"] == "5"
+        assert shed.json() == {"detail": "Server is busy, please retry shortly"}
+
+        # Slots are released once responses are sent
+        assert admission.in_flight == 0
+        assert (await client.get("/api/v1/reports/allowance-summary")).status_code == 200
+
+        # Exempt paths are never counted
+        assert (await client.get("/health")).status_code == 200
+        assert admission.in_flight == 0
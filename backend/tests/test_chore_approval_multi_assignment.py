@@ -571,3 +571,56 @@ class TestChoreApprovalMultiAssignment:
 
         assert exc_info.value.status_code == 403
         assert "you created" in str(exc_info.value.detail).lower() or "your family" in str(exc_info.value.detail).lower()
+
+    @pytest.mark.asyncio
+    async def test_approve_in_session_without_loaded_child(self, db_session: AsyncSession):
+        """Test approval when the child is not already in the session, as in a fresh request."""
+        user_service = UserService()
+        chore_service = ChoreService()
+
+        parent = await user_service.register_user(
+            db_session,
+            username="parent_fresh_session",
+            password="password123",
+            email="parentfs@test.com",
+            is_parent=True
+        )
+
+        child = await user_service.register_user(
+            db_session,
+            username="child_fresh_session",
+            password="password123",
+            is_parent=False,
+            parent_id=parent.id
+        )
+
+        chore = await chore_service.create_chore(
+            db_session,
+            creator_id=parent.id,
+            chore_data={
+                "title": "Water Plants",
+                "description": "Test",
+                "reward": 3.0,
+                "assignment_mode": "single",
+                "assignee_ids": [child.id]
+            }
+        )
+
+        completion_result = await chore_service.complete_chore(
+            db_session,
+            chore_id=chore.id,
+            user_id=child.id
+        )
+        assignment_id = completion_result["assignment"].id
+        parent_id, child_id = parent.id, child.id
+
+        db_session.expunge_all()
+
+        result = await chore_service.approve_assignment(
+            db_session,
+            assignment_id=assignment_id,
+            parent_id=parent_id
+        )
+
+        assert result["reward_adjustment"].child_id == child_id
+        assert result["reward_adjustment"].child.id == child_id
@@ -0,0 +1,81 @@
+"""
+Tests for the synthetic benchmark dataset generator (backend.benchmarks.dataset).
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.app.core.security.password import verify_password
+from backend.app.db.base import Base
+from backend.app.models.activity import Activity
+from backend.app.models.chore import Chore
+from backend.app.models.chore_assignment import ChoreAssignment
+from backend.app.models.user import User
+from backend.benchmarks.dataset import PASSWORD, PROFILES, TABLES, generate_batches, load_dataset
+
+END = datetime(2025, 6, 1)
+
+
+def rows(seed, batch_families=200):
+    return list(generate_batches(PROFILES["tiny"], seed=seed, end=END, batch_families=batch_families))
+
+
+def test_generation_is_deterministic():
+    first = rows(seed=7)
+    assert rows(seed=7) == first
+    assert rows(seed=8) != first
+
+    # Batching only changes how rows are grouped
+    merged = {table.name: [] for table in TABLES}
+    for batch in rows(seed=7, batch_families=3):
+        for name, table_rows in batch.items():
+            merged[name].extend(table_rows)
+    assert merged == first[0]
+
+
+def test_history_stays_inside_the_window():
+    (batch,) = rows(seed=1)
+    assert len(batch["families"]) == PROFILES["tiny"].families
+    assert {row["assignment_mode"] for row in batch["chores"]} == {"single", "multi_independent", "unassigned"}
+    assert all(row["created_at"] <= END for row in batch["activities"])
+    approvals = [a for a in batch["chore_assignments"] if a["is_approved"]]
+    assert approvals and all(a["approval_reward"] is not None and a["approval_date"] <= END for a in approvals)
+
+
+@pytest.mark.asyncio
+async def test_load_dataset(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'dataset.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    counts = await load_dataset(engine, PROFILES["tiny"], seed=3, end=END)
+    # Loading again appends a second dataset after the existing ids
+    again = await load_dataset(engine, PROFILES["tiny"], seed=3, end=END)
+    assert again == counts
+
+    async with engine.connect() as conn:
+        for table in TABLES:
+            stored = (await conn.execute(select(func.count()).select_from(table))).scalar()
+            assert stored == 2 * counts[table.name]
+        orphans = (await conn.execute(text("PRAGMA foreign_key_check"))).all()
+        assert orphans == []
+
+        recurring_history = (await conn.execute(
+            select(func.count(Activity.id))
+            .join(Chore, Chore.id == Activity.activity_data["chore_id"].as_integer())
+            .where(Activity.activity_type == "chore_approved", Chore.is_recurring == True)
+        )).scalar()
+        assert recurring_history > counts["chores"]
+
+        parent_assignments = (await conn.execute(
+            select(func.count(ChoreAssignment.id))
+            .join(User, User.id == ChoreAssignment.assignee_id)
+            .where(User.is_parent == True)
+        )).scalar()
+        assert parent_assignments == 0
+
+        hashed = (await conn.execute(select(User.hashed_password).limit(1))).scalar()
+    assert verify_password(PASSWORD, hashed)
+    await engine.dispose()
@@ -0,0 +1,198 @@
+"""
+Tests for request deadlines (backend.app.core.deadline) and their middleware.
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.app.core.deadline import (
+    DEADLINE_DETAIL, STATEMENT_TIMEOUT_DETAIL, Deadline, DeadlineExceeded, apply_statement_deadlines,
+    bind_deadline, is_statement_timeout, parse_deadlines, request_deadline, statement_timeout_ms
+)
+from backend.app.middleware.deadline import DeadlineMiddleware, deadline_exceeded_handler, statement_timeout_handler
+
+REPORTS = "/api/v1/reports/allowance-summary"
+
+
+def timeouts(route_class, cause):
+    return REGISTRY.get_sample_value(
+        "request_timeouts_total", {"route_class": route_class, "cause": cause}
+    ) or 0
+
+
+def deadline_in(seconds, route_class="read"):
+    return Deadline(route_class, time.monotonic() + seconds, seconds)
+
+
+class QueryCanceled(Exception):
+    sqlstate = "57014"
+
+
+def test_parse_deadlines():
+    assert parse_deadlines("read=10000, report=60000,") == {"read": 10.0, "report": 60.0}
+    for value in ("read", "batch=10", "read=0", "read=x"):
+        with pytest.raises(ValueError):
+            parse_deadlines(value)
+
+
+def test_clients_can_only_shorten_the_budget():
+    assert request_deadline("read", 10.0).budget_seconds == 10.0
+    assert request_deadline("read", 10.0, "2500").budget_seconds == 2.5
+    assert request_deadline("read", 10.0, "60000").budget_seconds == 10.0
+    assert request_deadline("read", 10.0, "soon").budget_seconds == 10.0
+    assert request_deadline("read", 10.0, "-5").budget_seconds == 10.0
+
+
+def test_statement_timeout_follows_the_remaining_budget():
+    assert statement_timeout_ms(15000) is None
+    with bind_deadline(deadline_in(2.0)):
+        assert 1900 < statement_timeout_ms(15000) <= 2000
+        assert 1900 < statement_timeout_ms() <= 2000
+    # The pool's own statement timeout stays the ceiling
+    with bind_deadline(deadline_in(30.0)):
+        assert statement_timeout_ms(15000) is None
+    with bind_deadline(deadline_in(-1.0)):
+        with pytest.raises(DeadlineExceeded):
+            statement_timeout_ms(15000)
+
+
+def test_is_statement_timeout():
+    assert is_statement_timeout(exc.DBAPIError("SELECT 1", None, QueryCanceled()))
+    assert not is_statement_timeout(exc.DBAPIError("SELECT 1", None, ValueError()))
+
+
+@pytest.mark.asyncio
+async def test_transactions_past_the_deadline_do_not_start(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'deadline.db'}")
+    apply_statement_deadlines(engine, 15000)
+    try:
+        with bind_deadline(deadline_in(5.0)):
+            async with engine.begin() as conn:
+                assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+        with bind_deadline(deadline_in(-1.0)):
+            with pytest.raises(DeadlineExceeded):
+                async with engine.begin() as conn:
+                    await conn.execute(text("SELECT 1"))
+    finally:
+        await engine.dispose()
+
+
+def deadline_app(delay: float, budgets=None):
+    """An app whose report endpoint takes ``delay`` seconds, behind the middleware."""
+    app = FastAPI()
+    app.state.finished = False
+    app.state.remaining = None
+
+    @app.get(REPORTS)
+    async def report():
+        await asyncio.sleep(delay)
+        app.state.finished = True
+        return {"ok": True}
+
+    @app.get("/api/v1/chores")
+    async def fails():
+        raise exc.DBAPIError("SELECT 1", None, QueryCanceled())
+
+    @app.get("/api/v1/users/me")
+    async def expired():
+        raise DeadlineExceeded(DEADLINE_DETAIL)
+
+    app.add_exception_handler(DeadlineExceeded, deadline_exceeded_handler)
+    app.add_exception_handler(exc.DBAPIError, statement_timeout_handler)
+    return app, DeadlineMiddleware(app, budgets=budgets or {"report": 5.0, "read": 5.0})
+
+
+@pytest.mark.asyncio
+async def test_requests_past_their_deadline_get_504(monkeypatch):
+    monkeypatch.setattr("backend.app.middleware.deadline.GRACE_SECONDS", 0.0)
+    app, middleware = deadline_app(0.5, budgets={"report": 0.05})
+    before = timeouts("report", "deadline")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://test") as client:
+        response = await client.get(REPORTS)
+    assert response.status_code == 504
+    assert response.json() == {"detail": DEADLINE_DETAIL}
+    assert timeouts("report", "deadline") == before + 1
+    assert not app.state.finished
+
+
+@pytest.mark.asyncio
+async def test_client_supplied_budget(monkeypatch):
+    monkeypatch.setattr("backend.app.middleware.deadline.GRACE_SECONDS", 0.0)
+    app, middleware = deadline_app(0.2)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://test") as client:
+        assert (await client.get(REPORTS)).status_code == 200
+        response = await client.get(REPORTS, headers={"X-Request-Timeout-Ms": "50"})
+    assert response.status_code == 504
+
+
+@pytest.mark.asyncio
+async def test_timeouts_raised_by_endpoints_get_distinct_504s():
+    app, middleware = deadline_app(0.0)
+    before = timeouts("read", "statement_timeout")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://test") as client:
+        response = await client.get("/api/v1/chores")
+        assert response.status_code == 504
+        assert response.json() == {"detail": STATEMENT_TIMEOUT_DETAIL}
+        assert timeouts("read", "statement_timeout") == before + 1
+
+        response = await client.get("/api/v1/users/me")
+        assert response.status_code == 504
+        assert response.json() == {"detail": DEADLINE_DETAIL}
+
+
+@pytest.mark.asyncio
+async def test_client_disconnect_cancels_the_request():
+    app, middleware = deadline_app(5.0)
+    before = timeouts("report", "client_disconnect")
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.sleep(0.05)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": REPORTS, "raw_path": REPORTS.encode(), "root_path": "",
+        "query_string": b"", "headers": [], "client": ("test", 1), "server": ("test", 80),
+    }
+    start = time.monotonic()
+    await middleware(scope, receive, send)
+    assert time.monotonic() - start < 1.0
+    assert sent == [] and not app.state.finished
+    assert timeouts("report", "client_disconnect") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_disconnect_after_the_response_lets_the_app_clean_up():
+    # httpx's ASGITransport, like uvicorn, reports http.disconnect as soon as
+    # the response body is complete
+    state = {"cleaned_up": False}
+
+    async def app(scope, receive, send):
+        await receive()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+        # Work after the response, as when get_db closes its session
+        await asyncio.sleep(0.05)
+        state["cleaned_up"] = True
+
+    middleware = DeadlineMiddleware(app, budgets={"read": 5.0})
+    before = timeouts("read", "client_disconnect")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://test") as client:
+        for _ in range(5):
+            state["cleaned_up"] = False
+            assert (await client.get("/api/v1/chores")).status_code == 200
+            assert state["cleaned_up"]
+    assert timeouts("read", "client_disconnect") == before
@@ -0,0 +1,121 @@
+"""
+Tests for the denormalized family_id of chores and chore assignments: kept in
+step with the creator's family, and used by the family-scoped queries.
+"""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.query_stats import record_queries
+from backend.app.repositories.chore import ChoreRepository
+from backend.app.repositories.chore_assignment import ChoreAssignmentRepository
+from backend.app.repositories.read_model import ReadModelRepository
+from backend.app.repositories.user import UserRepository
+from backend.app.services.family import FamilyService
+
+chore_repo = ChoreRepository()
+assignment_repo = ChoreAssignmentRepository()
+user_repo = UserRepository()
+family_service = FamilyService()
+
+
+async def create_user(db: AsyncSession, username: str, *, parent_id=None):
+    return await user_repo.create(db, obj_in={
+        "username": username,
+        "password": "testpass123",
+        "is_parent": parent_id is None,
+        "parent_id": parent_id,
+    })
+
+
+async def create_chore(db: AsyncSession, creator, assignee, *, mode="single", completed=False):
+    chore = await chore_repo.create(db, obj_in={
+        "title": f"Chore of {creator.username}",
+        "description": "",
+        "reward": 1.0,
+        "creator_id": creator.id,
+        "assignment_mode": mode,
+    })
+    assignment = await assignment_repo.create(db, obj_in={
+        "chore_id": chore.id,
+        "assignee_id": assignee.id,
+        "is_completed": completed,
+    })
+    return chore, assignment
+
+
+@pytest.fixture
+async def family(db_session: AsyncSession):
+    """A family with one parent and one child; yields (family, parent, child)."""
+    parent = await create_user(db_session, "denorm_parent")
+    child = await create_user(db_session, "denorm_child", parent_id=parent.id)
+    family = await family_service.create_family_for_user(db_session, user_id=parent.id)
+    return family, parent, child
+
+
+@pytest.mark.asyncio
+async def test_new_chores_take_their_creators_family(db_session, family):
+    family, parent, child = family
+    chore, assignment = await create_chore(db_session, parent, child)
+    assert chore.family_id == family.id
+    assert assignment.family_id == family.id
+
+    loner = await create_user(db_session, "denorm_loner")
+    chore, assignment = await create_chore(db_session, loner, child)
+    assert chore.family_id is None and assignment.family_id is None
+
+
+@pytest.mark.asyncio
+async def test_chores_follow_their_creator_into_and_out_of_a_family(db_session, family):
+    family, parent, child = family
+    other = await create_user(db_session, "denorm_other_parent")
+    chore, _ = await create_chore(db_session, other, child, completed=True)
+    await create_chore(db_session, other, child, mode="unassigned")
+    assert await chore_repo.get_by_family(db_session, family_id=family.id) == []
+
+    # Joining moves the chores created before
+    await family_service.join_family_by_code(db_session, user_id=other.id, invite_code=family.invite_code)
+    chores = await chore_repo.get_by_family(db_session, family_id=family.id)
+    assert {c.creator_id for c in chores} == {other.id}
+    assert len(await chore_repo.get_unassigned_pool(db_session, family_id=family.id)) == 1
+    pending = await assignment_repo.get_pending_approval(db_session, family_id=family.id)
+    assert [a.chore_id for a in pending] == [chore.id]
+    rows = await ReadModelRepository().get_pending_approval(db_session, family_id=family.id)
+    assert [record.chore_id for record, _, _ in rows] == [chore.id]
+
+    # Leaving takes them out again
+    await family_service.remove_user_from_family(
+        db_session, user_id=other.id, family_id=family.id, requesting_user_id=parent.id
+    )
+    assert await chore_repo.get_by_family(db_session, family_id=family.id) == []
+    assert await assignment_repo.get_pending_approval(db_session, family_id=family.id) == []
+
+
+async def query_plan(db: AsyncSession, statement: str) -> str:
+    """SQLite's plan for a recorded statement fingerprint (every ``?`` bound to NULL)."""
+    conn = await db.connection()
+    rows = (await conn.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", (None,) * statement.count("?")
+    )).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query, index", [
+    (lambda db, family_id: chore_repo.get_by_family(db, family_id=family_id, with_assignments=False),
+     "idx_chores_family_status"),
+    (lambda db, family_id: chore_repo.get_unassigned_pool(db, family_id=family_id),
+     "idx_chores_family_status"),
+    (lambda db, family_id: assignment_repo.get_pending_approval(db, family_id=family_id),
+     "idx_assignments_family_status"),
+])
+async def test_family_queries_are_single_table_index_scans(db_session, family, query, index):
+    family, parent, child = family
+    await create_chore(db_session, parent, child, completed=True)
+
+    with record_queries() as recorder:
+        await query(db_session, family.id)
+    # The first statement filters by family; any others load relationships
+    statement = next(iter(recorder.fingerprints))
+    assert "users.family_id" not in statement
+    plan = await query_plan(db_session, statement)
+    assert index in plan
@@ -0,0 +1,157 @@
+"""
+Tests for the background health prober (backend.app.core.health) and the
+health endpoints served from its cached result.
+"""
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import backend.app.core.health as health_module
+from backend.app.core.health import (
+    DEGRADED,
+    NOT_READY,
+    READY,
+    DatabaseCheck,
+    HealthProber,
+    evaluate,
+)
+from backend.app.core.query_stats import record_queries
+
+POOL = {"size": 5, "max_overflow": 0, "checked_out": 1, "overflow": 0, "headroom": 4}
+
+
+def make_check(ok=True, age=0.0, latency_ms=1.0):
+    return DatabaseCheck(
+        ok=ok,
+        checked_at=datetime.utcnow(),
+        checked_monotonic=time.monotonic() - age,
+        latency_ms=latency_ms if ok else None,
+        error=None if ok else "connection refused"
+    )
+
+
+def verdict(check, pool=POOL):
+    return evaluate(check, pool, stale_after=30, slow_ms=500, min_headroom=2)
+
+
+@pytest.fixture
+async def running_prober(tmp_path, monkeypatch):
+    """A started prober on its own SQLite engine, installed as the app's prober."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'probe.db'}")
+    prober = HealthProber(engine, interval=60, timeout=1)
+    await prober.start()
+    monkeypatch.setattr(health_module, "prober", prober)
+    yield prober
+    await prober.stop()
+
+
+def test_evaluate():
+    assert verdict(make_check()).status == READY
+
+    report = verdict(make_check(latency_ms=800))
+    assert report.status == DEGRADED
+    assert report.database_status == DEGRADED
+    assert report.issues == ["database latency 800ms"]
+
+    report = verdict(make_check(), {**POOL, "checked_out": 4, "headroom": 1})
+    assert report.status == DEGRADED and report.ready
+    assert report.pool_status == DEGRADED
+
+    report = verdict(make_check(ok=False))
+    assert report.status == NOT_READY and not report.ready
+    assert report.issues == ["database check failed: connection refused"]
+
+    report = verdict(make_check(age=45))
+    assert report.status == NOT_READY
+    assert report.issues == ["database check is stale (45s old)"]
+
+
+@pytest.mark.asyncio
+async def test_prober_keeps_the_last_check(running_prober):
+    check = running_prober.last
+    assert check.ok
+    assert check.latency_ms >= 0
+    assert check.version  # SQLite version, fetched on the first check only
+    assert running_prober.running
+
+    second = await running_prober.probe()
+    assert second.checked_monotonic > check.checked_monotonic
+    assert second.version == check.version
+
+
+@pytest.mark.asyncio
+async def test_slow_checks_fail_after_the_timeout(running_prober, monkeypatch):
+    async def hang():
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(running_prober, "_check", hang)
+    running_prober.timeout = 0.05
+    check = await running_prober.probe()
+    assert not check.ok
+    assert check.error == "no response within 0.05s"
+
+
+@pytest.mark.asyncio
+async def test_probes_are_served_without_queries(client: AsyncClient, running_prober):
+    with record_queries() as recorder:
+        ready = await client.get("/api/v1/health/ready")
+        legacy = await client.get("/health")
+        detailed = await client.get("/api/v1/health/detailed")
+    assert recorder.count == 0
+
+    assert ready.status_code == 200
+    assert ready.json()["status"] == READY
+    assert ready.json()["database"] == "connected"
+    assert ready.json()["pool"]["headroom"] > 0
+    assert legacy.json() == {"status": "healthy", "database": "connected"}
+
+    components = detailed.json()["components"]
+    assert components["database"]["status"] == "healthy"
+    assert components["database"]["version"] == running_prober.last.version
+    assert components["connection_pool"]["status"] == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_stale_or_failed_checks_make_the_pod_not_ready(client: AsyncClient, running_prober):
+    running_prober.last = make_check(age=120)
+    response = await client.get("/api/v1/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == NOT_READY
+    assert "stale" in response.json()["issues"][0]
+
+    running_prober.last = make_check(ok=False)
+    response = await client.get("/api/v1/health/detailed")
+    assert response.status_code == 503
+    database = response.json()["components"]["database"]
+    assert database["status"] == "unhealthy"
+    assert database["error"] == "connection refused"
+    assert (await client.get("/health")).status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_pool_exhaustion_is_reported_as_degraded(client: AsyncClient, running_prober, monkeypatch):
+    monkeypatch.setattr(health_module, "pool_status", lambda pool: {**POOL, "checked_out": 5, "headroom": 0})
+
+    response = await client.get("/api/v1/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == DEGRADED
+    assert response.json()["issues"] == ["connection pool headroom 0"]
+
+    response = await client.get("/api/v1/health/detailed")
+    assert response.status_code == 200
+    assert response.json()["status"] == DEGRADED
+    assert response.json()["components"]["connection_pool"]["status"] == DEGRADED
+
+
+@pytest.mark.asyncio
+async def test_probes_check_the_database_when_no_prober_runs(client: AsyncClient):
+    assert health_module.prober is None
+    with record_queries() as recorder:
+        response = await client.get("/api/v1/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == READY
+    assert recorder.count >= 1
@@ -0,0 +1,44 @@
+"""
+Tests for the HTTP load-test harness (backend.benchmarks.load).
+"""
+import argparse
+
+import pytest
+
+from backend.benchmarks.load import (
+    HISTOGRAM_BOUNDS_MS, RouteStats, drive, in_process_target, parse_mix
+)
+
+
+def test_parse_mix():
+    assert parse_mix("child=6,parent=3,reports") == {"child": 6.0, "parent": 3.0, "reports": 1.0}
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_mix("child=1,teacher=2")
+
+
+def test_route_stats_summary():
+    stats = RouteStats()
+    for ms, status in [(0.5, 200), (3.0, 200), (40.0, 200), (9000.0, 500)]:
+        stats.add(ms, status)
+    summary = stats.summary(seconds=2)
+    assert summary["count"] == 4 and summary["errors"] == 1 and summary["rps"] == 2.0
+    assert summary["statuses"] == {"200": 3, "500": 1}
+    assert summary["max_ms"] == 9000.0
+    assert len(summary["histogram"]) == len(HISTOGRAM_BOUNDS_MS) + 1
+    assert summary["histogram"][0] == 1 and summary["histogram"][-1] == 1 and sum(summary["histogram"]) == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+async def test_drive_records_steady_state_per_route():
+    async with in_process_target("tiny", seed=2) as (client, members):
+        report = await drive(
+            client, members, users=6, mix={"child": 1, "parent": 1, "reports": 1},
+            warmup=0.2, duration=1.5, think_ms=0, bulk=2, seed=2
+        )
+
+    assert report["total"]["count"] > 0
+    assert sum(report["virtual_users"].values()) == 6
+    assert "GET /chores/available" in report["routes"] or "GET /chores/pending-approval" in report["routes"]
+    for route, stats in report["routes"].items():
+        assert not any(code.startswith("5") for code in stats["statuses"]), (route, stats["statuses"])
@@ -0,0 +1,81 @@
+"""
+Memory regression tests for large families: the loader strategies of
+FamilyRepository, and the per-endpoint peak memory budgets of
+backend.benchmarks.memory_footprint.
+"""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.chore import Chore
+from backend.app.models.chore_assignment import ChoreAssignment
+from backend.app.models.family import Family
+from backend.app.models.user import User
+from backend.app.repositories.family import JOINED, NOLOAD, SELECTIN, FamilyRepository
+from backend.benchmarks.memory_footprint import measure_endpoints, over_budget
+
+repo = FamilyRepository()
+
+
+@pytest.fixture
+async def family(db_session: AsyncSession) -> Family:
+    """A family with one parent and two children with three assignments each."""
+    family = Family(name="Loader Family", invite_code="LOADER01")
+    db_session.add(family)
+    await db_session.flush()
+
+    parent = User(username="loader_parent", hashed_password="x", is_parent=True, family_id=family.id)
+    db_session.add(parent)
+    await db_session.flush()
+    children = [
+        User(username=f"loader_child_{i}", hashed_password="x", parent_id=parent.id, family_id=family.id)
+        for i in range(2)
+    ]
+    db_session.add_all(children)
+    await db_session.flush()
+
+    for i in range(6):
+        chore = Chore(title=f"Chore {i}", description="", reward=1.0, creator_id=parent.id)
+        db_session.add(chore)
+        await db_session.flush()
+        db_session.add(ChoreAssignment(chore_id=chore.id, assignee_id=children[i % 2].id))
+    await db_session.commit()
+    db_session.expunge_all()
+    return family
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("loader", [JOINED, SELECTIN])
+async def test_loaders_return_the_same_children(db_session: AsyncSession, family, loader):
+    children = await repo.get_family_children_with_chores(db_session, family_id=family.id, loader=loader)
+    assert [child.username for child in children] == ["loader_child_0", "loader_child_1"]
+    assert [len(child.chore_assignments) for child in children] == [3, 3]
+    assert all(child.parent.username == "loader_parent" for child in children)
+    assert children[0].chore_assignments[0].chore.title.startswith("Chore")
+
+
+@pytest.mark.asyncio
+async def test_noload_leaves_relationships_empty(db_session: AsyncSession, family):
+    children = await repo.get_family_children(db_session, family_id=family.id, loader=NOLOAD)
+    assert [child.username for child in children] == ["loader_child_0", "loader_child_1"]
+    assert all(child.chore_assignments == [] and child.parent is None for child in children)
+
+    with pytest.raises(ValueError):
+        await repo.get_family_children_with_chores(db_session, family_id=family.id, loader=NOLOAD)
+    with pytest.raises(ValueError):
+        await repo.get_family_members(db_session, family_id=family.id, loader="lazy")
+
+
+@pytest.mark.asyncio
+async def test_count_family_members(db_session: AsyncSession, family):
+    counts = await repo.count_family_members(db_session, family_id=family.id)
+    assert counts == {"total": 3, "parents": 1, "children": 2}
+    assert await repo.count_family_members(db_session, family_id=family.id + 1) == {
+        "total": 0, "parents": 0, "children": 0
+    }
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_large_family_endpoints_stay_within_memory_budgets():
+    peaks = await measure_endpoints()
+    assert over_budget(peaks) == []
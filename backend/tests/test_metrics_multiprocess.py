@@ -0,0 +1,135 @@
+"""
+Tests for Prometheus multiprocess mode (PROMETHEUS_MULTIPROC_DIR).
+
+prometheus_client decides at import time whether it runs in multiprocess
+mode, so every worker here is a separate Python process started with the
+directory in its environment.
+"""
+import os
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from prometheus_client import CollectorRegistry, generate_latest, multiprocess
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+WORKER = textwrap.dedent("""
+    import sys
+    from backend.app.core import metrics
+
+    worker, exits = int(sys.argv[1]), sys.argv[2] == "exit"
+    metrics.user_logins_total.labels(role="parent").inc(worker)
+    metrics.pending_approvals_count.set(worker * 10)
+    metrics.db_pool_size.labels(pool="default").set(5)
+    metrics.db_pool_checked_out_connections.labels(pool="default").set(worker)
+    if exits:
+        metrics.mark_worker_dead()
+""")
+
+
+def run_worker(multiproc_dir: Path, *args: str) -> None:
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(multiproc_dir)}
+    subprocess.run([sys.executable, "-c", WORKER, *args], cwd=REPO_ROOT, env=env, check=True)
+
+
+def aggregate(multiproc_dir: Path) -> CollectorRegistry:
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=str(multiproc_dir))
+    return registry
+
+
+def test_samples_are_aggregated_across_workers(tmp_path):
+    run_worker(tmp_path, "1", "stay")
+    run_worker(tmp_path, "2", "stay")
+    run_worker(tmp_path, "3", "exit")
+    registry = aggregate(tmp_path)
+
+    # Counters are summed, including the exited worker's samples
+    assert registry.get_sample_value("user_logins_total", {"role": "parent"}) == 6
+    # The same business gauge is reported once, with the latest value
+    assert registry.get_sample_value("pending_approvals_count") == 30
+    # Pool gauges are summed over the live workers only
+    assert registry.get_sample_value("db_pool_size", {"pool": "default"}) == 10
+    assert registry.get_sample_value("db_pool_checked_out_connections", {"pool": "default"}) == 3
+
+
+def test_single_process_mode_renders_the_default_registry(monkeypatch):
+    from backend.app.core import metrics
+
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    assert not metrics.multiprocess_mode_enabled()
+    assert b"chores_created_total" in metrics.generate_metrics()
+    metrics.mark_worker_dead()  # no-op outside multiprocess mode
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def health_checks(text: str) -> float:
+    """Requests to /health counted by the per-request query histogram."""
+    for line in text.splitlines():
+        if line.startswith("db_queries_per_request_count{") and 'route="/health"' in line:
+            return float(line.rsplit(" ", 1)[1])
+    return 0
+
+
+@pytest.mark.slow
+def test_uvicorn_workers_report_the_same_totals(tmp_path):
+    multiproc_dir = tmp_path / "metrics"
+    multiproc_dir.mkdir()
+    port = free_port()
+    env = {
+        **os.environ,
+        "TESTING": "true",
+        "DATABASE_URL": f"sqlite+aiosqlite:///{tmp_path / 'workers.db'}",
+        # /health must query the database itself rather than report the prober's result
+        "HEALTH_PROBER_ENABLED": "false",
+        "PROMETHEUS_MULTIPROC_DIR": str(multiproc_dir),
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.app.main:app",
+         "--host", "127.0.0.1", "--port", str(port), "--workers", "2", "--log-level", "warning"],
+        cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 30
+        while len(list(multiproc_dir.glob("gauge_livesum_*.db"))) < 2:
+            if time.monotonic() > deadline or server.poll() is not None:
+                pytest.fail("uvicorn workers did not start")
+            time.sleep(0.2)
+        while True:
+            try:
+                httpx.get(f"{base_url}/", timeout=1)
+                break
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    pytest.fail("uvicorn did not accept connections")
+                time.sleep(0.2)
+
+        # Fresh connections let the kernel spread the requests over both workers
+        for _ in range(20):
+            assert httpx.get(f"{base_url}/health", timeout=5).status_code == 200
+
+        scrapes = [httpx.get(f"{base_url}/metrics", timeout=5) for _ in range(6)]
+        assert all(scrape.status_code == 200 for scrape in scrapes)
+        assert {health_checks(scrape.text) for scrape in scrapes} == {20}
+        # Summed over the workers: on a SQLite file each has one writer connection and a read pool
+        assert all('db_pool_size{pool="default"} 2.0' in scrape.text for scrape in scrapes)
+        assert all('db_pool_size{pool="sqlite_read"} 8.0' in scrape.text for scrape in scrapes)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    # Exited workers' live gauges are gone; their counters and histograms stay
+    assert not list(multiproc_dir.glob("gauge_livesum_*.db"))
+    assert health_checks(generate_latest(aggregate(multiproc_dir)).decode()) == 20
@@ -0,0 +1,119 @@
+"""
+Tests for connection-pool telemetry (backend.app.db.pool).
+
+Each test builds its own file-backed engine on the instrumented pool and
+exports it under a unique ``pool`` label, so metrics do not leak between tests.
+"""
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.app.db.pool import InstrumentedAsyncAdaptedQueuePool, bind_request_scope, instrument_engine
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.fixture
+async def pool_engine(tmp_path):
+    """A one-connection instrumented engine and its metrics label."""
+    name = f"test-{uuid.uuid4().hex[:8]}"
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+        pool_pre_ping=True,
+    )
+    instrument_engine(engine, name)
+    yield engine, name
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_gauges_follow_checked_out_connections(pool_engine):
+    engine, name = pool_engine
+    assert sample("db_pool_size", pool=name) == 1
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        assert sample("db_pool_checked_out_connections", pool=name) == 1
+        assert sample("db_pool_overflow_connections", pool=name) == 0
+
+    assert sample("db_pool_checked_out_connections", pool=name) == 0
+
+
+@pytest.mark.asyncio
+async def test_checkout_wait_and_timeouts(pool_engine):
+    engine, name = pool_engine
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        with pytest.raises(exc.TimeoutError):
+            async with engine.connect() as second:
+                await second.execute(text("SELECT 1"))
+
+    assert sample("db_pool_checkout_timeouts_total", pool=name) == 1
+    assert sample("db_pool_checkout_wait_seconds_count", pool=name) == 2
+    assert sample("db_pool_checkout_wait_seconds_sum", pool=name) >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_hold_time_is_labelled_by_route(pool_engine):
+    engine, name = pool_engine
+    scope = {"route": SimpleNamespace(path="/api/v1/chores/{chore_id}")}
+
+    with bind_request_scope(scope):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await asyncio.sleep(0.02)
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    with bind_request_scope({}):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    held = "db_pool_connection_hold_seconds"
+    assert sample(f"{held}_count", pool=name, route="/api/v1/chores/{chore_id}") == 1
+    assert sample(f"{held}_sum", pool=name, route="/api/v1/chores/{chore_id}") >= 0.02
+    assert sample(f"{held}_count", pool=name, route="none") == 1
+    assert sample(f"{held}_count", pool=name, route="unmatched") == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidations_and_pre_ping_failures(pool_engine):
+    engine, name = pool_engine
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        await conn.invalidate()
+    assert sample("db_pool_invalidations_total", pool=name, kind="hard") == 1
+
+    # Break the pooled connection behind SQLAlchemy's back: the next checkout's pre-ping fails
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await conn.run_sync(lambda _: raw.dbapi_connection.close())
+    async with engine.connect() as conn:
+        assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+
+    assert sample("db_pool_pre_ping_failures_total", pool=name) == 1
+    assert sample("db_pool_invalidations_total", pool=name, kind="hard") == 2
+
+
+@pytest.mark.asyncio
+async def test_metrics_survive_pool_recreation(pool_engine):
+    engine, name = pool_engine
+    await engine.dispose()
+    assert engine.sync_engine.pool.metrics_name == name
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        assert sample("db_pool_checked_out_connections", pool=name) == 1
+    assert sample("db_pool_connection_hold_seconds_count", pool=name, route="none") == 1
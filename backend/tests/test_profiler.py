@@ -0,0 +1,139 @@
+"""
+Tests for the sampling profiler (backend.app.core.profiler), the
+/debug/profile endpoints and per-request profiling via X-Profile.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+from httpx import AsyncClient
+
+import backend.app.core.metrics_auth as metrics_auth_module
+from backend.app.core.metrics_auth import MetricsAccessControl
+from backend.app.core.profiler import SamplingProfiler
+
+
+def busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+async def parked(event: asyncio.Event) -> None:
+    await event.wait()
+
+
+def test_samples_thread_stacks():
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,), name="busy-worker")
+    worker.start()
+    try:
+        profiler = SamplingProfiler(0.001, thread_ids={worker.ident}).start()
+        time.sleep(0.05)
+        profiler.stop()
+    finally:
+        stop.set()
+        worker.join()
+
+    assert profiler.samples > 0
+    lines = profiler.collapsed().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    frames = stack.split(";")
+    assert frames[0] == "thread:busy-worker"
+    assert any(frame.startswith("busy_loop (") for frame in frames)
+    assert all(line.startswith("thread:busy-worker;") for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_task_stacks_follow_the_await_chain():
+    event = asyncio.Event()
+    task = asyncio.create_task(parked(event), name="parked-task")
+    await asyncio.sleep(0)
+    try:
+        profiler = SamplingProfiler(loop=asyncio.get_running_loop(), include_tasks=True, thread_ids=set())
+        profiler.sample()
+        (stack,) = [line for line in profiler.stacks if line.startswith("task:parked-task;")]
+        frames = stack.split(";")
+        assert frames[1].startswith("parked (")
+        assert frames[2].startswith("Event.wait (asyncio.locks:")
+
+        # A single-task profile reports where the task waits...
+        single = SamplingProfiler(task=task)
+        single.sample()
+        (waiting,) = single.stacks
+        assert waiting.startswith("(waiting);parked (")
+    finally:
+        event.set()
+        await task
+
+    # ...and the thread's stack while the task is running
+    running = SamplingProfiler(task=asyncio.current_task())
+    running.sample()
+    (stack,) = running.stacks
+    assert "test_task_stacks_follow_the_await_chain (" in stack
+
+
+@pytest.mark.asyncio
+async def test_worker_profile_endpoint(client: AsyncClient):
+    event = asyncio.Event()
+    task = asyncio.create_task(parked(event), name="parked-task")
+    try:
+        response = await client.get("/debug/profile", params={"seconds": 0.2, "interval_ms": 5})
+    finally:
+        event.set()
+        await task
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert int(response.headers["x-profile-samples"]) > 0
+    lines = response.text.splitlines()
+    assert any(line.startswith("thread:MainThread;") for line in lines)
+    assert any(line.startswith("task:parked-task;") and ";parked (" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_worker_profile_limits(client: AsyncClient):
+    response = await client.get("/debug/profile", params={"seconds": 3600})
+    assert response.status_code == 400
+
+    first, second = await asyncio.gather(
+        client.get("/debug/profile", params={"seconds": 0.2}),
+        client.get("/debug/profile", params={"seconds": 0.2}),
+    )
+    assert sorted([first.status_code, second.status_code]) == [200, 409]
+
+
+@pytest.mark.asyncio
+async def test_request_profile_via_header(client: AsyncClient, parent_token, test_chore):
+    response = await client.get(
+        "/api/v1/chores",
+        headers={"Authorization": f"Bearer {parent_token}", "X-Profile": "1"}
+    )
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+
+    profile = await client.get(f"/debug/profile/{profile_id}")
+    assert profile.status_code == 200
+    assert profile.headers["content-type"].startswith("text/plain")
+
+    assert (await client.get("/debug/profile/unknown")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_request_profile_requires_trusted_caller(client: AsyncClient, parent_token, monkeypatch):
+    monkeypatch.setattr(
+        metrics_auth_module,
+        "metrics_access_control",
+        MetricsAccessControl(allowed_ips=["10.0.0.1"], auth_token="profile-secret")
+    )
+    headers = {"Authorization": f"Bearer {parent_token}"}
+
+    response = await client.get("/api/v1/chores", headers={**headers, "X-Profile": "1"})
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+
+    response = await client.get("/api/v1/chores", headers={**headers, "X-Profile": "profile-secret"})
+    assert "x-profile-id" in response.headers
@@ -0,0 +1,150 @@
+"""
+Tests for per-request query statistics (backend.app.core.query_stats) and
+the query budgets of hot endpoints.
+"""
+import asyncio
+import logging
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy import select, text
+
+from backend.app.core.config import settings
+from backend.app.core.query_stats import current_recorder, fingerprint, record_queries
+from backend.app.models.chore import Chore
+
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_fingerprint_collapses_literals_and_parameter_lists():
+    first = fingerprint("SELECT * FROM chores WHERE id IN (?, ?, ?) AND title = 'a'")
+    second = fingerprint("SELECT *\n  FROM chores WHERE id IN (?) AND title = 'it''s'")
+    assert first == second == "SELECT * FROM chores WHERE id IN (?) AND title = ?"
+    assert fingerprint("SELECT chores_1.id FROM chores AS chores_1 LIMIT 10") == (
+        "SELECT chores_1.id FROM chores AS chores_1 LIMIT ?"
+    )
+
+
+@pytest.mark.asyncio
+async def test_recorder_counts_statements_and_repeats(db_session):
+    assert current_recorder() is None
+
+    with record_queries() as recorder:
+        for chore_id in range(3):
+            await db_session.execute(select(Chore).where(Chore.id == chore_id))
+        await db_session.execute(text("SELECT 1"))
+
+    assert current_recorder() is None
+    assert recorder.count == 4
+    assert recorder.duration > 0
+    assert len(recorder.repeated(3)) == 1
+    assert recorder.repeated(4) == []
+
+    # Statements outside a block are not recorded anywhere
+    await db_session.execute(text("SELECT 1"))
+    assert recorder.count == 4
+
+
+@pytest.mark.asyncio
+async def test_nested_recorders_report_to_parent_and_tasks_are_isolated(db_session):
+    async def run(n):
+        with record_queries() as recorder:
+            for _ in range(n):
+                await db_session.execute(text("SELECT 1"))
+                await asyncio.sleep(0)
+            return recorder.count
+
+    with record_queries() as outer:
+        counts = await asyncio.gather(run(1), run(3))
+
+    assert counts == [1, 3]
+    assert outer.count == 4
+
+
+@pytest.mark.asyncio
+async def test_middleware_observes_histograms_by_route(client: AsyncClient, child_token, test_chore):
+    labels = {"method": "GET", "route": "/api/v1/chores/available"}
+    before = REGISTRY.get_sample_value("db_queries_per_request_count", labels) or 0
+
+    response = await client.get("/api/v1/chores/available", headers=auth(child_token))
+    assert response.status_code == 200
+
+    assert REGISTRY.get_sample_value("db_queries_per_request_count", labels) == before + 1
+    assert REGISTRY.get_sample_value("db_queries_per_request_sum", labels) > 0
+    assert REGISTRY.get_sample_value("db_time_per_request_seconds_count", labels) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_middleware_logs_repeated_statements(
+    client: AsyncClient, child_token, test_chore, monkeypatch, caplog
+):
+    # The current user is loaded by auth and again by the service: two identical lookups
+    monkeypatch.setattr(settings, "QUERY_REPEAT_THRESHOLD", 2)
+    labels = {"method": "GET", "route": "/api/v1/chores/available"}
+    before = REGISTRY.get_sample_value("db_n_plus_one_requests_total", labels) or 0
+
+    with caplog.at_level(logging.WARNING, logger="backend.app.middleware.query_stats"):
+        await client.get("/api/v1/chores/available", headers=auth(child_token))
+
+    assert "Possible N+1 query: GET /api/v1/chores/available" in caplog.text
+    assert REGISTRY.get_sample_value("db_n_plus_one_requests_total", labels) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_query_budget_fails_when_exceeded(db_session, query_budget):
+    with pytest.raises(AssertionError, match="at most 1 queries, ran 2"):
+        with query_budget(1):
+            await db_session.execute(text("SELECT 1"))
+            await db_session.execute(text("SELECT 2"))
+
+    with pytest.raises(AssertionError, match="more than 1 times"):
+        with query_budget(10, max_repeats=1):
+            await db_session.execute(text("SELECT 1"))
+            await db_session.execute(text("SELECT 1"))
+
+
+class TestEndpointQueryBudgets:
+    """Hot endpoints must not grow queries with the number of rows."""
+
+    @pytest.fixture
+    async def many_chores(self, db_session, test_parent_user, test_child_user):
+        from backend.app.models.chore_assignment import ChoreAssignment
+
+        for i in range(10):
+            chore = Chore(
+                title=f"Chore {i}", description="", reward=1.0,
+                assignment_mode="single", creator_id=test_parent_user.id
+            )
+            db_session.add(chore)
+            await db_session.flush()
+            db_session.add(ChoreAssignment(
+                chore_id=chore.id, assignee_id=test_child_user.id, is_completed=i % 2 == 0
+            ))
+        await db_session.commit()
+
+    @pytest.mark.asyncio
+    async def test_available_chores(self, client, child_token, many_chores, query_budget):
+        with query_budget(5, max_repeats=2):
+            response = await client.get("/api/v1/chores/available", headers=auth(child_token))
+        assert response.json()["total_count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_pending_approval(self, client, parent_token, many_chores, query_budget):
+        with query_budget(4, max_repeats=2):
+            response = await client.get("/api/v1/chores/pending-approval", headers=auth(parent_token))
+        assert len(response.json()) == 5
+
+    @pytest.mark.asyncio
+    async def test_chore_list(self, client, parent_token, many_chores, query_budget):
+        with query_budget(3, max_repeats=1):
+            response = await client.get("/api/v1/chores", headers=auth(parent_token))
+        assert len(response.json()) == 10
+
+    @pytest.mark.asyncio
+    async def test_parent_dashboard(self, client, parent_token, many_chores, query_budget):
+        with query_budget(8, max_repeats=2):
+            response = await client.get("/api/v1/dashboard/parent", headers=auth(parent_token))
+        assert len(response.json()["pending_approval"]) == 5
@@ -0,0 +1,157 @@
+"""
+Tests for read-replica routing (backend.app.db.replica, get_read_db and the
+read-your-writes middleware), with the replica as a second SQLite file.
+"""
+import asyncio
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+import backend.app.db.base as db_base
+from backend.app.core.security.jwt import create_access_token
+from backend.app.db.base import Base
+from backend.app.db.replica import PRIMARY, READ_PRIMARY_COOKIE, REPLICA, ReadRouter, ReplicaLag
+from backend.app.models.activity import Activity
+from backend.app.models.user import User
+
+PARENT_ID, CHILD_ID, NEW_USER_ID = 1, 2, 3
+
+
+def headers(user_id):
+    return {"Authorization": f"Bearer {create_access_token(subject=str(user_id))}"}
+
+
+def users():
+    return [
+        User(id=PARENT_ID, username="replica_parent", email="replica@test.com",
+             hashed_password="x", is_parent=True),
+        User(id=CHILD_ID, username="replica_child", hashed_password="x", is_parent=False, parent_id=PARENT_ID),
+    ]
+
+
+@pytest.fixture
+async def replica(tmp_path, db_session, monkeypatch):
+    """
+    A started router on a replica file installed as the app's router.
+
+    Both databases have the parent and child; only the replica has an
+    activity per user, so responses show which database served them.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with sessionmaker(engine, class_=AsyncSession)() as session:
+        session.add_all(users())
+        session.add_all([
+            Activity(user_id=user_id, activity_type="chore_completed", description="replica activity")
+            for user_id in (PARENT_ID, CHILD_ID)
+        ])
+        await session.commit()
+
+    db_session.add_all(users() + [
+        User(id=NEW_USER_ID, username="replica_newcomer", hashed_password="x", is_parent=False)
+    ])
+    await db_session.commit()
+
+    router = ReadRouter(engine, read_your_writes_seconds=30, max_lag_seconds=10, check_interval=60)
+    await router.start()
+    monkeypatch.setattr(db_base, "read_router", router)
+    yield router
+    await router.stop()
+
+
+async def served_by(client: AsyncClient, user_id: int) -> str:
+    response = await client.get("/api/v1/activities/recent", headers=headers(user_id))
+    assert response.status_code == 200, response.text
+    descriptions = [a["description"] for a in response.json()["activities"]]
+    return REPLICA if "replica activity" in descriptions else PRIMARY
+
+
+def test_routing_decisions(tmp_path):
+    router = ReadRouter(
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'unused.db'}"),
+        read_your_writes_seconds=30, max_lag_seconds=10, check_interval=5
+    )
+    # No lag check yet
+    assert router.route("1") == PRIMARY
+
+    router.last = ReplicaLag(ok=True, checked_monotonic=time.monotonic(), lag_seconds=2.0)
+    assert router.route("1") == REPLICA
+    assert router.route(None) == REPLICA
+
+    router.record_write("1")
+    assert router.route("1") == PRIMARY
+    assert router.route("2") == REPLICA
+    assert router.route("2", primary_until=time.time() + 5) == PRIMARY
+    assert router.route("2", primary_until=time.time() - 5) == REPLICA
+
+    router.last = ReplicaLag(ok=True, checked_monotonic=time.monotonic(), lag_seconds=11.0)
+    assert router.route("2") == PRIMARY
+    router.last = ReplicaLag(ok=True, checked_monotonic=time.monotonic() - 16, lag_seconds=0.0)
+    assert router.route("2") == PRIMARY
+    router.last = ReplicaLag(ok=False, checked_monotonic=time.monotonic(), error="refused")
+    assert router.route("2") == PRIMARY
+
+
+@pytest.mark.asyncio
+async def test_lag_check(replica, monkeypatch):
+    assert replica.last.ok and replica.last.lag_seconds == 0.0
+    assert replica.available
+
+    async def unreachable():
+        raise ConnectionRefusedError("replica is down")
+
+    monkeypatch.setattr(replica, "_measure", unreachable)
+    check = await replica.check()
+    assert not check.ok and check.error == "replica is down"
+    assert not replica.available
+
+    async def stuck():
+        await asyncio.sleep(5)
+
+    replica.check_timeout = 0.05
+    monkeypatch.setattr(replica, "_measure", stuck)
+    assert (await replica.check()).error == "no response within 0.05s"
+
+
+@pytest.mark.asyncio
+async def test_reads_use_the_replica_until_the_user_writes(client: AsyncClient, replica):
+    assert await served_by(client, PARENT_ID) == REPLICA
+    assert await served_by(client, CHILD_ID) == REPLICA
+
+    response = await client.post("/api/v1/chores", headers=headers(PARENT_ID), json={
+        "title": "Rake leaves",
+        "description": "Front yard",
+        "reward": 2.0,
+        "assignment_mode": "single",
+        "assignee_ids": [CHILD_ID]
+    })
+    assert response.status_code == 201, response.text
+    assert READ_PRIMARY_COOKIE in response.headers["set-cookie"]
+
+    # The cookie keeps this client on the primary, in any worker
+    assert await served_by(client, CHILD_ID) == PRIMARY
+    # Without it, this process still remembers the parent's write
+    client.cookies.clear()
+    assert await served_by(client, PARENT_ID) == PRIMARY
+    assert await served_by(client, CHILD_ID) == REPLICA
+
+    # Failed writes do not count
+    response = await client.post("/api/v1/chores", headers=headers(CHILD_ID), json={"title": "x"})
+    assert response.status_code >= 400
+    assert "set-cookie" not in response.headers
+    assert await served_by(client, CHILD_ID) == REPLICA
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_falls_back_to_the_primary(client: AsyncClient, replica):
+    replica.last = replica.last._replace(lag_seconds=60.0)
+    assert await served_by(client, CHILD_ID) == PRIMARY
+
+
+@pytest.mark.asyncio
+async def test_users_missing_on_the_replica_are_authenticated_on_the_primary(client: AsyncClient, replica):
+    assert await served_by(client, NEW_USER_ID) == PRIMARY
@@ -0,0 +1,87 @@
+"""
+Tests for the fast serialization helpers in backend.app.core.serialization.
+"""
+import json
+from datetime import datetime
+from typing import List
+
+from backend.app.core.serialization import (
+    FastJSONResponse,
+    construct_model,
+    dump_models_json,
+    type_adapter,
+)
+from backend.app.models.chore import Chore
+from backend.app.models.chore_assignment import ChoreAssignment
+from backend.app.schemas.chore import ChoreResponse, sparse_chore_model
+
+
+def make_chore(**overrides):
+    now = datetime(2024, 12, 20, 10, 0, 0, 123456)
+    values = dict(
+        id=7, title="Dishes", description="Wash up", reward=2.5, min_reward=None,
+        max_reward=None, is_range_reward=False, cooldown_days=1, is_recurring=True,
+        frequency=None, assignment_mode="single", is_disabled=False, creator_id=1,
+        created_at=now, updated_at=now,
+    )
+    values.update(overrides)
+    chore = Chore(**values)
+    chore.assignments = [
+        ChoreAssignment(
+            id=3, chore_id=7, assignee_id=2, is_completed=True, is_approved=False,
+            completion_date=now, approval_date=None, approval_reward=None,
+            rejection_reason=None, created_at=now, updated_at=now,
+        )
+    ]
+    return chore
+
+
+def test_construct_matches_validation():
+    chore = make_chore()
+    constructed = construct_model(ChoreResponse, chore)
+    validated = ChoreResponse.model_validate(chore)
+    assert constructed.model_dump(mode="json") == validated.model_dump(mode="json")
+    assert constructed.assignments[0].assignee_id == 2
+
+
+def test_construct_uses_defaults_for_missing_attributes():
+    chore = make_chore()
+    constructed = construct_model(ChoreResponse, chore)
+    assert constructed.is_completed is None
+    assert constructed.approval_reward is None
+
+    chore.assignments = []
+    first = construct_model(ChoreResponse, chore)
+    second = construct_model(ChoreResponse, chore)
+    assert first.assignments == [] and first.assignments is not second.assignments
+
+
+def test_construct_reads_assignment_fields_copied_onto_chore():
+    chore = make_chore()
+    chore.is_completed = True
+    chore.is_approved = False
+    assert construct_model(ChoreResponse, chore).is_completed is True
+
+
+def test_dump_models_json_matches_response_model_encoding():
+    chores = [make_chore(id=i, title=f"Chore {i}") for i in range(1, 4)]
+    expected = type_adapter(List[ChoreResponse]).dump_json(
+        [ChoreResponse.model_validate(c) for c in chores]
+    )
+    assert dump_models_json(ChoreResponse, chores) == expected
+
+
+def test_dump_models_json_with_sparse_model():
+    model = sparse_chore_model(frozenset({"id", "title"}))
+    assert json.loads(dump_models_json(model, [make_chore()])) == [{"id": 7, "title": "Dishes"}]
+
+
+def test_fast_json_response_renders_models_and_passes_bytes_through():
+    chore = construct_model(ChoreResponse, make_chore())
+    response = FastJSONResponse(content={"chore": chore, "total_count": 1})
+    body = json.loads(response.body)
+    assert body["chore"]["created_at"] == "2024-12-20T10:00:00.123456"
+    assert body["total_count"] == 1
+    assert response.media_type == "application/json"
+
+    assert FastJSONResponse(content=b'[1,2]').body == b'[1,2]'
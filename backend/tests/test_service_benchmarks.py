@@ -0,0 +1,35 @@
+"""
+Tests for the service-layer benchmark comparison (backend.benchmarks.services).
+"""
+import json
+
+from backend.benchmarks.services import BASELINE_PATH, CASES, compare
+
+
+def result(median_ms=10.0, queries=3, peak_kib=100.0):
+    return {"median_ms": median_ms, "p95_ms": median_ms * 1.2, "queries": queries, "peak_kib": peak_kib}
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = {"tiny/a": result(), "tiny/b": result(), "tiny/c": result()}
+    results = {
+        "tiny/a": result(median_ms=12.0, peak_kib=120.0),
+        "tiny/b": result(median_ms=13.0),
+        "tiny/c": result(queries=4, peak_kib=130.0),
+        "tiny/new": result(median_ms=1000.0),
+    }
+    regressions = compare(results, baseline, threshold=0.25)
+    assert len(regressions) == 3
+    assert regressions[0].startswith("tiny/b: median_ms 13.0 ms")
+    assert regressions[1] == "tiny/c: 4 statements (baseline 3)"
+    assert regressions[2].startswith("tiny/c: peak_kib 130.0 KiB")
+
+
+def test_compare_ignores_sub_millisecond_noise():
+    assert compare({"tiny/a": result(median_ms=0.2)}, {"tiny/a": result(median_ms=0.1)}, threshold=0.25) == []
+
+
+def test_baseline_covers_every_case():
+    with open(BASELINE_PATH) as f:
+        baseline = json.load(f)["results"]
+    assert {key.split("/", 1)[1] for key in baseline} == set(CASES)
@@ -0,0 +1,210 @@
+"""
+Tests for the SQLite deployment profile (backend.app.db.sqlite) and the
+statistics bucketing it runs on.
+"""
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+from sqlalchemy import exc, literal, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.api.api_v1.endpoints.statistics import period_key, period_start
+from backend.app.core.config import async_database_url
+from backend.app.core.security.jwt import create_access_token
+from backend.app.dependencies import auth
+from backend.app.db import base as db_base
+from backend.app.db.base import (
+    Base, get_read_db, get_read_session_factory, get_reporting_session_factory, pool_options
+)
+from backend.app.db.sqlite import SqlitePragmas, configure_sqlite_engine, is_sqlite_file
+from backend.app.main import app
+from backend.app.middleware.rate_limit import reset_limiter
+from backend.app.models.user import User
+
+
+def test_is_sqlite_file():
+    assert is_sqlite_file("sqlite:///./chores.db")
+    assert is_sqlite_file("sqlite+aiosqlite:////var/lib/chores/chores.db")
+    assert not is_sqlite_file("sqlite+aiosqlite:///:memory:")
+    assert not is_sqlite_file("sqlite://")
+    assert not is_sqlite_file("postgresql+asyncpg://u:p@db/chores")
+    assert async_database_url("sqlite:///./chores.db") == "sqlite+aiosqlite:///./chores.db"
+
+
+def test_pragma_statements():
+    writer = list(SqlitePragmas(busy_timeout_ms=250, cache_size_kib=1024).statements(writer=True))
+    assert "PRAGMA busy_timeout = 250" in writer
+    assert "PRAGMA journal_mode = WAL" in writer
+    assert "PRAGMA cache_size = -1024" in writer
+    assert "PRAGMA query_only = ON" not in writer
+    assert "PRAGMA query_only = ON" in list(SqlitePragmas().statements(writer=False))
+    with pytest.raises(ValueError):
+        list(SqlitePragmas(synchronous="NORMAL; DROP TABLE users").statements(writer=True))
+
+
+@pytest.fixture
+async def profile(tmp_path):
+    """(writer engine, reader engine) on one SQLite file, configured as db/base.py does."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}"
+    pragmas = SqlitePragmas(busy_timeout_ms=250)
+    writer = create_async_engine(url, **pool_options(1, 0, 30, pool_pre_ping=False))
+    configure_sqlite_engine(writer, pragmas, writer=True)
+    reader = create_async_engine(url, **pool_options(2, 0, 30, pool_pre_ping=False))
+    configure_sqlite_engine(reader, pragmas, writer=False)
+    async with writer.begin() as conn:
+        await conn.execute(text("CREATE TABLE accounts (id INTEGER PRIMARY KEY, balance INTEGER NOT NULL)"))
+        await conn.execute(text("INSERT INTO accounts (id, balance) VALUES (1, 0)"))
+    yield writer, reader
+    await writer.dispose()
+    await reader.dispose()
+
+
+@pytest.mark.asyncio
+async def test_connections_get_the_pragmas(profile):
+    writer, reader = profile
+    async with writer.connect() as conn:
+        assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+        assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 250
+        assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1  # NORMAL
+    async with reader.connect() as conn:
+        assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+        with pytest.raises(exc.OperationalError):
+            await conn.execute(text("UPDATE accounts SET balance = 1"))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_read_then_write_transactions_serialize(profile):
+    writer, reader = profile
+
+    async def increment():
+        async with writer.begin() as conn:
+            balance = (await conn.execute(text("SELECT balance FROM accounts WHERE id = 1"))).scalar()
+            await asyncio.sleep(0)
+            await conn.execute(text("UPDATE accounts SET balance = :b WHERE id = 1"), {"b": balance + 1})
+
+    await asyncio.gather(*(increment() for _ in range(20)))
+    # No "database is locked" and no lost updates; readers see the committed state
+    async with reader.connect() as conn:
+        assert (await conn.execute(text("SELECT balance FROM accounts WHERE id = 1"))).scalar() == 20
+
+
+@pytest.mark.asyncio
+async def test_readers_do_not_wait_for_the_writer(profile):
+    writer, reader = profile
+    async with writer.begin() as conn:
+        await conn.execute(text("UPDATE accounts SET balance = 7 WHERE id = 1"))
+        async with reader.connect() as read:
+            # The write lock is held, the reader sees the last committed state
+            assert (await read.execute(text("SELECT balance FROM accounts WHERE id = 1"))).scalar() == 0
+
+
+@pytest.mark.asyncio
+async def test_get_read_db_uses_the_read_pool(profile):
+    _, reader = profile
+    read_sessions = sessionmaker(reader, class_=AsyncSession, expire_on_commit=False)
+    primary = object()
+    dependency = get_read_db(None, db=primary, read_sessions=read_sessions)
+    session = await dependency.__anext__()
+    assert session is not primary and session.bind is reader
+    await dependency.aclose()
+
+
+@pytest.fixture
+async def profile_app(tmp_path, monkeypatch):
+    """
+    The app on a SQLite file wired as db/base.py does for the profile, with a
+    short writer pool timeout so that a wait for the writer fails fast.
+    Yields (client, parent headers, child headers).
+    """
+    url = f"sqlite+aiosqlite:///{tmp_path / 'app.db'}"
+    pragmas = SqlitePragmas(busy_timeout_ms=250)
+    writer = create_async_engine(url, **pool_options(1, 0, 2, pool_pre_ping=False))
+    configure_sqlite_engine(writer, pragmas, writer=True)
+    reader = create_async_engine(url, **pool_options(2, 0, 2, pool_pre_ping=False))
+    configure_sqlite_engine(reader, pragmas, writer=False)
+    async with writer.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    write_sessions = sessionmaker(writer, class_=AsyncSession, expire_on_commit=False)
+    read_sessions = sessionmaker(reader, class_=AsyncSession, expire_on_commit=False)
+    async with write_sessions() as session:
+        parent = User(username="profile_parent", hashed_password="x", is_parent=True)
+        session.add(parent)
+        await session.flush()
+        child = User(username="profile_child", hashed_password="x", is_parent=False, parent_id=parent.id)
+        session.add(child)
+        await session.commit()
+
+    reset_limiter()
+    monkeypatch.setattr(db_base, "AsyncSessionLocal", write_sessions)
+    app.dependency_overrides[get_read_session_factory] = lambda: read_sessions
+    app.dependency_overrides[get_reporting_session_factory] = lambda: None
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client, *(
+                {"Authorization": f"Bearer {create_access_token(subject=str(user.id))}"} for user in (parent, child)
+            )
+    finally:
+        app.dependency_overrides.clear()
+        await writer.dispose()
+        await reader.dispose()
+
+
+@pytest.mark.asyncio
+async def test_dashboards_do_not_wait_for_the_writer(profile_app):
+    # The request's get_db session holds the writer connection; the sections
+    # must run on the read pool or they wait for it until the pool timeout
+    client, parent_headers, child_headers = profile_app
+    for path, headers in (("/api/v1/dashboard/parent", parent_headers), ("/api/v1/dashboard/child", child_headers)):
+        response = await asyncio.wait_for(client.get(path, headers=headers), timeout=10)
+        assert response.status_code == 200, response.text
+
+
+@pytest.mark.asyncio
+async def test_slow_reads_do_not_hold_up_writes(profile_app, monkeypatch):
+    # A GET that takes longer than the writer's pool timeout; on the writer it
+    # would hold the connection, and the POST would time out waiting for it
+    client, parent_headers, _ = profile_app
+    authenticate = auth._authenticate
+    reading = asyncio.Event()
+
+    async def slow_authenticate(token, db, fallback_db=None):
+        user = await authenticate(token, db, fallback_db)
+        if not reading.is_set():
+            reading.set()
+            await asyncio.sleep(3)
+        return user
+
+    monkeypatch.setattr(auth, "_authenticate", slow_authenticate)
+    read = asyncio.create_task(client.get("/api/v1/chores", headers=parent_headers))
+    await asyncio.wait_for(reading.wait(), timeout=5)
+    response = await asyncio.wait_for(client.post("/api/v1/chores", headers=parent_headers, json={
+        "title": "Water the plants",
+        "description": "",
+        "reward": 1.0,
+        "assignment_mode": "unassigned",
+        "assignee_ids": []
+    }), timeout=1)
+    assert response.status_code == 201, response.text
+    assert not read.done()
+    assert (await read).status_code == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("period, value, expected", [
+    ("week", datetime(2026, 10, 18, 23, 0), "2026-10-12"),    # Sunday
+    ("week", datetime(2026, 10, 19, 0, 30), "2026-10-19"),    # Monday
+    ("week", datetime(2026, 10, 21, 12, 0), "2026-10-19"),
+    ("month", datetime(2026, 10, 31, 23, 59), "2026-10-01"),
+    ("month", datetime(2026, 11, 1, 0, 0), "2026-11-01"),
+])
+async def test_sqlite_period_start(period, value, expected):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.connect() as conn:
+            start = (await conn.execute(select(period_start(literal(value), period, "sqlite")))).scalar()
+        assert period_key(start) == expected
+    finally:
+        await engine.dispose()
@@ -0,0 +1,41 @@
+"""
+Startup cost guards: importing the application must not load modules that
+are only needed by later requests, nor build the OpenAPI schema.
+"""
+import json
+import subprocess
+import sys
+
+from backend.benchmarks.startup import REPO_ROOT, child_env
+
+# Loaded on first use by core/security (password hashing, token decoding)
+DEFERRED_MODULES = ["jose", "passlib", "bcrypt", "cryptography"]
+
+CHECK = """
+import json, sys
+import backend.app.main as main
+print(json.dumps({
+    "loaded": [name for name in %r if name in sys.modules],
+    "openapi_built": main.app.openapi_schema is not None,
+}))
+""" % (DEFERRED_MODULES,)
+
+
+def test_import_leaves_heavy_modules_and_openapi_for_later(tmp_path):
+    output = subprocess.run(
+        [sys.executable, "-c", CHECK],
+        cwd=REPO_ROOT, env=child_env(str(tmp_path)), capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    assert result == {"loaded": [], "openapi_built": False}
+
+
+def test_security_helpers_load_their_dependencies_on_first_use():
+    from backend.app.core.security.jwt import create_access_token, verify_token
+    from backend.app.core.security.password import get_password_hash, verify_password
+
+    assert verify_token(create_access_token(subject=42)) == "42"
+    assert verify_token("not-a-token") is None
+    hashed = get_password_hash("password123")
+    assert verify_password("password123", hashed)
+    assert not verify_password("wrong", hashed)
@@ -0,0 +1,104 @@
+"""
+Tests for the statement profiler (backend.app.core.logging) and the
+/metrics/statements endpoint.
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from backend.app.core.logging import StatementProfiler, setup_statement_profiler, statement_profiler
+from backend.app.repositories.chore import ChoreRepository
+from backend.app.repositories.user import UserRepository
+
+
+@pytest.fixture
+def profiler():
+    """Enable the global profiler for one test, starting from empty statistics."""
+    setup_statement_profiler()
+    statement_profiler.reset()
+    yield statement_profiler
+    statement_profiler.enabled = False
+    statement_profiler.reset()
+
+
+def test_aggregates_by_fingerprint():
+    stats = StatementProfiler()
+    for i in range(1, 21):
+        stats.record(f"SELECT * FROM chores WHERE id = {i}", i / 1000, rows=1, caller="ChoreRepository.get")
+    stats.record("SELECT 1", 0.5)
+
+    slowest, other = stats.top(order_by="total_time")
+    assert other["query"] == "SELECT * FROM chores WHERE id = ?"
+    assert other["calls"] == 20
+    assert other["rows"] == 20
+    assert other["total_time_ms"] == pytest.approx(210)
+    assert other["mean_time_ms"] == pytest.approx(10.5)
+    assert other["p95_time_ms"] == pytest.approx(20)
+    assert other["min_time_ms"] == pytest.approx(1)
+    assert other["callers"] == [{"caller": "ChoreRepository.get", "calls": 20}]
+    assert slowest["query"] == "SELECT ?"
+
+    assert [s["query"] for s in stats.top(limit=1, order_by="calls")] == ["SELECT * FROM chores WHERE id = ?"]
+    with pytest.raises(ValueError):
+        stats.top(order_by="query")
+
+
+def test_memory_is_bounded_by_evicting_least_called():
+    stats = StatementProfiler(max_statements=20, sample_size=4)
+    for _ in range(3):
+        stats.record("SELECT * FROM users", 0.001)
+    for i in range(100):
+        stats.record(f"SELECT * FROM table_{i}", 0.001)
+        assert len(stats) <= 20
+
+    assert stats.deallocations > 0
+    assert stats.top(limit=1, order_by="calls")[0]["query"] == "SELECT * FROM users"
+    assert all(len(s.samples) <= 4 for s in stats._stats.values())
+
+
+@pytest.mark.asyncio
+async def test_attributes_statements_to_repository_methods(db_session, profiler, test_parent_user, test_chore):
+    await UserRepository().get(db_session, id=test_parent_user.id)
+    await ChoreRepository().get_by_creator(db_session, creator_id=test_parent_user.id)
+    await db_session.execute(text("SELECT 1"))
+
+    callers = {caller["caller"] for s in profiler.top(limit=50) for caller in s["callers"]}
+    assert "BaseRepository.get" in callers
+    assert "ChoreRepository.get_by_creator" in callers
+
+    chore_query = next(s for s in profiler.top(limit=50) if s["callers"][:1] == [
+        {"caller": "ChoreRepository.get_by_creator", "calls": 1}
+    ])
+    # Only rows the driver reports through rowcount are counted
+    assert chore_query["rows"] == 0
+    await db_session.execute(text("UPDATE users SET is_active = is_active"))
+    update = next(s for s in profiler.top(limit=50) if s["query"].startswith("UPDATE users"))
+    assert update["rows"] == 2
+
+    raw = next(s for s in profiler.top(limit=50) if s["query"] == "SELECT ?")
+    assert raw["callers"] == []
+
+
+@pytest.mark.asyncio
+async def test_disabled_profiler_records_nothing(db_session, profiler):
+    profiler.enabled = False
+    await db_session.execute(text("SELECT 1"))
+    assert len(profiler) == 0
+
+
+@pytest.mark.asyncio
+async def test_statements_endpoint(client: AsyncClient, profiler, parent_token):
+    await client.get("/api/v1/chores", headers={"Authorization": f"Bearer {parent_token}"})
+
+    response = await client.get("/metrics/statements", params={"limit": 2, "order_by": "calls"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is True
+    assert data["tracked_statements"] >= 1
+    assert 1 <= len(data["statements"]) <= 2
+    assert data["statements"][0]["calls"] >= data["statements"][-1]["calls"]
+
+    assert (await client.get("/metrics/statements", params={"order_by": "query"})).status_code == 422
+
+    assert (await client.delete("/metrics/statements")).json() == {"status": "reset"}
+    assert len(profiler) == 0
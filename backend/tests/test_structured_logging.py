@@ -0,0 +1,146 @@
+"""
+Tests for the non-blocking structured logging pipeline
+(backend.app.core.structured_logging) and request id correlation.
+"""
+import io
+import json
+import logging
+import queue
+import threading
+import time
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+from backend.app.core.structured_logging import (
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    parse_sample_rates,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+def dropped(reason: str) -> float:
+    return REGISTRY.get_sample_value("log_records_dropped_total", {"reason": reason}) or 0
+
+
+def make_record(name: str, level: int) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 0, "message", None, None)
+
+
+@pytest.fixture
+def json_logs():
+    """Log through the pipeline into a buffer; call the fixture to flush and parse."""
+    stream = io.StringIO()
+    setup_logging(level="DEBUG", stream=stream)
+
+    def records():
+        shutdown_logging()
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    yield records
+    shutdown_logging()
+
+
+@pytest.mark.asyncio
+async def test_records_carry_the_request_id(client: AsyncClient, test_parent_user, json_logs):
+    response = await client.post(
+        "/api/v1/users/login",
+        data={"username": "parent_user", "password": "password123"},
+        headers={"X-Request-ID": "req-42"}
+    )
+    assert response.status_code == 200
+    assert response.headers["x-request-id"] == "req-42"
+
+    (login,) = [r for r in json_logs() if r["message"].startswith("Login successful")]
+    assert login["logger"] == "backend.app.api.api_v1.endpoints.users"
+    assert login["level"] == "INFO"
+    assert login["request_id"] == "req-42"
+    assert login["user_id"] == test_parent_user.id
+    assert login["timestamp"].endswith("+00:00")
+
+
+@pytest.mark.asyncio
+async def test_request_ids_are_generated_when_missing_or_invalid(client: AsyncClient):
+    first = await client.get("/")
+    second = await client.get("/", headers={"X-Request-ID": "not valid\tid"})
+    ids = {first.headers["x-request-id"], second.headers["x-request-id"]}
+    assert len(ids) == 2
+    assert all(len(request_id) == 32 for request_id in ids)
+
+
+def test_exceptions_and_extra_fields_are_serialized(json_logs):
+    logger = logging.getLogger("backend.tests.structured_logging")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.exception("Failed for %s", "child", extra={"child_id": 7})
+
+    (record,) = [r for r in json_logs() if r["logger"] == logger.name]
+    assert record["message"] == "Failed for child"
+    assert record["level"] == "ERROR"
+    assert record["child_id"] == 7
+    assert "RuntimeError: boom" in record["exception"]
+    assert "request_id" not in record
+
+
+def test_logging_does_not_wait_for_a_blocked_stream():
+    released = threading.Event()
+
+    class BlockedStream(io.StringIO):
+        def write(self, text):
+            released.wait()
+            return super().write(text)
+
+    stream = BlockedStream()
+    setup_logging(stream=stream)
+    try:
+        logger = logging.getLogger("backend.tests.structured_logging")
+        start = time.perf_counter()
+        for i in range(100):
+            logger.info("record %d", i)
+        assert time.perf_counter() - start < 1
+    finally:
+        released.set()
+        shutdown_logging()
+
+    assert stream.getvalue().count("record ") == 100
+
+
+def test_full_queue_drops_records_instead_of_blocking():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    before = dropped("queue_full")
+    for _ in range(3):
+        handler.handle(make_record("backend.tests", logging.INFO))
+    assert handler.queue.qsize() == 1
+    assert dropped("queue_full") - before == 2
+
+
+def test_sampling_applies_to_a_logger_and_its_children():
+    sampler = SamplingFilter({"backend.app.api": 0, "backend.app.api.api_v1.endpoints.users": 1})
+    before = dropped("sampled")
+
+    assert not sampler.filter(make_record("backend.app.api.api_v1.endpoints.reports", logging.DEBUG))
+    assert not sampler.filter(make_record("backend.app.api", logging.INFO))
+    # Warnings are never sampled, other loggers are not configured
+    assert sampler.filter(make_record("backend.app.api.api_v1.endpoints.reports", logging.WARNING))
+    assert sampler.filter(make_record("backend.app.services.chore_service", logging.DEBUG))
+    # The closest configured ancestor wins
+    assert sampler.filter(make_record("backend.app.api.api_v1.endpoints.users", logging.DEBUG))
+    assert dropped("sampled") - before == 2
+
+
+def test_sampling_keeps_roughly_the_configured_fraction():
+    sampler = SamplingFilter({"hot": 0.1})
+    kept = sum(sampler.filter(make_record("hot.path", logging.DEBUG)) for _ in range(10000))
+    assert 700 < kept < 1300
+
+
+def test_parse_sample_rates():
+    assert parse_sample_rates("") == {}
+    assert parse_sample_rates(" a.b=0.5, c=1 ,") == {"a.b": 0.5, "c": 1.0}
+    for invalid in ("a", "=0.5", "a=2", "a=x"):
+        with pytest.raises(ValueError):
+            parse_sample_rates(invalid)
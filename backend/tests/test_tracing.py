@@ -0,0 +1,138 @@
+"""
+Tests for request tracing (backend.app.core.tracing) and the Server-Timing
+header added by TracingMiddleware.
+"""
+import json
+import re
+
+import pytest
+from httpx import AsyncClient
+
+from backend.app.core import tracing
+from backend.app.core.tracing import Trace, activate_trace, setup_tracing_exporter, shutdown_tracing_exporter, span
+
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def timings(response):
+    """Parse Server-Timing into {name: (duration ms, description)}."""
+    parsed = {}
+    for entry in response.headers["server-timing"].split(", "):
+        name, *params = entry.split(";")
+        values = dict(param.split("=", 1) for param in params)
+        parsed[name] = (float(values["dur"]), values.get("desc", "").strip('"'))
+    return parsed
+
+
+def test_span_is_noop_outside_a_trace():
+    with span("anything") as recorded:
+        assert recorded is None
+
+
+def test_server_timing_sums_spans_by_name():
+    trace = Trace()
+    with activate_trace(trace):
+        with span("request"):
+            for _ in range(3):
+                with span("db"):
+                    pass
+            with span("render"):
+                pass
+
+    header = trace.server_timing()
+    assert [entry.split(";")[0] for entry in header.split(", ")] == ["request", "db", "render"]
+    assert 'db;dur=' in header and ';desc="3x"' in header
+
+    request_span, first_db = trace.spans[:2]
+    assert first_db.parent_id == request_span.span_id
+
+
+def test_trace_bounds_the_number_of_spans():
+    trace = Trace(max_spans=2)
+    with activate_trace(trace):
+        for _ in range(5):
+            with span("db"):
+                pass
+    assert len(trace.spans) == 2
+    assert trace.dropped == 3
+
+
+def test_traceparent_is_continued_or_sampled():
+    parent = Trace.from_traceparent("00-" + "a" * 32 + "-" + "b" * 16 + "-01", sample_rate=0.0)
+    assert (parent.trace_id, parent.parent_span_id, parent.sampled) == ("a" * 32, "b" * 16, True)
+
+    unsampled = Trace.from_traceparent("00-" + "a" * 32 + "-" + "b" * 16 + "-00", sample_rate=1.0)
+    assert unsampled.sampled is False
+
+    for invalid in (None, "", "garbage", "00-xyz-b-01"):
+        fresh = Trace.from_traceparent(invalid, sample_rate=1.0)
+        assert fresh.sampled is True
+        assert re.fullmatch(r"[0-9a-f]{32}", fresh.trace_id)
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_breaks_down_a_write(client: AsyncClient, parent_token, test_child_user):
+    response = await client.post(
+        "/api/v1/chores",
+        json={
+            "title": "Traced chore",
+            "description": "",
+            "reward": 2.0,
+            "assignment_mode": "single",
+            "assignee_ids": [test_child_user.id]
+        },
+        headers=auth(parent_token)
+    )
+    assert response.status_code == 201
+
+    spans = timings(response)
+    assert {"request", "validation", "auth", "db", "render"} <= spans.keys()
+    assert spans["request"][0] >= spans["auth"][0]
+    assert spans["db"][1].endswith("x")
+
+
+@pytest.mark.asyncio
+async def test_server_timing_on_fast_json_list(client: AsyncClient, parent_token, test_chore):
+    response = await client.get("/api/v1/chores", headers=auth(parent_token))
+    assert response.status_code == 200
+    assert {"request", "auth", "db", "render"} <= timings(response).keys()
+
+
+@pytest.mark.asyncio
+async def test_sampled_traces_are_exported_as_otlp_json(client: AsyncClient, parent_token, test_chore, tmp_path):
+    path = tmp_path / "traces" / "otlp.jsonl"
+    setup_tracing_exporter(str(path), service_name="test-service")
+    try:
+        traceparent = "00-" + "1" * 32 + "-" + "2" * 16 + "-01"
+        await client.get("/api/v1/chores", headers={**auth(parent_token), "traceparent": traceparent})
+        await client.get(
+            "/api/v1/chores",
+            headers={**auth(parent_token), "traceparent": traceparent[:-2] + "00"}
+        )
+    finally:
+        shutdown_tracing_exporter()
+    assert tracing.exporter is None
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1
+    resource_spans = json.loads(lines[0])["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "test-service"}}
+    ]
+    spans = resource_spans["scopeSpans"][0]["spans"]
+    assert {s["traceId"] for s in spans} == {"1" * 32}
+
+    root = next(s for s in spans if s["name"] == "request")
+    assert root["parentSpanId"] == "2" * 16
+    attributes = {a["key"]: a["value"] for a in root["attributes"]}
+    assert attributes["http.route"] == {"stringValue": "/api/v1/chores"}
+    assert attributes["http.status_code"] == {"intValue": "200"}
+
+    db_spans = [s for s in spans if s["name"] == "db"]
+    assert db_spans
+    db_attributes = [{a["key"]: a["value"]["stringValue"] for a in s["attributes"]} for s in db_spans]
+    assert all("db.statement" in a for a in db_attributes)
+    assert any(a.get("code.function", "").endswith("Repository.get") for a in db_attributes)
+    assert all(int(s["endTimeUnixNano"]) >= int(s["startTimeUnixNano"]) for s in spans)
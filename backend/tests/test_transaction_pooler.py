@@ -0,0 +1,191 @@
+"""
+Tests for transaction pooler mode (backend.app.db.base) and the PgBouncer
+stand-in in backend.benchmarks.pooler.
+
+The stand-in is exercised against a fake PostgreSQL server here; set
+TEST_POSTGRES_URL to also run the app's pooler configuration through it
+against a real server.
+"""
+import asyncio
+import itertools
+import os
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from backend.app.core.config import async_database_url, settings
+from backend.app.core.deadline import Deadline, apply_statement_deadlines, bind_deadline, statement_timeout_ms
+from backend.app.db.base import pool_options, postgresql_connect_args
+from backend.app.db.pool import InstrumentedAsyncAdaptedQueuePool
+from backend.benchmarks.pooler import TERMINATE, TransactionPoolerStandIn, build_engine, read_message
+
+POSTGRES_URL = "postgresql+asyncpg://u:p@pgbouncer/chores"
+
+
+def test_pooler_connect_args_carry_no_session_state():
+    args = postgresql_connect_args(POSTGRES_URL, 15000, transaction_pooler=True)
+    assert "server_settings" not in args
+    assert args["statement_cache_size"] == 0
+    assert args["prepared_statement_cache_size"] == 0
+    name = args["prepared_statement_name_func"]
+    assert name() != name()
+    assert args["command_timeout"] == 60
+    assert postgresql_connect_args("sqlite+aiosqlite:///chores.db", 15000, transaction_pooler=True) == {}
+
+
+def test_pooler_pool_options(monkeypatch):
+    assert pool_options(20, 40, 60)["pool_size"] == 20
+    options = pool_options(20, 40, 60, transaction_pooler=True)
+    assert options["poolclass"] is InstrumentedAsyncAdaptedQueuePool
+    assert (options["pool_size"], options["max_overflow"]) == (
+        settings.TRANSACTION_POOLER_POOL_SIZE, settings.TRANSACTION_POOLER_MAX_OVERFLOW
+    )
+    monkeypatch.setattr(settings, "TRANSACTION_POOLER_POOL_SIZE", 0)
+    assert pool_options(20, 40, 60, transaction_pooler=True) == {"poolclass": NullPool}
+
+
+def test_statement_timeout_is_set_per_transaction_behind_a_pooler():
+    assert statement_timeout_ms(15000, per_transaction=True) == 15000
+    assert statement_timeout_ms(0, per_transaction=True) is None
+    with bind_deadline(Deadline("read", time.monotonic() + 60, 60)):
+        assert statement_timeout_ms(15000, per_transaction=True) == 15000
+    with bind_deadline(Deadline("read", time.monotonic() + 2, 2)):
+        assert 1900 < statement_timeout_ms(15000, per_transaction=True) <= 2000
+
+
+# The stand-in against a fake server
+
+def message(kind: bytes, body: bytes) -> bytes:
+    return kind + (len(body) + 4).to_bytes(4, "big") + body
+
+
+def startup_message() -> bytes:
+    body = (196608).to_bytes(4, "big") + b"user\x00test\x00\x00"
+    return (len(body) + 4).to_bytes(4, "big") + body
+
+
+@pytest.fixture
+async def fake_postgres():
+    """
+    A server answering simple queries with "conn <n>", its connection number.
+
+    BEGIN and COMMIT move its ReadyForQuery status in and out of a
+    transaction; ``terminated`` counts connections closed with Terminate.
+    """
+    numbers = itertools.count(1)
+    state = {"terminated": 0}
+
+    async def serve(reader, writer):
+        number = next(numbers)
+        length = int.from_bytes(await reader.readexactly(4), "big")
+        await reader.readexactly(length - 4)
+        writer.write(message(b"R", (0).to_bytes(4, "big")) + message(b"Z", b"I"))
+        status = b"I"
+        while True:
+            kind, raw = await read_message(reader)
+            if kind is None:
+                break
+            if raw == TERMINATE:
+                state["terminated"] += 1
+                break
+            query = raw[5:-1]
+            if query == b"BEGIN":
+                status = b"T"
+            elif query == b"COMMIT":
+                status = b"I"
+            writer.write(message(b"C", f"conn {number}".encode() + b"\x00") + message(b"Z", status))
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    yield server.sockets[0].getsockname()[1], state
+    server.close()
+    await server.wait_closed()
+
+
+class RawClient:
+    def __init__(self, reader, writer):
+        self.reader, self.writer = reader, writer
+
+    @classmethod
+    async def connect(cls, port: int) -> "RawClient":
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write((8).to_bytes(4, "big") + (80877103).to_bytes(4, "big"))
+        assert await reader.readexactly(1) == b"N"
+        writer.write(startup_message())
+        while (await read_message(reader))[0] != b"Z":
+            pass
+        return cls(reader, writer)
+
+    async def query(self, sql: str) -> str:
+        self.writer.write(message(b"Q", sql.encode() + b"\x00"))
+        _, complete = await read_message(self.reader)
+        await read_message(self.reader)
+        return complete[5:-1].decode()
+
+    def close(self):
+        self.writer.write(TERMINATE)
+        self.writer.close()
+
+
+@pytest.mark.asyncio
+async def test_stand_in_shares_server_connections_per_transaction(fake_postgres):
+    server_port, server_state = fake_postgres
+    pooler = TransactionPoolerStandIn("127.0.0.1", server_port, pool_size=2)
+    port = await pooler.start()
+    try:
+        clients = [await RawClient.connect(port) for _ in range(3)]
+        # The third client's own connection did not fit in the pool
+        assert pooler.server_connections == 2
+        await asyncio.sleep(0.05)
+        assert server_state["terminated"] == 1
+
+        first, second, third = clients
+        # A transaction keeps its server connection...
+        assert await first.query("BEGIN") == "conn 1"
+        assert await first.query("SELECT 1") == "conn 1"
+        # ...while the others share the remaining one
+        assert await second.query("SELECT 1") == "conn 2"
+        assert await third.query("SELECT 1") == "conn 2"
+        assert await first.query("COMMIT") == "conn 1"
+        # Once idle, any client can get any connection
+        used = {await third.query("SELECT 1") for _ in range(2)}
+        assert used <= {"conn 1", "conn 2"}
+        assert pooler.transactions == 5
+
+        for client in clients:
+            client.close()
+    finally:
+        await pooler.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.getenv("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL is not set")
+async def test_pooler_mode_through_the_stand_in():
+    url = make_url(async_database_url(os.environ["TEST_POSTGRES_URL"]))
+    pooler = TransactionPoolerStandIn(url.host or "localhost", url.port or 5432, pool_size=2)
+    port = await pooler.start()
+    engine = build_engine(url.set(host="127.0.0.1", port=port).render_as_string(hide_password=False), True, 4)
+    apply_statement_deadlines(engine, 15000, per_transaction=True)
+    sessions = sessionmaker(engine, class_=AsyncSession)
+    try:
+        async def worker(n: int):
+            # The same statements over and over: prepared statements must not
+            # be looked up on another client's server connection
+            for i in range(20):
+                async with sessions() as session:
+                    value = (await session.execute(text("SELECT :n + :i"), {"n": n, "i": i})).scalar()
+                    assert value == n + i
+                    assert (await session.execute(text("SHOW statement_timeout"))).scalar() == "15s"
+
+        await asyncio.gather(*(worker(n) for n in range(8)))
+        assert pooler.server_connections <= 2
+        assert pooler.transactions >= 8 * 20
+    finally:
+        await engine.dispose()
+        await pooler.stop()
@@ -0,0 +1,103 @@
+"""
+Tests for the reporting workload pool (get_report_db) and per-workload
+connection settings in backend.app.db.base.
+"""
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.security.jwt import create_access_token
+from backend.app.db.base import Base, get_db, get_reporting_session_factory, postgresql_connect_args
+from backend.app.db.pool import InstrumentedAsyncAdaptedQueuePool, instrument_engine
+from backend.app.main import app
+from backend.app.middleware.rate_limit import reset_limiter
+from backend.app.models.user import User
+
+POOL_NAME = "reporting_test"
+
+
+def test_connect_args_carry_the_workload_statement_timeout():
+    url = "postgresql+asyncpg://u:p@db/chores"
+    assert postgresql_connect_args(url, 15000) == {
+        "server_settings": {"jit": "off", "statement_timeout": "15000"},
+        "command_timeout": 60,
+    }
+    assert postgresql_connect_args(url, 120000)["command_timeout"] == 125
+    assert "statement_timeout" not in postgresql_connect_args(url, 0)["server_settings"]
+    assert postgresql_connect_args("sqlite+aiosqlite:///chores.db", 15000) == {}
+
+
+@pytest.fixture
+async def lanes(tmp_path):
+    """
+    The app with get_db on one SQLite file and a one-connection reporting pool
+    on the same file. Yields (client, reporting engine, parent headers).
+    """
+    url = f"sqlite+aiosqlite:///{tmp_path / 'lanes.db'}"
+    primary = create_async_engine(url)
+    reporting = create_async_engine(
+        url, poolclass=InstrumentedAsyncAdaptedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.2
+    )
+    instrument_engine(reporting, POOL_NAME)
+    async with primary.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    primary_sessions = sessionmaker(primary, class_=AsyncSession, expire_on_commit=False)
+    async with primary_sessions() as session:
+        parent = User(username="lane_parent", email="lane@test.com", hashed_password="x", is_parent=True)
+        session.add(parent)
+        await session.commit()
+        parent_id = parent.id
+
+    async def override_get_db():
+        async with primary_sessions() as session:
+            yield session
+
+    reset_limiter()
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_reporting_session_factory] = lambda: sessionmaker(
+        reporting, class_=AsyncSession, expire_on_commit=False
+    )
+    headers = {"Authorization": f"Bearer {create_access_token(subject=str(parent_id))}"}
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client, reporting, headers
+    finally:
+        app.dependency_overrides.clear()
+        await primary.dispose()
+        await reporting.dispose()
+
+
+def reporting_checkouts() -> float:
+    return REGISTRY.get_sample_value("db_pool_checkout_wait_seconds_count", {"pool": POOL_NAME}) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_reports_run_on_the_reporting_pool(lanes):
+    client, reporting, headers = lanes
+    before = reporting_checkouts()
+
+    response = await client.get("/api/v1/reports/allowance-summary", headers=headers)
+    assert response.status_code == 200, response.text
+    response = await client.get("/api/v1/statistics/weekly-summary", headers=headers)
+    assert response.status_code == 200, response.text
+
+    assert reporting_checkouts() == before + 2
+    assert reporting.pool.checkedout() == 0
+
+
+@pytest.mark.asyncio
+async def test_exhausted_reporting_pool_leaves_transactional_traffic_alone(lanes):
+    client, reporting, headers = lanes
+
+    async with reporting.connect():
+        response = await client.get("/api/v1/reports/allowance-summary", headers=headers)
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "5"
+
+        response = await client.get("/api/v1/users/me", headers=headers)
+        assert response.status_code == 200
+
+    response = await client.get("/api/v1/reports/allowance-summary", headers=headers)
+    assert response.status_code == 200
@@ -27,5 +27,14 @@ echo "MySQL is up - database migrations should be handled by migration job"
 # This is particularly important for production workloads with high concurrency
 ulimit -n 65536 2>/dev/null || echo "Warning: Could not set ulimit (may need pod securityContext)"
 
+# With several uvicorn workers (--workers / WEB_CONCURRENCY), Prometheus metrics
+# are shared through PROMETHEUS_MULTIPROC_DIR. Files left by a previous run
+# would be aggregated with the new workers' samples, so start from a clean directory.
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+    echo "Prometheus multiprocess mode: metrics shared in $PROMETHEUS_MULTIPROC_DIR"
+fi
+
 echo "Starting application..."
 exec "$@"